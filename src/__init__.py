@@ -5,47 +5,63 @@ A framework for enforcing multi-phase workflows with active verification,
 analytics, automated learning, and multi-model code review.
 """
 
-from .schema import (
-    WorkflowDef,
-    WorkflowState,
-    WorkflowEvent,
-    ItemStatus,
-    PhaseStatus,
-    WorkflowStatus,
-    EventType,
-    VerificationType,
-    StepType,
-)
+from importlib import import_module
+
+# Public names are resolved lazily (PEP 562) so that importing any submodule,
+# e.g. ``src.cli`` from a hook, does not pay for the review and enforcement
+# packages up front.
+_LAZY_EXPORTS = {
+    # Workflow
+    "WorkflowDef": (".schema", "WorkflowDef"),
+    "WorkflowState": (".schema", "WorkflowState"),
+    "WorkflowEvent": (".schema", "WorkflowEvent"),
+    "ItemStatus": (".schema", "ItemStatus"),
+    "PhaseStatus": (".schema", "PhaseStatus"),
+    "WorkflowStatus": (".schema", "WorkflowStatus"),
+    "EventType": (".schema", "EventType"),
+    "VerificationType": (".schema", "VerificationType"),
+    "StepType": (".schema", "StepType"),
+    "WorkflowEngine": (".engine", "WorkflowEngine"),
+    "WorkflowAnalytics": (".analytics", "WorkflowAnalytics"),
+    "LearningEngine": (".learning_engine", "LearningEngine"),
+
+    # Multi-model review system
+    "ReviewOrchestrator": (".review", "ReviewOrchestrator"),
+    "ReviewTier": (".review", "ReviewTier"),
+    "ReviewConfig": (".review", "ReviewConfig"),
+    "ChangeContext": (".review", "ChangeContext"),
+    "SynthesizedReview": (".review", "SynthesizedReview"),
+    "review_changes": (".review", "review_changes"),
+    "get_review_tier": (".review", "get_review_tier"),
+    "get_default_review_config": (".review", "get_default_config"),
+
+    # Step enforcement system
+    "SkipDecision": (".enforcement", "SkipDecision"),
+    "CodeAnalysisEvidence": (".enforcement", "CodeAnalysisEvidence"),
+    "EdgeCaseEvidence": (".enforcement", "EdgeCaseEvidence"),
+    "SpecReviewEvidence": (".enforcement", "SpecReviewEvidence"),
+    "TestPlanEvidence": (".enforcement", "TestPlanEvidence"),
+    "GateResult": (".enforcement", "GateResult"),
+    "HardGateExecutor": (".enforcement", "HardGateExecutor"),
+    "validate_skip_reasoning": (".enforcement", "validate_skip_reasoning"),
+    "validate_evidence_depth": (".enforcement", "validate_evidence_depth"),
+    "get_evidence_schema": (".enforcement", "get_evidence_schema"),
+}
+
+
+def __getattr__(name: str):
+    try:
+        module_name, attr = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module_name, __name__), attr)
+    globals()[name] = value
+    return value
 
-from .engine import WorkflowEngine
-from .analytics import WorkflowAnalytics
-from .learning_engine import LearningEngine
 
-# Multi-model review system
-from .review import (
-    ReviewOrchestrator,
-    ReviewTier,
-    ReviewConfig,
-    ChangeContext,
-    SynthesizedReview,
-    review_changes,
-    get_review_tier,
-    get_default_config as get_default_review_config,
-)
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
 
-# Step enforcement system
-from .enforcement import (
-    SkipDecision,
-    CodeAnalysisEvidence,
-    EdgeCaseEvidence,
-    SpecReviewEvidence,
-    TestPlanEvidence,
-    GateResult,
-    HardGateExecutor,
-    validate_skip_reasoning,
-    validate_evidence_depth,
-    get_evidence_schema,
-)
 
 __version__ = "3.0.0"
 __all__ = [
@@ -13,35 +13,15 @@ from pathlib import Path
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
+# Only modules needed by the hot-path commands that hooks call on every tool
+# use (status, context-reminder, verify-write-allowed, complete, skip, advance)
+# are imported here. Everything else - dashboard, visual verification, review
+# executors, secrets, LLM resolver, adherence validator, PRD, healing - is
+# imported inside the command that dispatches to it, so e.g. `orchestrator
+# status` never pays for them. tests/test_cli_import_budget.py guards this.
 from src.engine import WorkflowEngine
 from src.mode_detection import detect_operator_mode, is_llm_mode, log_mode_detection
-from src.analytics import WorkflowAnalytics
-from src.learning_engine import LearningEngine
-from src.dashboard import start_dashboard, generate_static_dashboard
 from src.schema import WorkflowDef, WorkflowEvent, EventType, ItemStatus
-from src.claude_integration import ClaudeCodeIntegration
-from src.providers import get_provider, list_providers, AgentProvider
-from src.environment import detect_environment, get_environment_info, Environment
-from src.checkpoint import CheckpointManager, CheckpointData
-from src.visual_verification import (
-    VisualVerificationClient,
-    VisualVerificationError,
-    VerificationResult,
-    CostSummary,
-    create_desktop_viewport,
-    create_mobile_viewport,
-    format_verification_result,
-    format_cost_summary,
-    discover_visual_tests,
-    run_all_visual_tests,
-    DEVICE_PRESETS,
-)
-from src.review import (
-    ReviewRouter,
-    ReviewMethod,
-    check_review_setup,
-    setup_reviews,
-)
 from src.review.registry import get_review_item_mapping, get_all_review_types
 from src.config import (
     find_workflow_path,
@@ -52,32 +32,12 @@ from src.config import (
     load_settings_overrides,
 )
 from src.validation import validate_constraints, validate_note
-from src.secrets import (
-    SecretsManager,
-    get_secrets_manager,
-    get_user_config,
-    get_user_config_value,
-    set_user_config_value,
-    init_secrets_interactive,
-    CONFIG_FILE,
-    SIMPLE_SECRETS_FILE,
-)
 from src.git_conflict_resolver import (
     GitConflictResolver,
     check_conflicts,
     format_escalation_for_user,
 )
 from src.sync_manager import SyncManager, SyncResult
-from src.resolution.llm_resolver import (
-    LLMResolver,
-    LLMResolutionResult,
-    ConfidenceLevel,
-)
-from src.adherence_validator import (
-    AdherenceValidator,
-    format_adherence_report,
-    find_session_log_for_workflow,
-)
 from src.path_resolver import OrchestratorPaths
 from src.session_manager import SessionManager
 from src.task_provider import (
@@ -90,8 +50,8 @@ from src.task_provider import (
 # Natural language command support (Issue #60)
 NL_AVAILABLE = False
 try:
-    from src.nl_commands import register_nl_commands
     from ai_tool_bridge.argparse_adapter import add_nl_subcommand
+    from src.nl_commands import register_nl_commands
     NL_AVAILABLE = True
 except ImportError:
     pass  # ai-tool-bridge not installed
@@ -178,6 +138,7 @@ def run_auto_review(review_type: str, working_dir: Path = None) -> tuple[bool, s
         - error_message: Error description if review couldn't run (CLIs not available, etc.)
         - review_info: Dict with model info for tracking: {model_name, method, issues, success}
     """
+    from src.review import ReviewRouter, ReviewMethod
     working_dir = working_dir or Path('.')
 
     try:
@@ -230,6 +191,40 @@ def run_auto_review(review_type: str, working_dir: Path = None) -> tuple[bool, s
 # Helper Functions (CORE-010, CORE-011)
 # ============================================================================
 
+class LazyChoices:
+    """
+    Argparse ``choices`` container that loads its values on first use.
+
+    Lets a subcommand validate against a list owned by a heavy module
+    (e.g. visual verification device presets) without importing that module
+    every time the parser is built.
+    """
+
+    def __init__(self, loader):
+        self._loader = loader
+        self._values = None
+
+    def _load(self) -> list:
+        if self._values is None:
+            self._values = list(self._loader())
+        return self._values
+
+    def __contains__(self, value) -> bool:
+        return value in self._load()
+
+    def __iter__(self):
+        return iter(self._load())
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+
+def _device_preset_names() -> list:
+    from src.visual_verification import DEVICE_PRESETS
+    return list(DEVICE_PRESETS.keys())
+
+
+
 def format_duration(delta: timedelta) -> str:
     """
     Format a timedelta as a human-readable duration string.
@@ -683,6 +678,7 @@ def cmd_verify_write_allowed(args):
 
 def cmd_resolve(args):
     """CORE-023: Resolve git merge/rebase conflicts."""
+    from src.resolution.llm_resolver import LLMResolver, ConfidenceLevel
     working_dir = Path(args.dir or '.')
 
     # Handle abort first
@@ -1028,6 +1024,24 @@ def cmd_complete(args):
         print(f"Error: {e}")
         sys.exit(1)
 
+    if getattr(args, 'all', False):
+        if args.item:
+            print("Error: Pass either an item ID or --all, not both")
+            sys.exit(1)
+        if args.skip_verify:
+            print("Error: --all always runs verification; complete items individually to use --skip-verify")
+            sys.exit(1)
+        results = _complete_phase_items(engine, args, notes=notes)
+        if not all(success for _, success, _ in results):
+            sys.exit(1)
+        if not args.quiet:
+            print("\n" + engine.get_recitation_text())
+        return
+
+    if not args.item:
+        print("Error: Item ID required (or use --all)")
+        sys.exit(1)
+
     # WF-010: Auto-run third-party reviews for REVIEW phase items
     item_id = args.item
     if item_id in REVIEW_ITEM_MAPPING and not args.skip_auto_review:
@@ -1187,6 +1201,55 @@ def cmd_complete(args):
         sys.exit(1)
 
 
+def _complete_phase_items(engine, args, notes: Optional[str] = None) -> list:
+    """
+    Complete outstanding items of the current phase with parallel command
+    verification, printing each verification result as it finishes.
+
+    Items that auto-run a third-party review are left out unless
+    --skip-auto-review is given; complete them individually.
+
+    Returns:
+        List of (item_id, success, message).
+    """
+    exclude = set()
+    if not getattr(args, 'skip_auto_review', False):
+        exclude = set(REVIEW_ITEM_MAPPING)
+
+    def on_result(item_id, passed, message):
+        print(f"  {'✓' if passed else '✗'} {item_id}: {message}", flush=True)
+
+    print("Running verifications...")
+    try:
+        results = engine.complete_phase_items(
+            notes=notes,
+            max_workers=getattr(args, 'jobs', None),
+            on_result=on_result,
+            exclude=exclude,
+        )
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    print()
+    for item_id, success, message in results:
+        print(f"{'✓' if success else '✗'} {item_id}: {message}")
+    completed = sum(1 for _, success, _ in results if success)
+    print(f"\nCompleted {completed}/{len(results)} item(s)")
+
+    phase_state = engine.state.phases.get(engine.state.current_phase_id)
+    skipped_reviews = sorted(
+        item_id for item_id in exclude
+        if phase_state and item_id in phase_state.items
+        and phase_state.items[item_id].status not in (ItemStatus.COMPLETED, ItemStatus.SKIPPED)
+    )
+    if skipped_reviews:
+        print("Review items need their third-party review, complete them individually:")
+        for item_id in skipped_reviews:
+            print(f"  orchestrator complete {item_id}")
+    return results
+
+
 def cmd_skip(args):
     """Skip an item with a reason."""
     engine = get_engine(args)
@@ -1388,6 +1451,10 @@ def cmd_advance(args):
     # Capture previous phase ID before advancing (for CORE-010 skip visibility)
     previous_phase_id = engine.state.current_phase_id
 
+    if getattr(args, 'verify_parallel', False):
+        _complete_phase_items(engine, args)
+        print()
+
     # First check if we can advance
     can_advance, blockers, skipped = engine.can_advance_phase()
 
@@ -1504,6 +1571,7 @@ def cmd_approve(args):
 
 def cmd_finish(args):
     """Complete or abandon the workflow."""
+    from src.learning_engine import LearningEngine
     engine = get_engine(args)
 
     if not engine.state:
@@ -1991,6 +2059,7 @@ def cmd_finish(args):
 
 def cmd_analyze(args):
     """Analyze workflow history."""
+    from src.analytics import WorkflowAnalytics
     analytics = WorkflowAnalytics(args.dir or '.')
     
     if args.json:
@@ -2001,6 +2070,7 @@ def cmd_analyze(args):
 
 def cmd_learn(args):
     """Generate a learning report from the current/last workflow."""
+    from src.learning_engine import LearningEngine
     learning = LearningEngine(args.dir or '.')
     
     report = learning.generate_learning_report()
@@ -2013,6 +2083,7 @@ def cmd_learn(args):
 
 def cmd_dashboard(args):
     """Start the visual dashboard."""
+    from src.dashboard import start_dashboard, generate_static_dashboard
     if args.static:
         html = generate_static_dashboard(args.dir or '.')
         output_path = Path(args.dir or '.') / 'dashboard.html'
@@ -2082,6 +2153,7 @@ def cmd_validate(args):
 
 def cmd_handoff(args):
     """Generate a handoff prompt for an agent provider or execute directly."""
+    from src.providers import get_provider, list_providers
     engine = get_engine(args)
     
     if not engine.state or not engine.workflow_def:
@@ -2256,6 +2328,13 @@ def cmd_cleanup(args):
 
 def cmd_visual_verify(args):
     """Run visual verification against a URL."""
+    from src.visual_verification import (
+        VisualVerificationClient,
+        VisualVerificationError,
+        create_desktop_viewport,
+        create_mobile_viewport,
+        format_verification_result,
+    )
     try:
         client = VisualVerificationClient()
     except VisualVerificationError as e:
@@ -2346,6 +2425,13 @@ def cmd_visual_verify(args):
 
 def cmd_visual_verify_all(args):
     """Run all visual tests in a directory (VV-003)."""
+    from src.visual_verification import (
+        VisualVerificationClient,
+        VisualVerificationError,
+        format_cost_summary,
+        discover_visual_tests,
+        run_all_visual_tests,
+    )
     try:
         client = VisualVerificationClient(
             style_guide_path=args.style_guide if hasattr(args, 'style_guide') else None
@@ -2551,6 +2637,7 @@ def generate_workflow_md(engine: WorkflowEngine) -> str:
 
 def cmd_checkpoint(args):
     """Create a checkpoint for the current workflow state."""
+    from src.checkpoint import CheckpointManager
     engine = get_engine(args)
     
     if not engine.state:
@@ -2607,6 +2694,7 @@ def cmd_checkpoint(args):
 
 def cmd_checkpoints(args):
     """List all checkpoints."""
+    from src.checkpoint import CheckpointManager
     # CORE-025: Use session-aware paths for checkpoints
     working_dir = Path(args.dir or '.')
     paths = OrchestratorPaths(base_dir=working_dir)
@@ -2655,6 +2743,7 @@ def cmd_checkpoints(args):
 
 def cmd_resume(args):
     """Resume from a checkpoint."""
+    from src.checkpoint import CheckpointManager
     # CORE-025: Use session-aware paths for checkpoints
     working_dir = Path(args.dir or '.')
     paths = OrchestratorPaths(base_dir=working_dir)
@@ -2702,13 +2791,15 @@ def cmd_resume(args):
 
 def cmd_review(args):
     """Run AI code reviews."""
+    from src.review import ReviewRouter
     working_dir = Path(args.dir or '.')
 
     try:
         router = ReviewRouter(
             working_dir=working_dir,
             method=args.method if args.method != 'auto' else None,
-            no_fallback=getattr(args, 'no_fallback', False)  # CORE-028b
+            no_fallback=getattr(args, 'no_fallback', False),  # CORE-028b
+            use_cache=not getattr(args, 'no_cache', False),
         )
     except ValueError as e:
         print(f"Error: {e}")
@@ -2718,7 +2809,22 @@ def cmd_review(args):
 
     review_type = args.review_type or 'all'
 
-    if review_type == 'all':
+    if review_type == 'all' and getattr(args, 'parallel', False):
+        import time
+        review_types = get_all_review_types()
+        completed = {}
+        start = time.perf_counter()
+        for result in router.iter_reviews(review_types, max_concurrency=args.max_concurrency):
+            completed[result.review_type] = result
+            if not args.json:
+                icon = "✓" if result.success else "✗"
+                print(f"  {icon} {result.review_type} finished ({result.duration_seconds or 0:.1f}s)", flush=True)
+        wall = time.perf_counter() - start
+        serial = sum(r.duration_seconds or 0 for r in completed.values())
+        results = {t: completed[t] for t in review_types if t in completed}
+        if not args.json:
+            print(f"\nTotal {wall:.1f}s wall clock vs {serial:.1f}s if run serially\n")
+    elif review_type == 'all':
         results = router.execute_all_reviews()
     else:
         results = {review_type: router.execute_review(review_type)}
@@ -2775,7 +2881,8 @@ def cmd_review(args):
         icon = "✓" if result.success and not result.has_blocking_findings() else "✗"
         # CORE-028b: Show fallback indicator if used
         fallback_tag = " [fallback]" if getattr(result, 'was_fallback', False) else ""
-        print(f"{icon} {review_name.upper()} REVIEW{fallback_tag}")
+        cached_tag = " [cached]" if getattr(result, 'cached', False) else ""
+        print(f"{icon} {review_name.upper()} REVIEW{fallback_tag}{cached_tag}")
         print(f"  Model: {result.model_used}")
         print(f"  Method: {result.method_used}")
         if getattr(result, 'was_fallback', False) and getattr(result, 'fallback_reason', None):
@@ -2819,6 +2926,7 @@ def cmd_review(args):
 
 def cmd_review_status(args):
     """Show review infrastructure status."""
+    from src.review import check_review_setup
     working_dir = Path(args.dir or '.')
     setup = check_review_setup(working_dir)
 
@@ -2857,6 +2965,13 @@ def cmd_review_status(args):
     agents_status = "✓" if setup.agents_md else "✗"
     print(f"  Config Files:   {styleguide_status} .gemini/styleguide.md  {agents_status} AGENTS.md")
 
+    # API response cache
+    from src.path_resolver import OrchestratorPaths
+    from src.review.response_cache import ReviewResponseCache
+    cache_stats = ReviewResponseCache(OrchestratorPaths(base_dir=working_dir).review_response_cache_dir()).stats()
+    print(f"  Response Cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses "
+          f"({cache_stats['entries']} entries, {cache_stats['size_bytes'] / 1024:.0f} KB)")
+
     print()
 
     # Recommended action
@@ -2918,6 +3033,7 @@ def cmd_review_results(args):
 
 def cmd_review_retry(args):
     """Retry failed reviews after fixing issues (CORE-026)."""
+    from src.review import ReviewRouter
     engine = get_engine(args)
 
     if not engine.state:
@@ -2961,7 +3077,8 @@ def cmd_review_retry(args):
         try:
             router = ReviewRouter(
                 working_dir=working_dir,
-                method=args.method if hasattr(args, 'method') and args.method != 'auto' else None
+                method=args.method if hasattr(args, 'method') and args.method != 'auto' else None,
+                use_cache=not getattr(args, 'no_cache', False),
             )
             result = router.execute_review(review_type)
 
@@ -3005,6 +3122,11 @@ def cmd_review_retry(args):
 
 def cmd_validate_adherence(args):
     """Validate workflow adherence (WF-034 Phase 2)."""
+    from src.adherence_validator import (
+        AdherenceValidator,
+        format_adherence_report,
+        find_session_log_for_workflow,
+    )
     engine = get_engine(args)
 
     # Determine workflow ID
@@ -3083,6 +3205,7 @@ def _find_secrets_source() -> Path | None:
     Returns:
         Path to secrets file if found, None otherwise.
     """
+    from src.secrets import SIMPLE_SECRETS_FILE
     # Check orchestrator installation directory
     src_dir = Path(__file__).parent
     orchestrator_secrets = src_dir.parent / SIMPLE_SECRETS_FILE
@@ -3107,6 +3230,7 @@ def _copy_secrets_to_repo(source: Path, working_dir: Path) -> bool:
     Returns:
         True if copied successfully
     """
+    from src.secrets import SIMPLE_SECRETS_FILE
     import shutil
 
     dest = working_dir / SIMPLE_SECRETS_FILE
@@ -3122,6 +3246,7 @@ def _copy_secrets_to_repo(source: Path, working_dir: Path) -> bool:
 
 def cmd_setup(args):
     """Set up automatic updates for this repo, or remove the setup."""
+    from src.secrets import SIMPLE_SECRETS_FILE
     working_dir = Path(args.dir or '.')
     hooks_dir = working_dir / '.claude' / 'hooks'
     hook_file = hooks_dir / 'session-start.sh'
@@ -3307,6 +3432,7 @@ def cmd_enforce(args):
 
 def cmd_setup_reviews(args):
     """Set up review infrastructure in a repository."""
+    from src.review import setup_reviews
     working_dir = Path(args.dir or '.')
 
     print("Setting up review infrastructure...\n")
@@ -3338,6 +3464,12 @@ def cmd_setup_reviews(args):
 
 def cmd_config(args):
     """Manage orchestrator configuration."""
+    from src.secrets import (
+        get_user_config,
+        get_user_config_value,
+        set_user_config_value,
+        CONFIG_FILE,
+    )
     action = args.action
 
     if action == "set":
@@ -3572,6 +3704,7 @@ def cmd_health(args):
 
 def cmd_secrets(args):
     """Manage secrets and test secret access."""
+    from src.secrets import get_secrets_manager, init_secrets_interactive, SIMPLE_SECRETS_FILE
     working_dir = Path(args.dir or '.')
     action = args.action
 
@@ -6501,7 +6634,11 @@ Examples:
 
     # Complete command
     complete_parser = subparsers.add_parser('complete', help='Mark an item as complete')
-    complete_parser.add_argument('item', help='Item ID to complete')
+    complete_parser.add_argument('item', nargs='?', help='Item ID to complete')
+    complete_parser.add_argument('--all', action='store_true',
+                                 help='Complete all outstanding items in the current phase, verifying commands in parallel')
+    complete_parser.add_argument('--jobs', '-j', type=int,
+                                 help='Max concurrent verification commands with --all (default: max_parallel_verifications setting)')
     complete_parser.add_argument('--notes', '-n', help='Notes about the completion')
     complete_parser.add_argument('--skip-verify', action='store_true', help='Skip verification')
     complete_parser.add_argument('--skip-auto-review', action='store_true',
@@ -6532,6 +6669,10 @@ Examples:
     advance_parser.add_argument('--quiet', '-q', action='store_true', help='Minimal output')
     advance_parser.add_argument('--yes', '-y', action='store_true', help='Skip summary/critique prompts (WF-005, WF-008)')
     advance_parser.add_argument('--no-critique', action='store_true', help='Skip AI critique at phase gate (WF-008)')
+    advance_parser.add_argument('--verify-parallel', action='store_true',
+                                help='First complete outstanding items, verifying commands in parallel')
+    advance_parser.add_argument('--jobs', '-j', type=int,
+                                help='Max concurrent verification commands with --verify-parallel')
     advance_parser.set_defaults(func=cmd_advance)
     
     # Approve command (for phase gates)
@@ -6609,7 +6750,8 @@ Examples:
     visual_verify_parser = subparsers.add_parser('visual-verify', help='Run visual verification against a URL')
     visual_verify_parser.add_argument('--url', '-u', required=True, help='URL to verify')
     visual_verify_parser.add_argument('--spec', '-s', required=True, help='Path to specification file or inline spec')
-    visual_verify_parser.add_argument('--device', '-d', choices=list(DEVICE_PRESETS.keys()), help='Device preset (e.g., iphone-14, desktop)')
+    visual_verify_parser.add_argument('--device', '-d', choices=LazyChoices(_device_preset_names), metavar='PRESET',
+                                      help='Device preset (e.g., iphone-14, desktop)')
     visual_verify_parser.add_argument('--no-mobile', dest='mobile', action='store_false', default=True, help='Skip mobile viewport test')
     visual_verify_parser.add_argument('--style-guide', '-g', help='Path to style guide file')
     visual_verify_parser.add_argument('--show-cost', action='store_true', help='Show cost/token usage (VV-006)')
@@ -6673,6 +6815,12 @@ Examples:
     review_parser.add_argument('--no-fallback', action='store_true',
                                help='Disable model fallback on transient failures (CORE-028b)')
     review_parser.add_argument('--json', action='store_true', help='Output as JSON')
+    review_parser.add_argument('--parallel', action='store_true',
+                               help='Run all review types concurrently, reporting each as it finishes')
+    review_parser.add_argument('--max-concurrency', type=int, default=4,
+                               help='Reviews in flight at once with --parallel (default: 4)')
+    review_parser.add_argument('--no-cache', action='store_true',
+                               help='Call the model even if an identical prompt has a cached response (API method)')
     review_parser.set_defaults(func=cmd_review)
 
     # Review-status command
@@ -6690,6 +6838,8 @@ Examples:
                                      default='auto', help='Execution method (default: auto-detect)')
     review_retry_parser.add_argument('--no-fallback', action='store_true',
                                      help='Disable model fallback on transient failures (CORE-028b)')
+    review_retry_parser.add_argument('--no-cache', action='store_true',
+                                     help='Call the model even if an identical prompt has a cached response (API method)')
     review_retry_parser.set_defaults(func=cmd_review_retry)
 
     # Setup-reviews command
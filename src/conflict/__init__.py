@@ -14,6 +14,7 @@ from .detector import (
     ConflictSeverity,
     ConflictFile,
     ConflictInfo,
+    ConflictMatrix,
     ConflictDetector,
     detect_conflicts,
 )
@@ -53,6 +54,7 @@ __all__ = [
     "ConflictSeverity",
     "ConflictFile",
     "ConflictInfo",
+    "ConflictMatrix",
     "ConflictDetector",
     "detect_conflicts",
 
@@ -10,7 +10,8 @@ all conflicts at once.
 """
 
 import logging
-from collections import defaultdict
+import re
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from typing import Optional
 
@@ -46,17 +47,73 @@ class ConflictCluster:
         }
 
 
+class _DisjointSet:
+    """Union-find over agent IDs (path halving, union by size)."""
+
+    def __init__(self, items: list[str]):
+        self.parent = {item: item for item in items}
+        self.size = {item: 1 for item in items}
+
+    def find(self, item: str) -> str:
+        parent = self.parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    def union(self, a: str, b: str) -> None:
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return
+        if self.size[root_a] < self.size[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        self.size[root_a] += self.size[root_b]
+
+    def union_all(self, items: set[str]) -> None:
+        """Join every item in the group into one set."""
+        it = iter(items)
+        first = next(it, None)
+        for item in it:
+            self.union(first, item)
+
+
 class ConflictClusterer:
     """
     Groups agents into conflict clusters for wave-based resolution.
 
     Strategy:
-    1. Build file overlap graph
-    2. Build domain overlap graph (infer from paths, manifests)
-    3. Find connected components = clusters
+    1. Index files -> agents and domains -> agents (infer domains from paths)
+    2. Union the agents under each index key (disjoint-set)
+    3. Sets = clusters, in order of their first agent
     4. Order clusters by dependencies
+
+    Agents sharing a file are joined directly rather than through a
+    pairwise adjacency graph, so a file touched by every agent costs
+    linear rather than quadratic work.
     """
 
+    DOMAIN_PATTERNS = {
+        "auth": ["auth", "login", "session", "permission"],
+        "api": ["api/", "routes", "endpoints", "handlers"],
+        "database": ["models", "migrations", "schema", "db"],
+        "ui": ["components", "views", "pages", "templates"],
+        "config": ["config", "settings"],
+    }
+
+    # One alternation per domain: a path is in the domain if any pattern
+    # occurs in it
+    _DOMAIN_REGEXES = [
+        (domain, re.compile("|".join(re.escape(p) for p in patterns)))
+        for domain, patterns in DOMAIN_PATTERNS.items()
+    ]
+
+    # Paths to remember inferred domains for
+    PATH_CACHE_SIZE = 10000
+
+    def __init__(self):
+        self._path_domains: dict[str, tuple[str, ...]] = {}
+
     def cluster(
         self,
         agents: list[dict],
@@ -87,27 +144,26 @@ class ConflictClusterer:
                 shared_files=agents[0].get("files", []),
             )]
 
-        # Build adjacency based on clustering strategy
-        if by == "file":
-            adjacency = self._build_file_adjacency(agents)
-        elif by == "domain":
-            adjacency = self._build_domain_adjacency(agents)
-        else:  # both
-            file_adj = self._build_file_adjacency(agents)
-            domain_adj = self._build_domain_adjacency(agents)
-            # Merge adjacencies
-            adjacency = defaultdict(set)
-            for agent_id, neighbors in file_adj.items():
-                adjacency[agent_id].update(neighbors)
-            for agent_id, neighbors in domain_adj.items():
-                adjacency[agent_id].update(neighbors)
-
-        # Find connected components
-        clusters = self._find_connected_components(agents, adjacency)
+        agent_ids = list(dict.fromkeys(a["id"] for a in agents))
+        domains_by_agent = {a["id"]: self._agent_domains(a) for a in agents}
+        sets = _DisjointSet(agent_ids)
+
+        # Union agents sharing an index key, based on clustering strategy
+        if by in ("file", "both"):
+            for agent_group in self._build_file_index(agents).values():
+                sets.union_all(agent_group)
+        if by in ("domain", "both"):
+            for agent_group in self._build_domain_index(agents, domains_by_agent).values():
+                sets.union_all(agent_group)
+
+        clusters = self._find_connected_components(agent_ids, sets)
 
         # Enrich clusters with shared files/domains
+        agents_by_id = {}
+        for agent in agents:
+            agents_by_id.setdefault(agent["id"], agent)
         for cluster in clusters:
-            self._enrich_cluster(cluster, agents)
+            self._enrich_cluster(cluster, agents_by_id, domains_by_agent)
 
         return clusters
 
@@ -141,171 +197,125 @@ class ConflictClusterer:
         # Build dependency graph
         id_to_cluster = {c["id"]: c for c in cluster_dicts}
         in_degree = {c["id"]: 0 for c in cluster_dicts}
+        dependents = defaultdict(list)
 
         for cluster in cluster_dicts:
             for dep_id in cluster.get("depends_on", []):
                 if dep_id in in_degree:
                     in_degree[cluster["id"]] += 1
+            for dep_id in dict.fromkeys(cluster.get("depends_on", [])):
+                dependents[dep_id].append(cluster["id"])
 
         # Kahn's algorithm for topological sort
-        queue = [cid for cid, degree in in_degree.items() if degree == 0]
+        queue = deque(cid for cid, degree in in_degree.items() if degree == 0)
         ordered = []
 
         while queue:
-            current_id = queue.pop(0)
+            current_id = queue.popleft()
             ordered.append(id_to_cluster[current_id])
 
             # Reduce in-degree for dependent clusters
-            for cluster in cluster_dicts:
-                if current_id in cluster.get("depends_on", []):
-                    in_degree[cluster["id"]] -= 1
-                    if in_degree[cluster["id"]] == 0:
-                        queue.append(cluster["id"])
+            for dependent_id in dependents[current_id]:
+                in_degree[dependent_id] -= 1
+                if in_degree[dependent_id] == 0:
+                    queue.append(dependent_id)
 
         # Handle cycles (shouldn't happen, but be safe)
-        remaining = [c for c in cluster_dicts if c not in ordered]
-        ordered.extend(remaining)
+        ordered_ids = {id(c) for c in ordered}
+        ordered.extend(c for c in cluster_dicts if id(c) not in ordered_ids)
 
         return ordered
 
-    def _build_file_adjacency(
-        self,
-        agents: list[dict],
-    ) -> dict[str, set[str]]:
-        """Build adjacency graph based on shared files."""
-        adjacency = defaultdict(set)
-
-        # Map files to agents
+    def _build_file_index(self, agents: list[dict]) -> dict[str, set[str]]:
+        """Map each file to the agents touching it."""
         file_to_agents = defaultdict(set)
         for agent in agents:
             agent_id = agent["id"]
             for file_path in agent.get("files", []):
                 file_to_agents[file_path].add(agent_id)
+        return file_to_agents
 
-        # Agents sharing files are adjacent
-        for file_path, agent_ids in file_to_agents.items():
-            agent_list = list(agent_ids)
-            for i, a1 in enumerate(agent_list):
-                for a2 in agent_list[i + 1:]:
-                    adjacency[a1].add(a2)
-                    adjacency[a2].add(a1)
-
-        return adjacency
-
-    def _build_domain_adjacency(
+    def _build_domain_index(
         self,
         agents: list[dict],
+        domains_by_agent: dict[str, list[str]],
     ) -> dict[str, set[str]]:
-        """Build adjacency graph based on shared domains."""
-        adjacency = defaultdict(set)
-
-        # Map domains to agents
+        """Map each domain to the agents working in it."""
         domain_to_agents = defaultdict(set)
         for agent in agents:
             agent_id = agent["id"]
-            domains = agent.get("domains", self._infer_domains(agent.get("files", [])))
-            for domain in domains:
+            for domain in domains_by_agent[agent_id]:
                 domain_to_agents[domain].add(agent_id)
+        return domain_to_agents
 
-        # Agents sharing domains are adjacent
-        for domain, agent_ids in domain_to_agents.items():
-            agent_list = list(agent_ids)
-            for i, a1 in enumerate(agent_list):
-                for a2 in agent_list[i + 1:]:
-                    adjacency[a1].add(a2)
-                    adjacency[a2].add(a1)
-
-        return adjacency
+    def _agent_domains(self, agent: dict) -> list[str]:
+        """Domains given for an agent, or inferred from its files."""
+        if "domains" in agent:
+            return agent["domains"]
+        return self._infer_domains(agent.get("files", []))
 
     def _infer_domains(self, files: list[str]) -> list[str]:
         """Infer domains from file paths."""
         domains = set()
-
-        domain_patterns = {
-            "auth": ["auth", "login", "session", "permission"],
-            "api": ["api/", "routes", "endpoints", "handlers"],
-            "database": ["models", "migrations", "schema", "db"],
-            "ui": ["components", "views", "pages", "templates"],
-            "config": ["config", "settings"],
-        }
+        cache = self._path_domains
 
         for file_path in files:
-            path_lower = file_path.lower()
-            for domain, patterns in domain_patterns.items():
-                if any(p in path_lower for p in patterns):
-                    domains.add(domain)
+            path_domains = cache.get(file_path)
+            if path_domains is None:
+                path_lower = file_path.lower()
+                path_domains = tuple(
+                    domain for domain, regex in self._DOMAIN_REGEXES
+                    if regex.search(path_lower)
+                )
+                if len(cache) >= self.PATH_CACHE_SIZE:
+                    cache.clear()
+                cache[file_path] = path_domains
+            domains.update(path_domains)
 
         return list(domains)
 
     def _find_connected_components(
         self,
-        agents: list[dict],
-        adjacency: dict[str, set[str]],
+        agent_ids: list[str],
+        sets: _DisjointSet,
     ) -> list[ConflictCluster]:
-        """Find connected components in the agent graph."""
-        visited = set()
-        clusters = []
-        cluster_idx = 0
-
-        agent_ids = [a["id"] for a in agents]
-
+        """Turn disjoint sets into clusters, ordered by first agent."""
+        components: dict[str, list[str]] = {}
         for agent_id in agent_ids:
-            if agent_id in visited:
-                continue
+            components.setdefault(sets.find(agent_id), []).append(agent_id)
 
-            # BFS to find all connected agents
-            component = []
-            queue = [agent_id]
-
-            while queue:
-                current = queue.pop(0)
-                if current in visited:
-                    continue
-
-                visited.add(current)
-                component.append(current)
-
-                for neighbor in adjacency.get(current, []):
-                    if neighbor not in visited:
-                        queue.append(neighbor)
-
-            # Create cluster from component
-            clusters.append(ConflictCluster(
+        return [
+            ConflictCluster(
                 id=f"cluster-{cluster_idx}",
                 cluster_type="file",
                 agent_ids=component,
-            ))
-            cluster_idx += 1
-
-        return clusters
+            )
+            for cluster_idx, component in enumerate(components.values())
+        ]
 
     def _enrich_cluster(
         self,
         cluster: ConflictCluster,
-        agents: list[dict],
+        agents_by_id: dict[str, dict],
+        domains_by_agent: dict[str, list[str]],
     ) -> None:
         """Add shared files and domains to cluster."""
         # Get all agents in this cluster
-        cluster_agents = [a for a in agents if a["id"] in cluster.agent_ids]
+        cluster_agents = [agents_by_id[agent_id] for agent_id in cluster.agent_ids]
 
         if len(cluster_agents) < 2:
             return
 
         # Find shared files
-        file_sets = [set(a.get("files", [])) for a in cluster_agents]
-        shared_files = file_sets[0]
-        for fs in file_sets[1:]:
-            shared_files = shared_files & fs
+        shared_files = set(cluster_agents[0].get("files", []))
+        for agent in cluster_agents[1:]:
+            shared_files.intersection_update(agent.get("files", []))
         cluster.shared_files = list(shared_files)
 
         # Find shared domains
-        domain_sets = [
-            set(a.get("domains", self._infer_domains(a.get("files", []))))
-            for a in cluster_agents
-        ]
-        shared_domains = domain_sets[0]
-        for ds in domain_sets[1:]:
-            shared_domains = shared_domains & ds
+        shared_domains = set(domains_by_agent[cluster.agent_ids[0]])
+        for agent_id in cluster.agent_ids[1:]:
+            shared_domains.intersection_update(domains_by_agent[agent_id])
         cluster.shared_domains = list(shared_domains)
 
         # Assess complexity
@@ -8,11 +8,12 @@ like package.json, requirements.txt, Cargo.toml, etc.
 import json
 import logging
 import re
-import subprocess
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
+from ..git_objects import GitObjectReader
+
 logger = logging.getLogger(__name__)
 
 
@@ -49,6 +50,14 @@ class DependencyAnalyzer:
         "go": ["go.mod", "go.sum"],
     }
 
+    def __init__(self, object_reader: Optional[GitObjectReader] = None):
+        """
+        Args:
+            object_reader: Reader for files at branches (shared with other
+                analyzers to reuse its git process and blob cache)
+        """
+        self.object_reader = object_reader or GitObjectReader()
+
     def analyze(
         self,
         branches: list[str],
@@ -173,14 +182,7 @@ class DependencyAnalyzer:
 
     def _get_file_from_branch(self, branch: str, file_path: str) -> Optional[str]:
         """Get file contents from a specific branch."""
-        result = subprocess.run(
-            ["git", "show", f"{branch}:{file_path}"],
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode == 0:
-            return result.stdout
-        return None
+        return self.object_reader.read(branch, file_path)
 
     def _parse_dependency_file(
         self,
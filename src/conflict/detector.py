@@ -13,8 +13,10 @@ A merge can be "git clean" but still broken (semantic conflicts).
 import logging
 import re
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
+from itertools import combinations
 from typing import Optional
 
 logger = logging.getLogger(__name__)
@@ -41,6 +43,14 @@ class ConflictSeverity(Enum):
     CRITICAL = "critical"  # Definitely needs human input
 
 
+_SEVERITY_ORDER = [
+    ConflictSeverity.LOW,
+    ConflictSeverity.MEDIUM,
+    ConflictSeverity.HIGH,
+    ConflictSeverity.CRITICAL,
+]
+
+
 # ============================================================================
 # Data Classes
 # ============================================================================
@@ -72,6 +82,9 @@ class ConflictInfo:
     # For fast-path: if no conflicts, this is the merged tree SHA
     merged_tree_sha: Optional[str] = None
 
+    # For 3+ branches: every pairwise result behind this summary
+    conflict_matrix: Optional["ConflictMatrix"] = None
+
     @property
     def is_fast_path(self) -> bool:
         """Can this be fast-path merged without resolution?"""
@@ -83,6 +96,36 @@ class ConflictInfo:
         return len(self.conflicting_files)
 
 
+@dataclass
+class ConflictMatrix:
+    """Pairwise textual conflict results for a set of branches."""
+    base_branch: str
+    branches: list[str]
+
+    # (branch1, branch2) -> result, in the order of `branches`.
+    # Pairs that cannot conflict (disjoint changed files) are not checked
+    # and have no entry.
+    pairs: dict[tuple[str, str], ConflictInfo] = field(default_factory=dict)
+    skipped_pairs: int = 0
+
+    @property
+    def has_conflicts(self) -> bool:
+        """Does any pair of branches conflict?"""
+        return any(info.has_conflicts for info in self.pairs.values())
+
+    def conflicts(self) -> list[ConflictInfo]:
+        """Results for the conflicting pairs."""
+        return [info for info in self.pairs.values() if info.has_conflicts]
+
+    def conflicting_with(self, branch: str) -> list[str]:
+        """Branches that conflict with the given branch."""
+        others = []
+        for (branch1, branch2), info in self.pairs.items():
+            if info.has_conflicts and branch in (branch1, branch2):
+                others.append(branch2 if branch == branch1 else branch1)
+        return others
+
+
 # ============================================================================
 # Conflict Detector
 # ============================================================================
@@ -95,8 +138,12 @@ class ConflictDetector:
     Phase 2+: Will add build testing, semantic analysis.
     """
 
-    def __init__(self, base_branch: str = "main"):
+    # Concurrent git processes used for N-way detection
+    DEFAULT_MAX_WORKERS = 8
+
+    def __init__(self, base_branch: str = "main", max_workers: int = DEFAULT_MAX_WORKERS):
         self.base_branch = base_branch
+        self.max_workers = max_workers
 
     def detect(self, branches: list[str]) -> ConflictInfo:
         """
@@ -136,32 +183,27 @@ class ConflictDetector:
         Detect conflicts between multiple branches.
 
         Strategy:
-        1. Find common merge base
-        2. Try to merge all branches together
-        3. Parse results for conflicts
+        1. Check each branch against base (one batched merge-tree run)
+        2. Check every pair of branches against each other
+        3. Report all conflicting pairs
         """
         # First, check if branches can merge with base individually
-        individual_conflicts = []
+        against_base = self._merge_tree_many([(self.base_branch, branch) for branch in branches])
         for branch in branches:
-            result = self._detect_single_branch(branch)
+            result = against_base[(self.base_branch, branch)]
             if result.has_conflicts:
-                individual_conflicts.append((branch, result))
-
-        if individual_conflicts:
-            # Return the first conflict found
-            # (Full multi-branch conflict detection is Phase 2+)
-            branch, result = individual_conflicts[0]
-            logger.warning(f"Branch {branch} has conflicts with {self.base_branch}")
-            return result
+                # Conflicts with base are reported first, as they must be
+                # resolved before the branches can be compared meaningfully
+                logger.warning(f"Branch {branch} has conflicts with {self.base_branch}")
+                result.branches = [branch]
+                return result
 
         # All branches merge cleanly with base individually
         # Now check if they conflict with each other
         if len(branches) == 2:
             return self._detect_pairwise(branches[0], branches[1])
 
-        # For 3+ branches, use sequential merge approach (MVP)
-        # Full N-way conflict detection is Phase 2+
-        return self._detect_sequential(branches)
+        return self._detect_nway(branches)
 
     def _detect_pairwise(self, branch1: str, branch2: str) -> ConflictInfo:
         """Detect conflicts between two branches."""
@@ -177,23 +219,232 @@ class ConflictDetector:
         result = self._run_merge_tree(merge_base, branch1, branch2)
         return self._parse_merge_tree_result(result, [branch1, branch2])
 
-    def _detect_sequential(self, branches: list[str]) -> ConflictInfo:
+    def _detect_nway(self, branches: list[str]) -> ConflictInfo:
+        """
+        Detect conflicts among 3+ branches from the full conflict matrix.
+
+        Returns one result covering every conflicting pair; the pairwise
+        results are in its conflict_matrix.
+        """
+        matrix = self.detect_matrix(branches)
+        conflicts = matrix.conflicts()
+        if not conflicts:
+            result = self._no_conflict_result(branches)
+            result.conflict_matrix = matrix
+            return result
+
+        involved = set()
+        files: dict[str, ConflictFile] = {}
+        outputs = []
+        for info in conflicts:
+            logger.warning(f"Conflict detected between {info.branches[0]} and {info.branches[1]}")
+            involved.update(info.branches)
+            for conflict_file in info.conflicting_files:
+                files.setdefault(conflict_file.file_path, conflict_file)
+            outputs.append(f"{info.branches[0]} <-> {info.branches[1]}:\n{info.merge_tree_output}")
+
+        conflicting_files = list(files.values())
+        return ConflictInfo(
+            has_conflicts=True,
+            conflict_type=ConflictType.TEXTUAL,
+            severity=max(
+                (info.severity for info in conflicts),
+                key=_SEVERITY_ORDER.index,
+            ),
+            base_branch=self.base_branch,
+            branches=[branch for branch in branches if branch in involved],
+            conflicting_files=conflicting_files,
+            merge_tree_output="\n\n".join(outputs),
+            conflict_matrix=matrix,
+        )
+
+    def detect_matrix(self, branches: list[str]) -> ConflictMatrix:
+        """
+        Check every pair of branches for textual conflicts.
+
+        Pairs whose changes (relative to the same merge base with the base
+        branch) touch disjoint files cannot conflict and are skipped, unless
+        a file changed on one branch is a directory containing changes on
+        the other (a file/directory conflict). The rest are checked with batched `git merge-tree --stdin` runs spread
+        over up to max_workers processes.
+
+        Args:
+            branches: Branch names
+
+        Returns:
+            ConflictMatrix with a result per checked pair
+        """
+        changes = self._changed_files(branches)
+
+        to_check = []
+        skipped = 0
+        for branch1, branch2 in combinations(branches, 2):
+            change1, change2 = changes.get(branch1), changes.get(branch2)
+            if (
+                change1 is not None
+                and change2 is not None
+                and change1[0] == change2[0]
+                and change1[1].isdisjoint(change2[1])
+                and change1[1].isdisjoint(change2[2])
+                and change2[1].isdisjoint(change1[2])
+            ):
+                skipped += 1
+                continue
+            to_check.append((branch1, branch2))
+
+        logger.debug(
+            f"Conflict matrix: {len(to_check)} pairs to check, "
+            f"{skipped} skipped (disjoint changes)"
+        )
+        return ConflictMatrix(
+            base_branch=self.base_branch,
+            branches=list(branches),
+            pairs=self._merge_tree_many(to_check),
+            skipped_pairs=skipped,
+        )
+
+    def _changed_files(
+        self, branches: list[str]
+    ) -> dict[str, tuple[str, frozenset[str], frozenset[str]]]:
+        """
+        Files each branch changed since its merge base with the base branch.
+
+        Returns:
+            branch -> (merge base, changed files, directories containing
+            them); branches whose changes could not be determined are
+            omitted
+        """
+        def changed(branch: str) -> Optional[tuple[str, frozenset[str], frozenset[str]]]:
+            merge_base = self._get_merge_base(self.base_branch, branch)
+            if not merge_base:
+                return None
+            result = subprocess.run(
+                ["git", "diff", "--name-only", "--no-renames", merge_base, branch],
+                capture_output=True,
+                text=True
+            )
+            if result.returncode != 0:
+                return None
+            files = result.stdout.splitlines()
+            directories = set()
+            for path in files:
+                while "/" in path:
+                    path = path.rsplit("/", 1)[0]
+                    if path in directories:
+                        break
+                    directories.add(path)
+            return merge_base, frozenset(files), frozenset(directories)
+
+        with ThreadPoolExecutor(max_workers=max(1, self.max_workers)) as pool:
+            results = pool.map(changed, branches)
+            return {
+                branch: change
+                for branch, change in zip(branches, results)
+                if change is not None
+            }
+
+    def _merge_tree_many(self, pairs: list[tuple[str, str]]) -> dict[tuple[str, str], ConflictInfo]:
+        """
+        Check many pairs of refs, splitting them into concurrent batches.
+
+        Returns:
+            (ref1, ref2) -> ConflictInfo for every pair
+        """
+        if not pairs:
+            return {}
+
+        workers = max(1, min(self.max_workers, len(pairs)))
+        size = -(-len(pairs) // workers)
+        batches = [pairs[i:i + size] for i in range(0, len(pairs), size)]
+
+        results: dict[tuple[str, str], ConflictInfo] = {}
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for batch_results in pool.map(self._merge_tree_batch, batches):
+                results.update(batch_results)
+        return results
+
+    def _merge_tree_batch(self, pairs: list[tuple[str, str]]) -> dict[tuple[str, str], ConflictInfo]:
         """
-        Detect conflicts by sequentially merging branches.
+        Check pairs of refs with one `git merge-tree --stdin` process.
 
-        This is a simplified approach for MVP. Full graph-based
-        conflict detection is Phase 2+.
+        git computes each pair's merge base itself. If the batch fails
+        (git older than 2.38, or an unknown ref aborting the run), pairs
+        without a result are checked one at a time.
         """
-        # Check each pair of branches
-        for i, branch1 in enumerate(branches):
-            for branch2 in branches[i + 1:]:
-                result = self._detect_pairwise(branch1, branch2)
-                if result.has_conflicts:
-                    logger.warning(f"Conflict detected between {branch1} and {branch2}")
-                    return result
+        result = subprocess.run(
+            ["git", "merge-tree", "--stdin", "--name-only", "--no-messages"],
+            input="".join(f"{ref1} {ref2}\n" for ref1, ref2 in pairs),
+            capture_output=True,
+            text=True
+        )
+
+        results = {}
+        records = self._parse_merge_tree_stdin(result.stdout)
+        for (ref1, ref2), (clean, tree_sha, paths) in zip(pairs, records):
+            results[(ref1, ref2)] = self._merge_result(clean, tree_sha, paths, [ref1, ref2])
 
-        # No conflicts found between any pairs
-        return self._no_conflict_result(branches)
+        for ref1, ref2 in pairs[len(results):]:
+            results[(ref1, ref2)] = self._detect_pairwise(ref1, ref2)
+        return results
+
+    @staticmethod
+    def _parse_merge_tree_stdin(output: str) -> list[tuple[bool, str, list[str]]]:
+        """
+        Parse `git merge-tree --stdin --name-only --no-messages` output.
+
+        Each merge is NUL-separated: status (1 clean, 0 conflicts), tree
+        OID, conflicted paths, then an empty field.
+
+        Returns:
+            (clean, tree SHA, conflicted paths) per complete merge
+        """
+        fields = output.split("\0")
+        records = []
+        i = 0
+        while i + 2 < len(fields) and fields[i] in ("0", "1"):
+            clean = fields[i] == "1"
+            tree_sha = fields[i + 1]
+            i += 2
+            paths = []
+            while i < len(fields) and fields[i] != "":
+                paths.append(fields[i])
+                i += 1
+            if i >= len(fields):
+                break  # truncated record
+            records.append((clean, tree_sha, list(dict.fromkeys(paths))))
+            i += 1
+        return records
+
+    def _merge_result(
+        self,
+        clean: bool,
+        tree_sha: str,
+        paths: list[str],
+        branches: list[str],
+    ) -> ConflictInfo:
+        """Build a ConflictInfo from one parsed merge-tree result."""
+        output = "\n".join([tree_sha] + paths)
+        if clean:
+            return ConflictInfo(
+                has_conflicts=False,
+                conflict_type=ConflictType.NONE,
+                severity=ConflictSeverity.LOW,
+                base_branch=self.base_branch,
+                branches=branches,
+                merged_tree_sha=tree_sha,
+                merge_tree_output=output,
+            )
+
+        conflicting_files = [ConflictFile(file_path=path) for path in paths]
+        return ConflictInfo(
+            has_conflicts=True,
+            conflict_type=ConflictType.TEXTUAL,
+            severity=self._assess_severity(conflicting_files),
+            base_branch=self.base_branch,
+            branches=branches,
+            conflicting_files=conflicting_files,
+            merge_tree_output=output,
+        )
 
     def _run_merge_tree(
         self,
@@ -208,15 +459,16 @@ class ConflictDetector:
         - Clean merge: just the tree SHA
         - Conflicts: conflict markers and file info
         """
-        # Modern git merge-tree (2.38+) with --write-tree
+        # Modern git merge-tree (2.38+) with --write-tree; it finds the
+        # merge base itself and does not accept one on the command line
         result = subprocess.run(
-            ["git", "merge-tree", "--write-tree", base, branch1, branch2],
+            ["git", "merge-tree", "--write-tree", branch1, branch2],
             capture_output=True,
             text=True
         )
 
-        # If modern merge-tree fails, try legacy format
-        if result.returncode != 0 and "unrecognized option" in result.stderr.lower():
+        # If modern merge-tree is not supported (usage error), try legacy format
+        if result.returncode == 129:
             result = subprocess.run(
                 ["git", "merge-tree", base, branch1, branch2],
                 capture_output=True,
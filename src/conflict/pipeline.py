@@ -22,6 +22,7 @@ from .build_tester import BuildTester, BuildTestResult
 from .dependency import DependencyAnalyzer, DependencyConflict
 from .semantic import SemanticAnalyzer, SemanticAnalysisResult
 from .clusterer import ConflictClusterer, ConflictCluster
+from ..git_objects import GitObjectReader
 
 logger = logging.getLogger(__name__)
 
@@ -98,10 +99,22 @@ class DetectionPipeline:
             build_command=build_command,
             test_command=test_command,
         )
-        self.dependency_analyzer = DependencyAnalyzer()
-        self.semantic_analyzer = SemanticAnalyzer()
+        # One cat-file reader serves file contents to both analyzers
+        self.object_reader = GitObjectReader()
+        self.dependency_analyzer = DependencyAnalyzer(object_reader=self.object_reader)
+        self.semantic_analyzer = SemanticAnalyzer(object_reader=self.object_reader)
         self.clusterer = ConflictClusterer()
 
+    def __enter__(self) -> "DetectionPipeline":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop the git processes behind the shared object reader."""
+        self.object_reader.close()
+
     def run(
         self,
         branches: list[str],
@@ -282,8 +295,8 @@ def run_detection_pipeline(
     Returns:
         PipelineResult with all detection results
     """
-    pipeline = DetectionPipeline(
+    with DetectionPipeline(
         base_branch=base_branch,
         skip_build_test=skip_build_test,
-    )
-    return pipeline.run(branches)
+    ) as pipeline:
+        return pipeline.run(branches)
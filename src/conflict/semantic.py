@@ -15,6 +15,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
+from ..git_objects import GitObjectReader
+
 logger = logging.getLogger(__name__)
 
 
@@ -105,6 +107,14 @@ class SemanticAnalyzer:
         ],
     }
 
+    def __init__(self, object_reader: Optional[GitObjectReader] = None):
+        """
+        Args:
+            object_reader: Reader for files at branches (shared with other
+                analyzers to reuse its git process and blob cache)
+        """
+        self.object_reader = object_reader or GitObjectReader()
+
     def analyze(
         self,
         branches: list[str],
@@ -256,14 +266,7 @@ class SemanticAnalyzer:
 
     def _get_file_from_branch(self, branch: str, file_path: str) -> Optional[str]:
         """Get file contents from a specific branch."""
-        result = subprocess.run(
-            ["git", "show", f"{branch}:{file_path}"],
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode == 0:
-            return result.stdout
-        return None
+        return self.object_reader.read(branch, file_path)
 
     def _classify_files_by_domain(self, files: list[str]) -> dict[str, list[str]]:
         """Classify files into domains based on path patterns."""
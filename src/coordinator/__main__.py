@@ -171,7 +171,10 @@ class Coordinator:
         self.dry_run = dry_run
         self.formatter = formatter or ConsoleFormatter()
 
-        self.discovery = AgentDiscovery(base_branch=base_branch)
+        self.discovery = AgentDiscovery(
+            base_branch=base_branch,
+            cache_path=Path(".claude/discovery_cache.json"),
+        )
         self.detector = ConflictDetector(base_branch=base_branch)
         self.merger = FastPathMerger(base_branch=base_branch)
 
@@ -12,11 +12,14 @@ Branch naming convention:
     - claude/refactor-api-ghi789
 """
 
+import json
 import logging
 import re
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from pathlib import Path
 from typing import Optional
 
 from .schema import (
@@ -59,6 +62,11 @@ class AgentDiscovery:
     - claude/*
     - agent/*
     - Optional custom patterns
+
+    Branch names, head SHAs and commit times come from a single
+    `git for-each-ref` call; merge bases and commits ahead are queried
+    concurrently. With a cache_path, results are kept between runs and
+    reused for branches whose head has not moved.
     """
 
     DEFAULT_PATTERNS = [
@@ -66,15 +74,22 @@ class AgentDiscovery:
         r"^agent/.*",
     ]
 
+    # Concurrent git processes for per-branch queries
+    DEFAULT_MAX_WORKERS = 8
+
     def __init__(
         self,
         base_branch: str = "main",
         patterns: Optional[list[str]] = None,
-        remote: str = "origin"
+        remote: str = "origin",
+        cache_path: Optional[Path] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
     ):
         self.base_branch = base_branch
         self.patterns = patterns or self.DEFAULT_PATTERNS
         self.remote = remote
+        self.cache_path = cache_path
+        self.max_workers = max_workers
         self._compiled_patterns = [re.compile(p) for p in self.patterns]
 
     def discover_branches(self, include_remote: bool = True) -> list[DiscoveredBranch]:
@@ -87,35 +102,73 @@ class AgentDiscovery:
         Returns:
             List of discovered branches with metadata
         """
-        branches = []
-
-        # Get local branches
-        local_branches = self._get_local_branches()
-        for branch in local_branches:
-            if self._matches_pattern(branch):
-                try:
-                    info = self._get_branch_info(branch, is_remote=False)
-                    if info:
-                        branches.append(info)
-                except Exception as e:
-                    logger.warning(f"Failed to get info for local branch {branch}: {e}")
-
-        # Get remote branches
         if include_remote:
-            remote_branches = self._get_remote_branches()
-            for branch in remote_branches:
-                # Strip remote prefix for pattern matching
-                short_name = branch.replace(f"{self.remote}/", "")
-                if self._matches_pattern(short_name):
-                    # Skip if we already have this as a local branch
-                    if short_name in [b.branch_name for b in branches]:
-                        continue
-                    try:
-                        info = self._get_branch_info(branch, is_remote=True)
-                        if info:
-                            branches.append(info)
-                    except Exception as e:
-                        logger.warning(f"Failed to get info for remote branch {branch}: {e}")
+            # Fetch first to ensure we have latest
+            subprocess.run(
+                ["git", "fetch", self.remote, "--prune"],
+                capture_output=True
+            )
+
+        refs = self._list_refs(include_remote)
+
+        # Local branches first; a remote branch is skipped if it is also local
+        candidates: dict[str, tuple[str, str, datetime]] = {}
+        for refname, short_name, head_sha, commit_time in refs:
+            if short_name in candidates or not self._matches_pattern(short_name):
+                continue
+            candidates[short_name] = (refname, head_sha, commit_time)
+
+        base_tip = self._resolve_base_tip(refs)
+        cached = self._load_cache(base_tip)
+
+        # Merge base and commits ahead: from cache, else queried concurrently
+        ancestry: dict[str, tuple[str, list[str]]] = {}
+        to_query = []
+        for short_name, (refname, head_sha, _) in candidates.items():
+            entry = cached.get(refname)
+            if entry and entry["head_sha"] == head_sha:
+                ancestry[short_name] = (entry["base_sha"], entry["ahead"])
+            else:
+                to_query.append((short_name, refname))
+
+        if to_query:
+            with ThreadPoolExecutor(max_workers=max(1, self.max_workers)) as pool:
+                results = pool.map(lambda item: self._query_ancestry(item[1]), to_query)
+                for (short_name, _), result in zip(to_query, results):
+                    if result:
+                        ancestry[short_name] = result
+
+        logger.debug(
+            f"Branch ancestry: {len(candidates) - len(to_query)} cached, "
+            f"{len(to_query)} queried"
+        )
+
+        branches = []
+        for short_name, (refname, head_sha, commit_time) in candidates.items():
+            ids = self._parse_branch_name(short_name)
+            if ids is None or short_name not in ancestry:
+                continue
+            session_id, agent_id = ids
+            base_sha, ahead = ancestry[short_name]
+            branches.append(DiscoveredBranch(
+                branch_name=short_name,
+                agent_id=agent_id,
+                session_id=session_id,
+                base_sha=base_sha,
+                head_sha=head_sha,
+                last_commit_time=commit_time,
+                commit_count=len(ahead),
+                is_ahead_of_base=len(ahead) > 0,
+            ))
+
+        self._save_cache(base_tip, {
+            candidates[name][0]: {
+                "head_sha": candidates[name][1],
+                "base_sha": base_sha,
+                "ahead": ahead,
+            }
+            for name, (base_sha, ahead) in ancestry.items()
+        })
 
         logger.info(f"Discovered {len(branches)} agent branches")
         return branches
@@ -124,42 +177,53 @@ class AgentDiscovery:
         """Check if branch name matches any agent pattern."""
         return any(p.match(branch_name) for p in self._compiled_patterns)
 
-    def _get_local_branches(self) -> list[str]:
-        """Get list of local branch names."""
-        result = subprocess.run(
-            ["git", "branch", "--format=%(refname:short)"],
-            capture_output=True,
-            text=True
-        )
-        if result.returncode != 0:
-            logger.error(f"Failed to list local branches: {result.stderr}")
-            return []
-        return [b.strip() for b in result.stdout.strip().split("\n") if b.strip()]
+    def _list_refs(self, include_remote: bool) -> list[tuple[str, str, str, datetime]]:
+        """
+        List branches with one `git for-each-ref` call.
 
-    def _get_remote_branches(self) -> list[str]:
-        """Get list of remote branch names."""
-        # Fetch first to ensure we have latest
-        subprocess.run(
-            ["git", "fetch", self.remote, "--prune"],
-            capture_output=True
-        )
+        Returns:
+            (refname, short name without remote prefix, head SHA, last
+            commit time) per branch, local branches first
+        """
+        ref_patterns = ["refs/heads"]
+        if include_remote:
+            ref_patterns.append(f"refs/remotes/{self.remote}")
 
         result = subprocess.run(
-            ["git", "branch", "-r", "--format=%(refname:short)"],
+            [
+                "git", "for-each-ref",
+                "--format=%(refname)%00%(objectname)%00%(committerdate:iso-strict)",
+                *ref_patterns,
+            ],
             capture_output=True,
             text=True
         )
         if result.returncode != 0:
-            logger.error(f"Failed to list remote branches: {result.stderr}")
+            logger.error(f"Failed to list branches: {result.stderr}")
             return []
-        return [b.strip() for b in result.stdout.strip().split("\n") if b.strip()]
 
-    def _get_branch_info(self, branch: str, is_remote: bool) -> Optional[DiscoveredBranch]:
-        """Get detailed info about a branch."""
-        # Get the short name (without remote prefix)
-        short_name = branch.replace(f"{self.remote}/", "") if is_remote else branch
-
-        # Extract session ID from branch name (last segment after final dash)
+        remote_prefix = f"refs/remotes/{self.remote}/"
+        refs = []
+        for line in result.stdout.splitlines():
+            fields = line.split("\0")
+            if len(fields) != 3:
+                continue
+            refname, head_sha, date = fields
+            if refname.startswith("refs/heads/"):
+                short_name = refname[len("refs/heads/"):]
+            elif refname.startswith(remote_prefix):
+                short_name = refname[len(remote_prefix):]
+            else:
+                continue
+            try:
+                commit_time = datetime.fromisoformat(date)
+            except ValueError:
+                commit_time = datetime.now(timezone.utc)
+            refs.append((refname, short_name, head_sha, commit_time))
+        return refs
+
+    def _parse_branch_name(self, short_name: str) -> Optional[tuple[str, str]]:
+        """Extract (session ID, agent ID) from a branch name."""
         parts = short_name.split("/", 1)
         if len(parts) < 2:
             return None
@@ -169,86 +233,113 @@ class AgentDiscovery:
         session_match = re.search(r"-([a-zA-Z0-9]+)$", branch_suffix)
         session_id = session_match.group(1) if session_match else branch_suffix[:8]
 
-        # Generate agent ID
-        agent_id = f"claude-{session_id}"
-
-        # Get base SHA (merge-base with main)
-        base_sha = self._get_merge_base(branch)
-        if not base_sha:
-            return None
-
-        # Get head SHA
-        head_sha = self._get_head_sha(branch)
-        if not head_sha:
-            return None
+        return session_id, f"claude-{session_id}"
 
-        # Get last commit time
-        last_commit_time = self._get_last_commit_time(branch)
-
-        # Get commit count ahead of base
-        commit_count = self._get_commits_ahead(branch, base_sha)
-
-        return DiscoveredBranch(
-            branch_name=short_name,
-            agent_id=agent_id,
-            session_id=session_id,
-            base_sha=base_sha,
-            head_sha=head_sha,
-            last_commit_time=last_commit_time,
-            commit_count=commit_count,
-            is_ahead_of_base=commit_count > 0,
-        )
+    def _resolve_base_tip(self, refs: list[tuple[str, str, str, datetime]]) -> Optional[str]:
+        """SHA of the base branch (from the listed refs when possible)."""
+        for refname, _, head_sha, _ in refs:
+            if refname in (
+                f"refs/heads/{self.base_branch}",
+                f"refs/remotes/{self.remote}/{self.base_branch}",
+            ):
+                return head_sha
 
-    def _get_merge_base(self, branch: str) -> Optional[str]:
-        """Get the merge base between branch and base branch."""
         result = subprocess.run(
-            ["git", "merge-base", self.base_branch, branch],
+            ["git", "rev-parse", "--verify", "--quiet", f"{self.base_branch}^{{commit}}"],
             capture_output=True,
             text=True
         )
-        if result.returncode != 0:
+        return result.stdout.strip() if result.returncode == 0 else None
+
+    def _query_ancestry(self, ref: str) -> Optional[tuple[str, list[str]]]:
+        """
+        Get a branch's merge base with the base branch and its commits ahead.
+
+        Returns:
+            (merge base SHA, SHAs of commits on the branch but not the base)
+        """
+        base_sha = self._get_merge_base(ref)
+        if not base_sha:
             return None
-        return result.stdout.strip()
 
-    def _get_head_sha(self, branch: str) -> Optional[str]:
-        """Get the HEAD SHA of a branch."""
         result = subprocess.run(
-            ["git", "rev-parse", branch],
+            ["git", "rev-list", f"{self.base_branch}..{ref}"],
             capture_output=True,
             text=True
         )
         if result.returncode != 0:
-            return None
-        return result.stdout.strip()
+            return base_sha, []
+        return base_sha, result.stdout.split()
 
-    def _get_last_commit_time(self, branch: str) -> datetime:
-        """Get the timestamp of the last commit on a branch."""
+    def _get_merge_base(self, branch: str) -> Optional[str]:
+        """Get the merge base between branch and base branch."""
         result = subprocess.run(
-            ["git", "log", "-1", "--format=%cI", branch],
+            ["git", "merge-base", self.base_branch, branch],
             capture_output=True,
             text=True
         )
         if result.returncode != 0:
-            return datetime.now(timezone.utc)
+            return None
+        return result.stdout.strip()
 
-        try:
-            return datetime.fromisoformat(result.stdout.strip())
-        except ValueError:
-            return datetime.now(timezone.utc)
+    # ------------------------------------------------------------------
+    # Incremental cache
+    # ------------------------------------------------------------------
 
-    def _get_commits_ahead(self, branch: str, base_sha: str) -> int:
-        """Count commits on branch ahead of base."""
+    def _load_cache(self, base_tip: Optional[str]) -> dict[str, dict]:
+        """
+        Cached ancestry that is still valid for the current base tip.
+
+        If the base branch moved forward since the cache was written, a
+        branch's merge base and commits ahead change only if some of its
+        commits ahead are now on the base branch, so only those entries
+        are dropped. If the base moved any other way, nothing is reused.
+        """
+        if self.cache_path is None or base_tip is None or not self.cache_path.exists():
+            return {}
+        try:
+            cache = json.loads(self.cache_path.read_text())
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable discovery cache: {e}")
+            return {}
+
+        if cache.get("base_branch") != self.base_branch:
+            return {}
+        branches = cache.get("branches", {})
+        old_tip = cache.get("base_tip")
+        if old_tip == base_tip:
+            return branches
+
+        # Commits now on the base branch that were not before
         result = subprocess.run(
-            ["git", "rev-list", "--count", f"{base_sha}..{branch}"],
+            ["git", "rev-list", f"{old_tip}..{base_tip}"],
             capture_output=True,
             text=True
         )
-        if result.returncode != 0:
-            return 0
+        ancestor = subprocess.run(
+            ["git", "merge-base", "--is-ancestor", str(old_tip), base_tip],
+            capture_output=True
+        )
+        if result.returncode != 0 or ancestor.returncode != 0:
+            return {}
+        landed = set(result.stdout.split())
+        return {
+            ref: entry for ref, entry in branches.items()
+            if landed.isdisjoint(entry["ahead"])
+        }
+
+    def _save_cache(self, base_tip: Optional[str], branches: dict[str, dict]) -> None:
+        if self.cache_path is None or base_tip is None:
+            return
         try:
-            return int(result.stdout.strip())
-        except ValueError:
-            return 0
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self.cache_path.write_text(json.dumps({
+                "base_branch": self.base_branch,
+                "base_tip": base_tip,
+                "branches": branches,
+            }))
+        except OSError as e:
+            logger.warning(f"Failed to write discovery cache: {e}")
 
     def derive_manifest(self, branch: DiscoveredBranch) -> DerivedManifest:
         """
@@ -5,6 +5,7 @@ Provides enforcement mechanisms for workflow steps:
 - Hard gates: Commands run by orchestrator, cannot be skipped
 - Evidence requirements: Structured output proving engagement
 - Skip reasoning validation: Substantive justification for skips
+- Result cache: Passing verifications reused on an unchanged tree
 """
 
 from .evidence import (
@@ -26,6 +27,10 @@ from .gates import (
     GateResult,
     HardGateExecutor,
 )
+from .result_cache import (
+    VerificationResultCache,
+    working_tree_hash,
+)
 
 __all__ = [
     # Evidence
@@ -44,4 +49,7 @@ __all__ = [
     # Gates
     "GateResult",
     "HardGateExecutor",
+    # Result cache
+    "VerificationResultCache",
+    "working_tree_hash",
 ]
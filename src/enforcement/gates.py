@@ -12,6 +12,7 @@ from pathlib import Path
 from typing import Optional
 from pydantic import BaseModel
 
+from .result_cache import VerificationResultCache
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +26,7 @@ class GateResult(BaseModel):
     command: str = ""
     error: Optional[str] = None
     duration_seconds: Optional[float] = None
+    cached: bool = False  # Served from the verification result cache
 
 
 class HardGateExecutor:
@@ -52,7 +54,8 @@ class HardGateExecutor:
         self,
         command: str,
         working_dir: Path,
-        env: Optional[dict] = None
+        env: Optional[dict] = None,
+        result_cache: Optional[VerificationResultCache] = None
     ) -> GateResult:
         """
         Execute a hard gate command.
@@ -61,10 +64,31 @@ class HardGateExecutor:
             command: The command to execute
             working_dir: Working directory for execution
             env: Optional environment variables
+            result_cache: If given, a pass recorded for the same tree, command
+                and environment is returned without running the command
 
         Returns:
             GateResult with success status and output
         """
+        cache_key = result_cache.key_for(working_dir, command, env) if result_cache else None
+        if cache_key:
+            cached = result_cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"Hard gate passed on an unchanged tree, skipping: {command}")
+                return GateResult(**{**cached, "cached": True})
+
+        result = self._run(command, working_dir, env)
+        if cache_key and result.success:
+            result_cache.put(cache_key, result.model_dump(exclude={"cached"}))
+        return result
+
+    def _run(
+        self,
+        command: str,
+        working_dir: Path,
+        env: Optional[dict] = None
+    ) -> GateResult:
+        """Run the command and build its GateResult."""
         import time
         import os
 
@@ -0,0 +1,215 @@
+"""
+Verification result cache.
+
+Re-running `complete` on an item whose verification command already passed
+against the exact same working tree would re-execute the whole command (often
+the full test suite). Passing results are cached content-addressed by:
+
+- a hash of the working tree: git's index entries for tracked files plus the
+  content hashes of modified and untracked (non-ignored) files
+- the command after template substitution
+- a fingerprint of the environment variables that commonly change results
+
+Any edit to the tree, the command or that environment produces a new key, so
+a stale result is never served. Failing results are not cached, so flaky or
+fixed-elsewhere failures are always re-run.
+
+Entries are JSON files in .orchestrator/verification_cache/, expire after a
+TTL and are evicted least-recently-used beyond a size bound.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 24 * 60 * 60
+DEFAULT_MAX_ENTRIES = 256
+GIT_TIMEOUT_SECONDS = 30
+
+# Orchestrator bookkeeping that changes on every transition and never affects
+# verification results
+EXCLUDED_PATHS = (
+    ".orchestrator",
+    ".claude",
+    ".workflow_state.json",
+    ".workflow_log.jsonl",
+    ".workflow_checkpoints",
+)
+
+# Environment variables that commonly change what a verification command does
+ENV_FINGERPRINT_VARS = (
+    "PATH",
+    "VIRTUAL_ENV",
+    "CONDA_PREFIX",
+    "PYTHONPATH",
+    "NODE_ENV",
+    "CI",
+)
+
+
+def _git(working_dir: Path, *args: str, stdin: Optional[bytes] = None) -> Optional[bytes]:
+    try:
+        proc = subprocess.run(
+            ["git", *args],
+            cwd=working_dir,
+            input=stdin,
+            capture_output=True,
+            timeout=GIT_TIMEOUT_SECONDS,
+        )
+    except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
+        return None
+    if proc.returncode != 0:
+        return None
+    return proc.stdout
+
+
+def working_tree_hash(working_dir: Path) -> Optional[str]:
+    """
+    Hash the tracked and dirty files of the git working tree at `working_dir`.
+
+    Blob hashes come from git itself (the index for clean files, `git
+    hash-object` for modified and untracked ones), so unchanged files are not
+    re-read and nothing is written to the object database.
+
+    Returns:
+        Hex digest, or None if `working_dir` is not inside a git work tree.
+    """
+    pathspec = ["--", "."] + [f":(exclude){path}" for path in EXCLUDED_PATHS]
+
+    staged = _git(working_dir, "ls-files", "--stage", "-z", *pathspec)
+    dirty = _git(working_dir, "ls-files", "-z", "--modified", "--others", "--exclude-standard", *pathspec)
+    if staged is None or dirty is None:
+        return None
+
+    digest = hashlib.sha256(staged)
+    dirty_paths = sorted({p for p in dirty.decode("utf-8", "surrogateescape").split("\0") if p})
+    present = [p for p in dirty_paths if os.path.isfile(os.path.join(working_dir, p))]
+    if present:
+        hashes = _git(working_dir, "hash-object", "--stdin-paths", stdin="\n".join(present).encode("utf-8", "surrogateescape"))
+        if hashes is None:
+            return None
+        blobs = dict(zip(present, hashes.decode().split()))
+    else:
+        blobs = {}
+    for path in dirty_paths:
+        # Deleted tracked files show up as modified with no blob
+        digest.update(f"\0{path}\0{blobs.get(path, 'deleted')}".encode("utf-8", "surrogateescape"))
+    return digest.hexdigest()
+
+
+def env_fingerprint(env: Optional[dict] = None) -> str:
+    """Fingerprint the result-relevant environment, including explicit overrides."""
+    values = {name: os.environ.get(name) for name in ENV_FINGERPRINT_VARS}
+    values.update(env or {})
+    content = json.dumps(values, sort_keys=True, default=str)
+    return hashlib.sha256(content.encode()).hexdigest()[:16]
+
+
+class VerificationResultCache:
+    """Content-addressed store of passing verification results."""
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+
+    def key_for(
+        self,
+        working_dir: Path,
+        command: str,
+        env: Optional[dict] = None,
+        extra: Optional[dict] = None,
+    ) -> Optional[str]:
+        """
+        Cache key for running `command` in the current state of `working_dir`.
+
+        Args:
+            working_dir: Directory the command runs in
+            command: Command after template substitution
+            env: Environment overrides passed to the command
+            extra: Anything else that decides pass/fail (e.g. expected exit code)
+
+        Returns:
+            Key, or None if the tree cannot be hashed (not a git repository).
+        """
+        tree = working_tree_hash(Path(working_dir))
+        if tree is None:
+            return None
+        content = json.dumps(
+            [tree, str(Path(working_dir).resolve()), command, env_fingerprint(env), extra or {}],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[dict]:
+        """Return the cached result for `key`, or None if missing or expired."""
+        path = self._entry_path(key)
+        try:
+            with open(path) as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.debug(f"Discarding unreadable verification cache entry {path}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+
+        if time.time() - entry.get("created_at", 0) > self.ttl_seconds:
+            path.unlink(missing_ok=True)
+            return None
+
+        try:
+            os.utime(path)  # Recency for LRU eviction
+        except OSError:
+            pass
+        return entry.get("result")
+
+    def put(self, key: str, result: dict) -> None:
+        """Store a passing result and evict beyond max_entries."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        entry = {"created_at": time.time(), "result": result}
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(entry, f, default=str)
+            os.replace(temp_path, self._entry_path(key))
+        except OSError as e:
+            logger.debug(f"Failed to write verification cache entry: {e}")
+            Path(temp_path).unlink(missing_ok=True)
+            return
+        self._evict()
+
+    def clear(self) -> None:
+        """Remove all cached results."""
+        for path in self.cache_dir.glob("*.json"):
+            path.unlink(missing_ok=True)
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def _evict(self) -> None:
+        entries = []
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                entries.append((path.stat().st_mtime, path))
+            except FileNotFoundError:
+                continue
+        if len(entries) <= self.max_entries:
+            return
+        entries.sort()
+        for _, path in entries[:len(entries) - self.max_entries]:
+            path.unlink(missing_ok=True)
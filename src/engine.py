@@ -11,9 +11,13 @@ import re
 import hashlib
 import fcntl
 import logging
+import os
+import resource
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Optional, Tuple
+from typing import Callable, Optional, Tuple
 import uuid
 
 # Configure logging
@@ -26,11 +30,15 @@ from .schema import (
 )
 from .enforcement import (
     HardGateExecutor,
+    VerificationResultCache,
     validate_skip_reasoning,
     validate_evidence_depth,
     get_evidence_schema,
 )
 from .path_resolver import OrchestratorPaths
+from .event_log import EventLogIndex, read_tail_lines
+from .state_journal import StateJournal, diff_state
+from .state_cache import file_fingerprint, get_state_cache
 
 # Template pattern for {{variable}} substitution
 _TEMPLATE_PATTERN = re.compile(r"\{\{(\w+)\}\}")
@@ -41,6 +49,12 @@ OUTPUT_TRUNCATE_LENGTH = 1000  # Max chars for stdout/stderr
 MIN_SKIP_REASON_LENGTH = 10  # Minimum characters for skip reason
 
 
+def _children_cpu_seconds() -> float:
+    """User + system CPU time of all terminated child processes."""
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
 class WorkflowEngine:
     """
     The core workflow engine that manages state transitions and verification.
@@ -60,12 +74,22 @@ class WorkflowEngine:
         # State and log file paths (session-aware)
         self.state_file = self.paths.state_file()
         self.log_file = self.paths.log_file()
+        self.event_index = EventLogIndex(self.log_file)
+        self.state_journal = StateJournal(self.state_file)
+        # Last persisted state (json form, without workflow_definition), the
+        # base that journaled saves diff against
+        self._journal_base: Optional[dict] = None
+        self._journal_definition: Optional[dict] = None
 
         self.workflow_def: Optional[WorkflowDef] = None
         self.state: Optional[WorkflowState] = None
         # Step enforcement
         self.gate_executor = HardGateExecutor()
         self.max_gate_retries = 3
+        # item_id -> command verification outcome computed ahead of complete_item
+        # by complete_phase_items (a GateResult for gate steps, otherwise the
+        # _run_verification tuple); consumed once
+        self._prefetched_verifications: dict = {}
         # Typed settings (loaded from workflow or passed directly)
         self._settings = settings
 
@@ -218,11 +242,8 @@ class WorkflowEngine:
         except Exception as e:
             raise ValueError(f"Failed to load workflow from {yaml_path}: {e}")
     
-    def load_state(self) -> Optional[WorkflowState]:
-        """Load the current workflow state from the state file."""
-        if not self.state_file.exists():
-            return None
-
+    def _read_state_file(self) -> dict:
+        """Read the state file and verify its integrity checksum."""
         with open(self.state_file, 'r') as f:
             fcntl.flock(f.fileno(), fcntl.LOCK_SH)
             try:
@@ -244,17 +265,43 @@ class WorkflowEngine:
                     f"Expected {stored_checksum}, got {computed}. "
                     f"State may have been modified externally."
                 )
+        return data
+
+    def load_state(self) -> Optional[WorkflowState]:
+        """
+        Load the current workflow state from the state file.
+
+        Parsed states are cached per process, keyed on the state and journal
+        files' inode/mtime/size (see src/state_cache.py), so repeated loads of
+        an unchanged file skip parsing and validation.
+        """
+        if not self.state_file.exists():
+            return None
+
+        state_cache = get_state_cache()
+        fingerprint = file_fingerprint(self.state_file, self.state_journal.journal_file)
+        self.state = state_cache.get_state(fingerprint)
+
+        if self.state is None:
+            if self.state_journal.journal_file.exists():
+                # Journaled mode: snapshot + replayed deltas (checksum verified there)
+                data = self.state_journal.load()
+                if data is None:
+                    return None
+            else:
+                data = self._read_state_file()
 
-        # Parse datetime strings
-        data = self._parse_state_datetimes(data)
+            # Parse datetime strings
+            data = self._parse_state_datetimes(data)
 
-        self.state = WorkflowState(**data)
+            self.state = state_cache.put_state(fingerprint, WorkflowState(**data))
 
         # PRIORITY 1: Use version-locked workflow definition from state (prevents schema drift)
         if self.state and self.state.workflow_definition:
             try:
-                self.workflow_def = WorkflowDef(**self.state.workflow_definition)
+                self.workflow_def = state_cache.get_workflow_def(self.state.workflow_definition)
                 logger.debug("Loaded version-locked workflow definition from state")
+                self._remember_persisted_state()
                 return self.state
             except Exception as e:
                 logger.warning(f"Failed to load stored workflow definition: {e}")
@@ -272,10 +319,16 @@ class WorkflowEngine:
                 # Fallback to default location
                 self.load_workflow_def(str(self.working_dir / "workflow.yaml"))
 
+        self._remember_persisted_state()
         return self.state
     
     def save_state(self):
-        """Save the current workflow state to the state file (with file locking)."""
+        """
+        Save the current workflow state to the state file (with file locking).
+
+        With the `state_journal` setting enabled, only the changes since the
+        last save are appended to the state journal (see src/state_journal.py).
+        """
         if not self.state:
             return
 
@@ -284,9 +337,23 @@ class WorkflowEngine:
         # CORE-025: Ensure session directory exists before writing
         self.paths.ensure_dirs()
 
+        settings = self.settings
+        if settings.state_journal and self._journal_base is not None and self.state_file.exists():
+            self._append_state_delta(settings)
+            return
+
         # Get state as dict
         state_data = self.state.model_dump(mode='json')
 
+        if settings.state_journal or self.state_journal.journal_file.exists():
+            # Full snapshot through the journal so that stale deltas are discarded
+            self.state_journal.write_snapshot(state_data)
+            self._remember_persisted_state({
+                key: value for key, value in state_data.items()
+                if key != 'workflow_definition' and not key.startswith('_')
+            })
+            return
+
         # V3 Phase 5: Add integrity checksum and version
         from .state_version import compute_state_checksum, STATE_VERSION
         from datetime import datetime, timezone
@@ -308,36 +375,80 @@ class WorkflowEngine:
             finally:
                 fcntl.flock(f.fileno(), fcntl.LOCK_UN)
 
+    def _append_state_delta(self, settings: WorkflowSettings):
+        """Append the changes since the last save to the state journal."""
+        state_data = self.state.model_dump(mode='json', exclude={'workflow_definition'})
+        ops = diff_state(self._journal_base, state_data)
+        if self.state.workflow_definition is not self._journal_definition:
+            ops.append(["set", ["workflow_definition"], self.state.workflow_definition])
+
+        self.state_journal.compact_every = settings.state_journal_compact_every
+        self.state_journal.append(ops)
+        self._remember_persisted_state(state_data)
+
+    def _remember_persisted_state(self, state_data: Optional[dict] = None):
+        """Record the persisted state that the next journaled save diffs against."""
+        if not self.state or not self.settings.state_journal:
+            self._journal_base = None
+            return
+        if state_data is None:
+            state_data = self.state.model_dump(mode='json', exclude={'workflow_definition'})
+        self._journal_base = state_data
+        self._journal_definition = self.state.workflow_definition
+
     def log_event(self, event: WorkflowEvent):
-        """Append an event to the log file (with file locking)."""
+        """Append an event to the log file (with file locking) and index it."""
         # CORE-025: Ensure session directory exists before logging
         self.paths.ensure_dirs()
 
-        with open(self.log_file, 'a') as f:
+        line = (json.dumps(event.model_dump(mode='json'), default=str) + '\n').encode('utf-8')
+        with open(self.log_file, 'ab') as f:
             fcntl.flock(f.fileno(), fcntl.LOCK_EX)
             try:
-                f.write(json.dumps(event.model_dump(mode='json'), default=str) + '\n')
+                offset = f.seek(0, os.SEEK_END)
+                f.write(line)
+                f.flush()
+                self.event_index.record(event.event_type.value, offset, offset + len(line), os.fstat(f.fileno()))
             finally:
                 fcntl.flock(f.fileno(), fcntl.LOCK_UN)
-    
-    def get_events(self, limit: int = 100) -> list[WorkflowEvent]:
-        """Read recent events from the log file."""
+
+    def get_events(
+        self,
+        limit: Optional[int] = 100,
+        event_type: Optional[EventType] = None,
+    ) -> list[WorkflowEvent]:
+        """
+        Read recent events from the log file, oldest first.
+
+        The log is read backwards from the end (or through the per-type index
+        when event_type is given), so the cost is proportional to the number
+        of events returned rather than the size of the log.
+
+        Args:
+            limit: Maximum number of most recent events to return (None for all)
+            event_type: Only return events of this type
+        """
         if not self.log_file.exists():
             return []
+
+        if event_type is not None:
+            lines = reversed(self.event_index.read_lines(event_type.value, limit))
+        else:
+            lines = read_tail_lines(self.log_file)
+
         events = []
-        line_num = 0
-        with open(self.log_file, 'r') as f:
-            for line in f:
-                line_num += 1
-                if line.strip():
-                    try:
-                        events.append(WorkflowEvent(**json.loads(line)))
-                    except json.JSONDecodeError as e:
-                        logger.warning(f"Malformed JSON in log file at line {line_num}: {e}")
-                    except Exception as e:
-                        logger.warning(f"Failed to parse event at line {line_num}: {e}")
-        return events[-limit:]
-    
+        for offset, line in lines:
+            if limit is not None and len(events) >= limit:
+                break
+            try:
+                events.append(WorkflowEvent(**json.loads(line)))
+            except json.JSONDecodeError as e:
+                logger.warning(f"Malformed JSON in log file at byte {offset}: {e}")
+            except Exception as e:
+                logger.warning(f"Failed to parse event at byte {offset}: {e}")
+        events.reverse()
+        return events
+
     def reload(self):
         """Reload state and workflow definition from disk."""
         self.load_state()
@@ -777,7 +888,11 @@ class WorkflowEngine:
             details={"command": command}
         ))
 
-        result = self.gate_executor.execute(command, self.working_dir)
+        result = self._prefetched_verifications.pop(item_def.id, None)
+        if result is None:
+            result = self.gate_executor.execute(
+                command, self.working_dir, result_cache=self._verification_cache()
+            )
 
         # Store gate result
         item_state.gate_result = {
@@ -787,7 +902,8 @@ class WorkflowEngine:
             "stderr": result.stderr[:OUTPUT_TRUNCATE_LENGTH] if result.stderr else "",
             "command": command,
             "duration_seconds": result.duration_seconds,
-            "error": result.error
+            "error": result.error,
+            "cached": result.cached
         }
 
         if result.success:
@@ -1193,7 +1309,11 @@ class WorkflowEngine:
         
         elif verification.type == VerificationType.COMMAND:
             import shlex
-            
+
+            prefetched = self._prefetched_verifications.pop(item_def.id, None)
+            if prefetched is not None:
+                return prefetched
+
             # Substitute template variables with shell sanitization
             try:
                 command = self._substitute_template(verification.command, sanitize_for_shell=True)
@@ -1214,7 +1334,17 @@ class WorkflowEngine:
                 result["error"] = "Empty command"
                 result["blocked"] = True
                 return False, "Command blocked: empty command", result
-            
+
+            cache = self._verification_cache()
+            cache_key = cache.key_for(
+                self.working_dir, command, extra={"expect_exit_code": verification.expect_exit_code}
+            ) if cache else None
+            if cache_key:
+                cached = cache.get(cache_key)
+                if cached is not None:
+                    result.update(cached, timestamp=result["timestamp"], cached=True)
+                    return True, f"Command passed (exit code {cached['exit_code']}, unchanged tree)", result
+
             try:
                 # Use shell=False for security - command is parsed into args
                 proc = subprocess.run(
@@ -1233,6 +1363,8 @@ class WorkflowEngine:
                 result["stderr"] = proc.stderr[:OUTPUT_TRUNCATE_LENGTH] if proc.stderr else ""
                 
                 if proc.returncode == verification.expect_exit_code:
+                    if cache_key:
+                        cache.put(cache_key, result)
                     return True, f"Command passed (exit code {proc.returncode})", result
                 else:
                     return False, f"Command failed (exit code {proc.returncode}, expected {verification.expect_exit_code})", result
@@ -1254,6 +1386,192 @@ class WorkflowEngine:
         # No verification configured
         return True, "No verification required", result
     
+    def _verification_cache(self) -> Optional[VerificationResultCache]:
+        """Result cache for command verifications, None if disabled."""
+        settings = self.settings
+        if not settings.verification_cache:
+            return None
+        return VerificationResultCache(
+            self.paths.verification_cache_dir(),
+            ttl_seconds=settings.verification_cache_ttl_seconds,
+            max_entries=settings.verification_cache_max_entries,
+        )
+
+    def complete_phase_items(
+        self,
+        notes: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        on_result: Optional[Callable[[str, bool, str], None]] = None,
+        exclude: Optional[set[str]] = None,
+    ) -> list[Tuple[str, bool, str]]:
+        """
+        Complete every outstanding item in the current phase.
+
+        Command verifications run concurrently (at most `max_workers`
+        subprocesses at a time); items marked ``serial`` run alone and an
+        item's command starts only after the commands of its ``depends_on``
+        items passed. Items are then completed one by one in dependency order
+        through complete_item, so state changes and events are the same as
+        completing them individually.
+
+        Args:
+            notes: Optional notes recorded on every completed item
+            max_workers: Concurrent verifications (default: workflow setting
+                max_parallel_verifications)
+            on_result: Called with (item_id, passed, message) as each command
+                verification finishes
+            exclude: Item IDs to leave untouched
+
+        Returns:
+            List of (item_id, success, message) in completion order.
+        """
+        if not self.state or not self.workflow_def:
+            raise ValueError("No active workflow")
+
+        phase_def = self.workflow_def.get_phase(self.state.current_phase_id)
+        phase_state = self.state.phases.get(self.state.current_phase_id)
+        if not phase_def or not phase_state:
+            raise ValueError("Invalid phase")
+
+        exclude = exclude or set()
+        outstanding = (ItemStatus.PENDING, ItemStatus.IN_PROGRESS, ItemStatus.FAILED)
+        candidates = [
+            item_def for item_def in phase_def.items_in_dependency_order()
+            if item_def.id not in exclude
+            and item_def.id in phase_state.items
+            and phase_state.items[item_def.id].status in outstanding
+        ]
+
+        results = []
+        try:
+            self._prefetch_command_verifications(
+                candidates, max_workers or self.settings.max_parallel_verifications, on_result
+            )
+            for item_def in candidates:
+                blocked_by = [
+                    dep for dep in item_def.depends_on
+                    if phase_state.items[dep].status not in (ItemStatus.COMPLETED, ItemStatus.SKIPPED)
+                ]
+                if blocked_by:
+                    results.append((item_def.id, False, f"Blocked by incomplete dependencies: {', '.join(blocked_by)}"))
+                    continue
+                try:
+                    success, message = self.complete_item(item_def.id, notes=notes)
+                except ValueError as e:
+                    success, message = False, str(e)
+                results.append((item_def.id, success, message))
+        finally:
+            # Never let an outcome outlive this batch
+            self._prefetched_verifications.clear()
+        return results
+
+    def _prefetch_command_verifications(
+        self,
+        items: list[ChecklistItemDef],
+        max_workers: int,
+        on_result: Optional[Callable[[str, bool, str], None]] = None,
+    ) -> None:
+        """
+        Run the command verifications of `items` concurrently and keep their
+        outcomes for complete_item. `items` must be in dependency order.
+
+        Records wall-clock and summed CPU time of the batch in the event log.
+        """
+        commands = {
+            item_def.id: item_def for item_def in items
+            if item_def.verification.type == VerificationType.COMMAND
+        }
+        if not commands:
+            return
+
+        pending = list(commands.values())
+        running = {}  # future -> item_def
+        passed: set[str] = set()
+        failed: set[str] = set()
+        item_seconds = 0.0
+
+        def report(item_id: str, success: bool, message: str):
+            (passed if success else failed).add(item_id)
+            if on_result:
+                on_result(item_id, success, message)
+
+        cpu_start = _children_cpu_seconds()
+        wall_start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="verification") as pool:
+            while pending or running:
+                for item_def in list(pending):
+                    deps = [dep for dep in item_def.depends_on if dep in commands]
+                    failed_deps = [dep for dep in deps if dep in failed]
+                    if failed_deps:
+                        pending.remove(item_def)
+                        report(item_def.id, False, f"Not run: dependency failed ({', '.join(failed_deps)})")
+                        continue
+                    if not all(dep in passed for dep in deps):
+                        continue
+                    # A serial item needs the pool to itself, and holds it
+                    if any(r.serial for r in running.values()) or (item_def.serial and running):
+                        break
+                    if len(running) >= max_workers:
+                        break
+                    pending.remove(item_def)
+                    running[pool.submit(self._verify_command, item_def)] = item_def
+                    if item_def.serial:
+                        break
+
+                if not running:
+                    continue
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    item_def = running.pop(future)
+                    success, message, seconds = future.result()
+                    item_seconds += seconds
+                    report(item_def.id, success, message)
+
+        wall_seconds = time.perf_counter() - wall_start
+        cpu_seconds = _children_cpu_seconds() - cpu_start
+
+        self.log_event(WorkflowEvent(
+            event_type=EventType.VERIFICATION_BATCH_COMPLETED,
+            workflow_id=self.state.workflow_id,
+            phase_id=self.state.current_phase_id,
+            message=f"Verified {len(commands)} items in {wall_seconds:.2f}s ({len(passed)} passed, {len(failed)} failed)",
+            details={
+                "items": sorted(commands),
+                "passed": sorted(passed),
+                "failed": sorted(failed),
+                "max_workers": max_workers,
+                "wall_seconds": round(wall_seconds, 3),
+                "item_seconds": round(item_seconds, 3),
+                "cpu_seconds": round(cpu_seconds, 3),
+            }
+        ))
+
+    def _verify_command(self, item_def: ChecklistItemDef) -> Tuple[bool, str, float]:
+        """
+        Run one command verification on a worker thread, storing the outcome
+        where complete_item will pick it up.
+
+        Returns (passed, message, wall seconds).
+        """
+        start = time.perf_counter()
+        if item_def.step_type == StepType.GATE:
+            try:
+                command = self._substitute_template(item_def.verification.command, sanitize_for_shell=True)
+            except ValueError as e:
+                # complete_item reports this itself
+                return False, f"Command blocked: {e}", time.perf_counter() - start
+            gate_result = self.gate_executor.execute(
+                command, self.working_dir, result_cache=self._verification_cache()
+            )
+            self._prefetched_verifications[item_def.id] = gate_result
+            success = gate_result.success
+            message = "Gate passed" if success else f"Gate failed (exit code {gate_result.exit_code})"
+        else:
+            outcome = self._run_verification(item_def)
+            self._prefetched_verifications[item_def.id] = outcome
+            success, message = outcome[0], outcome[1]
+        return success, message, time.perf_counter() - start
+
     # ========================================================================
     # Status and Reporting
     # ========================================================================
@@ -1553,15 +1871,14 @@ class WorkflowEngine:
             Set of review type strings (e.g., {"security", "quality"})
         """
         completed = set()
-        for event in self.get_events():
-            if event.event_type == EventType.REVIEW_COMPLETED:
-                # Try to get review_type from details first
-                review_type = event.details.get("review_type") if event.details else None
-                # Fall back to extracting from item_id (e.g., "security_review" -> "security")
-                if not review_type and event.item_id and event.item_id.endswith("_review"):
-                    review_type = event.item_id.rsplit("_review", 1)[0]
-                if review_type:
-                    completed.add(review_type)
+        for event in self.get_events(limit=None, event_type=EventType.REVIEW_COMPLETED):
+            # Try to get review_type from details first
+            review_type = event.details.get("review_type") if event.details else None
+            # Fall back to extracting from item_id (e.g., "security_review" -> "security")
+            if not review_type and event.item_id and event.item_id.endswith("_review"):
+                review_type = event.item_id.rsplit("_review", 1)[0]
+            if review_type:
+                completed.add(review_type)
         return completed
 
     def get_required_reviews(self) -> set[str]:
@@ -1596,19 +1913,18 @@ class WorkflowEngine:
         failed = {}
         completed = self.get_completed_reviews()
 
-        for event in self.get_events():
-            if event.event_type == EventType.REVIEW_FAILED:
-                review_type = event.details.get("review_type") if event.details else None
-                if not review_type and event.item_id and event.item_id.endswith("_review"):
-                    review_type = event.item_id.rsplit("_review", 1)[0]
-
-                if review_type and review_type not in completed:
-                    # This review failed and hasn't been completed since
-                    failed[review_type] = {
-                        "error_type": event.details.get("error_type", "unknown") if event.details else "unknown",
-                        "error": event.details.get("error", event.message) if event.details else event.message,
-                        "timestamp": event.timestamp.isoformat() if event.timestamp else None,
-                    }
+        for event in self.get_events(limit=None, event_type=EventType.REVIEW_FAILED):
+            review_type = event.details.get("review_type") if event.details else None
+            if not review_type and event.item_id and event.item_id.endswith("_review"):
+                review_type = event.item_id.rsplit("_review", 1)[0]
+
+            if review_type and review_type not in completed:
+                # This review failed and hasn't been completed since
+                failed[review_type] = {
+                    "error_type": event.details.get("error_type", "unknown") if event.details else "unknown",
+                    "error": event.details.get("error", event.message) if event.details else event.message,
+                    "timestamp": event.timestamp.isoformat() if event.timestamp else None,
+                }
 
         return failed
 
@@ -0,0 +1,254 @@
+"""
+Event log indexing for the workflow engine.
+
+The workflow log (log.jsonl) is append-only and grows for the whole session.
+Reading it front to back and validating every event made `status`, the
+dashboard and analytics slower as sessions got longer. This module provides:
+
+- read_tail_lines(): a reverse reader that walks the log backwards in blocks,
+  so fetching the last N events costs O(N) regardless of log size.
+- EventLogIndex: a sidecar directory (log.jsonl.idx/) holding one append-only
+  postings file of byte offsets per event type, so fetching all events of one
+  type costs O(result).
+
+Sidecar layout:
+    log.jsonl.idx/
+    ├── meta.json          # {"version", "inode", "indexed_bytes", "count"}
+    └── types/
+        ├── item_completed.pos   # 8-byte big-endian offsets into log.jsonl
+        └── ...
+
+The index is a cache: it is caught up incrementally when the log has grown
+behind its back (older writers, external tools) and rebuilt from scratch when
+the log was replaced or truncated. Index failures never break logging.
+"""
+
+import fcntl
+import json
+import logging
+import os
+import re
+import struct
+from pathlib import Path
+from typing import Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+TAIL_BLOCK_SIZE = 64 * 1024
+
+_OFFSET = struct.Struct(">Q")
+_UNSAFE_NAME_CHARS = re.compile(r"[^\w.-]")
+
+
+def read_tail_lines(path: Path, block_size: int = TAIL_BLOCK_SIZE) -> Iterator[tuple[int, bytes]]:
+    """
+    Yield (offset, line) pairs from the end of a file towards the start.
+
+    Blank lines are skipped and the trailing newline is stripped. Only the
+    blocks needed to produce the consumed lines are read.
+    """
+    with open(path, 'rb') as f:
+        position = f.seek(0, os.SEEK_END)
+        remainder = b""
+        while position > 0:
+            read_size = min(block_size, position)
+            position -= read_size
+            f.seek(position)
+            chunk = f.read(read_size) + remainder
+            lines = chunk.split(b"\n")
+            # The first piece may be a partial line continuing in the previous block
+            remainder = lines[0]
+            start = position + len(chunk)
+            for line in reversed(lines[1:]):
+                start -= len(line)
+                if line.strip():
+                    yield start, line
+                start -= 1  # The newline terminating the previous line
+        if remainder.strip():
+            yield 0, remainder
+
+
+class EventLogIndex:
+    """Per-event-type postings of byte offsets into an append-only JSONL log."""
+
+    def __init__(self, log_file: Path, index_dir: Optional[Path] = None):
+        self.log_file = Path(log_file)
+        self.index_dir = Path(index_dir) if index_dir else self.log_file.with_name(self.log_file.name + ".idx")
+        self.meta_file = self.index_dir / "meta.json"
+        self.types_dir = self.index_dir / "types"
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def record(self, event_type: str, offset: int, end: int, log_stat: os.stat_result) -> None:
+        """
+        Record an event just appended to the log.
+
+        Must be called while holding the exclusive lock on the log file.
+
+        Args:
+            event_type: Event type value of the appended event
+            offset: Byte offset where the event's line starts
+            end: Byte offset just past the event's trailing newline
+            log_stat: os.fstat() of the log file handle used for the append
+        """
+        try:
+            meta = self._load_meta(log_stat)
+            if meta["indexed_bytes"] != offset:
+                # Someone appended without indexing (or the index is new)
+                meta = self._index_range(meta, meta["indexed_bytes"], offset)
+            self._append_posting(event_type, offset)
+            meta["indexed_bytes"] = end
+            meta["count"] += 1
+            self._save_meta(meta)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Failed to update event log index, it will be rebuilt: {e}")
+            self.clear()
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def read_lines(self, event_type: str, limit: Optional[int] = None) -> list[tuple[int, bytes]]:
+        """
+        Read the raw log lines of one event type, oldest first.
+
+        Args:
+            event_type: Event type value to fetch
+            limit: Only return the most recent `limit` lines (None for all)
+
+        Returns:
+            List of (offset, line) pairs
+        """
+        with open(self.log_file, 'rb') as f:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                for _ in range(2):
+                    self._sync(f)
+                    lines = [
+                        (offset, self._read_line_at(f, offset))
+                        for offset in self._read_postings(event_type, limit)
+                    ]
+                    if all(self._line_has_type(line, event_type) for _, line in lines):
+                        return lines
+                    logger.warning("Event log index is inconsistent with the log, rebuilding")
+                    self.clear()
+                return lines
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    def count(self, event_type: str) -> int:
+        """Return the number of indexed events of a type (syncing the index first)."""
+        with open(self.log_file, 'rb') as f:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                self._sync(f)
+                path = self._postings_path(event_type)
+                return path.stat().st_size // _OFFSET.size if path.exists() else 0
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    def clear(self) -> None:
+        """Remove the index; it is rebuilt on next use."""
+        if self.types_dir.exists():
+            for posting in self.types_dir.iterdir():
+                posting.unlink(missing_ok=True)
+        self.meta_file.unlink(missing_ok=True)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _sync(self, f) -> dict:
+        """Bring the index up to date with the log (caller holds the lock)."""
+        log_stat = os.fstat(f.fileno())
+        meta = self._load_meta(log_stat)
+        if meta["indexed_bytes"] < log_stat.st_size:
+            meta = self._index_range(meta, meta["indexed_bytes"], log_stat.st_size)
+            self._save_meta(meta)
+        return meta
+
+    def _load_meta(self, log_stat: os.stat_result) -> dict:
+        """Load index metadata, resetting the index if it no longer matches the log."""
+        try:
+            meta = json.loads(self.meta_file.read_text())
+            valid = (
+                meta.get("version") == INDEX_VERSION
+                and meta.get("inode") == log_stat.st_ino
+                and 0 <= meta.get("indexed_bytes", -1) <= log_stat.st_size
+            )
+        except (OSError, ValueError):
+            valid = False
+
+        if not valid:
+            self.clear()
+            meta = {"version": INDEX_VERSION, "inode": log_stat.st_ino, "indexed_bytes": 0, "count": 0}
+        return meta
+
+    def _save_meta(self, meta: dict) -> None:
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        temp_file = self.meta_file.with_suffix('.tmp')
+        temp_file.write_text(json.dumps(meta))
+        temp_file.replace(self.meta_file)
+
+    def _index_range(self, meta: dict, start: int, stop: int) -> dict:
+        """Scan log lines in [start, stop) and append their postings."""
+        postings: dict[str, list[int]] = {}
+        with open(self.log_file, 'rb') as f:
+            f.seek(start)
+            offset = start
+            while offset < stop:
+                line = f.readline()
+                if not line:
+                    break
+                event_type = self._parse_event_type(line)
+                if event_type is not None:
+                    postings.setdefault(event_type, []).append(offset)
+                    meta["count"] += 1
+                offset += len(line)
+
+        for event_type, offsets in postings.items():
+            self._append_posting(event_type, *offsets)
+        meta["indexed_bytes"] = offset
+        return meta
+
+    def _postings_path(self, event_type: str) -> Path:
+        return self.types_dir / f"{_UNSAFE_NAME_CHARS.sub('_', event_type)}.pos"
+
+    def _append_posting(self, event_type: str, *offsets: int) -> None:
+        self.types_dir.mkdir(parents=True, exist_ok=True)
+        with open(self._postings_path(event_type), 'ab') as f:
+            f.write(b"".join(_OFFSET.pack(offset) for offset in offsets))
+
+    def _read_postings(self, event_type: str, limit: Optional[int]) -> list[int]:
+        path = self._postings_path(event_type)
+        if not path.exists():
+            return []
+        with open(path, 'rb') as f:
+            size = f.seek(0, os.SEEK_END)
+            size -= size % _OFFSET.size  # Ignore a torn trailing record
+            start = 0 if limit is None else max(0, size - limit * _OFFSET.size)
+            f.seek(start)
+            data = f.read(size - start)
+        return [offset for (offset,) in _OFFSET.iter_unpack(data)]
+
+    @staticmethod
+    def _read_line_at(f, offset: int) -> bytes:
+        f.seek(offset)
+        return f.readline().rstrip(b"\n")
+
+    @staticmethod
+    def _parse_event_type(line: bytes) -> Optional[str]:
+        if not line.strip():
+            return None
+        try:
+            event_type = json.loads(line).get("event_type")
+        except (ValueError, AttributeError):
+            return None
+        return event_type if isinstance(event_type, str) else None
+
+    @classmethod
+    def _line_has_type(cls, line: bytes, event_type: str) -> bool:
+        return cls._parse_event_type(line) == event_type
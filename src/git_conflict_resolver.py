@@ -27,7 +27,6 @@ from enum import Enum
 from pathlib import Path
 from typing import Optional
 
-from .resolution.logger import log_resolution, log_escalation
 
 logger = logging.getLogger(__name__)
 
@@ -487,7 +486,9 @@ class GitConflictResolver:
             capture_output=True
         )
 
-        # CORE-023-P3: Log the resolution
+        # CORE-023-P3: Log the resolution (imported here so that `status`
+        # conflict checks don't load the resolution package)
+        from .resolution.logger import log_resolution
         log_resolution(
             file_path=result.file_path,
             strategy=result.strategy,
@@ -0,0 +1,221 @@
+"""Batched git object reads.
+
+GitObjectReader serves file contents at arbitrary refs from long-lived
+`git cat-file` processes instead of one `git show ref:path` per file:
+
+    - `git cat-file --batch-check` resolves ref:path specs to object SHAs
+    - `git cat-file --batch` returns the contents of objects not yet cached
+
+Blob contents are cached by object SHA, so a file that is identical on
+several branches is read from git once.
+"""
+
+import logging
+import subprocess
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Specs sent to --batch-check before reading their answers; keeps both
+# pipes well below their buffer size
+_CHECK_CHUNK = 200
+
+
+class GitObjectReader:
+    """Reads files at git refs through persistent `git cat-file` processes.
+
+    Processes are started on first use and shared by all callers; a lock
+    serialises requests, so one reader can be used from several threads.
+    Close the reader (or use it as a context manager) when done.
+    """
+
+    DEFAULT_CACHE_BYTES = 64 * 1024 * 1024
+
+    def __init__(self, repo_path: Optional[Path] = None, cache_bytes: int = DEFAULT_CACHE_BYTES):
+        """Initialize reader.
+
+        Args:
+            repo_path: Repository to read from (defaults to the working
+                directory at the time of the first read)
+            cache_bytes: Total size of blob contents to keep in memory
+        """
+        self.repo_path = repo_path
+        self.cache_bytes = cache_bytes
+        self._cache: OrderedDict[str, bytes] = OrderedDict()  # object SHA -> contents
+        self._cached_bytes = 0
+        self._check_proc: Optional[subprocess.Popen] = None
+        self._batch_proc: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "GitObjectReader":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    def close(self) -> None:
+        """Stop the cat-file processes (they are restarted on next use)."""
+        with self._lock:
+            for proc in (self._check_proc, self._batch_proc):
+                if proc is not None:
+                    try:
+                        proc.stdin.close()
+                        proc.wait(timeout=5)
+                    except Exception:
+                        proc.kill()
+                        proc.wait()
+                    proc.stdout.close()
+            self._check_proc = None
+            self._batch_proc = None
+
+    # Public API
+
+    def read(self, ref: str, path: str) -> Optional[str]:
+        """Get a file's text at a ref (None if missing, not a file, or binary)."""
+        return self.read_many([(ref, path)])[(ref, path)]
+
+    def read_many(self, specs: Iterable[tuple[str, str]]) -> dict[tuple[str, str], Optional[str]]:
+        """Get the text of several (ref, path) pairs.
+
+        Returns:
+            Mapping of each (ref, path) to its text, or None if the path
+            is missing at that ref, is not a file, or is not UTF-8
+        """
+        specs = list(dict.fromkeys(specs))
+        blobs = self.read_blobs(specs)
+        texts = {}
+        for spec in specs:
+            data = blobs[spec]
+            try:
+                texts[spec] = data.decode("utf-8") if data is not None else None
+            except UnicodeDecodeError:
+                texts[spec] = None
+        return texts
+
+    def read_blobs(self, specs: Iterable[tuple[str, str]]) -> dict[tuple[str, str], Optional[bytes]]:
+        """Get the raw contents of several (ref, path) pairs."""
+        specs = list(dict.fromkeys(specs))
+        with self._lock:
+            infos = self._check([f"{ref}:{path}" for ref, path in specs])
+            result = {}
+            for spec, info in zip(specs, infos):
+                if info is None or info[1] != "blob":
+                    result[spec] = None
+                else:
+                    result[spec] = self._contents(info[0])
+        return result
+
+    def resolve(self, ref: str) -> Optional[str]:
+        """Get the object SHA a ref (or ref:path) names, or None."""
+        with self._lock:
+            info = self._check([ref])[0]
+        return info[0] if info else None
+
+    def list_tree(self, ref: str, directory: str = "") -> Optional[list[str]]:
+        """List entries of a directory at a ref, as paths from the repo root.
+
+        Matches `git ls-tree --name-only ref directory/`; returns None if
+        the directory does not exist at the ref.
+        """
+        directory = directory.strip("/")
+        if directory == ".":
+            directory = ""
+        with self._lock:
+            info = self._check([f"{ref}:{directory}"])[0]
+            if info is None or info[1] != "tree":
+                return None
+            data = self._contents(info[0])
+
+        prefix = f"{directory}/" if directory else ""
+        hash_len = len(info[0]) // 2
+        names = []
+        pos = 0
+        while pos < len(data):
+            nul = data.index(b"\0", pos)
+            _, name = data[pos:nul].split(b" ", 1)
+            names.append(prefix + name.decode("utf-8", errors="surrogateescape"))
+            pos = nul + 1 + hash_len
+        return names
+
+    # cat-file protocol (callers hold self._lock)
+
+    def _start(self, mode: str) -> subprocess.Popen:
+        return subprocess.Popen(
+            ["git", "cat-file", mode],
+            cwd=self.repo_path,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+
+    def _check(self, specs: list[str]) -> list[Optional[tuple[str, str]]]:
+        """Resolve specs to (object SHA, type) with --batch-check."""
+        infos: list[Optional[tuple[str, str]]] = [None] * len(specs)
+        valid = [i for i, spec in enumerate(specs) if "\n" not in spec]
+
+        for start in range(0, len(valid), _CHECK_CHUNK):
+            chunk = valid[start:start + _CHECK_CHUNK]
+            proc = self._check_proc
+            if proc is None or proc.poll() is not None:
+                proc = self._check_proc = self._start("--batch-check")
+            try:
+                proc.stdin.write(b"".join(specs[i].encode("utf-8") + b"\n" for i in chunk))
+                proc.stdin.flush()
+                for i in chunk:
+                    line = proc.stdout.readline().decode("utf-8", errors="replace").rstrip("\n")
+                    # "<sha> <type> <size>", or "<spec> missing" / "<spec> ambiguous"
+                    if line.endswith((" missing", " ambiguous")):
+                        continue
+                    fields = line.split(" ")
+                    if len(fields) == 3:
+                        infos[i] = (fields[0], fields[1])
+            except (OSError, ValueError) as e:
+                logger.warning(f"git cat-file --batch-check failed: {e}")
+                self._check_proc = None
+                proc.kill()
+                proc.wait()
+                break
+        return infos
+
+    def _contents(self, sha: str) -> Optional[bytes]:
+        """Get an object's contents, from the cache or with --batch."""
+        data = self._cache.get(sha)
+        if data is not None:
+            self._cache.move_to_end(sha)
+            return data
+
+        proc = self._batch_proc
+        if proc is None or proc.poll() is not None:
+            proc = self._batch_proc = self._start("--batch")
+        try:
+            proc.stdin.write(sha.encode("ascii") + b"\n")
+            proc.stdin.flush()
+            fields = proc.stdout.readline().split()
+            if len(fields) != 3:
+                return None
+            size = int(fields[2])
+            data = proc.stdout.read(size)
+            proc.stdout.read(1)  # trailing newline
+        except (OSError, ValueError) as e:
+            logger.warning(f"git cat-file --batch failed: {e}")
+            self._batch_proc = None
+            proc.kill()
+            proc.wait()
+            return None
+
+        if size <= self.cache_bytes:
+            self._cache[sha] = data
+            self._cached_bytes += size
+            while self._cached_bytes > self.cache_bytes:
+                _, evicted = self._cache.popitem(last=False)
+                self._cached_bytes -= len(evicted)
+        return data
@@ -199,6 +199,32 @@ class CacheAdapter(ABC):
             key: Cache key to delete.
         """
 
+    async def get_many(self, keys: list[str]) -> dict[str, dict]:
+        """Get several cached values.
+
+        Args:
+            keys: Cache keys.
+
+        Returns:
+            Dict of key -> value for the keys found (missing/expired keys omitted).
+        """
+        found = {}
+        for key in keys:
+            value = await self.get(key)
+            if value is not None:
+                found[key] = value
+        return found
+
+    async def set_many(self, items: dict[str, dict], ttl_seconds: int = 3600) -> None:
+        """Set several cached values with the same TTL.
+
+        Args:
+            items: Dict of key -> value (values must be JSON-serializable).
+            ttl_seconds: Time-to-live in seconds.
+        """
+        for key, value in items.items():
+            await self.set(key, value, ttl_seconds)
+
 
 class ExecutionAdapter(ABC):
     """Abstract command execution for local subprocess vs CI triggers."""
@@ -1,33 +1,62 @@
 """Local SQLite cache adapter."""
 
+import asyncio
 import json
 import sqlite3
+import threading
 import time
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional
 
 from .base import CacheAdapter
 
+# SQLite limits the number of bound parameters per statement
+_BATCH_SIZE = 500
+
 
 class LocalSQLiteCache(CacheAdapter):
-    """SQLite-backed cache for local environments."""
+    """SQLite-backed cache for local environments.
+
+    One connection is opened lazily and kept for the lifetime of the cache.
+    Database work runs in a worker thread (asyncio.to_thread) so lookups do
+    not block the event loop, and an in-memory LRU tier in front of SQLite
+    answers repeated lookups without touching the database. The memory tier
+    is per instance: a value changed by another process can be served from
+    it until it is evicted or expires.
+
+    Expired rows are ignored on read and removed by a sweep that runs after
+    writes at most every SWEEP_INTERVAL_SECONDS, deleting at most
+    SWEEP_LIMIT rows per run.
+    """
 
-    def __init__(self, path: Optional[Path] = None):
+    SWEEP_INTERVAL_SECONDS = 60.0
+    SWEEP_LIMIT = 500
+
+    def __init__(self, path: Optional[Path] = None, memory_entries: int = 1024):
         """Initialize SQLite cache.
 
         Args:
             path: Path to SQLite database file. Defaults to .claude/healing_cache.sqlite.
+            memory_entries: Size of the in-memory LRU tier (0 disables it).
         """
         if path is None:
             path = Path.cwd() / ".claude" / "healing_cache.sqlite"
         self.path = Path(path)
+        self.memory_entries = memory_entries
+        # key -> (value JSON, expires_at); decoded on each read so callers never share a dict
+        self._memory: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        self._memory_lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+        self._last_sweep = time.time()
         self._init_db()
 
     def _init_db(self) -> None:
         """Initialize the database schema."""
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        conn = sqlite3.connect(str(self.path))
-        try:
+        with self._db_lock:
+            conn = self._get_connection()
             conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS cache (
@@ -39,74 +68,163 @@ class LocalSQLiteCache(CacheAdapter):
             )
             conn.execute("CREATE INDEX IF NOT EXISTS idx_expires ON cache(expires_at)")
             conn.commit()
-        finally:
-            conn.close()
 
     def _get_connection(self) -> sqlite3.Connection:
-        """Get a database connection with WAL mode for better concurrency."""
-        conn = sqlite3.connect(str(self.path), timeout=30)
-        conn.execute("PRAGMA journal_mode=WAL")
-        return conn
+        """Get the shared connection, opening it (in WAL mode) on first use.
 
-    async def get(self, key: str) -> Optional[dict]:
-        """Get cached value from SQLite."""
-        conn = self._get_connection()
-        try:
-            cursor = conn.execute(
-                "SELECT value, expires_at FROM cache WHERE key = ?",
-                (key,),
-            )
-            row = cursor.fetchone()
-            if row is None:
-                return None
+        Callers must hold self._db_lock.
+        """
+        if self._conn is None:
+            conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        """Close the database connection (it is reopened on next use)."""
+        with self._db_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
 
-            value, expires_at = row
-            if time.time() > expires_at:
-                # Expired, delete it
-                conn.execute("DELETE FROM cache WHERE key = ?", (key,))
-                conn.commit()
+    # In-memory tier
+
+    def _memory_get(self, key: str, now: float) -> Optional[str]:
+        with self._memory_lock:
+            entry = self._memory.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if now > expires_at:
+                del self._memory[key]
                 return None
+            self._memory.move_to_end(key)
+            return value
 
-            return json.loads(value)
-        finally:
-            conn.close()
+    def _memory_put(self, key: str, value: str, expires_at: float) -> None:
+        if self.memory_entries <= 0:
+            return
+        with self._memory_lock:
+            self._memory[key] = (value, expires_at)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_entries:
+                self._memory.popitem(last=False)
 
-    async def set(self, key: str, value: dict, ttl_seconds: int = 3600) -> None:
-        """Set cached value in SQLite."""
-        expires_at = time.time() + ttl_seconds
-        value_json = json.dumps(value)
+    def _memory_discard(self, keys: list[str]) -> None:
+        with self._memory_lock:
+            for key in keys:
+                self._memory.pop(key, None)
 
-        conn = self._get_connection()
-        try:
-            conn.execute(
+    # Blocking database operations (run in a worker thread)
+
+    def _select(self, keys: list[str], now: float) -> dict[str, tuple[str, float]]:
+        rows = {}
+        with self._db_lock:
+            conn = self._get_connection()
+            for i in range(0, len(keys), _BATCH_SIZE):
+                batch = keys[i:i + _BATCH_SIZE]
+                placeholders = ",".join("?" * len(batch))
+                cursor = conn.execute(
+                    f"SELECT key, value, expires_at FROM cache WHERE key IN ({placeholders}) AND expires_at >= ?",
+                    (*batch, now),
+                )
+                for key, value, expires_at in cursor:
+                    rows[key] = (value, expires_at)
+        return rows
+
+    def _upsert(self, rows: list[tuple[str, str, float]]) -> None:
+        with self._db_lock:
+            conn = self._get_connection()
+            conn.executemany(
                 """
                 INSERT OR REPLACE INTO cache (key, value, expires_at)
                 VALUES (?, ?, ?)
                 """,
-                (key, value_json, expires_at),
+                rows,
             )
             conn.commit()
-        finally:
-            conn.close()
+            self._maybe_sweep(conn)
 
-    async def delete(self, key: str) -> None:
-        """Delete cached value from SQLite."""
-        conn = self._get_connection()
-        try:
+    def _delete(self, key: str) -> None:
+        with self._db_lock:
+            conn = self._get_connection()
             conn.execute("DELETE FROM cache WHERE key = ?", (key,))
             conn.commit()
-        finally:
-            conn.close()
 
-    async def cleanup_expired(self) -> int:
-        """Remove all expired entries. Returns count of deleted entries."""
-        conn = self._get_connection()
-        try:
+    def _maybe_sweep(self, conn: sqlite3.Connection) -> None:
+        """Delete a bounded batch of expired rows if a sweep is due."""
+        now = time.time()
+        if now - self._last_sweep < self.SWEEP_INTERVAL_SECONDS:
+            return
+        self._last_sweep = now
+        conn.execute(
+            "DELETE FROM cache WHERE key IN (SELECT key FROM cache WHERE expires_at < ? LIMIT ?)",
+            (now, self.SWEEP_LIMIT),
+        )
+        conn.commit()
+
+    def _delete_expired(self) -> int:
+        with self._db_lock:
+            conn = self._get_connection()
             cursor = conn.execute(
                 "DELETE FROM cache WHERE expires_at < ?",
                 (time.time(),),
             )
             conn.commit()
+            self._last_sweep = time.time()
             return cursor.rowcount
-        finally:
-            conn.close()
+
+    # CacheAdapter interface
+
+    async def get(self, key: str) -> Optional[dict]:
+        """Get cached value, from memory if possible, else from SQLite."""
+        found = await self.get_many([key])
+        return found.get(key)
+
+    async def get_many(self, keys: list[str]) -> dict[str, dict]:
+        """Get several cached values with one query for the memory misses."""
+        now = time.time()
+        found = {}
+        missing = []
+        for key in keys:
+            value = self._memory_get(key, now)
+            if value is not None:
+                found[key] = json.loads(value)
+            else:
+                missing.append(key)
+
+        if missing:
+            rows = await asyncio.to_thread(self._select, list(dict.fromkeys(missing)), now)
+            for key, (value, expires_at) in rows.items():
+                self._memory_put(key, value, expires_at)
+                found[key] = json.loads(value)
+        return found
+
+    async def set(self, key: str, value: dict, ttl_seconds: int = 3600) -> None:
+        """Set cached value in SQLite (and the memory tier)."""
+        await self.set_many({key: value}, ttl_seconds)
+
+    async def set_many(self, items: dict[str, dict], ttl_seconds: int = 3600) -> None:
+        """Set several cached values in one transaction."""
+        if not items:
+            return
+        expires_at = time.time() + ttl_seconds
+        rows = [(key, json.dumps(value), expires_at) for key, value in items.items()]
+
+        await asyncio.to_thread(self._upsert, rows)
+        for key, value_json, _ in rows:
+            self._memory_put(key, value_json, expires_at)
+
+    async def delete(self, key: str) -> None:
+        """Delete cached value from SQLite."""
+        self._memory_discard([key])
+        await asyncio.to_thread(self._delete, key)
+
+    async def cleanup_expired(self) -> int:
+        """Remove all expired entries. Returns count of deleted entries."""
+        now = time.time()
+        with self._memory_lock:
+            for key in [k for k, (_, expires_at) in self._memory.items() if expires_at < now]:
+                del self._memory[key]
+        return await asyncio.to_thread(self._delete_expired)
@@ -49,3 +49,17 @@ class BaseDetector(ABC):
         error.fingerprint = self.fingerprinter.fingerprint(error)
         error.fingerprint_coarse = self.fingerprinter.fingerprint_coarse(error)
         return error
+
+    def _fingerprint_many(self, errors: List[ErrorEvent]) -> List[ErrorEvent]:
+        """Add fingerprints to several errors in one batch.
+
+        Args:
+            errors: Error events without fingerprints.
+
+        Returns:
+            Same error events with fingerprint and fingerprint_coarse set.
+        """
+        for error, (fine, coarse) in zip(errors, self.fingerprinter.fingerprint_many(errors)):
+            error.fingerprint = fine
+            error.fingerprint_coarse = coarse
+        return errors
@@ -100,7 +100,7 @@ class SubprocessDetector(BaseDetector):
                     match, language, fixed_type, command, combined
                 )
                 if error:
-                    errors.append(self._fingerprint(error))
+                    errors.append(error)
 
         # If no specific pattern matched, create a generic error
         if not errors and stderr.strip():
@@ -110,22 +110,20 @@ class SubprocessDetector(BaseDetector):
                 workflow_phase=self.phase_id,
             )
             errors.append(
-                self._fingerprint(
-                    ErrorEvent(
-                        error_id=f"sub-{uuid.uuid4().hex[:8]}",
-                        timestamp=datetime.utcnow(),
-                        source="subprocess",
-                        description=description,
-                        command=command,
-                        exit_code=exit_code,
-                        workflow_id=self.workflow_id,
-                        phase_id=self.phase_id,
-                        context=context,
-                    )
+                ErrorEvent(
+                    error_id=f"sub-{uuid.uuid4().hex[:8]}",
+                    timestamp=datetime.utcnow(),
+                    source="subprocess",
+                    description=description,
+                    command=command,
+                    exit_code=exit_code,
+                    workflow_id=self.workflow_id,
+                    phase_id=self.phase_id,
+                    context=context,
                 )
             )
 
-        return errors
+        return self._fingerprint_many(errors)
 
     def _parse_python_traceback(
         self, output: str, command: str
@@ -81,17 +81,15 @@ class TranscriptDetector(BaseDetector):
                 workflow_phase=self.phase_id,
             )
             errors.append(
-                self._fingerprint(
-                    ErrorEvent(
-                        error_id=f"trs-{uuid.uuid4().hex[:8]}",
-                        timestamp=datetime.utcnow(),
-                        source="transcript",
-                        description=description,
-                        error_type=error_type,
-                        workflow_id=self.workflow_id,
-                        phase_id=self.phase_id,
-                        context=context,
-                    )
+                ErrorEvent(
+                    error_id=f"trs-{uuid.uuid4().hex[:8]}",
+                    timestamp=datetime.utcnow(),
+                    source="transcript",
+                    description=description,
+                    error_type=error_type,
+                    workflow_id=self.workflow_id,
+                    phase_id=self.phase_id,
+                    context=context,
                 )
             )
 
@@ -123,21 +121,19 @@ class TranscriptDetector(BaseDetector):
                 workflow_phase=self.phase_id,
             )
             errors.append(
-                self._fingerprint(
-                    ErrorEvent(
-                        error_id=f"trs-{uuid.uuid4().hex[:8]}",
-                        timestamp=datetime.utcnow(),
-                        source="transcript",
-                        description=description,
-                        error_type=error_type,
-                        file_path=file_path,
-                        line_number=line_number,
-                        stack_trace=full_stack_trace,
-                        workflow_id=self.workflow_id,
-                        phase_id=self.phase_id,
-                        context=context,
-                    )
+                ErrorEvent(
+                    error_id=f"trs-{uuid.uuid4().hex[:8]}",
+                    timestamp=datetime.utcnow(),
+                    source="transcript",
+                    description=description,
+                    error_type=error_type,
+                    file_path=file_path,
+                    line_number=line_number,
+                    stack_trace=full_stack_trace,
+                    workflow_id=self.workflow_id,
+                    phase_id=self.phase_id,
+                    context=context,
                 )
             )
 
-        return errors
+        return self._fingerprint_many(errors)
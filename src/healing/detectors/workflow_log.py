@@ -69,12 +69,12 @@ class WorkflowLogDetector(BaseDetector):
 
                     error = self._parse_event(event)
                     if error:
-                        errors.append(self._fingerprint(error))
+                        errors.append(error)
         except (OSError, IOError):
             # File access errors - return empty
             return []
 
-        return errors
+        return self._fingerprint_many(errors)
 
     def _parse_event(self, event: dict) -> Optional[ErrorEvent]:
         """Parse a single log event.
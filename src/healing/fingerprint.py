@@ -6,11 +6,19 @@ enabling deduplication across different occurrences of the same error.
 
 import hashlib
 import re
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import List, Optional, Tuple
+from typing import Iterable, List, Optional, Tuple
 
 from .models import ErrorEvent
 
+# Error type and stack frame patterns
+_PYTHON_ERROR_TYPE = re.compile(r"^(\w+Error|\w+Exception|\w+Warning):")
+_RUST_ERROR_TYPE = re.compile(r"error\[(E\d+)\]")
+_PYTHON_FRAME = re.compile(r'File "([^"]+)", line \d+, in (\w+)')
+_NODE_FRAME = re.compile(r"at (\w+) \(([^)]+)\)")
+_BACKREFERENCE = re.compile(r"\\\d|\(\?P=")
+
 
 @dataclass
 class FingerprintConfig:
@@ -49,15 +57,40 @@ class Fingerprinter:
     - Different machine paths
     - Different line numbers (for the same error type)
     - Different PIDs, memory addresses, etc.
+
+    The strip patterns are compiled once per instance, and the results for
+    recently seen (error type, description, stack trace) inputs are kept in
+    an LRU of cache_size entries.
     """
 
-    def __init__(self, config: Optional[FingerprintConfig] = None):
+    def __init__(self, config: Optional[FingerprintConfig] = None, cache_size: int = 4096):
         """Initialize fingerprinter with optional config.
 
         Args:
             config: Normalization rules. Uses defaults if not provided.
+            cache_size: Number of recent inputs whose fingerprints are cached.
         """
         self.config = config or FingerprintConfig()
+        self.cache_size = cache_size
+        self._cache: OrderedDict[tuple, Tuple[str, str]] = OrderedDict()
+
+        # Rules run in order (later rules see earlier replacements, e.g. the
+        # line number rule matches "<path>/foo.py:12"), so they stay separate
+        # passes; fingerprints are persisted and must not change. One
+        # combined search skips all passes for text no rule matches.
+        self._strip_rules = [
+            (re.compile(pattern), replacement)
+            for pattern, replacement in self.config.strip_patterns
+        ]
+        self._any_rule = None
+        patterns = [pattern for pattern, _ in self.config.strip_patterns]
+        # Backreferences would point at the wrong group once combined
+        if patterns and not any(_BACKREFERENCE.search(p) for p in patterns):
+            try:
+                self._any_rule = re.compile("|".join(f"(?:{p})" for p in patterns))
+            except re.error:
+                # e.g. inline flags that are only valid at the start
+                self._any_rule = None
 
     def fingerprint(self, error: ErrorEvent) -> str:
         """Generate fine-grained fingerprint (16 hex chars).
@@ -73,10 +106,44 @@ class Fingerprinter:
         Returns:
             16-character hex fingerprint.
         """
+        return self._fingerprints(error)[0]
+
+    def fingerprint_many(self, errors: Iterable[ErrorEvent]) -> List[Tuple[str, str]]:
+        """Generate fine and coarse fingerprints for several errors.
+
+        Repeated inputs within the batch (or seen recently) are computed once.
+
+        Args:
+            errors: Error events to fingerprint.
+
+        Returns:
+            (fingerprint, fingerprint_coarse) for each error, in order.
+        """
+        return [self._fingerprints(error) for error in errors]
+
+    def _fingerprints(self, error: ErrorEvent) -> Tuple[str, str]:
+        """Return (fine, coarse) fingerprints, from the LRU when possible."""
+        key = (error.error_type, error.description, error.stack_trace)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
+
+        error_type = self._extract_error_type(error.error_type or error.description)
+        result = (
+            self._compute_fingerprint(error, error_type),
+            hashlib.sha256(f"coarse:{error_type}".encode()).hexdigest()[:8],
+        )
+        if self.cache_size > 0:
+            self._cache[key] = result
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return result
+
+    def _compute_fingerprint(self, error: ErrorEvent, error_type: str) -> str:
         components = []
 
         # Error type
-        error_type = self._extract_error_type(error.error_type or error.description)
         components.append(f"type:{error_type}")
 
         # Normalized message
@@ -103,8 +170,7 @@ class Fingerprinter:
         Returns:
             8-character hex fingerprint.
         """
-        error_type = self._extract_error_type(error.error_type or error.description)
-        return hashlib.sha256(f"coarse:{error_type}".encode()).hexdigest()[:8]
+        return self._fingerprints(error)[1]
 
     def _normalize(self, text: str) -> str:
         """Apply normalization patterns to text.
@@ -115,9 +181,12 @@ class Fingerprinter:
         Returns:
             Normalized text with variable parts replaced.
         """
+        if not self._strip_rules or (self._any_rule is not None and not self._any_rule.search(text)):
+            return text.strip()
+
         result = text
-        for pattern, replacement in self.config.strip_patterns:
-            result = re.sub(pattern, replacement, result)
+        for pattern, replacement in self._strip_rules:
+            result = pattern.sub(replacement, result)
         return result.strip()
 
     def _extract_error_type(self, text: str) -> str:
@@ -136,7 +205,7 @@ class Fingerprinter:
             Extracted error type or "UnknownError".
         """
         # Python errors: TypeError, ValueError, ImportError, etc.
-        match = re.match(r"^(\w+Error|\w+Exception|\w+Warning):", text)
+        match = _PYTHON_ERROR_TYPE.match(text)
         if match:
             return match.group(1)
 
@@ -145,7 +214,7 @@ class Fingerprinter:
             return "Error"
 
         # Rust errors: error[E0382]
-        match = re.match(r"error\[(E\d+)\]", text)
+        match = _RUST_ERROR_TYPE.match(text)
         if match:
             return f"RustError_{match.group(1)}"
 
@@ -169,14 +238,14 @@ class Fingerprinter:
             Normalized frame string (filename:function) or None.
         """
         # Python format: File "foo.py", line 10, in main
-        match = re.search(r'File "([^"]+)", line \d+, in (\w+)', stack_trace)
+        match = _PYTHON_FRAME.search(stack_trace)
         if match:
             filename = match.group(1).split("/")[-1]
             function = match.group(2)
             return f"{filename}:{function}"
 
         # Node.js format: at foo (/path/bar.js:10:5)
-        match = re.search(r"at (\w+) \(([^)]+)\)", stack_trace)
+        match = _NODE_FRAME.search(stack_trace)
         if match:
             function = match.group(1)
             filename = match.group(2).split("/")[-1].split(":")[0]
@@ -28,6 +28,8 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_ERROR_TYPE_PREFIX = re.compile(r"(\w+(?:Error|Exception)):\s*(.+)")
+
 
 @dataclass
 class ScanState:
@@ -158,6 +160,7 @@ class PatternScanner:
         # Generic
         r"FAILED|FATAL|CRITICAL",
     ]
+    _ERROR_REGEXES = [re.compile(pattern, re.MULTILINE) for pattern in ERROR_PATTERNS]
 
     def __init__(
         self,
@@ -233,63 +236,58 @@ class PatternScanner:
 
     def _extract_errors_from_text(self, text: str, source: str) -> list[ErrorEvent]:
         """Extract error patterns from text content."""
-        errors = []
-        seen_fingerprints = set()
-
-        for pattern in self.ERROR_PATTERNS:
-            for match in re.finditer(pattern, text, re.MULTILINE):
+        # Source must be one of: workflow_log, transcript, subprocess, hook
+        source_type = "transcript"  # Default for text extraction
+        if ".workflow_log" in source:
+            source_type = "workflow_log"
+
+        candidates = []
+        for pattern in self._ERROR_REGEXES:
+            for match in pattern.finditer(text):
                 error_text = match.group(0)
 
                 # Skip if too short
                 if len(error_text) < 10:
                     continue
 
-                # Extract error type and message
-                error_type = None
-                description = error_text
-
                 # Try to parse specific error types
-                type_match = re.match(r"(\w+(?:Error|Exception)):\s*(.+)", error_text)
-                if type_match:
-                    error_type = type_match.group(1)
-                    description = error_text
-
-                # Extract context from surrounding text
-                context = extract_context(
-                    description=description,
-                    error_type=error_type,
-                )
-
-                # Create error event
-                # Source must be one of: workflow_log, transcript, subprocess, hook
-                source_type = "transcript"  # Default for text extraction
-                if ".workflow_log" in source:
-                    source_type = "workflow_log"
-
-                error = ErrorEvent(
-                    error_id=str(uuid.uuid4()),
-                    timestamp=datetime.now(),
-                    source=source_type,
-                    error_type=error_type,
-                    description=description,
-                    context=context,
+                type_match = _ERROR_TYPE_PREFIX.match(error_text)
+                candidates.append(
+                    ErrorEvent(
+                        error_id=str(uuid.uuid4()),
+                        timestamp=datetime.now(),
+                        source=source_type,
+                        error_type=type_match.group(1) if type_match else None,
+                        description=error_text,
+                    )
                 )
 
-                # Generate fingerprint
-                error.fingerprint = self.fingerprinter.fingerprint(error)
-                error.fingerprint_coarse = self.fingerprinter.fingerprint_coarse(error)
-
-                # Deduplicate within this scan
-                if error.fingerprint not in seen_fingerprints:
-                    seen_fingerprints.add(error.fingerprint)
-                    errors.append(error)
+        # Context is only extracted for errors that survive deduplication
+        errors = self._fingerprint_unique(candidates)
+        for error in errors:
+            error.context = extract_context(
+                description=error.description,
+                error_type=error.error_type,
+            )
+        return errors
 
+    def _fingerprint_unique(self, candidates: list[ErrorEvent]) -> list[ErrorEvent]:
+        """Fingerprint errors in one batch and drop duplicates within this scan."""
+        errors = []
+        seen_fingerprints = set()
+        fingerprints = self.fingerprinter.fingerprint_many(candidates)
+        for error, (fingerprint, fingerprint_coarse) in zip(candidates, fingerprints):
+            if fingerprint in seen_fingerprints:
+                continue
+            seen_fingerprints.add(fingerprint)
+            error.fingerprint = fingerprint
+            error.fingerprint_coarse = fingerprint_coarse
+            errors.append(error)
         return errors
 
     def _extract_errors_from_jsonl(self, path: Path) -> list[ErrorEvent]:
         """Extract errors from JSONL workflow log format."""
-        errors = []
-        seen_fingerprints = set()
+        candidates = []
 
         try:
             with open(path) as f:
@@ -308,7 +306,7 @@ class PatternScanner:
                     if event_type not in ("error", "failure", "exception"):
                         # Also check description for error patterns
                         desc = entry.get("description", "")
-                        if not any(re.search(p, desc) for p in self.ERROR_PATTERNS):
+                        if not any(p.search(desc) for p in self._ERROR_REGEXES):
                             continue
 
                     description = entry.get("description", entry.get("message", ""))
@@ -345,17 +343,12 @@ class PatternScanner:
                         context=context,
                     )
 
-                    error.fingerprint = self.fingerprinter.fingerprint(error)
-                    error.fingerprint_coarse = self.fingerprinter.fingerprint_coarse(error)
-
-                    if error.fingerprint not in seen_fingerprints:
-                        seen_fingerprints.add(error.fingerprint)
-                        errors.append(error)
+                    candidates.append(error)
 
         except Exception as e:
             logger.warning(f"Failed to parse JSONL file {path}: {e}")
 
-        return errors
+        return self._fingerprint_unique(candidates)
 
     def _scan_file(self, path: Path) -> list[ErrorEvent]:
         """Scan a single file for error patterns."""
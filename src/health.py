@@ -137,8 +137,15 @@ class HealthChecker:
             )
 
         try:
-            with open(self.state_file, 'r') as f:
-                state = json.load(f)
+            journal_file = self.state_file.with_suffix('.journal')
+            if journal_file.exists():
+                # Journaled mode: read the snapshot and its pending deltas together
+                from .state_journal import StateJournal
+                state, pending = StateJournal(self.state_file).read()
+            else:
+                with open(self.state_file, 'r') as f:
+                    state = json.load(f)
+                pending = []
 
             # Verify version
             version = state.get('_version')
@@ -175,7 +182,8 @@ class HealthChecker:
             return ComponentHealth(
                 name="state_file",
                 status="ok",
-                message="State file is valid"
+                message="State file is valid",
+                details={"pending_journal_records": len(pending)} if pending else None
             )
 
         except json.JSONDecodeError as e:
@@ -0,0 +1,108 @@
+"""
+Shared pooled HTTP client.
+
+Review and provider calls to OpenRouter (and API key pings) used to create a
+fresh connection per request, repeating DNS resolution and the TLS handshake
+every time. They now share one process-wide httpx.Client, which keeps
+connections alive between requests and is safe to use from several threads
+(e.g. concurrent reviews).
+
+HTTP/2 is used when the optional ``h2`` package is installed.
+
+Connection limits can be tuned with environment variables:
+    ORCHESTRATOR_HTTP_MAX_CONNECTIONS        (default 20)
+    ORCHESTRATOR_HTTP_MAX_KEEPALIVE          (default 10)
+    ORCHESTRATOR_HTTP_KEEPALIVE_EXPIRY       (seconds, default 60)
+"""
+
+import atexit
+import logging
+import os
+import threading
+from typing import Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONNECTIONS = 20
+DEFAULT_MAX_KEEPALIVE = 10
+DEFAULT_KEEPALIVE_EXPIRY = 60.0
+DEFAULT_CONNECT_TIMEOUT = 10.0
+# Per-request timeouts are passed by callers; this only bounds forgotten ones
+DEFAULT_TIMEOUT = 300.0
+
+_client: Optional[httpx.Client] = None
+_lock = threading.Lock()
+
+
+def _env_number(name: str, default, cast=int):
+    value = os.environ.get(name)
+    if not value:
+        return default
+    try:
+        return cast(value)
+    except ValueError:
+        logger.warning(f"Ignoring invalid {name}={value!r}, using {default}")
+        return default
+
+
+def http2_available() -> bool:
+    """Whether the h2 package needed for HTTP/2 is installed."""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def create_http_client(
+    max_connections: Optional[int] = None,
+    max_keepalive: Optional[int] = None,
+    keepalive_expiry: Optional[float] = None,
+    http2: Optional[bool] = None,
+) -> httpx.Client:
+    """
+    Create a pooled client with the configured limits.
+
+    Args:
+        max_connections: Max open connections (default from environment)
+        max_keepalive: Max idle connections kept for reuse
+        keepalive_expiry: Seconds an idle connection is kept
+        http2: Use HTTP/2 (default: when h2 is installed)
+    """
+    limits = httpx.Limits(
+        max_connections=max_connections or _env_number("ORCHESTRATOR_HTTP_MAX_CONNECTIONS", DEFAULT_MAX_CONNECTIONS),
+        max_keepalive_connections=max_keepalive or _env_number("ORCHESTRATOR_HTTP_MAX_KEEPALIVE", DEFAULT_MAX_KEEPALIVE),
+        keepalive_expiry=keepalive_expiry or _env_number(
+            "ORCHESTRATOR_HTTP_KEEPALIVE_EXPIRY", DEFAULT_KEEPALIVE_EXPIRY, float
+        ),
+    )
+    return httpx.Client(
+        limits=limits,
+        http2=http2_available() if http2 is None else http2,
+        timeout=httpx.Timeout(DEFAULT_TIMEOUT, connect=DEFAULT_CONNECT_TIMEOUT),
+        verify=True,  # Explicitly enforce SSL certificate verification
+    )
+
+
+def get_http_client() -> httpx.Client:
+    """Get the process-wide pooled client, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        with _lock:
+            if _client is None or _client.is_closed:
+                _client = create_http_client()
+    return _client
+
+
+def close_http_client() -> None:
+    """Close the shared client and its connections (a new one is created on next use)."""
+    global _client
+    with _lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+
+
+atexit.register(close_http_client)
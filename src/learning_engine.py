@@ -17,6 +17,7 @@ from typing import Optional, TYPE_CHECKING
 
 from .schema import WorkflowEvent, EventType, WorkflowState
 from .analytics import WorkflowAnalytics
+from .state_journal import StateJournal
 
 if TYPE_CHECKING:
     from .path_resolver import OrchestratorPaths
@@ -87,8 +88,13 @@ class LearningEngine:
         """Load the current/last workflow state."""
         if not self.state_file.exists():
             return None
-        with open(self.state_file, 'r') as f:
-            data = json.load(f)
+        journal = StateJournal(self.state_file)
+        if journal.journal_file.exists():
+            # Journaled mode: the snapshot alone misses the latest saves
+            data = journal.load()
+        else:
+            with open(self.state_file, 'r') as f:
+                data = json.load(f)
         return WorkflowState(**data)
     
     def _get_workflow_events(self, workflow_id: str) -> list[WorkflowEvent]:
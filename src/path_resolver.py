@@ -155,6 +155,30 @@ class OrchestratorPaths:
             return self.session_dir() / "feedback"
         return self.orchestrator_dir / "feedback"
 
+    def verification_cache_dir(self) -> Path:
+        """Get verification result cache directory (shared by all sessions).
+
+        Returns:
+            .orchestrator/verification_cache/
+        """
+        return self.orchestrator_dir / "verification_cache"
+
+    def review_context_cache_dir(self) -> Path:
+        """Get review context cache directory (shared by all sessions).
+
+        Returns:
+            .orchestrator/review_context_cache/
+        """
+        return self.orchestrator_dir / "review_context_cache"
+
+    def review_response_cache_dir(self) -> Path:
+        """Get review response cache directory (shared by all sessions).
+
+        Returns:
+            .orchestrator/review_response_cache/
+        """
+        return self.orchestrator_dir / "review_response_cache"
+
     def meta_file(self) -> Path:
         """Get repo metadata file.
 
@@ -16,9 +16,10 @@ from pathlib import Path
 from typing import Optional, Any, Generator, Iterator
 
 try:
-    import requests
+    import httpx
+    from ..http_client import get_http_client
 except ImportError:
-    requests = None
+    httpx = None
 
 from .base import AgentProvider, ExecutionResult
 from .tools import (
@@ -113,8 +114,8 @@ class OpenRouterProvider(AgentProvider):
     
     def is_available(self) -> bool:
         """Check if OpenRouter API is available (API key is set)."""
-        if requests is None:
-            logger.warning("requests library not available")
+        if httpx is None:
+            logger.warning("httpx library not available")
             return False
         return bool(self._api_key)
     
@@ -331,7 +332,7 @@ class OpenRouterProvider(AgentProvider):
             }
 
             try:
-                response = requests.post(
+                response = get_http_client().post(
                     self.API_URL,
                     headers=headers,
                     json=payload,
@@ -422,11 +423,11 @@ class OpenRouterProvider(AgentProvider):
                         }
                     )
 
-            except requests.exceptions.Timeout:
+            except httpx.TimeoutException:
                 logger.warning(f"Request timed out after {self._timeout}s during tool execution")
                 return self._execute_basic(prompt, model_to_use, start_time)
 
-            except requests.exceptions.RequestException as e:
+            except httpx.HTTPError as e:
                 logger.warning(f"Request error during tool execution: {self._sanitize_error(str(e))}")
                 return self._execute_basic(prompt, model_to_use, start_time)
 
@@ -483,7 +484,7 @@ class OpenRouterProvider(AgentProvider):
         last_error = None
         for attempt in range(self.MAX_RETRIES):
             try:
-                response = requests.post(
+                response = get_http_client().post(
                     self.API_URL,
                     headers=headers,
                     json=payload,
@@ -530,13 +531,13 @@ class OpenRouterProvider(AgentProvider):
                     else:
                         break
 
-            except requests.exceptions.Timeout:
+            except httpx.TimeoutException:
                 last_error = f"Request timed out after {self._timeout}s"
                 logger.warning(last_error)
                 time.sleep(self.RETRY_DELAY * (attempt + 1))
                 continue
 
-            except requests.exceptions.RequestException as e:
+            except httpx.HTTPError as e:
                 last_error = self._sanitize_error(str(e))
                 logger.warning(f"Request error: {last_error}")
                 time.sleep(self.RETRY_DELAY * (attempt + 1))
@@ -551,7 +552,7 @@ class OpenRouterProvider(AgentProvider):
             duration_seconds=duration
         )
 
-    def _parse_error_response(self, response: requests.Response) -> str:
+    def _parse_error_response(self, response: "httpx.Response") -> str:
         """Parse error message from API response."""
         error_msg = f"API error {response.status_code}"
         try:
@@ -615,64 +616,62 @@ class OpenRouterProvider(AgentProvider):
         }
 
         try:
-            response = requests.post(
+            with get_http_client().stream(
+                "POST",
                 self.API_URL,
                 headers=headers,
                 json=payload,
                 timeout=self._timeout,
-                stream=True
-            )
-
-            if response.status_code != 200:
-                error_msg = self._parse_error_response(response)
-                yield ""
-                return ExecutionResult(
-                    success=False,
-                    output="",
-                    error=error_msg,
-                    model_used=model_to_use,
-                    duration_seconds=time.time() - start_time
-                )
-
-            full_output = []
-            total_tokens = 0
+            ) as response:
+                if response.status_code != 200:
+                    response.read()
+                    error_msg = self._parse_error_response(response)
+                    yield ""
+                    return ExecutionResult(
+                        success=False,
+                        output="",
+                        error=error_msg,
+                        model_used=model_to_use,
+                        duration_seconds=time.time() - start_time
+                    )
 
-            for line in response.iter_lines():
-                if not line:
-                    continue
+                full_output = []
+                total_tokens = 0
 
-                # SSE format: "data: {...}"
-                line_str = line.decode('utf-8') if isinstance(line, bytes) else line
+                for line_str in response.iter_lines():
+                    if not line_str:
+                        continue
 
-                if not line_str.startswith('data: '):
-                    continue
+                    # SSE format: "data: {...}"
+                    if not line_str.startswith('data: '):
+                        continue
 
-                data_str = line_str[6:]  # Remove "data: " prefix
+                    data_str = line_str[6:]  # Remove "data: " prefix
 
-                if data_str.strip() == '[DONE]':
-                    break
+                    if data_str.strip() == '[DONE]':
+                        break
 
-                try:
-                    data = json.loads(data_str)
+                    try:
+                        data = json.loads(data_str)
 
-                    # Track usage if present
-                    if 'usage' in data:
-                        total_tokens = data['usage'].get('total_tokens', total_tokens)
+                        # Track usage if present
+                        if 'usage' in data:
+                            total_tokens = data['usage'].get('total_tokens', total_tokens)
 
-                    # Extract content delta
-                    if 'choices' in data and len(data['choices']) > 0:
-                        delta = data['choices'][0].get('delta', {})
-                        content = delta.get('content', '')
+                        # Extract content delta
+                        if 'choices' in data and len(data['choices']) > 0:
+                            delta = data['choices'][0].get('delta', {})
+                            content = delta.get('content', '')
 
-                        if content:
-                            full_output.append(content)
-                            if on_chunk:
-                                on_chunk(content)
-                            yield content
+                            if content:
+                                full_output.append(content)
+                                if on_chunk:
+                                    on_chunk(content)
+                                yield content
 
-                except json.JSONDecodeError:
-                    logger.debug(f"Failed to parse SSE data: {data_str[:100]}")
-                    continue
+                    except json.JSONDecodeError:
+                        logger.debug(f"Failed to parse SSE data: {data_str[:100]}")
+                        continue
 
             duration = time.time() - start_time
             complete_output = ''.join(full_output)
@@ -690,7 +689,7 @@ class OpenRouterProvider(AgentProvider):
                 }
             )
 
-        except requests.exceptions.Timeout:
+        except httpx.TimeoutException:
             duration = time.time() - start_time
             yield ""
             return ExecutionResult(
@@ -701,7 +700,7 @@ class OpenRouterProvider(AgentProvider):
                 duration_seconds=duration
             )
 
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             duration = time.time() - start_time
             yield ""
             return ExecutionResult(
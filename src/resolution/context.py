@@ -25,6 +25,7 @@ from .schema import (
 from ..conflict.pipeline import PipelineResult
 from ..coordinator.schema import AgentManifest, DerivedManifest
 from ..coordinator.manifest_store import ManifestStore
+from ..git_objects import GitObjectReader
 
 logger = logging.getLogger(__name__)
 
@@ -114,10 +115,25 @@ class ContextAssembler:
         base_branch: str = "main",
         manifest_store: Optional[ManifestStore] = None,
         repo_path: Optional[Path] = None,
+        object_reader: Optional[GitObjectReader] = None,
     ):
         self.base_branch = base_branch
         self.manifest_store = manifest_store or ManifestStore()
         self.repo_path = repo_path or Path.cwd()
+        # File contents at refs come from one long-lived cat-file reader
+        self._owns_reader = object_reader is None
+        self.object_reader = object_reader or GitObjectReader(self.repo_path)
+
+    def __enter__(self) -> "ContextAssembler":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop the object reader's git processes, unless it was passed in."""
+        if self._owns_reader:
+            self.object_reader.close()
 
     def assemble(
         self,
@@ -293,14 +309,16 @@ class ContextAssembler:
     def _get_base_files(self, files: list[str]) -> list[FileVersion]:
         """Get file contents from base branch."""
         base_files = []
+        base_sha = self._get_sha(self.base_branch)
+        contents = self._get_file_contents([(self.base_branch, f) for f in files])
         for filepath in files:
-            content = self._get_file_content(self.base_branch, filepath)
+            content = contents[(self.base_branch, filepath)]
             if content is not None:
                 base_files.append(FileVersion(
                     path=filepath,
                     content=content,
                     source="base",
-                    sha=self._get_sha(self.base_branch),
+                    sha=base_sha,
                 ))
         return base_files
 
@@ -312,17 +330,19 @@ class ContextAssembler:
     ) -> dict[str, list[FileVersion]]:
         """Get file contents from each agent's branch."""
         agent_files = {}
+        contents = self._get_file_contents([(b, f) for b in branches for f in files])
 
         for agent_id, branch in zip(agent_ids, branches):
             agent_files[agent_id] = []
+            branch_sha = self._get_sha(branch)
             for filepath in files:
-                content = self._get_file_content(branch, filepath)
+                content = contents[(branch, filepath)]
                 if content is not None:
                     agent_files[agent_id].append(FileVersion(
                         path=filepath,
                         content=content,
                         source=agent_id,
-                        sha=self._get_sha(branch),
+                        sha=branch_sha,
                     ))
 
         return agent_files
@@ -333,24 +353,33 @@ class ContextAssembler:
         SECURITY: Validates filepath before passing to git to prevent
         path traversal attacks like ../../../etc/passwd
         """
-        # SECURITY: Sanitize and validate filepath
-        filepath = _sanitize_filepath(filepath)
-        if not _validate_repo_path(filepath, self.repo_path):
-            logger.warning(f"Path traversal blocked: {filepath}")
-            return None
+        return self._get_file_contents([(ref, filepath)])[(ref, filepath)]
+
+    def _get_file_contents(
+        self,
+        specs: list[tuple[str, str]],
+    ) -> dict[tuple[str, str], Optional[str]]:
+        """Get contents of several (ref, filepath) pairs in one batch.
+
+        SECURITY: Every filepath is validated as in _get_file_content.
+        """
+        contents = {spec: None for spec in specs}
+        safe = {}
+        for ref, filepath in specs:
+            # SECURITY: Sanitize and validate filepath
+            clean = _sanitize_filepath(filepath)
+            if not _validate_repo_path(clean, self.repo_path):
+                logger.warning(f"Path traversal blocked: {clean}")
+                continue
+            safe[(ref, filepath)] = (ref, clean)
 
         try:
-            result = subprocess.run(
-                ["git", "show", f"{ref}:{filepath}"],
-                capture_output=True,
-                text=True,
-                cwd=self.repo_path,
-            )
-            if result.returncode == 0:
-                return result.stdout
+            found = self.object_reader.read_many(safe.values())
+            for spec, clean_spec in safe.items():
+                contents[spec] = found[clean_spec]
         except Exception as e:
-            logger.debug(f"Could not get {filepath} from {ref}: {e}")
-        return None
+            logger.debug(f"Could not read files from git: {e}")
+        return contents
 
     def _find_related_files(self, conflicting_files: list[str]) -> list[RelatedFile]:
         """
@@ -363,10 +392,13 @@ class ContextAssembler:
         """
         related = []
         seen = set(conflicting_files)
+        base_contents = self._get_file_contents(
+            [(self.base_branch, f) for f in conflicting_files]
+        )
 
         for filepath in conflicting_files:
             # Find imports within this file
-            content = self._get_file_content(self.base_branch, filepath)
+            content = base_contents[(self.base_branch, filepath)]
             if not content:
                 continue
 
@@ -386,14 +418,9 @@ class ContextAssembler:
             # Find files in same directory (same module)
             directory = Path(filepath).parent
             try:
-                result = subprocess.run(
-                    ["git", "ls-tree", "--name-only", self.base_branch, str(directory) + "/"],
-                    capture_output=True,
-                    text=True,
-                    cwd=self.repo_path,
-                )
-                if result.returncode == 0:
-                    for sibling in result.stdout.strip().split("\n"):
+                siblings = self.object_reader.list_tree(self.base_branch, str(directory))
+                if siblings is not None:
+                    for sibling in siblings:
                         if sibling and sibling not in seen and sibling.endswith((".py", ".js", ".ts", ".go")):
                             sib_content = self._get_file_content(self.base_branch, sibling)
                             if sib_content:
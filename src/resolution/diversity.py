@@ -5,6 +5,9 @@ Ensures that generated resolution candidates are meaningfully different.
 If candidates are too similar, one of them is likely redundant.
 
 Uses Jaccard similarity on changed line sets to measure diversity.
+Each candidate's diff is parsed once per check; distinct changed lines
+are interned to bit positions, so every pair is compared with integer
+AND/OR and a popcount.
 """
 
 import logging
@@ -61,14 +64,12 @@ class DiversityChecker:
 
         pairwise_scores = {}
         all_scores = []
+        matrix = self.diversity_matrix(candidates)
 
         for i, c1 in enumerate(candidates):
-            for j, c2 in enumerate(candidates):
-                if i >= j:
-                    continue
-
-                score = self.calculate_pairwise_diversity(c1, c2)
-                key = (c1.candidate_id, c2.candidate_id)
+            for j in range(i + 1, len(candidates)):
+                score = matrix[i][j]
+                key = (c1.candidate_id, candidates[j].candidate_id)
                 pairwise_scores[key] = score
                 all_scores.append(score)
 
@@ -110,26 +111,63 @@ class DiversityChecker:
         Returns:
             Diversity score (0.0 to 1.0)
         """
-        lines1 = self._extract_changed_lines(candidate1.diff_from_base)
-        lines2 = self._extract_changed_lines(candidate2.diff_from_base)
-
-        if not lines1 and not lines2:
-            return 0.0  # Both empty = identical
-
-        if not lines1 or not lines2:
-            return 1.0  # One empty, one not = completely different
+        return self.diversity_matrix([candidate1, candidate2])[0][1]
 
-        # Jaccard distance = 1 - (intersection / union)
-        intersection = len(lines1 & lines2)
-        union = len(lines1 | lines2)
+    def diversity_matrix(
+        self,
+        candidates: list[ResolutionCandidate],
+    ) -> list[list[float]]:
+        """
+        Calculate diversity between every pair of candidates.
 
-        if union == 0:
-            return 0.0
+        Each diff is parsed once. Changed lines are interned to bit
+        positions, so each candidate becomes one integer bitset and a
+        pair's Jaccard distance needs only AND, OR and two popcounts.
 
-        jaccard_similarity = intersection / union
-        jaccard_distance = 1.0 - jaccard_similarity
+        Args:
+            candidates: Candidates to compare
 
-        return jaccard_distance
+        Returns:
+            Symmetric matrix where [i][j] is the diversity of candidates
+            i and j (0.0 on the diagonal)
+        """
+        line_bits: dict[str, int] = {}
+        positions = [
+            [
+                line_bits.setdefault(line, len(line_bits))
+                for line in self._extract_changed_lines(candidate.diff_from_base)
+            ]
+            for candidate in candidates
+        ]
+
+        bitsets = []
+        for bit_positions in positions:
+            bitmap = bytearray((len(line_bits) + 7) // 8)
+            for pos in bit_positions:
+                bitmap[pos >> 3] |= 1 << (pos & 7)
+            bitsets.append(int.from_bytes(bitmap, "little"))
+
+        sizes = [len(bit_positions) for bit_positions in positions]
+        n = len(candidates)
+        matrix = [[0.0] * n for _ in range(n)]
+
+        for i in range(n):
+            bits_i, size_i = bitsets[i], sizes[i]
+            row = matrix[i]
+            for j in range(i + 1, n):
+                if not size_i and not sizes[j]:
+                    score = 0.0  # Both empty = identical
+                elif not size_i or not sizes[j]:
+                    score = 1.0  # One empty, one not = completely different
+                else:
+                    # Jaccard distance = 1 - (intersection / union)
+                    intersection = (bits_i & bitsets[j]).bit_count()
+                    union = size_i + sizes[j] - intersection
+                    score = 1.0 - intersection / union
+                row[j] = score
+                matrix[j][i] = score
+
+        return matrix
 
     def _extract_changed_lines(self, diff: str) -> set[str]:
         """
@@ -183,30 +221,21 @@ class DiversityChecker:
         if len(candidates) <= target_count:
             return candidates
 
-        # Greedy selection: start with first, add most diverse each step
-        selected = [candidates[0]]
-
-        while len(selected) < target_count:
-            best_candidate = None
-            best_min_diversity = -1.0
-
-            for c in candidates:
-                if c in selected:
-                    continue
-
-                # Calculate minimum diversity to all selected
-                min_div = min(
-                    self.calculate_pairwise_diversity(c, s)
-                    for s in selected
-                )
+        matrix = self.diversity_matrix(candidates)
 
-                if min_div > best_min_diversity:
-                    best_min_diversity = min_div
-                    best_candidate = c
+        # Greedy max-min selection: start with first, add most diverse each
+        # step. min_to_selected[i] is candidate i's minimum diversity to the
+        # selected set, updated as each candidate is added.
+        selected = [0]
+        min_to_selected = list(matrix[0])
+        remaining = list(range(1, len(candidates)))
 
-            if best_candidate:
-                selected.append(best_candidate)
-            else:
-                break
+        while len(selected) < target_count and remaining:
+            best = max(remaining, key=lambda i: min_to_selected[i])
+            selected.append(best)
+            remaining.remove(best)
+            for i in remaining:
+                if matrix[best][i] < min_to_selected[i]:
+                    min_to_selected[i] = matrix[best][i]
 
-        return selected
+        return [candidates[i] for i in selected]
@@ -8,13 +8,18 @@ Generates multiple resolution candidates using distinct strategies:
 - fresh_synthesis: Re-implement from scratch (optional, for architectural conflicts)
 
 Each candidate is generated with a different approach to maximize
-the chance of finding a working resolution.
+the chance of finding a working resolution. Candidates are built
+concurrently and without a checkout: merges run in-index with
+`git merge-tree --write-tree` and are recorded with `git commit-tree`.
 """
 
 import logging
+import os
 import re
 import subprocess
+import tempfile
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
@@ -63,7 +68,16 @@ class MultiCandidateGenerator:
         strategies: Optional[list[str]] = None,
         max_candidates: int = 3,
         candidate_time_budget: int = 300,
+        max_parallel: int = 3,
+        in_index: bool = True,
     ):
+        """
+        Args:
+            max_parallel: Candidates generated at the same time (in-index only)
+            in_index: Build candidate branches with merge-tree/commit-tree;
+                if False, they are built one after another by checking out
+                and merging in repo_path
+        """
         self.repo_path = repo_path or Path.cwd()
 
         if not _validate_branch_name(base_branch):
@@ -73,6 +87,8 @@ class MultiCandidateGenerator:
         self.strategies = strategies or DEFAULT_STRATEGIES
         self.max_candidates = max_candidates
         self.candidate_time_budget = candidate_time_budget
+        self.max_parallel = max_parallel
+        self.in_index = in_index
 
     def generate(
         self,
@@ -93,10 +109,10 @@ class MultiCandidateGenerator:
         """
         logger.info(f"Generating up to {self.max_candidates} candidates")
 
-        candidates = []
         strategies_to_use = self._select_strategies(context, intents, harmonized)
+        strategies_to_use = strategies_to_use[:self.max_candidates]
 
-        for strategy in strategies_to_use[:self.max_candidates]:
+        def generate_one(strategy: str) -> Optional[ResolutionCandidate]:
             try:
                 candidate = self._generate_single_candidate(
                     strategy,
@@ -105,12 +121,21 @@ class MultiCandidateGenerator:
                     harmonized,
                 )
                 if candidate:
-                    candidates.append(candidate)
                     logger.info(f"Generated candidate {candidate.candidate_id} with strategy {strategy}")
+                return candidate
             except Exception as e:
                 logger.error(f"Failed to generate candidate with strategy {strategy}: {e}")
-                continue
+                return None
 
+        # Checkout-based generation shares one working tree, so only
+        # in-index generation can run concurrently
+        if self.in_index and self.max_parallel > 1 and len(strategies_to_use) > 1:
+            with ThreadPoolExecutor(max_workers=self.max_parallel) as pool:
+                results = list(pool.map(generate_one, strategies_to_use))
+        else:
+            results = [generate_one(strategy) for strategy in strategies_to_use]
+
+        candidates = [c for c in results if c]
         logger.info(f"Generated {len(candidates)} candidates")
         return candidates
 
@@ -209,6 +234,9 @@ class MultiCandidateGenerator:
                 logger.error(f"Invalid agent branch name: {branch}")
                 return False
 
+        if self.in_index:
+            return self._create_in_index(branch_name, strategy, branches)
+
         try:
             # Start from base
             subprocess.run(
@@ -226,21 +254,8 @@ class MultiCandidateGenerator:
                 check=True,
             )
 
-            # Apply strategy-specific merge order
-            if strategy == "agent1_primary":
-                self._merge_branch(branches[0], allow_conflicts=False)
-                self._merge_branch(branches[1], allow_conflicts=True)
-            elif strategy == "agent2_primary":
-                self._merge_branch(branches[1], allow_conflicts=False)
-                self._merge_branch(branches[0], allow_conflicts=True)
-            elif strategy == "convention_primary":
-                # Both merges, resolve toward conventions
-                self._merge_branch(branches[0], allow_conflicts=False)
-                self._merge_branch(branches[1], allow_conflicts=True)
-            elif strategy == "fresh_synthesis":
-                # For fresh synthesis, we merge both and resolve all conflicts
-                self._merge_branch(branches[0], allow_conflicts=True)
-                self._merge_branch(branches[1], allow_conflicts=True)
+            for branch, allow_conflicts in self._merge_order(strategy, branches):
+                self._merge_branch(branch, allow_conflicts=allow_conflicts)
 
             return True
 
@@ -249,6 +264,133 @@ class MultiCandidateGenerator:
             self._cleanup_branch(branch_name)
             return False
 
+    def _merge_order(self, strategy: str, branches: list[str]) -> list[tuple[str, bool]]:
+        """Strategy-specific merge order as (branch, allow_conflicts) pairs."""
+        if strategy == "agent1_primary":
+            return [(branches[0], False), (branches[1], True)]
+        elif strategy == "agent2_primary":
+            return [(branches[1], False), (branches[0], True)]
+        elif strategy == "convention_primary":
+            # Both merges, resolve toward conventions
+            return [(branches[0], False), (branches[1], True)]
+        elif strategy == "fresh_synthesis":
+            # For fresh synthesis, we merge both and resolve all conflicts
+            return [(branches[0], True), (branches[1], True)]
+        return []
+
+    def _create_in_index(self, branch_name: str, strategy: str, branches: list[str]) -> bool:
+        """Create a resolution branch without touching the working tree."""
+        try:
+            head = self._git("rev-parse", "--verify", f"{self.base_branch}^{{commit}}")
+            for branch, allow_conflicts in self._merge_order(strategy, branches):
+                head = self._merge_in_index(head, branch, allow_conflicts) or head
+            self._git("branch", branch_name, head)
+            return True
+
+        except subprocess.CalledProcessError as e:
+            logger.error(f"Git operation failed: {e}")
+            return False
+
+    def _merge_in_index(self, head: str, branch: str, allow_conflicts: bool) -> Optional[str]:
+        """
+        Merge a branch into commit head, as `git merge --no-edit` would.
+
+        Conflicts are resolved like _merge_branch does, by taking head's
+        side of each conflicted path.
+
+        Returns:
+            The new head commit, or None if the merge failed
+        """
+        if not _validate_branch_name(branch):
+            logger.error(f"Invalid branch name: {branch}")
+            return None
+
+        try:
+            tip = self._git("rev-parse", "--verify", f"{branch}^{{commit}}")
+            merge_base = self._git("merge-base", head, tip)
+            if merge_base == tip:
+                return head  # Already up to date
+            if merge_base == head:
+                return tip  # Fast-forward
+
+            result = subprocess.run(
+                ["git", "merge-tree", "--write-tree", "-z", "--no-messages", head, tip],
+                cwd=self.repo_path,
+                capture_output=True,
+                text=True,
+            )
+            if result.returncode not in (0, 1):
+                logger.error(f"Merge failed: {result.stderr}")
+                return None
+
+            tree, *entries = result.stdout.split("\0")
+            if result.returncode == 0:
+                message = f"Merge branch '{branch}'"
+            elif allow_conflicts:
+                tree = self._take_ours(tree, entries)
+                message = f"Resolve conflicts from {branch}"
+            else:
+                logger.error(f"Merge failed: conflicts with {branch}")
+                return None
+
+            return self._git("commit-tree", tree, "-p", head, "-p", tip, "-m", message)
+
+        except Exception as e:
+            logger.error(f"Merge error: {e}")
+            return None
+
+    def _take_ours(self, tree: str, entries: list[str]) -> str:
+        """
+        Resolve conflicted paths in a merge-tree result to our (stage 2) side.
+
+        Args:
+            tree: Merged tree written by merge-tree (with conflict markers)
+            entries: Its "<mode> <object> <stage>\t<path>" conflict entries
+
+        Returns:
+            The resolved tree
+        """
+        ours: dict[str, Optional[str]] = {}
+        for entry in entries:
+            if not entry:
+                break  # End of the conflicted file list
+            info, path = entry.split("\t", 1)
+            mode, sha, stage = info.split(" ")
+            ours.setdefault(path, None)
+            if stage == "2":
+                ours[path] = f"{mode} {sha}"
+
+        # Paths without our side were deleted by us
+        index_info = "".join(
+            f"{entry or '0 ' + '0' * len(tree)}\t{path}\0" for path, entry in ours.items()
+        )
+
+        with tempfile.TemporaryDirectory() as tmp:
+            env = {**os.environ, "GIT_INDEX_FILE": os.path.join(tmp, "index")}
+            self._git("read-tree", tree, env=env)
+            subprocess.run(
+                ["git", "update-index", "-z", "--index-info"],
+                cwd=self.repo_path,
+                input=index_info,
+                capture_output=True,
+                text=True,
+                env=env,
+                check=True,
+            )
+            return self._git("write-tree", env=env)
+
+    def _git(self, *args: str, env: Optional[dict] = None) -> str:
+        """Run a git command in repo_path and return its stripped output."""
+        result = subprocess.run(
+            ["git", *args],
+            cwd=self.repo_path,
+            capture_output=True,
+            text=True,
+            env=env,
+            check=True,
+        )
+        return result.stdout.strip()
+
     def _merge_branch(self, branch: str, allow_conflicts: bool = False) -> bool:
         """Merge a branch into current HEAD."""
         if not _validate_branch_name(branch):
@@ -31,6 +31,7 @@ from .harmonizer import InterfaceHarmonizer
 from .candidate import CandidateGenerator
 from .validator import ResolutionValidator
 from ..conflict.pipeline import PipelineResult
+from ..git_objects import GitObjectReader
 
 logger = logging.getLogger(__name__)
 
@@ -55,9 +56,11 @@ class ResolutionPipeline:
         self.auto_escalate_low_confidence = auto_escalate_low_confidence
 
         # Initialize stage components
+        self.object_reader = GitObjectReader(repo_path)
         self.context_assembler = ContextAssembler(
             base_branch=base_branch,
             repo_path=repo_path,
+            object_reader=self.object_reader,
         )
         self.intent_extractor = IntentExtractor()
         self.harmonizer = InterfaceHarmonizer(
@@ -74,6 +77,16 @@ class ResolutionPipeline:
             test_command=test_command,
         )
 
+    def __enter__(self) -> "ResolutionPipeline":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop the git processes behind the object reader."""
+        self.object_reader.close()
+
     def resolve(self, detection_result: PipelineResult) -> Resolution:
         """
         Run the full resolution pipeline.
@@ -290,8 +303,8 @@ def resolve_conflicts(
     Returns:
         Resolution with winning candidate or escalation
     """
-    pipeline = ResolutionPipeline(
+    with ResolutionPipeline(
         base_branch=base_branch,
         repo_path=repo_path,
-    )
-    return pipeline.resolve(detection_result)
+    ) as pipeline:
+        return pipeline.resolve(detection_result)
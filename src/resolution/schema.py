@@ -405,6 +405,9 @@ class TieredValidationResult:
     flaky_tests_detected: list[str] = field(default_factory=list)
     flaky_tests_retried: list[str] = field(default_factory=list)
 
+    # Stopped because another candidate already passed with a perfect score
+    cancelled: bool = False
+
     @property
     def passed_current_tier(self) -> bool:
         """Check if candidate passed the tier it reached."""
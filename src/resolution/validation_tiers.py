@@ -9,16 +9,25 @@ Validates resolution candidates through progressive tiers:
 
 Early elimination: candidates failing earlier tiers are dropped
 before more expensive validation.
+
+Candidates are validated concurrently, each in its own git worktree, and
+validation stops once a candidate passes all of its tiers perfectly.
 """
 
+import copy
 import logging
 import re
 import shlex
 import subprocess
+import threading
 import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, Union
 
+from ..worktree_manager import WorktreeError, WorktreeManager
+
 from .schema import (
     ResolutionCandidate,
     ConflictContext,
@@ -41,6 +50,19 @@ HIGH_RISK_PATTERNS = [
     r".*\.github/workflows/.*",
 ]
 
+# Tiers from cheapest to most thorough
+TIER_ORDER = [
+    ValidationTier.SMOKE,
+    ValidationTier.LINT,
+    ValidationTier.TARGETED,
+    ValidationTier.COMPREHENSIVE,
+]
+
+
+class ValidationCancelled(Exception):
+    """Raised inside a candidate's validation once it has been cancelled."""
+    pass
+
 
 class TieredValidator:
     """
@@ -50,6 +72,9 @@ class TieredValidator:
     if cheaper tiers pass.
     """
 
+    # How often running commands check for cancellation (seconds)
+    POLL_INTERVAL = 0.1
+
     def __init__(
         self,
         repo_path: Optional[Path] = None,
@@ -58,19 +83,38 @@ class TieredValidator:
         lint_command: Optional[str] = None,
         targeted_test_timeout: int = 300,  # 5 minutes
         full_test_timeout: int = 600,  # 10 minutes
+        max_parallel: int = 4,
+        candidate_timeout: Optional[int] = None,
+        use_worktrees: bool = True,
     ):
+        """
+        Args:
+            max_parallel: Candidates validated at the same time (worktrees only)
+            candidate_timeout: Seconds allowed for all tiers of one candidate
+            use_worktrees: Validate each candidate in its own git worktree;
+                if False, candidates are checked out one after another in
+                repo_path
+        """
         self.repo_path = repo_path or Path.cwd()
         self.build_command = build_command
         self.test_command = test_command
         self.lint_command = lint_command
         self.targeted_test_timeout = targeted_test_timeout
         self.full_test_timeout = full_test_timeout
+        self.max_parallel = max_parallel
+        self.candidate_timeout = candidate_timeout
+        self.use_worktrees = use_worktrees
+
+        # Set on the per-candidate copies made by validate_all
+        self._deadline: Optional[float] = None
+        self._cancel: Optional[threading.Event] = None
 
     def validate_all(
         self,
         candidates: list[ResolutionCandidate],
         context: ConflictContext,
         max_tier: Optional[ValidationTier] = None,
+        stop_on_perfect: bool = True,
     ) -> list[TieredValidationResult]:
         """
         Validate all candidates through appropriate tiers.
@@ -79,20 +123,50 @@ class TieredValidator:
             candidates: Candidates to validate
             context: Conflict context
             max_tier: Maximum tier to run (for limiting validation)
+            stop_on_perfect: Cancel the remaining candidates once one
+                passes all its tiers with a perfect score
 
         Returns:
-            Validation results for each candidate
+            Validation results for each candidate (in input order);
+            cancelled candidates have result.cancelled set
         """
-        results = []
+        cancel = threading.Event()
+
+        def validate(candidate: ResolutionCandidate) -> TieredValidationResult:
+            if cancel.is_set():
+                return TieredValidationResult(
+                    candidate_id=candidate.candidate_id, cancelled=True
+                )
 
-        for candidate in candidates:
             # Determine appropriate tier based on files
             tier = self.determine_tier(candidate.files_modified)
-            if max_tier and tier.value > max_tier.value:
+            if max_tier and TIER_ORDER.index(tier) > TIER_ORDER.index(max_tier):
                 tier = max_tier
 
-            result = self.validate_candidate(candidate, context, tier)
-            results.append(result)
+            if self.use_worktrees:
+                result = self._validate_in_worktree(candidate, context, tier, cancel)
+            else:
+                result = self._for_candidate(self.repo_path, cancel)._validate_cancellable(
+                    candidate, context, tier, checkout=True
+                )
+
+            if stop_on_perfect and not result.cancelled and self._is_perfect(result, tier):
+                logger.info(
+                    f"Candidate {candidate.candidate_id} passed all tiers, "
+                    f"cancelling remaining candidates"
+                )
+                cancel.set()
+            return result
+
+        if self.use_worktrees and self.max_parallel > 1 and len(candidates) > 1:
+            with ThreadPoolExecutor(max_workers=self.max_parallel) as pool:
+                results = list(pool.map(validate, candidates))
+        else:
+            results = [validate(candidate) for candidate in candidates]
+
+        for candidate, result in zip(candidates, results):
+            if result.cancelled:
+                continue
 
             # Update candidate with results
             candidate.build_passed = result.build_passed
@@ -109,21 +183,82 @@ class TieredValidator:
 
         return results
 
+    def _validate_in_worktree(
+        self,
+        candidate: ResolutionCandidate,
+        context: ConflictContext,
+        tier: ValidationTier,
+        cancel: threading.Event,
+    ) -> TieredValidationResult:
+        """Validate a candidate in a temporary worktree of its branch."""
+        branch = candidate.branch_name
+        if not self._is_safe_ref(branch):
+            return TieredValidationResult(candidate_id=candidate.candidate_id)
+
+        manager = WorktreeManager(self.repo_path)
+        name = re.sub(r"[^A-Za-z0-9_.-]", "-", f"validate-{candidate.candidate_id}")
+        try:
+            worktree_path = manager.create_detached(f"{name}-{uuid.uuid4().hex[:8]}", branch)
+        except WorktreeError as e:
+            logger.error(f"Failed to check out {branch}: {e}")
+            return TieredValidationResult(candidate_id=candidate.candidate_id)
+
+        try:
+            return self._for_candidate(worktree_path, cancel)._validate_cancellable(
+                candidate, context, tier, checkout=False
+            )
+        finally:
+            manager.remove(worktree_path)
+
+    def _for_candidate(self, repo_path: Path, cancel: threading.Event) -> "TieredValidator":
+        """Copy of this validator for one candidate's checkout and deadline."""
+        validator = copy.copy(self)
+        validator.repo_path = repo_path
+        validator._cancel = cancel
+        if self.candidate_timeout is not None:
+            validator._deadline = time.monotonic() + self.candidate_timeout
+        return validator
+
+    def _validate_cancellable(
+        self,
+        candidate: ResolutionCandidate,
+        context: ConflictContext,
+        tier: ValidationTier,
+        checkout: bool,
+    ) -> TieredValidationResult:
+        try:
+            return self.validate_candidate(candidate, context, tier, checkout=checkout)
+        except ValidationCancelled:
+            return TieredValidationResult(candidate_id=candidate.candidate_id, cancelled=True)
+
+    def _is_perfect(self, result: TieredValidationResult, target_tier: ValidationTier) -> bool:
+        """Whether a result reached its target tier with nothing to improve."""
+        if result.tier_reached != target_tier or not result.build_passed:
+            return False
+        if target_tier != ValidationTier.SMOKE and result.lint_score < 1.0:
+            return False
+        return result.targeted_tests_failed == 0 and result.full_tests_failed == 0
+
     def validate_candidate(
         self,
         candidate: ResolutionCandidate,
         context: ConflictContext,
         target_tier: ValidationTier,
+        checkout: bool = True,
     ) -> TieredValidationResult:
         """
         Validate a single candidate through specified tier.
 
         Implements early elimination: stops if any tier fails.
+
+        Args:
+            checkout: Check out the candidate branch in repo_path first
+                (False if repo_path already has it checked out)
         """
         result = TieredValidationResult(candidate_id=candidate.candidate_id)
 
         # Checkout candidate branch
-        if not self._checkout_branch(candidate.branch_name):
+        if checkout and not self._checkout_branch(candidate.branch_name):
             return result
 
         # Tier 1: Smoke (build)
@@ -140,6 +275,7 @@ class TieredValidator:
             return result
 
         # Tier 2: Lint
+        self._check_cancelled()
         result.lint_score = self._run_lint()
         result.lint_issues = self._count_lint_issues_from_score(result.lint_score)
         result.tier_reached = ValidationTier.LINT
@@ -148,6 +284,7 @@ class TieredValidator:
             return result
 
         # Tier 3: Targeted tests
+        self._check_cancelled()
         start = time.time()
         targeted = self._run_targeted_tests(
             candidate.files_modified,
@@ -169,6 +306,7 @@ class TieredValidator:
             return result
 
         # Tier 4: Comprehensive (full suite)
+        self._check_cancelled()
         start = time.time()
         full = self._run_full_test_suite()
         result.full_tests_passed = full.get("passed", 0)
@@ -270,11 +408,15 @@ class TieredValidator:
             viable.append(c)
         return viable
 
-    def _checkout_branch(self, branch: str) -> bool:
-        """Checkout a git branch with validation."""
+    def _is_safe_ref(self, branch: str) -> bool:
+        """Reject refs that git could read as options or ranges."""
         if not branch or not isinstance(branch, str):
             return False
-        if branch.startswith('-') or '..' in branch:
+        return not (branch.startswith('-') or '..' in branch)
+
+    def _checkout_branch(self, branch: str) -> bool:
+        """Checkout a git branch with validation."""
+        if not self._is_safe_ref(branch):
             return False
 
         try:
@@ -289,6 +431,57 @@ class TieredValidator:
             logger.error(f"Failed to checkout {branch}: {e}")
             return False
 
+    def _check_cancelled(self) -> None:
+        if self._cancel is not None and self._cancel.is_set():
+            raise ValidationCancelled()
+
+    def _run_command(self, cmd_args: list[str], timeout: float) -> subprocess.CompletedProcess:
+        """
+        Run a validation command in repo_path.
+
+        The timeout is capped by the candidate deadline, and the command is
+        killed if the candidate is cancelled while it runs.
+
+        Raises:
+            subprocess.TimeoutExpired: If the command or candidate timed out
+            ValidationCancelled: If the candidate was cancelled
+        """
+        self._check_cancelled()
+        if self._deadline is not None:
+            timeout = min(timeout, self._deadline - time.monotonic())
+            if timeout <= 0:
+                raise subprocess.TimeoutExpired(cmd_args, 0)
+
+        if self._cancel is None:
+            return subprocess.run(
+                cmd_args,
+                shell=False,
+                cwd=self.repo_path,
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+            )
+
+        end = time.monotonic() + timeout
+        with subprocess.Popen(
+            cmd_args,
+            shell=False,
+            cwd=self.repo_path,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+        ) as proc:
+            while True:
+                try:
+                    stdout, stderr = proc.communicate(timeout=self.POLL_INTERVAL)
+                    return subprocess.CompletedProcess(cmd_args, proc.returncode, stdout, stderr)
+                except subprocess.TimeoutExpired:
+                    if self._cancel.is_set() or time.monotonic() >= end:
+                        proc.kill()
+                        proc.communicate()
+                        self._check_cancelled()
+                        raise subprocess.TimeoutExpired(cmd_args, timeout)
+
     def _run_build(self) -> bool:
         """Run build and return success status."""
         command = self._detect_build_command()
@@ -302,18 +495,13 @@ class TieredValidator:
                 logger.error("Build command validation failed")
                 return False
 
-            result = subprocess.run(
-                cmd_args,
-                shell=False,
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True,
-                timeout=300,
-            )
+            result = self._run_command(cmd_args, timeout=300)
             return result.returncode == 0
         except subprocess.TimeoutExpired:
             logger.error("Build timed out")
             return False
+        except ValidationCancelled:
+            raise
         except Exception as e:
             logger.error(f"Build error: {e}")
             return False
@@ -378,14 +566,7 @@ class TieredValidator:
                 logger.warning("Lint command validation failed")
                 return 0.5
 
-            result = subprocess.run(
-                cmd_args,
-                shell=False,
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True,
-                timeout=120,
-            )
+            result = self._run_command(cmd_args, timeout=120)
 
             output = result.stdout + result.stderr
             issue_count = self._count_lint_issues(output)
@@ -401,6 +582,8 @@ class TieredValidator:
             else:
                 return 0.4
 
+        except ValidationCancelled:
+            raise
         except Exception as e:
             logger.warning(f"Lint check failed: {e}")
             return 0.5
@@ -479,14 +662,7 @@ class TieredValidator:
             return results
 
         try:
-            result = subprocess.run(
-                command,
-                shell=False,
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True,
-                timeout=self.targeted_test_timeout,
-            )
+            result = self._run_command(command, timeout=self.targeted_test_timeout)
 
             output = result.stdout + result.stderr
             return self._parse_test_results(output, result.returncode)
@@ -494,6 +670,8 @@ class TieredValidator:
         except subprocess.TimeoutExpired:
             logger.error("Targeted tests timed out")
             results["failed"] = 1
+        except ValidationCancelled:
+            raise
         except Exception as e:
             logger.error(f"Test error: {e}")
             results["failed"] = 1
@@ -510,14 +688,7 @@ class TieredValidator:
             return results
 
         try:
-            result = subprocess.run(
-                command,
-                shell=False,
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True,
-                timeout=self.full_test_timeout,
-            )
+            result = self._run_command(command, timeout=self.full_test_timeout)
 
             output = result.stdout + result.stderr
             return self._parse_test_results(output, result.returncode)
@@ -525,6 +696,8 @@ class TieredValidator:
         except subprocess.TimeoutExpired:
             logger.error("Full test suite timed out")
             results["failed"] = 1
+        except ValidationCancelled:
+            raise
         except Exception as e:
             logger.error(f"Test error: {e}")
             results["failed"] = 1
@@ -5,6 +5,7 @@ This module provides automated code reviews using multiple AI models.
 It supports two execution modes:"""
 
 import logging
+from importlib import import_module
 
 logger = logging.getLogger(__name__)
 
@@ -44,72 +45,77 @@ Model Strengths (from empirical testing):
 Model configuration: See .claude/review-config.yaml for canonical model settings.
 """
 
-# =============================================================================
-# CLI-Based Review System (PRIMARY)
-# Full repo access, best context understanding
-# =============================================================================
-from .context import ReviewContext, ReviewContextCollector
-from .router import ReviewRouter, ReviewMethod
-from .result import ReviewResult, ReviewFinding, Severity
-from .prompts import REVIEW_PROMPTS
-from .setup import setup_reviews, check_review_setup, ReviewSetup
-from .aider_executor import AiderExecutor
-from .cli_executor import CLIExecutor
-from .api_executor import APIExecutor
-
-# =============================================================================
-# Review Type Registry (ARCH-003)
-# Single source of truth for review types
-# =============================================================================
-from .registry import (
-    REVIEW_TYPES,
-    ReviewTypeDefinition,
-    get_review_item_mapping,
-    get_all_review_types,
-    get_review_type,
-    get_model_for_review,
-    get_workflow_item_ids,
-    validate_review_configuration,
-    get_configuration_status,
-    ReviewConfigurationError,
-)
-
-# =============================================================================
-# API-Based Orchestrator System (FALLBACK)
-# Used when CLIs unavailable or for merge conflict resolution
-# =============================================================================
-from .schema import (
-    # Enums
-    ReviewTier,
-    ReviewFocus,
-    IssueSeverity,
-    IssueCategory,
-    ConfidenceLevel,
-    # Configuration
-    ModelSpec,
-    TierConfig,
-    CriticalPathConfig,
-    ReviewConfig,
-    # Input/Output
-    ChangeContext,
-    ReviewIssue,
-    ModelReview,
-    SynthesizedReview,
-)
-
-from .orchestrator import (
-    ReviewOrchestrator,
-    get_default_config,
-    review_changes,
-    get_review_tier,
-)
-
-from .models import (
-    BaseReviewer,
-    LiteLLMReviewer,
-    SelfReviewer,
-    ReviewerFactory,
-)
+# Public names are resolved lazily (PEP 562): the registry is needed on hot CLI
+# paths such as ``orchestrator complete``, while the executors and the API
+# orchestrator pull in pydantic models, requests and the model registry.
+_LAZY_EXPORTS = {
+    # CLI-Based Review System (PRIMARY)
+    "ReviewContext": ".context",
+    "ReviewContextCollector": ".context",
+    "ReviewRouter": ".router",
+    "ReviewMethod": ".router",
+    "ReviewTiming": ".router",
+    "ReviewResult": ".result",
+    "ReviewFinding": ".result",
+    "Severity": ".result",
+    "REVIEW_PROMPTS": ".prompts",
+    "setup_reviews": ".setup",
+    "check_review_setup": ".setup",
+    "ReviewSetup": ".setup",
+    "AiderExecutor": ".aider_executor",
+    "CLIExecutor": ".cli_executor",
+    "APIExecutor": ".api_executor",
+    "ReviewResponseCache": ".response_cache",
+
+    # Review Type Registry (ARCH-003)
+    "REVIEW_TYPES": ".registry",
+    "ReviewTypeDefinition": ".registry",
+    "get_review_item_mapping": ".registry",
+    "get_all_review_types": ".registry",
+    "get_review_type": ".registry",
+    "get_model_for_review": ".registry",
+    "get_workflow_item_ids": ".registry",
+    "validate_review_configuration": ".registry",
+    "get_configuration_status": ".registry",
+    "ReviewConfigurationError": ".registry",
+
+    # API-Based Orchestrator System (FALLBACK)
+    "ReviewTier": ".schema",
+    "ReviewFocus": ".schema",
+    "IssueSeverity": ".schema",
+    "IssueCategory": ".schema",
+    "ConfidenceLevel": ".schema",
+    "ModelSpec": ".schema",
+    "TierConfig": ".schema",
+    "CriticalPathConfig": ".schema",
+    "ReviewConfig": ".schema",
+    "ChangeContext": ".schema",
+    "ReviewIssue": ".schema",
+    "ModelReview": ".schema",
+    "SynthesizedReview": ".schema",
+    "ReviewOrchestrator": ".orchestrator",
+    "get_default_config": ".orchestrator",
+    "review_changes": ".orchestrator",
+    "get_review_tier": ".orchestrator",
+    "BaseReviewer": ".models",
+    "LiteLLMReviewer": ".models",
+    "SelfReviewer": ".models",
+    "ReviewerFactory": ".models",
+}
+
+
+def __getattr__(name: str):
+    try:
+        module_name = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
 
 
 # =============================================================================
@@ -134,6 +140,10 @@ async def run_review(
     Returns:
         ReviewResult (CLI) or SynthesizedReview (API)
     """
+    from .router import ReviewRouter, ReviewMethod
+    from .schema import ChangeContext
+    from .orchestrator import ReviewOrchestrator
+
     if prefer_cli:
         # Try CLI-based review first
         try:
@@ -169,6 +179,7 @@ __all__ = [
     # Router
     "ReviewRouter",
     "ReviewMethod",
+    "ReviewTiming",
     # Results
     "ReviewResult",
     "ReviewFinding",
@@ -183,6 +194,7 @@ __all__ = [
     "AiderExecutor",
     "CLIExecutor",
     "APIExecutor",
+    "ReviewResponseCache",
 
     # =======================
     # API Orchestrator (Fallback)
@@ -9,9 +9,10 @@ import os
 import time
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 from .context import ReviewContext, ReviewContextCollector
+from .response_cache import ReviewResponseCache
 from .prompts import get_prompt, get_tool
 from .result import ReviewResult, ReviewErrorType, classify_http_error, parse_review_output
 from .retry import is_retryable_error, is_permanent_error, retry_with_backoff
@@ -21,6 +22,9 @@ from ..model_registry import get_latest_model
 
 logger = logging.getLogger(__name__)
 
+# Sampling temperature for review calls (low for more consistent reviews)
+REVIEW_TEMPERATURE = 0.3
+
 
 def get_openrouter_model(tool_category: str) -> str:
     """
@@ -45,19 +49,30 @@ class APIExecutor:
     the API doesn't have direct repository access.
     """
 
+    API_URL = "https://openrouter.ai/api/v1/chat/completions"
+
     def __init__(
         self,
         working_dir: Path,
         context_limit: Optional[int] = None,
         base_branch: str = "main",
-        api_key: Optional[str] = None
+        api_key: Optional[str] = None,
+        response_cache: Optional[ReviewResponseCache] = None,
+        use_cache: bool = True,
     ):
         self.working_dir = Path(working_dir).resolve()
         self.context_collector = ReviewContextCollector(
             working_dir=self.working_dir,
             context_limit=context_limit,
-            base_branch=base_branch
+            base_branch=base_branch,
+            use_cache=use_cache,
         )
+        if response_cache is None and use_cache:
+            from ..path_resolver import OrchestratorPaths
+            response_cache = ReviewResponseCache(
+                OrchestratorPaths(base_dir=self.working_dir).review_response_cache_dir()
+            )
+        self.response_cache = response_cache
         # Try to get API key from multiple sources:
         # 1. Passed directly
         # 2. Environment variable
@@ -73,13 +88,20 @@ class APIExecutor:
                 "Run: eval \"$(sops -d secrets.enc.yaml | sed 's/: /=/' | sed 's/^/export /')\" to load keys"
             )
 
-    def execute(self, review_type: str, context_override: Optional[str] = None) -> ReviewResult:
+    def execute(
+        self,
+        review_type: str,
+        context_override: Optional[str] = None,
+        use_cache: bool = True,
+    ) -> ReviewResult:
         """
         Execute a review using OpenRouter API.
 
         Args:
             review_type: One of security, consistency, quality, holistic
             context_override: Optional custom prompt to use instead of auto-collected context
+            use_cache: Reuse a cached response to an identical prompt
+                       (a fresh response is cached either way)
 
         Returns:
             ReviewResult with findings
@@ -101,8 +123,8 @@ class APIExecutor:
             tool = get_tool(review_type)
             model = get_openrouter_model(tool)
 
-            # Call OpenRouter
-            output = self._call_openrouter(prompt, model)
+            # Call OpenRouter (or reuse the response to an identical prompt)
+            output, cached = self._call_cached(self._call_openrouter, review_type, prompt, model, use_cache)
 
             duration = time.time() - start_time
 
@@ -120,6 +142,7 @@ class APIExecutor:
                 score=metadata.get("score"),
                 assessment=metadata.get("assessment"),
                 duration_seconds=duration,
+                cached=cached,
             )
 
             # Add truncation warning if applicable
@@ -151,7 +174,9 @@ class APIExecutor:
         review_type: str,
         fallbacks: Optional[list[str]] = None,
         no_fallback: bool = False,
-        context_override: Optional[str] = None
+        context_override: Optional[str] = None,
+        context: Optional[ReviewContext] = None,
+        use_cache: bool = True,
     ) -> ReviewResult:
         """
         Execute a review with automatic fallback on transient failures.
@@ -164,6 +189,10 @@ class APIExecutor:
                        If None, uses configured fallback chain for the tool.
             no_fallback: If True, disable fallback (fail immediately on error)
             context_override: Optional custom prompt
+            context: Pre-collected context (e.g. shared across review types);
+                     collected here if not given
+            use_cache: Reuse a cached response to an identical prompt
+                       (a fresh response is cached either way)
 
         Returns:
             ReviewResult with findings, was_fallback and fallback_reason set if applicable
@@ -186,13 +215,14 @@ class APIExecutor:
         models_to_try = [primary_model] + (fallbacks or [])
 
         # Collect context once (reused across attempts)
-        context = None
         prompt = None
         try:
             if context_override:
                 prompt = context_override
+                context = None
             else:
-                context = self.context_collector.collect(review_type)
+                if context is None:
+                    context = self.context_collector.collect(review_type)
                 prompt = self._build_prompt(review_type, context)
         except Exception as e:
             # Context collection failed - this is not retryable
@@ -219,13 +249,16 @@ class APIExecutor:
                 logger.debug(f"Trying model {model} for {review_type} (fallback={is_fallback})")
 
                 # Use retry_with_backoff for transient errors within same model
-                output = retry_with_backoff(
-                    self._call_openrouter,
-                    prompt,
-                    model,
-                    max_retries=2,  # Quick retries for same model
-                    base_delay=1.0,
-                )
+                def call(prompt: str, model: str) -> str:
+                    return retry_with_backoff(
+                        self._call_openrouter,
+                        prompt,
+                        model,
+                        max_retries=2,  # Quick retries for same model
+                        base_delay=1.0,
+                    )
+
+                output, cached = self._call_cached(call, review_type, prompt, model, use_cache)
 
                 duration = time.time() - start_time
                 model_used = model
@@ -246,6 +279,7 @@ class APIExecutor:
                     duration_seconds=duration,
                     was_fallback=is_fallback,
                     fallback_reason=fallback_reason if is_fallback else None,
+                    cached=cached,
                 )
 
                 # Add truncation warning if applicable
@@ -302,6 +336,37 @@ class APIExecutor:
             fallback_reason=fallback_reason,
         )
 
+    def _call_cached(
+        self,
+        call: Callable[[str, str], str],
+        review_type: str,
+        prompt: str,
+        model: str,
+        use_cache: bool,
+    ) -> tuple[str, bool]:
+        """
+        Run `call(prompt, model)` unless an identical request was cached.
+
+        With use_cache=False the cache is not read, but the fresh response
+        still replaces the cached one.
+
+        Returns:
+            (model output, whether it came from the cache)
+        """
+        if self.response_cache is None:
+            return call(prompt, model), False
+
+        key = ReviewResponseCache.key_for(model, review_type, prompt, REVIEW_TEMPERATURE)
+        if use_cache:
+            output = self.response_cache.get(key)
+            if output is not None:
+                logger.info(f"Using cached {review_type} review response from {model}")
+                return output, True
+
+        output = call(prompt, model)
+        self.response_cache.put(key, output, model=model, review_type=review_type)
+        return output, False
+
     def _sanitize_error(self, error: str) -> str:
         """Sanitize error message to avoid leaking sensitive information."""
         import re
@@ -321,12 +386,13 @@ class APIExecutor:
 
         CORE-026-E1: Wire error classification in executors.
         """
+        import httpx
         import requests
 
         # Check for specific exception types first
-        if isinstance(exc, requests.exceptions.Timeout):
+        if isinstance(exc, (httpx.TimeoutException, requests.exceptions.Timeout)):
             return ReviewErrorType.TIMEOUT
-        if isinstance(exc, requests.exceptions.ConnectionError):
+        if isinstance(exc, (httpx.TransportError, requests.exceptions.ConnectionError)):
             return ReviewErrorType.NETWORK_ERROR
 
         # Check for HTTP status codes in the error message
@@ -377,10 +443,10 @@ class APIExecutor:
 
         Returns the model's response text.
         """
-        import requests
+        from ..http_client import get_http_client
 
-        response = requests.post(
-            "https://openrouter.ai/api/v1/chat/completions",
+        response = get_http_client().post(
+            self.API_URL,
             headers={
                 "Authorization": f"Bearer {self.api_key}",
                 "Content-Type": "application/json",
@@ -404,10 +470,9 @@ class APIExecutor:
                     }
                 ],
                 "max_tokens": 4000,
-                "temperature": 0.3,  # Lower temperature for more consistent reviews
+                "temperature": REVIEW_TEMPERATURE,
             },
             timeout=300,  # 5 minute timeout
-            verify=True,  # Explicitly enforce SSL certificate verification
         )
 
         if response.status_code != 200:
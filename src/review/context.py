@@ -3,18 +3,52 @@ Review context collector.
 
 Gathers repository context for review prompts in API mode.
 In CLI mode, the tools (Codex/Gemini) access the repo directly.
+
+The expensive parts (git diff, changed file contents, related files) only
+depend on the commit and the uncommitted diff, so they are cached per
+HEAD + diff hash in memory and in .orchestrator/review_context_cache/ and
+reused by every review type and by `review-retry`.
 """
 
+import hashlib
+import json
 import os
+import posixpath
 import re
 import subprocess
 import logging
+import tempfile
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# Regexes used to find imports in changed files
+IMPORT_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    # Python: from X import Y, import X
+    r'(?:from|import)\s+([\w.]+)',
+    # JavaScript/TypeScript: import X from "Y"
+    r'import\s+.*?\s+from\s+["\']([^"\']+)["\']',
+    # JavaScript/TypeScript: require("X")
+    r'require\s*\(\s*["\']([^"\']+)["\']\s*\)',
+    # Go: import "X"
+    r'import\s+["\']([^"\']+)["\']',
+))
+
+# Standard library / external packages that never resolve to repo files
+EXTERNAL_MODULE_PREFIXES = (
+    "os", "sys", "re", "json", "typing", "datetime",
+    "pathlib", "subprocess", "logging", "dataclasses",
+    "enum", "abc", "functools", "collections",
+    "react", "vue", "angular", "@", "lodash", "axios",
+)
+
+# Directories skipped when listing files outside a git repository
+SKIPPED_DIRS = {".git", ".orchestrator", "node_modules", "__pycache__", ".venv", "venv"}
+
 
 class ReviewContextError(Exception):
     """Error collecting review context."""
@@ -65,6 +99,95 @@ class ReviewContext:
         return "\n\n".join(parts)
 
 
+class ReviewContextCache:
+    """
+    Per-commit store of collected review context.
+
+    Entries live in a process-wide LRU dict (shared by every collector) and
+    as JSON files in `cache_dir`, so a later process such as `review-retry`
+    reuses them. Each tier keeps only MAX_ENTRIES entries.
+    """
+
+    MAX_ENTRIES = 16
+
+    _memory: "OrderedDict[str, dict]" = OrderedDict()
+    _lock = threading.Lock()
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+
+    def get(self, key: str) -> Optional[dict]:
+        """Return the entry for `key`, or None if not cached."""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+        if entry is not None or self.cache_dir is None:
+            return entry
+
+        try:
+            with open(self.cache_dir / f"{key}.json") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable review context cache entry: {e}")
+            return None
+        self._remember(key, entry)
+        return entry
+
+    def put(self, key: str, entry: dict) -> None:
+        """Store `entry` under `key` (replacing any previous entry)."""
+        self._remember(key, entry)
+        if self.cache_dir is None:
+            return
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            gitignore_path = self.cache_dir / ".gitignore"
+            if not gitignore_path.exists():
+                # The cache lives in the user's repository; keep it out of git
+                gitignore_path.write_text("*\n")
+            fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(entry, f)
+                os.replace(temp_path, self.cache_dir / f"{key}.json")
+            except OSError:
+                Path(temp_path).unlink(missing_ok=True)
+                raise
+        except OSError as e:
+            logger.debug(f"Failed to write review context cache entry: {e}")
+            return
+        self._evict()
+
+    @classmethod
+    def clear_memory(cls) -> None:
+        """Drop all in-memory entries (files on disk are kept)."""
+        with cls._lock:
+            cls._memory.clear()
+
+    def _remember(self, key: str, entry: dict) -> None:
+        with self._lock:
+            self._memory[key] = entry
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.MAX_ENTRIES:
+                self._memory.popitem(last=False)
+
+    def _evict(self) -> None:
+        entries = []
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                entries.append((path.stat().st_mtime, path))
+            except FileNotFoundError:
+                continue
+        if len(entries) <= self.MAX_ENTRIES:
+            return
+        entries.sort()
+        for _, path in entries[:len(entries) - self.MAX_ENTRIES]:
+            path.unlink(missing_ok=True)
+
+
 class ReviewContextCollector:
     """
     Collects repository context for review prompts.
@@ -80,11 +203,17 @@ class ReviewContextCollector:
         self,
         working_dir: Path,
         context_limit: Optional[int] = None,
-        base_branch: str = "main"
+        base_branch: str = "main",
+        cache: Optional[ReviewContextCache] = None,
+        use_cache: bool = True,
     ):
         self.working_dir = Path(working_dir).resolve()
         self.context_limit = context_limit or self.DEFAULT_CONTEXT_LIMIT
         self.base_branch = base_branch
+        if cache is None and use_cache:
+            from ..path_resolver import OrchestratorPaths
+            cache = ReviewContextCache(OrchestratorPaths(base_dir=self.working_dir).review_context_cache_dir())
+        self.cache = cache
 
     def collect(self, review_type: str) -> ReviewContext:
         """
@@ -96,31 +225,69 @@ class ReviewContextCollector:
         Returns:
             ReviewContext with gathered information
         """
-        context = ReviewContext()
-
-        # Always get project context (type, build system, etc.)
-        context.project_context = self._detect_project_context()
-
-        # Always get git diff and changed files
-        context.git_diff = self._get_git_diff()
-        context.changed_files = self._get_changed_file_contents()
+        return self.collect_many([review_type])[review_type]
 
-        # Consistency and holistic reviews need related files
-        if review_type in ("consistency", "consistency_review", "holistic", "holistic_review"):
-            context.related_files = self._get_related_files(context.changed_files)
+    def collect_many(self, review_types: list[str]) -> dict[str, ReviewContext]:
+        """
+        Collect context for several review types at once.
 
-        # Try to get architecture docs for consistency review
-        if review_type in ("consistency", "consistency_review"):
-            context.architecture_docs = self._get_architecture_docs()
+        Each piece of context (diff, changed files, related files, docs) is
+        gathered once and shared by every review type that needs it; only
+        truncation is done per review type.
 
-        # For holistic review, add any context summary
-        if review_type in ("holistic", "holistic_review"):
-            context.context_summary = self._get_context_summary()
+        Args:
+            review_types: Review types, e.g. ["security", "consistency"]
 
-        # Truncate if needed
-        self._truncate_if_needed(context)
+        Returns:
+            Dict mapping each review type to its ReviewContext
+        """
+        needs_related = [t for t in review_types if t in ("consistency", "consistency_review", "holistic", "holistic_review")]
+        needs_docs = [t for t in review_types if t in ("consistency", "consistency_review")]
+        needs_summary = [t for t in review_types if t in ("holistic", "holistic_review")]
+
+        # Always get project context (type, build system), git diff and changed files
+        project_context = self._detect_project_context()
+
+        key = self._cache_key() if self.cache is not None else None
+        cached = self.cache.get(key) if key else None
+        if cached is not None:
+            git_diff = cached["git_diff"]
+            changed_files = cached["changed_files"]
+            related_files = cached.get("related_files")
+        else:
+            git_diff = self._get_git_diff()
+            changed_files = self._get_changed_file_contents()
+            related_files = None
 
-        return context
+        # Consistency and holistic reviews need related files
+        if needs_related and related_files is None:
+            related_files = self._get_related_files(changed_files)
+            cached = None  # Store the entry again with the related files
+        if key and cached is None:
+            self.cache.put(key, {
+                "git_diff": git_diff,
+                "changed_files": changed_files,
+                "related_files": related_files,
+            })
+        related_files = related_files or {}
+        # Architecture docs for consistency review, context summary for holistic
+        architecture_docs = self._get_architecture_docs() if needs_docs else None
+        context_summary = self._get_context_summary() if needs_summary else None
+
+        contexts = {}
+        for review_type in review_types:
+            # Truncation replaces (never mutates) the shared dicts and strings
+            context = ReviewContext(
+                git_diff=git_diff,
+                changed_files=changed_files,
+                related_files=related_files if review_type in needs_related else {},
+                architecture_docs=architecture_docs if review_type in needs_docs else None,
+                context_summary=context_summary if review_type in needs_summary else None,
+                project_context=project_context,
+            )
+            self._truncate_if_needed(context)
+            contexts[review_type] = context
+        return contexts
 
     def _detect_project_context(self) -> str:
         """Detect project type and build configuration."""
@@ -187,6 +354,35 @@ class ReviewContextCollector:
         except FileNotFoundError:
             raise ReviewContextError("git not found. Is git installed?")
 
+    def _cache_key(self) -> Optional[str]:
+        """
+        Key identifying the current commit and uncommitted changes.
+
+        Combines HEAD, the base branch tip and a hash of `git diff HEAD`
+        (staged and unstaged changes). Returns None outside a git repository
+        or before the first commit, which disables caching.
+        """
+        def git(*args: str) -> Optional[bytes]:
+            try:
+                result = subprocess.run(
+                    ["git", *args], cwd=self.working_dir, capture_output=True, timeout=30
+                )
+            except (subprocess.TimeoutExpired, OSError):
+                return None
+            return result.stdout if result.returncode == 0 else None
+
+        head = git("rev-parse", "HEAD")
+        diff = git("diff", "HEAD")
+        if head is None or diff is None:
+            return None
+        base = git("rev-parse", "--verify", "--quiet", self.base_branch) or b""
+
+        digest = hashlib.sha256()
+        for part in (str(self.working_dir).encode(), self.base_branch.encode(), head, base, diff):
+            digest.update(part)
+            digest.update(b"\0")
+        return digest.hexdigest()
+
     def _get_git_diff(self) -> str:
         """Get git diff for current changes."""
         # Try diff against base branch first
@@ -262,37 +458,26 @@ class ReviewContextCollector:
         This is a best-effort analysis using regex patterns.
         """
         related = {}
-        import_patterns = [
-            # Python: from X import Y, import X
-            r'(?:from|import)\s+([\w.]+)',
-            # JavaScript/TypeScript: import X from "Y"
-            r'import\s+.*?\s+from\s+["\']([^"\']+)["\']',
-            # JavaScript/TypeScript: require("X")
-            r'require\s*\(\s*["\']([^"\']+)["\']\s*\)',
-            # Go: import "X"
-            r'import\s+["\']([^"\']+)["\']',
-        ]
-
         imported_modules = set()
 
         for path, content in changed_files.items():
             if content.startswith("("):  # Skip error placeholders
                 continue
 
-            for pattern in import_patterns:
-                for match in re.finditer(pattern, content):
-                    module = match.group(1)
-                    imported_modules.add(module)
+            for pattern in IMPORT_PATTERNS:
+                for match in pattern.finditer(content):
+                    imported_modules.add(match.group(1))
 
-        # Try to resolve imports to files
-        for module in imported_modules:
-            # Skip standard library / external packages
-            if module.startswith(("os", "sys", "re", "json", "typing", "datetime",
-                                   "pathlib", "subprocess", "logging", "dataclasses",
-                                   "enum", "abc", "functools", "collections",
-                                   "react", "vue", "angular", "@", "lodash", "axios")):
-                continue
+        # Skip standard library / external packages
+        imported_modules = {m for m in imported_modules if not m.startswith(EXTERNAL_MODULE_PREFIXES)}
+        if not imported_modules:
+            return related
 
+        # One listing of the repository instead of probing paths per module
+        repo_files = self._list_repo_files()
+
+        # Try to resolve imports to files
+        for module in sorted(imported_modules):
             # Try to find the file
             possible_paths = [
                 f"{module.replace('.', '/')}.py",
@@ -308,8 +493,9 @@ class ReviewContextCollector:
             ]
 
             for possible_path in possible_paths:
-                file_path = self.working_dir / possible_path
-                if file_path.exists() and possible_path not in changed_files:
+                # Listed paths are normalised ("./utils.js" is "utils.js")
+                if posixpath.normpath(possible_path) in repo_files and possible_path not in changed_files:
+                    file_path = self.working_dir / possible_path
                     try:
                         if file_path.stat().st_size <= self.MAX_FILE_SIZE:
                             related[possible_path] = file_path.read_text(encoding="utf-8")
@@ -319,6 +505,33 @@ class ReviewContextCollector:
 
         return related
 
+    def _list_repo_files(self) -> set[str]:
+        """
+        List repository files as POSIX paths relative to the working dir.
+
+        Uses tracked plus untracked, non-ignored files from git, falling back
+        to walking the directory outside a git repository.
+        """
+        try:
+            result = subprocess.run(
+                ["git", "ls-files", "-z", "--cached", "--others", "--exclude-standard"],
+                cwd=self.working_dir,
+                capture_output=True,
+                timeout=30,
+            )
+            if result.returncode == 0:
+                return {p for p in result.stdout.decode("utf-8", "surrogateescape").split("\0") if p}
+        except (subprocess.TimeoutExpired, OSError):
+            pass
+
+        files = set()
+        for root, dirs, names in os.walk(self.working_dir):
+            dirs[:] = [d for d in dirs if d not in SKIPPED_DIRS]
+            rel_root = Path(root).relative_to(self.working_dir)
+            for name in names:
+                files.add((rel_root / name).as_posix())
+        return files
+
     def _get_architecture_docs(self) -> Optional[str]:
         """Load architecture documentation if available."""
         doc_paths = [
@@ -0,0 +1,165 @@
+"""
+Review response cache.
+
+Retrying a review (`review-retry`) or re-running it on an unchanged diff
+sends the exact same prompt to the same model again. Successful responses
+are cached keyed by:
+
+- the model ID
+- the review type
+- a hash of the full prompt (which embeds the diff and file contents)
+- the sampling temperature
+
+so any change to the code under review produces a new key. Failed calls are
+never cached.
+
+Entries are JSON files in .orchestrator/review_response_cache/. The total size
+is bounded and the least-recently-used entries are evicted first. Hit/miss
+counters are kept in stats.json next to the entries so `review-status` can
+report them.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+STATS_FILE = "stats.json"
+
+
+class ReviewResponseCache:
+    """Content-addressed store of raw review model responses."""
+
+    def __init__(self, cache_dir: Path, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key_for(model: str, review_type: str, prompt: str, temperature: float) -> str:
+        """Cache key for sending `prompt` to `model` for `review_type`."""
+        prompt_hash = hashlib.sha256(prompt.encode("utf-8", "surrogatepass")).hexdigest()
+        content = json.dumps([model, review_type, prompt_hash, temperature])
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for `key` (counting a hit or miss)."""
+        path = self._entry_path(key)
+        try:
+            with open(path) as f:
+                entry = json.load(f)
+            output = entry["output"]
+        except FileNotFoundError:
+            self._count("misses")
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.debug(f"Discarding unreadable review response cache entry {path}: {e}")
+            path.unlink(missing_ok=True)
+            self._count("misses")
+            return None
+
+        try:
+            os.utime(path)  # Recency for LRU eviction
+        except OSError:
+            pass
+        self._count("hits")
+        return output
+
+    def put(self, key: str, output: str, model: str, review_type: str) -> None:
+        """Store a successful response and evict beyond max_bytes."""
+        entry = {
+            "created_at": time.time(),
+            "model": model,
+            "review_type": review_type,
+            "output": output,
+        }
+        try:
+            self._write_json(self._entry_path(key), entry)
+        except OSError as e:
+            logger.debug(f"Failed to write review response cache entry: {e}")
+            return
+        self._evict()
+
+    def stats(self) -> dict:
+        """Hit/miss counters plus the number and total size of entries."""
+        counters = self._read_stats()
+        entries = self._entries()
+        return {
+            "hits": counters.get("hits", 0),
+            "misses": counters.get("misses", 0),
+            "entries": len(entries),
+            "size_bytes": sum(size for _, size, _ in entries),
+        }
+
+    def clear(self) -> None:
+        """Remove all cached responses and reset the counters."""
+        for path in self.cache_dir.glob("*.json"):
+            path.unlink(missing_ok=True)
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def _entries(self) -> list[tuple[float, int, Path]]:
+        entries = []
+        for path in self.cache_dir.glob("*.json"):
+            if path.name == STATS_FILE:
+                continue
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _evict(self) -> None:
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        if total <= self.max_bytes:
+            return
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def _read_stats(self) -> dict:
+        try:
+            with open(self.cache_dir / STATS_FILE) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _count(self, counter: str) -> None:
+        # Reviews run on a thread pool; the lock keeps increments from
+        # overwriting each other within a process
+        with self._lock:
+            stats = self._read_stats()
+            stats[counter] = stats.get(counter, 0) + 1
+            try:
+                self._write_json(self.cache_dir / STATS_FILE, stats)
+            except OSError as e:
+                logger.debug(f"Failed to update review response cache stats: {e}")
+
+    def _write_json(self, path: Path, data: dict) -> None:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        gitignore_path = self.cache_dir / ".gitignore"
+        if not gitignore_path.exists():
+            # Responses are per-machine; never committed with the user's repo
+            gitignore_path.write_text("*\n")
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f)
+            os.replace(temp_path, path)
+        except OSError:
+            Path(temp_path).unlink(missing_ok=True)
+            raise
@@ -156,6 +156,7 @@ class ReviewResult:
     fallbacks_tried: list[str] = field(default_factory=list)  # Issue #89: Models attempted before success
     # CORE-026: Error type classification for recovery guidance
     error_type: ReviewErrorType = ReviewErrorType.NONE
+    cached: bool = False  # True if the model response came from the response cache
 
     def has_blocking_findings(self) -> bool:
         """Check if any findings should block the workflow."""
@@ -187,6 +188,7 @@ class ReviewResult:
             "fallbacks_tried": self.fallbacks_tried,  # Issue #89
             # CORE-026: Error type classification
             "error_type": self.error_type.value,
+            "cached": self.cached,
         }
 
     @classmethod
@@ -217,6 +219,7 @@ class ReviewResult:
             fallbacks_tried=data.get("fallbacks_tried", []),  # Issue #89
             # CORE-026: Error type classification
             error_type=ReviewErrorType.from_string(data.get("error_type", "")),
+            cached=data.get("cached", False),
         )
 
 
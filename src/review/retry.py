@@ -10,6 +10,7 @@ import time
 import logging
 from typing import Callable, TypeVar, Tuple, Type, Optional
 
+import httpx
 import requests
 
 logger = logging.getLogger(__name__)
@@ -18,6 +19,8 @@ T = TypeVar("T")
 
 # Exceptions that indicate transient failures (should retry)
 TRANSIENT_EXCEPTIONS: Tuple[Type[Exception], ...] = (
+    httpx.TimeoutException,
+    httpx.TransportError,
     requests.exceptions.Timeout,
     requests.exceptions.ConnectionError,
     ConnectionError,
@@ -10,10 +10,13 @@ Supports three execution methods:
 import os
 import shutil
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 from .context import ReviewContext, ReviewContextCollector
 from .result import ReviewResult
@@ -176,63 +179,67 @@ def _ping_api(model: str, api_key: str) -> Optional[str]:
     Returns:
         None if successful, error message string if failed
     """
-    import urllib.request
-    import urllib.error
-    import json
+    import httpx
+    from ..http_client import get_http_client
+
+    headers = {"Authorization": f"Bearer {api_key}"}
+    params = None
+
+    if model in ("openrouter",):
+        # OpenRouter: GET /api/v1/models
+        url = "https://openrouter.ai/api/v1/models"
+    elif model in ("openai", "codex"):
+        # OpenAI: GET /v1/models
+        url = "https://api.openai.com/v1/models"
+    elif model in ("gemini",):
+        # Google AI: GET models with key parameter
+        url = "https://generativelanguage.googleapis.com/v1beta/models"
+        headers = {}
+        params = {"key": api_key}
+    elif model in ("grok",):
+        # XAI: GET /v1/models (or use OpenRouter if available)
+        # Check if this looks like an OpenRouter key
+        if api_key.startswith("sk-or-"):
+            url = "https://openrouter.ai/api/v1/models"
+        else:
+            url = "https://api.x.ai/v1/models"
+    else:
+        # Unknown model, skip ping
+        logger.debug(f"No ping endpoint configured for model: {model}")
+        return None
 
     try:
-        if model in ("openrouter",):
-            # OpenRouter: GET /api/v1/models
-            req = urllib.request.Request(
-                "https://openrouter.ai/api/v1/models",
-                headers={"Authorization": f"Bearer {api_key}"},
-                method="GET",
-            )
-        elif model in ("openai", "codex"):
-            # OpenAI: GET /v1/models
-            req = urllib.request.Request(
-                "https://api.openai.com/v1/models",
-                headers={"Authorization": f"Bearer {api_key}"},
-                method="GET",
-            )
-        elif model in ("gemini",):
-            # Google AI: GET models with key parameter
-            req = urllib.request.Request(
-                f"https://generativelanguage.googleapis.com/v1beta/models?key={api_key}",
-                method="GET",
-            )
-        elif model in ("grok",):
-            # XAI: GET /v1/models (or use OpenRouter if available)
-            # Check if this looks like an OpenRouter key
-            if api_key.startswith("sk-or-"):
-                req = urllib.request.Request(
-                    "https://openrouter.ai/api/v1/models",
-                    headers={"Authorization": f"Bearer {api_key}"},
-                    method="GET",
-                )
-            else:
-                req = urllib.request.Request(
-                    "https://api.x.ai/v1/models",
-                    headers={"Authorization": f"Bearer {api_key}"},
-                    method="GET",
-                )
-        else:
-            # Unknown model, skip ping
-            logger.debug(f"No ping endpoint configured for model: {model}")
-            return None
-
-        with urllib.request.urlopen(req, timeout=10) as response:
-            # Success - key is valid
-            return None
-
-    except urllib.error.HTTPError as e:
-        return f"API returned HTTP {e.code}: {e.reason}"
-    except urllib.error.URLError as e:
-        return f"Network error: {e.reason}"
+        # Only the status matters; don't download the (large) model list
+        with get_http_client().stream("GET", url, headers=headers, params=params, timeout=10) as response:
+            if response.status_code >= 400:
+                return f"API returned HTTP {response.status_code}: {response.reason_phrase}"
+        # Success - key is valid
+        return None
+
+    except httpx.TransportError as e:
+        return f"Network error: {e}"
     except Exception as e:
         return f"Ping failed: {str(e)}"
 
 
+# Concurrent review execution defaults
+DEFAULT_REVIEW_CONCURRENCY = 4  # Reviews in flight at once
+DEFAULT_PROVIDER_CONCURRENCY = 2  # Reviews in flight per provider (codex, gemini, grok)
+
+
+@dataclass
+class ReviewTiming:
+    """Latency of a batch of reviews."""
+    wall_seconds: float  # Elapsed time for the whole batch
+    serial_seconds: float  # Sum of individual review durations
+    concurrent: bool = False
+
+    @property
+    def speedup(self) -> float:
+        """How much faster the batch was than running reviews back to back."""
+        return self.serial_seconds / self.wall_seconds if self.wall_seconds > 0 else 1.0
+
+
 class ReviewMethod(Enum):
     """Available review execution methods."""
     CLI = "cli"
@@ -266,12 +273,14 @@ class ReviewRouter:
         method: Optional[str] = None,
         context_limit: Optional[int] = None,
         base_branch: str = "main",
-        no_fallback: bool = False
+        no_fallback: bool = False,
+        use_cache: bool = True,
     ):
         self.working_dir = Path(working_dir).resolve()
         self.context_limit = context_limit
         self.base_branch = base_branch
         self.no_fallback = no_fallback  # CORE-028b: Disable fallback
+        self.use_cache = use_cache  # Reuse cached API responses to identical prompts
 
         # Auto-load API keys from SOPS/secrets before checking setup
         self._loaded_keys = ensure_api_keys_loaded()
@@ -293,6 +302,9 @@ class ReviewRouter:
         self._aider_executor = None
         self._api_executor = None
 
+        # Timing of the last execute_all_reviews() call
+        self.last_timing: Optional[ReviewTiming] = None
+
     @property
     def method(self) -> ReviewMethod:
         """Current execution method."""
@@ -337,6 +349,7 @@ class ReviewRouter:
         self,
         review_type: str,
         context_override: Optional[str] = None,
+        context: Optional[ReviewContext] = None,
     ) -> ReviewResult:
         """
         Execute a review using the appropriate method.
@@ -344,6 +357,7 @@ class ReviewRouter:
         Args:
             review_type: One of security, consistency, quality, holistic, critique
             context_override: Optional custom prompt/context to use instead of auto-collected context
+            context: Pre-collected context (API method only; CLI tools read the repo themselves)
 
         Returns:
             ReviewResult with findings
@@ -358,7 +372,7 @@ class ReviewRouter:
         elif self._method == ReviewMethod.AIDER:
             return self._execute_aider(review_type, context_override)
         elif self._method == ReviewMethod.API:
-            return self._execute_api(review_type, context_override)
+            return self._execute_api(review_type, context_override, context)
         else:
             return ReviewResult(
                 review_type=review_type,
@@ -388,8 +402,24 @@ class ReviewRouter:
         # Aider uses full repo access, context_override not applicable
         return self._aider_executor.execute(review_type)
 
-    def _execute_api(self, review_type: str, context_override: Optional[str] = None) -> ReviewResult:
+    def _execute_api(
+        self,
+        review_type: str,
+        context_override: Optional[str] = None,
+        context: Optional[ReviewContext] = None,
+    ) -> ReviewResult:
         """Execute review using OpenRouter API."""
+        # CORE-028b: Use execute_with_fallback for automatic fallback on transient errors
+        return self._get_api_executor().execute_with_fallback(
+            review_type,
+            context_override=context_override,
+            no_fallback=self.no_fallback,
+            context=context,
+            use_cache=self.use_cache,
+        )
+
+    def _get_api_executor(self):
+        """Get (creating on first use) the API executor."""
         from .api_executor import APIExecutor
 
         if self._api_executor is None:
@@ -398,25 +428,112 @@ class ReviewRouter:
                 context_limit=self.context_limit,
                 base_branch=self.base_branch
             )
+        return self._api_executor
 
-        # CORE-028b: Use execute_with_fallback for automatic fallback on transient errors
-        return self._api_executor.execute_with_fallback(
-            review_type,
-            context_override=context_override,
-            no_fallback=self.no_fallback
-        )
-
-    def execute_all_reviews(self) -> dict[str, ReviewResult]:
+    def execute_all_reviews(
+        self,
+        concurrent: bool = False,
+        max_concurrency: int = DEFAULT_REVIEW_CONCURRENCY,
+        provider_limits: Optional[dict[str, int]] = None,
+    ) -> dict[str, ReviewResult]:
         """
         Execute all reviews defined in the registry.
 
         ARCH-003: Review types are now defined in registry.py (single source of truth).
         See registry.REVIEW_TYPES for the canonical list.
 
+        Batch latency (wall clock vs. sum of review durations) is recorded
+        in self.last_timing.
+
+        Args:
+            concurrent: Run reviews concurrently (see iter_reviews)
+            max_concurrency: Reviews in flight at once when concurrent
+            provider_limits: Per-provider concurrency caps when concurrent
+
         Returns:
-            Dict mapping review_type to ReviewResult
+            Dict mapping review_type to ReviewResult, in registry order
         """
-        results = {}
-        for review_type in get_all_review_types():
-            results[review_type] = self.execute_review(review_type)
+        review_types = get_all_review_types()
+        start = time.perf_counter()
+
+        if concurrent:
+            completed = {
+                result.review_type: result
+                for result in self.iter_reviews(review_types, max_concurrency, provider_limits)
+            }
+            results = {review_type: completed[review_type] for review_type in review_types}
+        else:
+            results = {}
+            for review_type in review_types:
+                results[review_type] = self.execute_review(review_type)
+
+        self.last_timing = ReviewTiming(
+            wall_seconds=time.perf_counter() - start,
+            serial_seconds=sum(r.duration_seconds or 0 for r in results.values()),
+            concurrent=concurrent,
+        )
         return results
+
+    def iter_reviews(
+        self,
+        review_types: Optional[list[str]] = None,
+        max_concurrency: int = DEFAULT_REVIEW_CONCURRENCY,
+        provider_limits: Optional[dict[str, int]] = None,
+    ) -> Iterator[ReviewResult]:
+        """
+        Run reviews concurrently, yielding each result as it completes.
+
+        In API mode the review context is collected once for all review
+        types. Besides the overall max_concurrency, each provider (the tool
+        a review type is routed to: codex, gemini, grok) has its own cap so
+        one provider is not sent every review at once.
+
+        Args:
+            review_types: Review types to run (default: all registered types)
+            max_concurrency: Reviews in flight at once
+            provider_limits: Per-provider caps, e.g. {"gemini": 1};
+                             unlisted providers get DEFAULT_PROVIDER_CONCURRENCY
+
+        Yields:
+            ReviewResult in completion order
+        """
+        review_types = [t.replace("_review", "") for t in (review_types or get_all_review_types())]
+        if not review_types:
+            return
+
+        contexts: dict[str, ReviewContext] = {}
+        if self._method == ReviewMethod.API:
+            collector = self._get_api_executor().context_collector
+            try:
+                contexts = collector.collect_many(review_types)
+            except Exception as e:
+                # Each review collects (and reports failures for) its own context
+                logger.warning(f"Shared review context collection failed: {e}")
+
+        provider_limits = provider_limits or {}
+        semaphores: dict[str, threading.BoundedSemaphore] = {}
+        for review_type in review_types:
+            provider = get_tool(review_type)
+            if provider not in semaphores:
+                semaphores[provider] = threading.BoundedSemaphore(
+                    max(1, provider_limits.get(provider, DEFAULT_PROVIDER_CONCURRENCY))
+                )
+
+        def run(review_type: str) -> ReviewResult:
+            with semaphores[get_tool(review_type)]:
+                return self.execute_review(review_type, context=contexts.get(review_type))
+
+        # Create executors up front so worker threads never race to do it
+        if self._method == ReviewMethod.CLI:
+            from .cli_executor import CLIExecutor
+            if self._cli_executor is None:
+                self._cli_executor = CLIExecutor(self.working_dir)
+        elif self._method == ReviewMethod.AIDER:
+            from .aider_executor import AiderExecutor
+            if self._aider_executor is None:
+                self._aider_executor = AiderExecutor(self.working_dir)
+
+        with ThreadPoolExecutor(max_workers=max(1, max_concurrency), thread_name_prefix="review") as pool:
+            futures = [pool.submit(run, review_type) for review_type in review_types]
+            for future in as_completed(futures):
+                yield future.result()
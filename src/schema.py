@@ -118,6 +118,10 @@ class ChecklistItemDef(BaseModel):
     evidence_schema: Optional[str] = None  # Name of Pydantic model for evidence (e.g., "CodeAnalysisEvidence")
     evidence_prompt: Optional[str] = None  # Custom prompt for generating evidence
 
+    # Parallel verification (complete --all / advance --verify-parallel)
+    depends_on: list[str] = Field(default_factory=list)  # Item IDs in the same phase verified first
+    serial: bool = False  # Run this item's command verification alone, never alongside others
+
     @field_validator('id')
     @classmethod
     def id_must_be_valid(cls, v):
@@ -184,6 +188,48 @@ class PhaseDef(BaseModel):
             raise ValueError('phase id must be uppercase')
         return v.upper()
 
+    @model_validator(mode='after')
+    def validate_item_dependencies(self):
+        """Item dependencies must reference items in this phase and be acyclic."""
+        item_ids = {item.id for item in self.items}
+        for item in self.items:
+            unknown = [dep for dep in item.depends_on if dep not in item_ids]
+            if unknown:
+                raise ValueError(f"item '{item.id}' depends on unknown items in phase {self.id}: {', '.join(unknown)}")
+        self.items_in_dependency_order()
+        return self
+
+    def items_in_dependency_order(self) -> list[ChecklistItemDef]:
+        """
+        Items ordered so that every item follows its dependencies.
+
+        Definition order is kept wherever dependencies allow.
+
+        Raises:
+            ValueError: If item dependencies form a cycle
+        """
+        by_id = {item.id: item for item in self.items}
+        ordered: list[ChecklistItemDef] = []
+        visiting: set[str] = set()
+        visited: set[str] = set()
+
+        def visit(item: ChecklistItemDef):
+            if item.id in visited:
+                return
+            if item.id in visiting:
+                raise ValueError(f"circular item dependency in phase {self.id} involving '{item.id}'")
+            visiting.add(item.id)
+            for dep in item.depends_on:
+                if dep in by_id:
+                    visit(by_id[dep])
+            visiting.discard(item.id)
+            visited.add(item.id)
+            ordered.append(item)
+
+        for item in self.items:
+            visit(item)
+        return ordered
+
 
 class SupervisionMode(str, Enum):
     """Supervision mode - determines how much human oversight is required."""
@@ -219,6 +265,15 @@ class WorkflowSettings(BaseModel):
     test_command: Optional[str] = None
     build_command: Optional[str] = None
     reviews: ReviewSettings = Field(default_factory=ReviewSettings)
+    # Append item transitions to a state journal instead of rewriting state.json
+    state_journal: bool = False
+    state_journal_compact_every: int = Field(default=50, ge=1)  # Deltas before compaction
+    # Concurrent command verifications for complete --all / advance --verify-parallel
+    max_parallel_verifications: int = Field(default=4, ge=1)
+    # Reuse passing command verifications on an unchanged working tree
+    verification_cache: bool = True
+    verification_cache_ttl_seconds: int = Field(default=24 * 60 * 60, ge=0)
+    verification_cache_max_entries: int = Field(default=256, ge=1)
 
     @field_validator('supervision_mode', mode='before')
     @classmethod
@@ -340,6 +395,7 @@ class EventType(str, Enum):
     ITEM_FAILED = "item_failed"
     VERIFICATION_PASSED = "verification_passed"
     VERIFICATION_FAILED = "verification_failed"
+    VERIFICATION_BATCH_COMPLETED = "verification_batch_completed"
     HUMAN_OVERRIDE = "human_override"
     NOTE_ADDED = "note_added"
     ERROR = "error"
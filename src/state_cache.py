@@ -0,0 +1,158 @@
+"""
+Process-level cache of parsed workflow state.
+
+A single CLI invocation often builds several WorkflowEngine objects and calls
+load_state repeatedly. Each load re-parsed the JSON, re-ran datetime parsing,
+re-validated WorkflowState and re-built the version-locked WorkflowDef.
+
+Parsed states are cached keyed on the identity of the files they were read
+from: (path, inode, mtime_ns, size) of the state file and of its journal.
+Any write - atomic rename, journal append, external edit - changes the key,
+so a stale entry is never served.
+
+Callers receive their own copy of the cached WorkflowState, since engines
+mutate state in place. WorkflowDef objects are shared: they are deduplicated
+by content hash and must be treated as read-only.
+"""
+
+import copy
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+from .schema import WorkflowDef, WorkflowState
+
+MAX_CACHED_STATES = 16
+MAX_CACHED_DEFINITIONS = 8
+
+
+def file_fingerprint(*paths: Path) -> tuple:
+    """Identity of a set of files: (path, inode, mtime_ns, size), None if missing."""
+    fingerprint = []
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            fingerprint.append((str(path), None))
+            continue
+        fingerprint.append((str(path), st.st_ino, st.st_mtime_ns, st.st_size))
+    return tuple(fingerprint)
+
+
+def copy_state(state: WorkflowState) -> WorkflowState:
+    """
+    Copy a WorkflowState so the copy can be mutated independently.
+
+    Phases and items are copied structurally (much cheaper than a deep copy
+    or re-validation); metadata is deep-copied because CLI commands update
+    nested metadata dicts in place. workflow_definition is shared.
+    """
+    phases = {
+        phase_id: phase.model_copy(update={
+            "items": {item_id: item.model_copy() for item_id, item in phase.items.items()}
+        })
+        for phase_id, phase in state.phases.items()
+    }
+    return state.model_copy(update={
+        "phases": phases,
+        "metadata": copy.deepcopy(state.metadata),
+        "constraints": list(state.constraints),
+    })
+
+
+class ParsedStateCache:
+    """LRU cache of parsed WorkflowState objects and deduplicated WorkflowDefs."""
+
+    def __init__(self, max_states: int = MAX_CACHED_STATES, max_definitions: int = MAX_CACHED_DEFINITIONS):
+        self.max_states = max_states
+        self.max_definitions = max_definitions
+        self._states: OrderedDict[str, tuple[tuple, WorkflowState]] = OrderedDict()
+        self._definitions: OrderedDict[str, WorkflowDef] = OrderedDict()
+        # id(definition dict) -> (definition dict, content hash), avoids rehashing
+        # the definition shared by copies of the same cached state
+        self._definition_hashes: dict[int, tuple[dict, str]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_state(self, fingerprint: tuple) -> Optional[WorkflowState]:
+        """Return a private copy of the cached state for these files, if fresh."""
+        path = fingerprint[0][0]
+        with self._lock:
+            entry = self._states.get(path)
+            if entry is None or entry[0] != fingerprint:
+                self.misses += 1
+                return None
+            self._states.move_to_end(path)
+            self.hits += 1
+            state = entry[1]
+        return copy_state(state)
+
+    def put_state(self, fingerprint: tuple, state: WorkflowState) -> WorkflowState:
+        """
+        Cache a freshly parsed state.
+
+        Returns:
+            A copy for the caller; the cached instance is never handed out.
+        """
+        path = fingerprint[0][0]
+        with self._lock:
+            self._states[path] = (fingerprint, state)
+            self._states.move_to_end(path)
+            while len(self._states) > self.max_states:
+                self._states.popitem(last=False)
+        return copy_state(state)
+
+    def get_workflow_def(self, definition: dict) -> WorkflowDef:
+        """Build (or reuse) the WorkflowDef for a version-locked definition dict."""
+        digest = self._definition_hash(definition)
+        with self._lock:
+            workflow_def = self._definitions.get(digest)
+            if workflow_def is not None:
+                self._definitions.move_to_end(digest)
+                return workflow_def
+
+        workflow_def = WorkflowDef(**definition)
+        with self._lock:
+            self._definitions[digest] = workflow_def
+            while len(self._definitions) > self.max_definitions:
+                self._definitions.popitem(last=False)
+        return workflow_def
+
+    def clear(self) -> None:
+        with self._lock:
+            self._states.clear()
+            self._definitions.clear()
+            self._definition_hashes.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def _definition_hash(self, definition: dict) -> str:
+        known = self._definition_hashes.get(id(definition))
+        if known is not None and known[0] is definition:
+            return known[1]
+        digest = hashlib.sha256(
+            json.dumps(definition, separators=(',', ':'), default=str).encode()
+        ).hexdigest()
+        with self._lock:
+            if len(self._definition_hashes) >= self.max_states * 2:
+                self._definition_hashes.clear()
+            self._definition_hashes[id(definition)] = (definition, digest)
+        return digest
+
+
+_state_cache = ParsedStateCache()
+
+
+def get_state_cache() -> ParsedStateCache:
+    """Get the process-wide parsed state cache."""
+    return _state_cache
+
+
+def clear_state_cache() -> None:
+    """Drop all cached states and workflow definitions."""
+    _state_cache.clear()
@@ -0,0 +1,289 @@
+"""
+Journaled workflow state persistence.
+
+By default WorkflowEngine.save_state rewrites the whole state file (including
+the embedded workflow definition) on every transition. In journaled mode
+(workflow setting ``state_journal: true``) a save appends only what changed
+since the last save as a small delta record, and the snapshot is compacted
+in the background once enough deltas have accumulated.
+
+Files (next to the state file):
+    state.json       # Snapshot, same format as non-journaled mode
+    state.journal    # JSONL delta records, one per save
+
+Delta record:
+    {"ops": [["set", ["phases", "PLAN", "items", "x"], {...}], ...],
+     "crc": "<sha256 of the ops, truncated>"}
+
+Operations are idempotent path assignments, so replaying records that were
+already folded into the snapshot (a crash between writing the snapshot and
+truncating the journal) yields the same state. A torn or corrupt record (for
+example from a crash mid-append) is skipped with a warning.
+
+Locking: all readers and writers take flock on the journal file, shared for
+reads and exclusive for appends, snapshots and compaction, so a reader never
+sees a compacted snapshot together with the pre-compaction journal.
+"""
+
+import fcntl
+import hashlib
+import json
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+from .state_version import compute_state_checksum, STATE_VERSION
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_COMPACT_EVERY = 50
+
+# Snapshot metadata keys, excluded from deltas and checksums
+_META_KEYS = ('_checksum', '_version', '_updated_at')
+
+
+def _record_checksum(ops: list) -> str:
+    content = json.dumps(ops, sort_keys=True, default=str)
+    return hashlib.sha256(content.encode()).hexdigest()[:16]
+
+
+def diff_state(old: dict, new: dict) -> list:
+    """
+    Compute the operations that turn `old` into `new`.
+
+    Top-level fields and phase fields are compared individually; each
+    checklist item is replaced as a whole when it changed, which keeps item
+    transitions to a single small operation.
+    """
+    ops = []
+    for key in old.keys() - new.keys():
+        ops.append(["del", [key], None])
+    for key, value in new.items():
+        if key == "phases" and isinstance(old.get("phases"), dict):
+            ops.extend(_diff_phases(old["phases"], value))
+        elif key not in old or old[key] != value:
+            ops.append(["set", [key], value])
+    return ops
+
+
+def _diff_phases(old_phases: dict, new_phases: dict) -> list:
+    ops = []
+    for phase_id in old_phases.keys() - new_phases.keys():
+        ops.append(["del", ["phases", phase_id], None])
+    for phase_id, phase in new_phases.items():
+        old_phase = old_phases.get(phase_id)
+        if not isinstance(old_phase, dict):
+            ops.append(["set", ["phases", phase_id], phase])
+            continue
+        for field, value in phase.items():
+            if field == "items" and isinstance(old_phase.get("items"), dict):
+                old_items = old_phase["items"]
+                for item_id in old_items.keys() - value.keys():
+                    ops.append(["del", ["phases", phase_id, "items", item_id], None])
+                for item_id, item in value.items():
+                    if old_items.get(item_id) != item:
+                        ops.append(["set", ["phases", phase_id, "items", item_id], item])
+            elif field not in old_phase or old_phase[field] != value:
+                ops.append(["set", ["phases", phase_id, field], value])
+    return ops
+
+
+def apply_ops(data: dict, ops: list) -> dict:
+    """Apply delta operations to a raw state dict in place."""
+    for op, path, value in ops:
+        target = data
+        for key in path[:-1]:
+            target = target.setdefault(key, {})
+        if op == "set":
+            target[path[-1]] = value
+        elif op == "del":
+            target.pop(path[-1], None)
+    return data
+
+
+class StateJournal:
+    """Snapshot + delta journal for one workflow state file."""
+
+    def __init__(self, state_file: Path, compact_every: int = DEFAULT_COMPACT_EVERY):
+        self.state_file = Path(state_file)
+        self.journal_file = self.state_file.with_suffix('.journal')
+        self.compact_every = compact_every
+        self._compaction: Optional[threading.Thread] = None
+
+    @contextmanager
+    def _locked(self, mode: int):
+        self.journal_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.journal_file, 'a+b') as f:
+            fcntl.flock(f.fileno(), mode)
+            try:
+                yield f
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def load(self) -> Optional[dict]:
+        """
+        Load the snapshot, verify its checksum and replay the journal on top.
+
+        Returns:
+            Raw state dict without snapshot metadata keys, or None if no
+            snapshot exists.
+        """
+        data, records = self.read()
+        if data is None:
+            return None
+
+        stored_checksum = data.get('_checksum')
+        for key in _META_KEYS:
+            data.pop(key, None)
+        if stored_checksum is not None and stored_checksum != compute_state_checksum(data):
+            logger.warning(
+                f"State snapshot integrity check failed for {self.state_file}. "
+                f"State may have been modified externally."
+            )
+
+        for ops in records:
+            apply_ops(data, ops)
+        return data
+
+    def read(self) -> tuple[Optional[dict], list]:
+        """
+        Read the snapshot and the valid delta records under one shared lock.
+
+        Returns:
+            (snapshot including metadata keys, or None if it does not exist;
+            list of delta operation lists not yet compacted into it)
+        """
+        with self._locked(fcntl.LOCK_SH) as f:
+            data = self._read_snapshot()
+            if data is None:
+                return None, []
+            f.seek(0)
+            return data, self._read_records(f)
+
+    def pending_records(self) -> int:
+        """Number of delta records not yet compacted into the snapshot."""
+        if not self.journal_file.exists():
+            return 0
+        with self._locked(fcntl.LOCK_SH) as f:
+            f.seek(0)
+            return len(self._read_records(f))
+
+    def _read_snapshot(self) -> Optional[dict]:
+        if not self.state_file.exists():
+            return None
+        with open(self.state_file, 'r') as f:
+            return json.load(f)
+
+    def _read_records(self, f) -> list:
+        records = []
+        for line_num, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                ops = record["ops"]
+                valid = record.get("crc") == _record_checksum(ops)
+            except (ValueError, KeyError, TypeError):
+                valid = False
+            if not valid:
+                logger.warning(f"Skipping corrupt state journal record at line {line_num} of {self.journal_file}")
+                continue
+            records.append(ops)
+        return records
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def append(self, ops: list) -> int:
+        """
+        Append one delta record.
+
+        Returns:
+            Number of records now pending compaction.
+        """
+        line = json.dumps({"ops": ops, "crc": _record_checksum(ops)}, default=str) + '\n'
+        with self._locked(fcntl.LOCK_EX) as f:
+            if f.seek(0, os.SEEK_END) > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b'\n':
+                    line = '\n' + line  # Terminate a record torn by a crash
+            f.write(line.encode('utf-8'))
+            f.flush()
+            f.seek(0)
+            pending = sum(1 for raw in f if raw.strip())
+        if pending >= self.compact_every:
+            self.compact_in_background()
+        return pending
+
+    def write_snapshot(self, state_data: dict) -> dict:
+        """
+        Write a full snapshot and discard the journal.
+
+        Args:
+            state_data: Raw state dict without metadata keys
+
+        Returns:
+            The snapshot as written, including metadata keys.
+        """
+        with self._locked(fcntl.LOCK_EX) as f:
+            snapshot = self._write_snapshot_file(state_data)
+            f.truncate(0)
+        return snapshot
+
+    def compact(self) -> None:
+        """Fold the journal into the snapshot."""
+        with self._locked(fcntl.LOCK_EX) as f:
+            data = self._read_snapshot()
+            f.seek(0)
+            records = self._read_records(f)
+            if data is None or not records:
+                return
+            for key in _META_KEYS:
+                data.pop(key, None)
+            for ops in records:
+                apply_ops(data, ops)
+            self._write_snapshot_file(data)
+            f.truncate(0)
+        logger.debug(f"Compacted {len(records)} journal records into {self.state_file}")
+
+    def compact_in_background(self) -> None:
+        """Start compaction on a worker thread unless one is already running."""
+        if self._compaction and self._compaction.is_alive():
+            return
+        # Not a daemon: a CLI process waits for the compaction before exiting
+        self._compaction = threading.Thread(target=self._compact_safely, name="state-journal-compaction")
+        self._compaction.start()
+
+    def wait_for_compaction(self, timeout: Optional[float] = None) -> None:
+        """Block until a background compaction (if any) finishes."""
+        if self._compaction:
+            self._compaction.join(timeout)
+
+    def _compact_safely(self) -> None:
+        try:
+            self.compact()
+        except Exception as e:
+            # The journal is still valid; the next save retries compaction
+            logger.warning(f"State journal compaction failed: {e}")
+
+    def _write_snapshot_file(self, state_data: dict) -> dict:
+        state_data['_version'] = STATE_VERSION
+        state_data['_checksum'] = compute_state_checksum(state_data)
+        state_data['_updated_at'] = datetime.now(timezone.utc).isoformat()
+
+        temp_file = self.state_file.with_suffix('.tmp')
+        with open(temp_file, 'w') as f:
+            json.dump(state_data, f, default=str)
+            f.flush()
+            os.fsync(f.fileno())
+        temp_file.replace(self.state_file)
+        return state_data
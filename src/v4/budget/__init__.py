@@ -3,7 +3,9 @@ V4.2 Token Budget System.
 
 This module provides token budget tracking and enforcement:
 - Provider-specific token counting (Claude, OpenAI, estimation)
+- Cached counting and an offline BPE tokenizer
 - Atomic budget operations (reserve/commit/rollback)
+- Optional in-memory ledger with journaled write-behind
 - Event sourcing integration
 
 Usage:
@@ -46,6 +48,7 @@ from .events import (
     tokens_committed_event,
     tokens_released_event,
     budget_exhausted_event,
+    BudgetUsageProjection,
 )
 
 from .counters import (
@@ -53,8 +56,12 @@ from .counters import (
     ClaudeTokenCounter,
     OpenAITokenCounter,
     EstimationTokenCounter,
+    CachingTokenCounter,
     get_token_counter,
 )
+from .bpe import BPETokenizer
+
+from .ledger import BudgetLedger
 
 from .manager import AtomicBudgetTracker
 
@@ -75,12 +82,17 @@ __all__ = [
     "tokens_committed_event",
     "tokens_released_event",
     "budget_exhausted_event",
+    "BudgetUsageProjection",
     # Counters
     "TokenCounter",
     "ClaudeTokenCounter",
     "OpenAITokenCounter",
     "EstimationTokenCounter",
+    "CachingTokenCounter",
+    "BPETokenizer",
     "get_token_counter",
+    # Ledger
+    "BudgetLedger",
     # Manager
     "AtomicBudgetTracker",
 ]
@@ -0,0 +1,125 @@
+"""
+Local byte-level BPE tokenizer for V4.2 Token Budget System.
+
+Counts tokens for OpenAI-style encodings without network access or the
+tiktoken package, given the encoding's rank file (the tiktoken format:
+one "<base64 token> <rank>" pair per line, e.g. cl100k_base.tiktoken).
+
+Pre-tokenization uses the standard library `re` module, which has no
+Unicode property classes; letters are matched as [^\\W\\d_] and numbers
+as \\d, so counts can differ from tiktoken on rare scripts and numerals.
+"""
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+import base64
+import re
+
+# cl100k_base pre-tokenizer with \p{L} -> [^\W\d_] and \p{N} -> \d
+CL100K_PATTERN = (
+    r"(?i:'s|'t|'re|'ve|'m|'ll|'d)"
+    r"|(?:[^\r\n\w]|_)?[^\W\d_]+"
+    r"|\d{1,3}"
+    r"| ?(?:[^\s\w]|_)+[\r\n]*"
+    r"|\s*[\r\n]+"
+    r"|\s+(?!\S)"
+    r"|\s+"
+)
+
+
+def load_ranks(path: Union[str, Path]) -> Dict[bytes, int]:
+    """
+    Load BPE merge ranks from a tiktoken-format file.
+
+    Args:
+        path: Rank file ("<base64 token> <rank>" per line)
+
+    Returns:
+        Mapping of token bytes to rank (lower ranks merge first)
+    """
+    ranks = {}
+    with open(path, "rb") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            token, rank = line.split()
+            ranks[base64.b64decode(token)] = int(rank)
+    return ranks
+
+
+class BPETokenizer:
+    """
+    Byte-level BPE encoder.
+
+    Each pre-tokenized piece is merged pair by pair, lowest rank first.
+    Results are cached per piece, since the same words recur constantly
+    in conversation text.
+    """
+
+    def __init__(
+        self,
+        ranks: Dict[bytes, int],
+        pattern: str = CL100K_PATTERN,
+        piece_cache_size: int = 50000,
+    ):
+        """
+        Initialize tokenizer.
+
+        Args:
+            ranks: Token bytes -> merge rank (must include all single bytes
+                   that occur in the text)
+            pattern: Pre-tokenizer regex
+            piece_cache_size: Pieces to remember token counts for
+        """
+        self.ranks = ranks
+        self._pattern = re.compile(pattern)
+        self._piece_cache_size = piece_cache_size
+        self._piece_cache: "OrderedDict[bytes, int]" = OrderedDict()
+
+    @classmethod
+    def from_file(cls, path: Union[str, Path], **kwargs) -> "BPETokenizer":
+        """Create a tokenizer from a tiktoken-format rank file."""
+        return cls(load_ranks(path), **kwargs)
+
+    def encode(self, text: str) -> List[int]:
+        """Encode text to token ranks."""
+        tokens = []
+        for piece in self._pattern.findall(text):
+            tokens.extend(self._encode_piece(piece.encode("utf-8")))
+        return tokens
+
+    def count(self, text: str) -> int:
+        """Count tokens in text."""
+        if not text:
+            return 0
+        total = 0
+        cache = self._piece_cache
+        for piece in self._pattern.findall(text):
+            data = piece.encode("utf-8")
+            n = cache.get(data)
+            if n is None:
+                n = len(self._encode_piece(data))
+                if self._piece_cache_size > 0:
+                    cache[data] = n
+                    if len(cache) > self._piece_cache_size:
+                        cache.popitem(last=False)
+            total += n
+        return total
+
+    def _encode_piece(self, data: bytes) -> List[int]:
+        rank = self.ranks.get(data)
+        if rank is not None:
+            return [rank]
+
+        parts = [data[i:i + 1] for i in range(len(data))]
+        while len(parts) > 1:
+            best: Optional[int] = None
+            best_rank = None
+            for i in range(len(parts) - 1):
+                rank = self.ranks.get(parts[i] + parts[i + 1])
+                if rank is not None and (best_rank is None or rank < best_rank):
+                    best, best_rank = i, rank
+            if best is None:
+                break
+            parts[best:best + 2] = [parts[best] + parts[best + 1]]
+        return [self.ranks[part] for part in parts]
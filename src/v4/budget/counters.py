@@ -3,13 +3,20 @@ Provider-specific token counters for V4.2 Token Budget System.
 
 Implements accurate token counting for different LLM providers:
 - ClaudeTokenCounter: Uses Anthropic's count_tokens API
-- OpenAITokenCounter: Uses tiktoken library
+- OpenAITokenCounter: Uses tiktoken library (or a local BPE rank file offline)
 - EstimationTokenCounter: Fallback (~4 chars/token)
+- CachingTokenCounter: LRU cache of counts in front of any of the above
 """
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from collections import OrderedDict
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple, Union
+import asyncio
+import hashlib
 import logging
 
+from .bpe import BPETokenizer
+
 logger = logging.getLogger(__name__)
 
 
@@ -55,23 +62,58 @@ class TokenCounter(ABC):
         """
         pass
 
+    async def count_many(self, texts: List[str]) -> List[int]:
+        """
+        Count tokens in several texts.
+
+        Counters backed by a network call override this to count the
+        whole list in one round of requests rather than one at a time.
+
+        Args:
+            texts: Texts to count tokens for
+
+        Returns:
+            Token count for each text, in order
+        """
+        return [await self.count(text) for text in texts]
+
+    @property
+    def cache_key(self) -> str:
+        """
+        Identifies this counter's tokenization for cached counts.
+
+        Counts cached under one key are only valid for counters with the
+        same key (same provider and model).
+        """
+        model = getattr(self, "model", None)
+        name = type(self).__name__
+        return f"{name}:{model}" if model else name
+
     def count_sync(self, text: str) -> int:
         """
-        Synchronous wrapper for count().
+        Synchronous version of count().
 
-        Uses asyncio.run() for convenience in sync contexts.
+        Counters that can count without awaiting override this. The default
+        runs count() on an event loop kept for sync calls rather than
+        creating a new loop per call.
         """
-        import asyncio
-        return asyncio.run(self.count(text))
+        return self._run_sync(self.count(text))
 
     def count_messages_sync(self, messages: List[Dict[str, Any]]) -> int:
         """
-        Synchronous wrapper for count_messages().
+        Synchronous version of count_messages().
 
-        Uses asyncio.run() for convenience in sync contexts.
+        See count_sync().
         """
-        import asyncio
-        return asyncio.run(self.count_messages(messages))
+        return self._run_sync(self.count_messages(messages))
+
+    def _run_sync(self, coro):
+        """Run a coroutine to completion on this counter's sync loop."""
+        loop = getattr(self, "_sync_loop", None)
+        if loop is None or loop.is_closed():
+            loop = asyncio.new_event_loop()
+            self._sync_loop = loop
+        return loop.run_until_complete(coro)
 
 
 class EstimationTokenCounter(TokenCounter):
@@ -91,17 +133,25 @@ class EstimationTokenCounter(TokenCounter):
     MESSAGE_OVERHEAD = 4  # Estimated overhead per message
 
     async def count(self, text: str) -> int:
+        """Count tokens using character estimation."""
+        return self.count_sync(text)
+
+    def count_sync(self, text: str) -> int:
         """Count tokens using character estimation."""
         if not text:
             return 0
         return max(1, len(text) // self.CHARS_PER_TOKEN)
 
     async def count_messages(self, messages: List[Dict[str, Any]]) -> int:
+        """Count tokens in messages with estimated overhead."""
+        return self.count_messages_sync(messages)
+
+    def count_messages_sync(self, messages: List[Dict[str, Any]]) -> int:
         """Count tokens in messages with estimated overhead."""
         total = 0
         for msg in messages:
             content = msg.get("content", "")
-            total += await self.count(content)
+            total += self.count_sync(content)
             total += self.MESSAGE_OVERHEAD
         # Add reply priming overhead
         total += 3
@@ -151,29 +201,72 @@ class ClaudeTokenCounter(TokenCounter):
                 return None
         return self._client
 
-    async def count(self, text: str) -> int:
+    def _count_request(self, messages: List[Dict[str, Any]]) -> Optional[int]:
         """
-        Count tokens using Anthropic API.
+        Count tokens with one count_tokens request.
 
-        Falls back to estimation on API failure.
+        Returns:
+            Token count, or None if the API is unavailable or the call failed
         """
-        if not text:
-            return 0
-
         client = self._get_client()
         if client is None:
-            return await self._fallback.count(text)
+            return None
 
         try:
-            # Use the messages.count_tokens endpoint
             response = client.messages.count_tokens(
                 model=self.model,
-                messages=[{"role": "user", "content": text}]
+                messages=messages
             )
             return response.input_tokens
         except Exception as e:
             logger.warning(f"Claude token counting failed, using fallback: {e}")
+            return None
+
+    async def count(self, text: str) -> int:
+        """
+        Count tokens using Anthropic API.
+
+        Falls back to estimation on API failure.
+        """
+        if not text:
+            return 0
+
+        tokens = self._count_request([{"role": "user", "content": text}])
+        if tokens is None:
             return await self._fallback.count(text)
+        return tokens
+
+    def count_sync(self, text: str) -> int:
+        """Count tokens using Anthropic API (the client call is blocking)."""
+        if not text:
+            return 0
+
+        tokens = self._count_request([{"role": "user", "content": text}])
+        if tokens is None:
+            return self._fallback.count_sync(text)
+        return tokens
+
+    async def count_many(self, texts: List[str]) -> List[int]:
+        """
+        Count tokens in several texts using Anthropic API.
+
+        The count_tokens endpoint returns one total per request, so each
+        text is still its own request; they are issued concurrently from
+        worker threads so the whole list costs about one round trip.
+        Falls back to estimation for any request that fails.
+        """
+        if self._get_client() is None:
+            return await self._fallback.count_many(texts)
+
+        results = await asyncio.gather(*(
+            asyncio.to_thread(self._count_request, [{"role": "user", "content": text}])
+            if text else asyncio.sleep(0, result=0)
+            for text in texts
+        ))
+        counts = []
+        for text, result in zip(texts, results):
+            counts.append(result if result is not None else await self._fallback.count(text))
+        return counts
 
     async def count_messages(self, messages: List[Dict[str, Any]]) -> int:
         """
@@ -184,19 +277,20 @@ class ClaudeTokenCounter(TokenCounter):
         if not messages:
             return 0
 
-        client = self._get_client()
-        if client is None:
+        tokens = self._count_request(messages)
+        if tokens is None:
             return await self._fallback.count_messages(messages)
+        return tokens
 
-        try:
-            response = client.messages.count_tokens(
-                model=self.model,
-                messages=messages
-            )
-            return response.input_tokens
-        except Exception as e:
-            logger.warning(f"Claude token counting failed, using fallback: {e}")
-            return await self._fallback.count_messages(messages)
+    def count_messages_sync(self, messages: List[Dict[str, Any]]) -> int:
+        """Count tokens in message array using Anthropic API."""
+        if not messages:
+            return 0
+
+        tokens = self._count_request(messages)
+        if tokens is None:
+            return self._fallback.count_messages_sync(messages)
+        return tokens
 
 
 class OpenAITokenCounter(TokenCounter):
@@ -205,6 +299,10 @@ class OpenAITokenCounter(TokenCounter):
 
     Uses cl100k_base encoding (GPT-4, GPT-3.5-turbo).
     Includes message overhead calculation per OpenAI's documentation.
+
+    Without tiktoken (or when it cannot fetch its encoding offline), counts
+    with the local BPE tokenizer if an encoding_file is given, else
+    estimates ~4 chars/token.
     """
 
     # Per-message overhead for chat models
@@ -212,19 +310,27 @@ class OpenAITokenCounter(TokenCounter):
     # Reply priming tokens
     REPLY_PRIMING_TOKENS = 3
 
-    def __init__(self, model: str = "gpt-4"):
+    def __init__(
+        self,
+        model: str = "gpt-4",
+        encoding_file: Optional[Union[str, Path]] = None,
+    ):
         """
         Initialize OpenAI token counter.
 
         Args:
             model: Model name (used for encoding selection)
+            encoding_file: tiktoken-format rank file for offline counting
         """
         self.model = model
+        self.encoding_file = encoding_file
         self._encoder = None
+        self._encoder_resolved = False
 
     def _get_encoder(self):
-        """Lazy initialization of tiktoken encoder."""
-        if self._encoder is None:
+        """Lazy initialization of tiktoken (or local BPE) encoder."""
+        if self._encoder is None and not self._encoder_resolved:
+            self._encoder_resolved = True
             try:
                 import tiktoken
                 # Use cl100k_base for GPT-4 and GPT-3.5-turbo
@@ -235,11 +341,15 @@ class OpenAITokenCounter(TokenCounter):
                     self._encoder = tiktoken.get_encoding("cl100k_base")
             except ImportError:
                 logger.warning("tiktoken package not installed")
-                return None
+            except Exception as e:
+                # e.g. encoding download failed while offline
+                logger.warning(f"tiktoken encoding unavailable: {e}")
+
+            if self._encoder is None and self.encoding_file is not None:
+                self._encoder = BPETokenizer.from_file(self.encoding_file)
         return self._encoder
 
-    async def count(self, text: str) -> int:
-        """Count tokens using tiktoken."""
+    def _token_len(self, text: str) -> int:
         if not text:
             return 0
 
@@ -247,9 +357,26 @@ class OpenAITokenCounter(TokenCounter):
         if encoder is None:
             # Fall back to estimation
             return max(1, len(text) // 4)
-
+        if isinstance(encoder, BPETokenizer):
+            return encoder.count(text)
         return len(encoder.encode(text))
 
+    async def count(self, text: str) -> int:
+        """Count tokens using tiktoken."""
+        return self._token_len(text)
+
+    def count_sync(self, text: str) -> int:
+        """Count tokens using tiktoken."""
+        return self._token_len(text)
+
+    async def count_many(self, texts: List[str]) -> List[int]:
+        """Count tokens in several texts with one batched tiktoken call."""
+        encoder = self._get_encoder()
+        if encoder is None or isinstance(encoder, BPETokenizer):
+            return [self._token_len(text) for text in texts]
+
+        return [len(tokens) for tokens in encoder.encode_batch(texts)]
+
     async def count_messages(self, messages: List[Dict[str, Any]]) -> int:
         """
         Count tokens in messages including overhead.
@@ -258,21 +385,21 @@ class OpenAITokenCounter(TokenCounter):
         - Each message adds ~3 tokens for role/structure
         - Reply priming adds ~3 tokens
         """
+        return self.count_messages_sync(messages)
+
+    def count_messages_sync(self, messages: List[Dict[str, Any]]) -> int:
+        """Count tokens in messages including overhead."""
         if not messages:
             return 0
 
-        encoder = self._get_encoder()
-        if encoder is None:
+        if self._get_encoder() is None:
             # Fall back to estimation
-            fallback = EstimationTokenCounter()
-            return await fallback.count_messages(messages)
+            return EstimationTokenCounter().count_messages_sync(messages)
 
         total = 0
         for msg in messages:
             total += self.TOKENS_PER_MESSAGE
-            content = msg.get("content", "")
-            if content:
-                total += len(encoder.encode(content))
+            total += self._token_len(msg.get("content", ""))
             # Name field adds 1 token if present
             if msg.get("name"):
                 total += 1
@@ -282,12 +409,115 @@ class OpenAITokenCounter(TokenCounter):
         return total
 
 
-def get_token_counter(provider: str, **kwargs) -> TokenCounter:
+class CachingTokenCounter(TokenCounter):
+    """
+    LRU cache of token counts in front of another counter.
+
+    Entries are keyed by (inner counter's cache_key, hash of the text), so
+    counts are never shared between model families and large texts are not
+    kept alive by the cache. Message-array counts include provider-specific
+    overhead and are passed straight through.
+    """
+
+    DEFAULT_MAX_ENTRIES = 10000
+
+    def __init__(self, inner: TokenCounter, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Initialize caching counter.
+
+        Args:
+            inner: Counter to cache results of
+            max_entries: Maximum cached counts (least recently used evicted)
+        """
+        self.inner = inner
+        self.max_entries = max_entries
+        self._cache: "OrderedDict[Tuple[str, bytes], int]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def cache_key(self) -> str:
+        return self.inner.cache_key
+
+    def _key(self, text: str) -> Tuple[str, bytes]:
+        digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+        return (self.inner.cache_key, digest)
+
+    def _get(self, key: Tuple[str, bytes]) -> Optional[int]:
+        tokens = self._cache.get(key)
+        if tokens is None:
+            self.misses += 1
+            return None
+        self._cache.move_to_end(key)
+        self.hits += 1
+        return tokens
+
+    def _put(self, key: Tuple[str, bytes], tokens: int) -> None:
+        self._cache[key] = tokens
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+
+    async def count(self, text: str) -> int:
+        """Count tokens, from the cache if this text was counted before."""
+        if not text:
+            return 0
+        key = self._key(text)
+        tokens = self._get(key)
+        if tokens is None:
+            tokens = await self.inner.count(text)
+            self._put(key, tokens)
+        return tokens
+
+    def count_sync(self, text: str) -> int:
+        """Count tokens, from the cache if this text was counted before."""
+        if not text:
+            return 0
+        key = self._key(text)
+        tokens = self._get(key)
+        if tokens is None:
+            tokens = self.inner.count_sync(text)
+            self._put(key, tokens)
+        return tokens
+
+    async def count_many(self, texts: List[str]) -> List[int]:
+        """Count tokens in several texts; misses go to the inner counter in one batch."""
+        keys = [self._key(text) if text else None for text in texts]
+        counts: List[Optional[int]] = []
+        missing: Dict[Tuple[str, bytes], str] = {}
+        for text, key in zip(texts, keys):
+            tokens = 0 if key is None else self._get(key)
+            counts.append(tokens)
+            if tokens is None:
+                missing[key] = text
+
+        if missing:
+            fresh = dict(zip(missing, await self.inner.count_many(list(missing.values()))))
+            for key, tokens in fresh.items():
+                self._put(key, tokens)
+            counts = [fresh[key] if tokens is None else tokens for key, tokens in zip(keys, counts)]
+        return counts
+
+    async def count_messages(self, messages: List[Dict[str, Any]]) -> int:
+        """Count tokens in messages (not cached)."""
+        return await self.inner.count_messages(messages)
+
+    def count_messages_sync(self, messages: List[Dict[str, Any]]) -> int:
+        """Count tokens in messages (not cached)."""
+        return self.inner.count_messages_sync(messages)
+
+    def clear(self) -> None:
+        """Drop all cached counts."""
+        self._cache.clear()
+
+
+def get_token_counter(provider: str, cache_size: int = 0, **kwargs) -> TokenCounter:
     """
     Factory function to get appropriate token counter.
 
     Args:
         provider: Provider name ('anthropic', 'openai', 'estimation')
+        cache_size: Wrap the counter in an LRU cache of this many counts (0 = no cache)
         **kwargs: Provider-specific arguments
 
     Returns:
@@ -303,4 +533,7 @@ def get_token_counter(provider: str, **kwargs) -> TokenCounter:
     }
 
     counter_class = counters.get(provider.lower(), EstimationTokenCounter)
-    return counter_class(**kwargs)
+    counter = counter_class(**kwargs)
+    if cache_size > 0:
+        counter = CachingTokenCounter(counter, max_entries=cache_size)
+    return counter
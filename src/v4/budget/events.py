@@ -10,6 +10,7 @@ from typing import Any, Dict, Optional
 import uuid
 
 from .models import BudgetEventType
+from ..security.async_storage import Projection
 
 
 def create_budget_event(
@@ -188,3 +189,51 @@ def budget_exhausted_event(
         },
         correlation_id=correlation_id,
     )
+
+
+class BudgetUsageProjection(Projection):
+    """
+    Per-budget usage rebuilt from budget events.
+
+    State: {"budgets": {budget_id: {"limit", "used", "reserved",
+    "reservations": {reservation_id: tokens}, "exhausted"}}}
+    """
+
+    name = "budget_usage"
+    version = 1
+    event_types = [
+        BudgetEventType.BUDGET_CREATED.value,
+        BudgetEventType.TOKENS_RESERVED.value,
+        BudgetEventType.TOKENS_COMMITTED.value,
+        BudgetEventType.TOKENS_RELEASED.value,
+        BudgetEventType.BUDGET_EXHAUSTED.value,
+    ]
+
+    def initial_state(self) -> Dict[str, Any]:
+        return {"budgets": {}}
+
+    def apply(self, state: Dict[str, Any], event: Any) -> None:
+        budget_id = event.stream_id.split(":", 1)[-1]
+        budget = state["budgets"].setdefault(budget_id, {
+            "limit": 0,
+            "used": 0,
+            "reserved": 0,
+            "reservations": {},
+            "exhausted": False,
+        })
+        data = event.data
+
+        if event.type == BudgetEventType.BUDGET_CREATED.value:
+            budget["limit"] = data["limit"]
+        elif event.type == BudgetEventType.TOKENS_RESERVED.value:
+            budget["reservations"][data["reservation_id"]] = data["tokens"]
+            budget["reserved"] += data["tokens"]
+        elif event.type == BudgetEventType.TOKENS_COMMITTED.value:
+            budget["reservations"].pop(data["reservation_id"], None)
+            budget["reserved"] -= data["reserved_tokens"]
+            budget["used"] += data["actual_tokens"]
+        elif event.type == BudgetEventType.TOKENS_RELEASED.value:
+            budget["reservations"].pop(data["reservation_id"], None)
+            budget["reserved"] -= data["tokens"]
+        elif event.type == BudgetEventType.BUDGET_EXHAUSTED.value:
+            budget["exhausted"] = True
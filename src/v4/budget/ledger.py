@@ -0,0 +1,312 @@
+"""
+In-process budget ledger for V4.2 Token Budget System.
+
+Serves reserve/commit/rollback for budgets owned by this process from
+memory, and persists the resulting operations in the background:
+
+- Every operation is appended to a journal file before it is
+  acknowledged, so a crash before the next flush loses nothing
+- Operations are flushed to SQLite in batches (write-behind)
+- Reservation expiry is driven by a heap of deadlines instead of a
+  table scan on every call
+
+A budget is "owned" once it has been loaded into the ledger; other
+processes must not modify owned budgets while this ledger is running.
+"""
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+import asyncio
+import heapq
+import json
+import logging
+import os
+import uuid
+
+from .models import Reservation, ReservationResult
+
+logger = logging.getLogger(__name__)
+
+# Operation kinds recorded in the journal and passed to persist()
+OP_RESERVE = "reserve"
+OP_COMMIT = "commit"
+OP_RELEASE = "release"
+
+
+class BudgetLedger:
+    """
+    In-memory budget counters with journaled write-behind.
+
+    Mutations happen without awaiting between the availability check and
+    the counter update, so they are atomic with respect to other
+    coroutines on the event loop.
+    """
+
+    DEFAULT_FLUSH_INTERVAL_MS = 50
+
+    def __init__(
+        self,
+        persist: Callable[[List[Dict[str, Any]]], Awaitable[None]],
+        journal_path: Optional[Path] = None,
+        flush_interval_ms: int = DEFAULT_FLUSH_INTERVAL_MS,
+        fsync: bool = False,
+    ):
+        """
+        Initialize ledger.
+
+        Args:
+            persist: Writes a batch of operations durably (called by flush)
+            journal_path: Append-only journal file (None disables journaling)
+            flush_interval_ms: Delay before pending operations are flushed
+            fsync: fsync the journal after every write (survives power loss,
+                   not just process crashes, at the cost of a disk sync per call)
+        """
+        self._persist = persist
+        self.journal_path = Path(journal_path) if journal_path else None
+        self.flush_interval_ms = flush_interval_ms
+        self.fsync = fsync
+
+        self.budgets: Dict[str, Dict[str, Any]] = {}  # budget_id -> budgets row
+        self.reservations: Dict[str, Reservation] = {}
+        self._expiry: List[Tuple[float, str]] = []  # (expires_at timestamp, reservation_id)
+
+        self._seq = 0
+        self._pending: List[Dict[str, Any]] = []
+        self._journal_file = None
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_lock = asyncio.Lock()
+
+    # ----------------------------------------------------------
+    # Ownership
+    # ----------------------------------------------------------
+
+    def owns(self, budget_id: str) -> bool:
+        """Whether the budget is served from memory."""
+        return budget_id in self.budgets
+
+    def load(self, row: Dict[str, Any], reservations: List[Dict[str, Any]]) -> None:
+        """
+        Take ownership of a budget.
+
+        Args:
+            row: Row from the budgets table
+            reservations: Its rows from the reservations table
+        """
+        self.budgets[row["id"]] = dict(row)
+        for res in reservations:
+            reservation = Reservation(
+                id=res["id"],
+                budget_id=res["budget_id"],
+                tokens=res["tokens"],
+                created_at=datetime.fromisoformat(res["created_at"]),
+                expires_at=datetime.fromisoformat(res["expires_at"]),
+            )
+            self.reservations[reservation.id] = reservation
+            heapq.heappush(self._expiry, (reservation.expires_at.timestamp(), reservation.id))
+
+    # ----------------------------------------------------------
+    # Operations
+    # ----------------------------------------------------------
+
+    def reserve(
+        self,
+        budget_id: str,
+        tokens: int,
+        timeout_minutes: int,
+        correlation_id: Optional[str] = None,
+    ) -> Tuple[ReservationResult, Optional[Dict[str, Any]]]:
+        """
+        Reserve tokens from an owned budget.
+
+        Returns:
+            (result, budgets row to build a status from on failure)
+        """
+        row = self.budgets[budget_id]
+        available = row["limit_tokens"] - row["used"] - row["reserved"]
+        if tokens > available:
+            return ReservationResult(
+                success=False,
+                reason=f"Insufficient budget: need {tokens}, have {available}",
+            ), row
+
+        now = datetime.now()
+        reservation = Reservation(
+            id=f"res_{uuid.uuid4().hex[:12]}",
+            budget_id=budget_id,
+            tokens=tokens,
+            created_at=now,
+            expires_at=now + timedelta(minutes=timeout_minutes),
+        )
+        row["reserved"] += tokens
+        row["updated_at"] = now.isoformat()
+        self.reservations[reservation.id] = reservation
+        heapq.heappush(self._expiry, (reservation.expires_at.timestamp(), reservation.id))
+
+        self._record({
+            "op": OP_RESERVE,
+            "budget_id": budget_id,
+            "reservation_id": reservation.id,
+            "tokens": tokens,
+            "created_at": now.isoformat(),
+            "expires_at": reservation.expires_at.isoformat(),
+            "correlation_id": correlation_id,
+        })
+        return ReservationResult(success=True, reservation_id=reservation.id), None
+
+    def commit(
+        self,
+        reservation_id: str,
+        actual_tokens: int,
+        correlation_id: Optional[str] = None,
+    ) -> None:
+        """Move a reservation's tokens from reserved to used."""
+        reservation = self.reservations.pop(reservation_id)
+        row = self.budgets[reservation.budget_id]
+        row["reserved"] -= reservation.tokens
+        row["used"] += actual_tokens
+        row["updated_at"] = datetime.now().isoformat()
+
+        self._record({
+            "op": OP_COMMIT,
+            "budget_id": reservation.budget_id,
+            "reservation_id": reservation_id,
+            "reserved_tokens": reservation.tokens,
+            "actual_tokens": actual_tokens,
+            "used": row["used"],
+            "limit": row["limit_tokens"],
+            "correlation_id": correlation_id,
+        })
+
+    def release(
+        self,
+        reservation_id: str,
+        reason: str = "rollback",
+        correlation_id: Optional[str] = None,
+    ) -> None:
+        """Release a reservation without using its tokens."""
+        reservation = self.reservations.pop(reservation_id)
+        row = self.budgets[reservation.budget_id]
+        row["reserved"] -= reservation.tokens
+        row["updated_at"] = datetime.now().isoformat()
+
+        self._record({
+            "op": OP_RELEASE,
+            "budget_id": reservation.budget_id,
+            "reservation_id": reservation_id,
+            "tokens": reservation.tokens,
+            "reason": reason,
+            "correlation_id": correlation_id,
+        })
+
+    def expire_due(self, now: Optional[datetime] = None) -> int:
+        """
+        Release reservations whose deadline has passed.
+
+        Only the heap entries that are due are touched; entries for
+        reservations already committed or released are discarded.
+
+        Returns:
+            Number of reservations released
+        """
+        deadline = (now or datetime.now()).timestamp()
+        expired = 0
+        while self._expiry and self._expiry[0][0] < deadline:
+            _, reservation_id = heapq.heappop(self._expiry)
+            if reservation_id in self.reservations:
+                self.release(reservation_id, reason="timeout")
+                expired += 1
+        return expired
+
+    # ----------------------------------------------------------
+    # Journal and write-behind
+    # ----------------------------------------------------------
+
+    def _record(self, op: Dict[str, Any]) -> None:
+        """Journal an operation and queue it for the next flush."""
+        self._seq += 1
+        op["seq"] = self._seq
+        if self.journal_path is not None:
+            if self._journal_file is None:
+                self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+                self._journal_file = open(self.journal_path, "a", encoding="utf-8")
+            self._journal_file.write(json.dumps(op) + "\n")
+            self._journal_file.flush()
+            if self.fsync:
+                os.fsync(self._journal_file.fileno())
+
+        self._pending.append(op)
+        if self._flush_task is None:
+            self._flush_task = asyncio.ensure_future(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        try:
+            await asyncio.sleep(self.flush_interval_ms / 1000)
+            await self._flush_pending()
+        except Exception as e:
+            # Operations stay pending (and journaled); the next flush retries
+            logger.warning(f"Budget ledger flush failed: {e}")
+        finally:
+            self._flush_task = None
+
+    async def _flush_pending(self) -> None:
+        async with self._flush_lock:
+            while self._pending:
+                batch = self._pending
+                self._pending = []
+                try:
+                    await self._persist(batch)
+                except BaseException:
+                    self._pending = batch + self._pending
+                    raise
+            self._truncate_journal()
+
+    async def flush(self) -> None:
+        """Persist all pending operations now."""
+        await self._flush_pending()
+
+    def _truncate_journal(self) -> None:
+        """Empty the journal once everything in it has been persisted."""
+        if self.journal_path is None or self._pending:
+            return
+        if self._journal_file is not None:
+            self._journal_file.close()
+            self._journal_file = None
+        if self.journal_path.exists():
+            self.journal_path.write_text("")
+
+    def start_seq(self, last_persisted_seq: int) -> None:
+        """Continue numbering after the last persisted operation."""
+        self._seq = max(self._seq, last_persisted_seq)
+
+    def read_journal(self, after_seq: int) -> List[Dict[str, Any]]:
+        """
+        Operations journaled but not yet persisted (for crash recovery).
+
+        Args:
+            after_seq: Last sequence number known to be persisted
+        """
+        if self.journal_path is None or not self.journal_path.exists():
+            return []
+        ops = []
+        with open(self.journal_path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    op = json.loads(line)
+                except json.JSONDecodeError:
+                    # Torn final write from a crash mid-append
+                    logger.warning("Ignoring partial budget journal entry")
+                    continue
+                if op["seq"] > after_seq:
+                    ops.append(op)
+        return ops
+
+    async def close(self) -> None:
+        """Flush pending operations and close the journal."""
+        await self._flush_pending()
+        if self._flush_task is not None:
+            # Nothing left for it to do; don't wait out its timer
+            self._flush_task.cancel()
+            self._flush_task = None
+        if self._journal_file is not None:
+            self._journal_file.close()
+            self._journal_file = None
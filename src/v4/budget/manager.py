@@ -6,6 +6,7 @@ Provides thread-safe budget tracking with:
 - SQLite persistence with BEGIN IMMEDIATE locking
 - Event sourcing integration
 - Reservation timeout handling
+- Optional in-memory ledger with journaled write-behind (see ledger.py)
 """
 from dataclasses import dataclass
 from datetime import datetime, timedelta
@@ -29,6 +30,7 @@ from .events import (
     tokens_released_event,
     budget_exhausted_event,
 )
+from .ledger import BudgetLedger, OP_COMMIT, OP_RELEASE, OP_RESERVE
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +46,12 @@ class AtomicBudgetTracker:
     - Tokens are reserved atomically before LLM calls
     - Actual usage is committed after the call
     - Reservations are released on failure/timeout
+
+    With use_ledger=True, budgets used by this tracker are owned by an
+    in-memory BudgetLedger: reserve/commit/rollback/get_status need no
+    SQLite round trips, and the ledger's journal is replayed on startup
+    after a crash. Only one tracker may own a given budget at a time, and
+    trackers sharing a database need distinct ledger_journal_path values.
     """
 
     DEFAULT_RESERVATION_TIMEOUT_MINUTES = 5
@@ -53,6 +61,9 @@ class AtomicBudgetTracker:
         db_path: str = ":memory:",
         event_store: Optional[Any] = None,
         reservation_timeout_minutes: int = DEFAULT_RESERVATION_TIMEOUT_MINUTES,
+        use_ledger: bool = False,
+        ledger_journal_path: Optional[str] = None,
+        ledger_flush_interval_ms: int = BudgetLedger.DEFAULT_FLUSH_INTERVAL_MS,
     ):
         """
         Initialize budget tracker.
@@ -61,6 +72,10 @@ class AtomicBudgetTracker:
             db_path: Path to SQLite database (or ":memory:")
             event_store: Optional event store for event sourcing
             reservation_timeout_minutes: Default reservation timeout
+            use_ledger: Serve owned budgets from an in-memory ledger
+            ledger_journal_path: Ledger journal (default: "<db_path>.journal";
+                                 none for in-memory databases)
+            ledger_flush_interval_ms: Write-behind delay for ledger operations
         """
         self.db_path = db_path
         self._event_store = event_store
@@ -68,6 +83,17 @@ class AtomicBudgetTracker:
         self._adapter = None
         self._initialized = False
 
+        self._ledger: Optional[BudgetLedger] = None
+        if use_ledger:
+            if ledger_journal_path is None and db_path != ":memory:":
+                ledger_journal_path = f"{db_path}.journal"
+            self._ledger = BudgetLedger(
+                persist=self._persist_ledger_ops,
+                journal_path=Path(ledger_journal_path) if ledger_journal_path else None,
+                flush_interval_ms=ledger_flush_interval_ms,
+            )
+        self._ledger_id = str(ledger_journal_path or "memory")
+
     async def _ensure_adapter(self):
         """Lazy initialization of database adapter."""
         if self._adapter is None:
@@ -123,8 +149,19 @@ class AtomicBudgetTracker:
                 ON reservations(expires_at)
             """)
 
+            # Last ledger operation written to the tables above, per journal
+            await tx.execute("""
+                CREATE TABLE IF NOT EXISTS ledger_state (
+                    ledger_id TEXT PRIMARY KEY,
+                    last_seq INTEGER NOT NULL
+                )
+            """)
+
         self._initialized = True
 
+        if self._ledger:
+            await self._recover_ledger()
+
     async def create_budget(
         self,
         budget_id: str,
@@ -188,6 +225,21 @@ class AtomicBudgetTracker:
                 )
             )
 
+        if self._ledger:
+            self._ledger.load({
+                "id": budget_id,
+                "limit_tokens": limit,
+                "used": 0,
+                "reserved": 0,
+                "soft_threshold": soft_threshold,
+                "hard_threshold": hard_threshold,
+                "emergency_threshold": emergency_threshold,
+                "workflow_id": workflow_id,
+                "phase_id": phase_id,
+                "created_at": now.isoformat(),
+                "updated_at": now.isoformat(),
+            }, [])
+
         # Record event
         if self._event_store:
             event = budget_created_event(
@@ -223,6 +275,20 @@ class AtomicBudgetTracker:
         await self._ensure_schema()
         adapter = await self._ensure_adapter()
 
+        if self._ledger:
+            if not await self._own(budget_id):
+                return ReservationResult(
+                    success=False,
+                    reason=f"Budget not found: {budget_id}"
+                )
+            self._ledger.expire_due()
+            result, row = self._ledger.reserve(
+                budget_id, tokens, self._reservation_timeout, correlation_id
+            )
+            if row is not None:
+                result.budget_status = self._build_status(row)
+            return result
+
         # Clean up expired reservations first
         await self._cleanup_expired_reservations(budget_id)
 
@@ -325,6 +391,13 @@ class AtomicBudgetTracker:
         await self._ensure_schema()
         adapter = await self._ensure_adapter()
 
+        if self._ledger:
+            if reservation_id in self._ledger.reservations:
+                self._ledger.commit(reservation_id, actual_tokens, correlation_id)
+                return
+            # Not held in memory: make SQLite current before looking there
+            await self._ledger.flush()
+
         async with adapter.exclusive_transaction() as tx:
             # Fetch reservation
             res_row = await tx.fetch_one(
@@ -411,6 +484,12 @@ class AtomicBudgetTracker:
         await self._ensure_schema()
         adapter = await self._ensure_adapter()
 
+        if self._ledger:
+            if reservation_id in self._ledger.reservations:
+                self._ledger.release(reservation_id, reason, correlation_id)
+                return
+            await self._ledger.flush()
+
         async with adapter.exclusive_transaction() as tx:
             # Fetch reservation
             res_row = await tx.fetch_one(
@@ -471,6 +550,12 @@ class AtomicBudgetTracker:
         await self._ensure_schema()
         adapter = await self._ensure_adapter()
 
+        if self._ledger:
+            if not await self._own(budget_id):
+                return None
+            self._ledger.expire_due()
+            return self._build_status(self._ledger.budgets[budget_id])
+
         # Clean up expired reservations first
         await self._cleanup_expired_reservations(budget_id)
 
@@ -575,6 +660,177 @@ class AtomicBudgetTracker:
 
         return len(rows)
 
+    async def _own(self, budget_id: str) -> bool:
+        """Load a budget into the ledger if needed. False if it doesn't exist."""
+        if self._ledger.owns(budget_id):
+            return True
+
+        adapter = await self._ensure_adapter()
+        async with adapter.exclusive_transaction() as tx:
+            row = await tx.fetch_one(
+                "SELECT * FROM budgets WHERE id = ?",
+                (budget_id,)
+            )
+            if not row:
+                return False
+            reservations = await tx.fetch_all(
+                "SELECT * FROM reservations WHERE budget_id = ?",
+                (budget_id,)
+            )
+
+        # Another coroutine may have loaded it while we were reading
+        if not self._ledger.owns(budget_id):
+            self._ledger.load(row, reservations)
+        return True
+
+    async def _recover_ledger(self) -> None:
+        """Apply journaled operations that never reached SQLite."""
+        adapter = await self._ensure_adapter()
+        async with adapter.exclusive_transaction() as tx:
+            row = await tx.fetch_one(
+                "SELECT last_seq FROM ledger_state WHERE ledger_id = ?",
+                (self._ledger_id,)
+            )
+        last_seq = row["last_seq"] if row else 0
+
+        ops = self._ledger.read_journal(after_seq=last_seq)
+        if ops:
+            logger.info(f"Recovering {len(ops)} budget ledger operations from journal")
+            await self._persist_ledger_ops(ops)
+            last_seq = ops[-1]["seq"]
+        self._ledger.start_seq(last_seq)
+        # Nothing pending: this only clears the journal
+        await self._ledger.flush()
+
+    async def _persist_ledger_ops(self, ops: List[Dict[str, Any]]) -> None:
+        """Write a batch of ledger operations to SQLite, then record events."""
+        adapter = await self._ensure_adapter()
+
+        async with adapter.exclusive_transaction() as tx:
+            row = await tx.fetch_one(
+                "SELECT last_seq FROM ledger_state WHERE ledger_id = ?",
+                (self._ledger_id,)
+            )
+            last_seq = row["last_seq"] if row else 0
+            ops = [op for op in ops if op["seq"] > last_seq]
+            if not ops:
+                return
+
+            deltas: Dict[str, List[int]] = {}  # budget_id -> [reserved, used]
+            inserts = []
+            deletes = []
+            for op in ops:
+                delta = deltas.setdefault(op["budget_id"], [0, 0])
+                if op["op"] == OP_RESERVE:
+                    delta[0] += op["tokens"]
+                    inserts.append((
+                        op["reservation_id"],
+                        op["budget_id"],
+                        op["tokens"],
+                        op["created_at"],
+                        op["expires_at"],
+                    ))
+                elif op["op"] == OP_COMMIT:
+                    delta[0] -= op["reserved_tokens"]
+                    delta[1] += op["actual_tokens"]
+                    deletes.append((op["reservation_id"],))
+                elif op["op"] == OP_RELEASE:
+                    delta[0] -= op["tokens"]
+                    deletes.append((op["reservation_id"],))
+
+            if inserts:
+                await tx.execute_many(
+                    """
+                    INSERT OR IGNORE INTO reservations
+                    (id, budget_id, tokens, created_at, expires_at)
+                    VALUES (?, ?, ?, ?, ?)
+                    """,
+                    inserts,
+                )
+            if deletes:
+                await tx.execute_many("DELETE FROM reservations WHERE id = ?", deletes)
+
+            now = datetime.now().isoformat()
+            await tx.execute_many(
+                """
+                UPDATE budgets
+                SET reserved = reserved + ?, used = used + ?, updated_at = ?
+                WHERE id = ?
+                """,
+                [(reserved, used, now, budget_id) for budget_id, (reserved, used) in deltas.items()],
+            )
+            await tx.execute(
+                "INSERT OR REPLACE INTO ledger_state (ledger_id, last_seq) VALUES (?, ?)",
+                (self._ledger_id, ops[-1]["seq"])
+            )
+
+        if self._event_store:
+            try:
+                await self._record_ledger_events(ops)
+            except Exception as e:
+                # Budget state is already durable; don't retry the batch
+                logger.warning(f"Failed to record budget ledger events: {e}")
+
+    async def _record_ledger_events(self, ops: List[Dict[str, Any]]) -> None:
+        """Append events for persisted ledger operations, one append per budget."""
+        by_budget: Dict[str, List[Dict[str, Any]]] = {}
+        for op in ops:
+            by_budget.setdefault(op["budget_id"], []).append(op)
+
+        for budget_id, budget_ops in by_budget.items():
+            version = await self._get_event_version(budget_id)
+            events = []
+            for op in budget_ops:
+                correlation_id = op.get("correlation_id")
+                if op["op"] == OP_RESERVE:
+                    events.append(tokens_reserved_event(
+                        budget_id=budget_id,
+                        reservation_id=op["reservation_id"],
+                        tokens=op["tokens"],
+                        version=version,
+                        expires_at=datetime.fromisoformat(op["expires_at"]),
+                        correlation_id=correlation_id,
+                    ))
+                elif op["op"] == OP_COMMIT:
+                    events.append(tokens_committed_event(
+                        budget_id=budget_id,
+                        reservation_id=op["reservation_id"],
+                        reserved_tokens=op["reserved_tokens"],
+                        actual_tokens=op["actual_tokens"],
+                        version=version,
+                        correlation_id=correlation_id,
+                    ))
+                    if op["used"] >= op["limit"]:
+                        version += 1
+                        events.append(budget_exhausted_event(
+                            budget_id=budget_id,
+                            limit=op["limit"],
+                            used=op["used"],
+                            version=version,
+                            correlation_id=correlation_id,
+                        ))
+                else:
+                    events.append(tokens_released_event(
+                        budget_id=budget_id,
+                        reservation_id=op["reservation_id"],
+                        tokens=op["tokens"],
+                        version=version,
+                        reason=op["reason"],
+                        correlation_id=correlation_id,
+                    ))
+                version += 1
+
+            await self._event_store.append(
+                f"budget:{budget_id}",
+                [event.to_storage_event() for event in events]
+            )
+
+    async def flush(self) -> None:
+        """Persist pending ledger operations (no-op without a ledger)."""
+        if self._ledger:
+            await self._ensure_schema()
+            await self._ledger.flush()
+
     async def _get_event_version(self, budget_id: str) -> int:
         """Get next event version for budget stream."""
         if self._event_store is None:
@@ -613,7 +869,9 @@ class AtomicBudgetTracker:
         )
 
     async def close(self) -> None:
-        """Close database connection."""
+        """Flush the ledger (if any) and close database connection."""
+        if self._ledger and self._initialized:
+            await self._ledger.close()
         if self._adapter:
             await self._adapter.close()
             self._adapter = None
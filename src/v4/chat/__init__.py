@@ -57,7 +57,7 @@ from .commands import (
     HistoryCommand,
 )
 
-from .session import ChatSession
+from .session import ChatSession, ChatSessionsProjection
 
 __all__ = [
     # Models
@@ -81,4 +81,5 @@ __all__ = [
     "HistoryCommand",
     # Session
     "ChatSession",
+    "ChatSessionsProjection",
 ]
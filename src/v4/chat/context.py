@@ -60,19 +60,41 @@ Provide a comprehensive summary that captures all critical information:"""
         self.llm_wrapper = llm_wrapper
         self.config = config or SessionConfig()
 
-    async def _count_tokens(self, messages: List[Message]) -> int:
-        """Count total tokens in messages."""
+    async def count_tokens(self, messages: List[Message]) -> int:
+        """
+        Count total tokens in messages.
+
+        Counts are cached on each message (per counter and content), so
+        only messages not seen before are counted, in one batched call.
+        """
+        key = self.token_counter.cache_key
         total = 0
+        uncounted = []
         for msg in messages:
-            total += await self.token_counter.count(msg.content)
+            cached = msg.cached_token_count(key)
+            if cached is None:
+                uncounted.append(msg)
+            else:
+                total += cached
+
+        if uncounted:
+            counts = await self.token_counter.count_many([m.content for m in uncounted])
+            for msg, tokens in zip(uncounted, counts):
+                msg.cache_token_count(key, tokens)
+                total += tokens
         return total
 
-    async def _should_summarize(self, messages: List[Message]) -> bool:
+    async def _should_summarize(
+        self,
+        messages: List[Message],
+        token_count: Optional[int] = None,
+    ) -> bool:
         """Check if context needs summarization."""
         if not messages:
             return False
 
-        token_count = await self._count_tokens(messages)
+        if token_count is None:
+            token_count = await self.count_tokens(messages)
         threshold = int(self.config.max_tokens * self.config.summarization_threshold)
 
         return token_count > threshold
@@ -81,6 +103,7 @@ Provide a comprehensive summary that captures all critical information:"""
         self,
         messages: List[Message],
         pinned: List[str],
+        token_count: Optional[int] = None,
     ) -> List[Message]:
         """
         Prepare context, summarizing if needed.
@@ -88,6 +111,8 @@ Provide a comprehensive summary that captures all critical information:"""
         Args:
             messages: All conversation messages
             pinned: Message IDs that must be preserved
+            token_count: Total tokens in messages, if the caller tracks it
+                         (counted here otherwise)
 
         Returns:
             Prepared messages (possibly with summary)
@@ -96,7 +121,7 @@ Provide a comprehensive summary that captures all critical information:"""
             return []
 
         # Check if summarization needed
-        if not await self._should_summarize(messages):
+        if not await self._should_summarize(messages, token_count):
             return messages
 
         logger.info(f"Context exceeds threshold, summarizing {len(messages)} messages")
@@ -6,7 +6,8 @@ Defines message types, events, and configuration.
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+import hashlib
 import uuid
 
 
@@ -34,6 +35,21 @@ class Message:
     content: str
     metadata: Dict[str, Any] = field(default_factory=dict)
     timestamp: datetime = field(default_factory=datetime.now)
+    # (counter cache_key, content hash) -> token count
+    _token_counts: Dict[Tuple[str, str], int] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def _content_hash(self) -> str:
+        return hashlib.blake2b(self.content.encode("utf-8"), digest_size=16).hexdigest()
+
+    def cached_token_count(self, counter_key: str) -> Optional[int]:
+        """Token count cached for this content by a counter, if any."""
+        return self._token_counts.get((counter_key, self._content_hash()))
+
+    def cache_token_count(self, counter_key: str, tokens: int) -> None:
+        """Remember this content's token count for a counter."""
+        self._token_counts[(counter_key, self._content_hash())] = tokens
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dict for LLM API calls."""
@@ -66,6 +82,7 @@ class ChatEventType(Enum):
     SESSION_RESTORED = "session_restored"
     MESSAGE_PINNED = "message_pinned"
     CONTEXT_SUMMARIZED = "context_summarized"
+    MESSAGE_CHUNK = "message_chunk"
 
 
 @dataclass
@@ -101,6 +118,25 @@ class ChatEvent:
             },
         )
 
+    @classmethod
+    def message_chunk(
+        cls,
+        session_id: str,
+        message_id: str,
+        role: MessageRole,
+        content: str,
+    ) -> "ChatEvent":
+        """Create MESSAGE_CHUNK event (output appended to a message still streaming)."""
+        return cls(
+            type=ChatEventType.MESSAGE_CHUNK,
+            data={
+                "session_id": session_id,
+                "message_id": message_id,
+                "role": role.value,
+                "content": content,
+            },
+        )
+
     @classmethod
     def checkpoint_created(
         cls,
@@ -175,12 +211,14 @@ class SessionConfig:
         checkpoint_interval_messages: Create checkpoint every N messages
         checkpoint_interval_minutes: Create checkpoint every N minutes
         recent_messages_to_keep: Always keep last N messages
+        stream_persist_interval_seconds: Persist streamed output at least this often
     """
     max_tokens: int = 100000
     summarization_threshold: float = 0.7
     checkpoint_interval_messages: int = 20
     checkpoint_interval_minutes: int = 10
     recent_messages_to_keep: int = 20
+    stream_persist_interval_seconds: float = 2.0
 
 
 @dataclass
@@ -3,10 +3,12 @@ Chat Session for V4.2 Chat Mode.
 
 Manages persistent chat sessions with crash recovery.
 """
+import asyncio
 import logging
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, AsyncIterator, Dict, List, Optional, Set
 import json
+import time
 
 from .models import (
     Message,
@@ -30,6 +32,7 @@ from ..security.async_storage import (
     AsyncEventStore,
     CheckpointStore,
     Checkpoint,
+    Projection,
 )
 from ..security.storage import Event
 from ..budget import AtomicBudgetTracker, TokenCounter, EstimationTokenCounter
@@ -89,6 +92,11 @@ class ChatSession:
         self._message_count_since_checkpoint = 0
         self._last_checkpoint_time = datetime.now()
         self._event_version = 0
+        # Running token total of self.messages[:_counted_messages]
+        self._token_total = 0
+        self._counted_messages = 0
+        # Timing of the last send_streaming response
+        self.last_stream_metrics: Optional[Dict[str, Any]] = None
 
         # Components
         self.validator = SummaryValidator()
@@ -123,39 +131,117 @@ class ChatSession:
         # Regular message
         return await self._send_message(user_input)
 
-    async def _send_message(self, content: str) -> str:
-        """Send a regular message to LLM."""
-        # Create user message
-        user_msg = Message.create(
-            role=MessageRole.USER,
-            content=content,
-        )
-        self.messages.append(user_msg)
+    async def send_streaming(self, user_input: str) -> AsyncIterator[str]:
+        """
+        Send a message and yield the response as it is generated.
 
-        # Persist user message
-        await self._persist_message(user_msg)
+        Streamed output is persisted at least every
+        config.stream_persist_interval_seconds, so a crash mid-response
+        loses at most that much; recover() restores the partial message.
+        Timing for the response is recorded in the assistant message's
+        metadata and in self.last_stream_metrics.
 
-        # Check budget
-        status = await self.budget_tracker.get_status(self.budget_id)
-        if status and status.exceeded:
-            error_msg = f"Token budget exhausted. Used: {status.used}/{status.limit}"
-            logger.warning(error_msg)
-            return error_msg
+        Args:
+            user_input: User's message or command
+
+        Yields:
+            Response text chunks (a command result is a single chunk)
+        """
+        command = self.command_parser.parse(user_input)
+        if command:
+            yield await self._execute_command(command)
+            return
+
+        error = await self._add_user_message(user_input)
+        if error:
+            yield error
+            return
+
+        # Created up front so partial output is persisted under its final ID
+        assistant_msg = Message.create(role=MessageRole.ASSISTANT, content="")
+        parts: List[str] = []
+        persisted_parts = 0
+        usage = None
+        started = time.monotonic()
+        first_token_at = None
+        last_persist = started
 
         try:
-            # Prepare context (may summarize)
-            context_msgs = await self.context_manager.prepare_context(
-                self.messages,
-                list(self.pinned_ids),
-            )
+            request = await self._prepare_request()
+
+            stream = self.llm_wrapper.call_streaming(request)
+            try:
+                async for chunk in stream:
+                    if chunk.usage:
+                        usage = chunk.usage
+                    if not chunk.content:
+                        continue
+                    if first_token_at is None:
+                        first_token_at = time.monotonic()
+                        logger.debug(f"Time to first token: {(first_token_at - started) * 1000:.0f}ms")
+                    parts.append(chunk.content)
+                    yield chunk.content
+
+                    now = time.monotonic()
+                    if now - last_persist >= self.config.stream_persist_interval_seconds:
+                        await self._persist_chunk(assistant_msg, "".join(parts[persisted_parts:]))
+                        persisted_parts = len(parts)
+                        last_persist = now
+            except (GeneratorExit, asyncio.CancelledError):
+                # Caller stopped reading: keep what was generated so far
+                if len(parts) > persisted_parts:
+                    await self._persist_chunk(assistant_msg, "".join(parts[persisted_parts:]))
+                raise
+            finally:
+                # Settles the budget reservation for an unfinished stream
+                await stream.aclose()
 
-            # Build LLM request
-            request = LLMRequest(
-                messages=[m.to_dict() for m in context_msgs],
-                model="claude-sonnet-4-20250514",
-                max_tokens=4096,
-                temperature=1.0,
-            )
+        except BudgetExhaustedError as e:
+            logger.warning(f"Budget exhausted: {e}")
+            yield f"Token budget exhausted: {e.message}"
+            return
+
+        except Exception as e:
+            logger.error(f"Error streaming message: {e}")
+            if len(parts) > persisted_parts:
+                await self._persist_chunk(assistant_msg, "".join(parts[persisted_parts:]))
+            yield f"Error: {str(e)}"
+            return
+
+        finished = time.monotonic()
+        self.last_stream_metrics = {
+            "time_to_first_token_ms": (
+                round((first_token_at - started) * 1000, 1) if first_token_at else None
+            ),
+            "duration_ms": round((finished - started) * 1000, 1),
+            "chunks": len(parts),
+        }
+
+        assistant_msg.content = "".join(parts)
+        assistant_msg.metadata = {
+            "model": request.model,
+            "streaming": self.last_stream_metrics,
+        }
+        if usage:
+            assistant_msg.metadata["usage"] = {
+                "input_tokens": usage.input_tokens,
+                "output_tokens": usage.output_tokens,
+            }
+        self.messages.append(assistant_msg)
+
+        # Persist the complete message (supersedes its chunks)
+        await self._persist_message(assistant_msg)
+
+        await self._maybe_checkpoint()
+
+    async def _send_message(self, content: str) -> str:
+        """Send a regular message to LLM."""
+        error = await self._add_user_message(content)
+        if error:
+            return error
+
+        try:
+            request = await self._prepare_request()
 
             # Make LLM call
             response = await self.llm_wrapper.call(request)
@@ -190,6 +276,63 @@ class ChatSession:
             logger.error(f"Error sending message: {e}")
             return f"Error: {str(e)}"
 
+    async def _add_user_message(self, content: str) -> Optional[str]:
+        """
+        Record and persist a user message.
+
+        Returns:
+            Error to show the user if the budget is exhausted, else None
+        """
+        user_msg = Message.create(
+            role=MessageRole.USER,
+            content=content,
+        )
+        self.messages.append(user_msg)
+
+        # Persist user message
+        await self._persist_message(user_msg)
+
+        # Check budget
+        status = await self.budget_tracker.get_status(self.budget_id)
+        if status and status.exceeded:
+            error_msg = f"Token budget exhausted. Used: {status.used}/{status.limit}"
+            logger.warning(error_msg)
+            return error_msg
+        return None
+
+    async def _prepare_request(self) -> LLMRequest:
+        """Build the LLM request for the conversation (may summarize)."""
+        context_msgs = await self.context_manager.prepare_context(
+            self.messages,
+            list(self.pinned_ids),
+            token_count=await self.context_tokens(),
+        )
+
+        return LLMRequest(
+            messages=[m.to_dict() for m in context_msgs],
+            model="claude-sonnet-4-20250514",
+            max_tokens=4096,
+            temperature=1.0,
+        )
+
+    async def context_tokens(self) -> int:
+        """
+        Total tokens in the conversation.
+
+        Maintained incrementally: only messages added since the last call
+        are counted.
+        """
+        new_messages = self.messages[self._counted_messages:]
+        if new_messages:
+            self._token_total += await self.context_manager.count_tokens(new_messages)
+            self._counted_messages = len(self.messages)
+        return self._token_total
+
+    def _reset_token_total(self) -> None:
+        """Recount from scratch after self.messages is replaced."""
+        self._token_total = 0
+        self._counted_messages = 0
+
     async def _execute_command(self, command: MetaCommand) -> str:
         """Execute a meta-command."""
         if isinstance(command, StatusCommand):
@@ -329,6 +472,7 @@ class ChatSession:
             self.messages.append(msg)
 
         self.pinned_ids = set(checkpoint.state.get("pinned_ids", []))
+        self._reset_token_total()
         self._message_count_since_checkpoint = 0
         self._last_checkpoint_time = datetime.now()
 
@@ -378,6 +522,7 @@ class ChatSession:
             await self._apply_event(event)
             self._event_version = event.version
 
+        self._reset_token_total()
         logger.info(f"Session recovered: {len(self.messages)} messages")
 
     def pin(self, message_id: str) -> None:
@@ -404,6 +549,16 @@ class ChatSession:
         # Update checkpoint counter
         self._message_count_since_checkpoint += 1
 
+    async def _persist_chunk(self, message: Message, content: str) -> None:
+        """Persist output streamed into a message since the last chunk."""
+        event = ChatEvent.message_chunk(
+            session_id=self.session_id,
+            message_id=message.id,
+            role=message.role,
+            content=content,
+        )
+        await self._persist_event(event)
+
     async def _persist_event(self, chat_event: ChatEvent) -> None:
         """Persist a chat event."""
         self._event_version += 1
@@ -435,9 +590,26 @@ class ChatSession:
                 metadata=event.data.get("metadata", {}),
                 timestamp=event.timestamp,
             )
-            self.messages.append(msg)
+            if self.messages and self.messages[-1].id == msg.id:
+                # Completed version of a message that was streaming
+                self.messages[-1] = msg
+            else:
+                self.messages.append(msg)
             self._event_version = event.version
 
+        elif event.type == ChatEventType.MESSAGE_CHUNK.value:
+            if self.messages and self.messages[-1].id == event.data["message_id"]:
+                self.messages[-1].content += event.data["content"]
+            else:
+                # Response interrupted before it completed
+                self.messages.append(Message(
+                    id=event.data["message_id"],
+                    role=MessageRole(event.data["role"]),
+                    content=event.data["content"],
+                    metadata={"partial": True},
+                    timestamp=event.timestamp,
+                ))
+
         elif event.type == ChatEventType.MESSAGE_PINNED.value:
             self.pinned_ids.add(event.data["message_id"])
 
@@ -458,3 +630,44 @@ class ChatSession:
 
         if should_checkpoint:
             await self.checkpoint(message="auto-checkpoint")
+
+
+class ChatSessionsProjection(Projection):
+    """
+    Summary of every chat session, rebuilt from chat events.
+
+    State: {"sessions": {session_id: {"message_count", "pinned_ids",
+    "last_message_at", "last_checkpoint_id"}}}
+
+    Message payloads (the bulk of chat history) are never decoded.
+    """
+
+    name = "chat_sessions"
+    version = 1
+    event_types = [
+        ChatEventType.MESSAGE_ADDED.value,
+        ChatEventType.MESSAGE_PINNED.value,
+        ChatEventType.CHECKPOINT_CREATED.value,
+    ]
+
+    def initial_state(self) -> Dict[str, Any]:
+        return {"sessions": {}}
+
+    def apply(self, state: Dict[str, Any], event: Any) -> None:
+        session_id = event.stream_id.split(":", 1)[-1]
+        session = state["sessions"].setdefault(session_id, {
+            "message_count": 0,
+            "pinned_ids": [],
+            "last_message_at": None,
+            "last_checkpoint_id": None,
+        })
+
+        if event.type == ChatEventType.MESSAGE_ADDED.value:
+            session["message_count"] += 1
+            session["last_message_at"] = event.timestamp.isoformat()
+        elif event.type == ChatEventType.MESSAGE_PINNED.value:
+            message_id = event.data["message_id"]
+            if message_id not in session["pinned_ids"]:
+                session["pinned_ids"].append(message_id)
+        elif event.type == ChatEventType.CHECKPOINT_CREATED.value:
+            session["last_checkpoint_id"] = event.data["checkpoint_id"]
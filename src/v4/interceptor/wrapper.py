@@ -6,8 +6,9 @@ Main component that intercepts all LLM API calls with:
 - Post-call: actual token counting, budget commit/rollback
 - Retry logic with same reservation
 """
+import asyncio
 import logging
-from typing import AsyncIterator, Optional
+from typing import AsyncIterator, List, Optional
 
 from .models import (
     LLMRequest,
@@ -204,6 +205,9 @@ class LLMCallWrapper:
         reservation_id = reservation.reservation_id
         logger.debug(f"Reserved {estimated_total} tokens for streaming: {reservation_id}")
 
+        correlation_id = request.metadata.get("correlation_id")
+        output_parts = []
+
         try:
             # Step 3: Start streaming
             stream = self.adapter.call_streaming(request)
@@ -214,36 +218,53 @@ class LLMCallWrapper:
             async for chunk in stream:
                 if chunk.is_final and chunk.usage:
                     final_usage = chunk.usage
+                output_parts.append(chunk.content)
                 yield chunk
 
             # Step 4: Commit actual usage
             if final_usage:
                 actual_tokens = final_usage.total
             else:
-                # Fallback to estimation if no usage in stream
+                # No usage in stream: count the output we actually received
                 logger.warning("No usage in stream, using estimation")
-                actual_tokens = estimated_total
+                actual_tokens = await self._streamed_tokens(estimated_input, output_parts)
 
             await self.budget_tracker.commit(
                 reservation_id,
                 actual_tokens,
-                correlation_id=request.metadata.get("correlation_id"),
+                correlation_id=correlation_id,
             )
 
             logger.debug(
                 f"Committed {actual_tokens} streaming tokens"
             )
 
+        except (GeneratorExit, asyncio.CancelledError):
+            # Consumer stopped reading: what was generated so far is still
+            # billed, so commit it rather than leaving the reservation to expire
+            actual_tokens = await self._streamed_tokens(estimated_input, output_parts)
+            await self.budget_tracker.commit(
+                reservation_id,
+                actual_tokens,
+                correlation_id=correlation_id,
+            )
+            logger.debug(f"Stream closed early, committed {actual_tokens} tokens")
+            raise
+
         except Exception as e:
             # Rollback on failure
             logger.warning(f"Streaming failed, rolling back reservation: {e}")
             await self.budget_tracker.rollback(
                 reservation_id,
                 reason=f"Streaming error: {type(e).__name__}",
-                correlation_id=request.metadata.get("correlation_id"),
+                correlation_id=correlation_id,
             )
             raise
 
+    async def _streamed_tokens(self, input_tokens: int, output_parts: List[str]) -> int:
+        """Estimate usage of a stream from its input estimate and received output."""
+        return input_tokens + await self.token_counter.count("".join(output_parts))
+
     async def _estimate_input_tokens(self, request: LLMRequest) -> int:
         """
         Estimate input tokens for a request.
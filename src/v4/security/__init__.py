@@ -12,6 +12,7 @@ Phase 1 (Persistence Layer - V4.2):
 - Checkpoint store for fast recovery (90%+ replay reduction)
 - Database adapter pattern for SQLite/PostgreSQL compatibility
 - Event sourced repository with automatic checkpointing
+- Incremental projections with snapshots
 """
 
 from .execution import (
@@ -46,6 +47,9 @@ from .async_storage import (
     CheckpointStore,
     Checkpoint,
     EventSourcedRepository,
+    EventRecord,
+    Projection,
+    ProjectionRunner,
 )
 
 __all__ = [
@@ -82,4 +86,7 @@ __all__ = [
     "CheckpointStore",
     "Checkpoint",
     "EventSourcedRepository",
+    "EventRecord",
+    "Projection",
+    "ProjectionRunner",
 ]
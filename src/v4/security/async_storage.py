@@ -5,6 +5,7 @@ This module provides:
 - DatabaseAdapter: Abstract interface for SQLite/PostgreSQL compatibility
 - AsyncEventStore: Async event sourcing with optimistic concurrency
 - CheckpointStore: Snapshot-based recovery for fast replay
+- ProjectionRunner: Incremental, snapshotted projections over all streams
 
 Design Principles:
 - SQLite uses BEGIN IMMEDIATE for write locking (no FOR UPDATE)
@@ -27,11 +28,14 @@ from typing import (
     runtime_checkable,
 )
 import json
+import logging
 import uuid
 
 # Import from existing synchronous storage for Event dataclass
 from .storage import Event, ConcurrencyError, DatabaseError
 
+logger = logging.getLogger(__name__)
+
 
 # ============================================================
 # Database Adapter Pattern
@@ -46,6 +50,10 @@ class TransactionProtocol(Protocol):
         """Execute a query."""
         ...
 
+    async def execute_many(self, query: str, params_seq: List[tuple]) -> None:
+        """Execute a query once per parameter tuple."""
+        ...
+
     async def fetch_one(self, query: str, params: tuple = ()) -> Optional[Dict[str, Any]]:
         """Fetch a single row as dict."""
         ...
@@ -101,6 +109,10 @@ class SQLiteTransaction:
         """Execute a query."""
         await self._conn.execute(query, params)
 
+    async def execute_many(self, query: str, params_seq: List[tuple]) -> None:
+        """Execute a query once per parameter tuple."""
+        await self._conn.executemany(query, params_seq)
+
     async def fetch_one(self, query: str, params: tuple = ()) -> Optional[Dict[str, Any]]:
         """Fetch a single row as dict."""
         cursor = await self._conn.execute(query, params)
@@ -117,6 +129,18 @@ class SQLiteTransaction:
         columns = [description[0] for description in cursor.description]
         return [dict(zip(columns, row)) for row in rows]
 
+    async def change_token(self) -> Any:
+        """
+        Token that changes whenever another connection commits.
+
+        Combines the connection identity with SQLite's data_version, which
+        is unchanged by this connection's own commits. Callers can cache
+        data read inside transactions while the token stays the same.
+        """
+        cursor = await self._conn.execute("PRAGMA data_version")
+        row = await cursor.fetchone()
+        return (id(self._conn), row[0])
+
 
 class SQLiteAdapter(DatabaseAdapter):
     """
@@ -127,24 +151,33 @@ class SQLiteAdapter(DatabaseAdapter):
     - Prevents race conditions between SELECT and INSERT
     - Works with single-writer, multi-reader model
 
-    For file-based databases, each exclusive_transaction() creates a new
-    connection to support concurrent operations.
+    For file-based databases, transactions run on one long-lived writer
+    connection (serialized by a lock within the process), and reads use a
+    small pool of reader connections, so connections and their pragmas are
+    set up once rather than per operation.
 
     For in-memory databases (:memory:), we use a shared connection since
     separate connections would create separate databases.
     """
 
-    def __init__(self, db_path: str):
+    DEFAULT_READ_POOL_SIZE = 4
+
+    def __init__(self, db_path: str, read_pool_size: int = DEFAULT_READ_POOL_SIZE):
         """
         Initialize SQLite adapter.
 
         Args:
             db_path: Path to SQLite database file, or ":memory:" for in-memory
+            read_pool_size: Idle reader connections kept open (file databases)
         """
         self.db_path = db_path
+        self.read_pool_size = read_pool_size
         self._shared_conn: Optional[Any] = None
         self._is_memory = db_path == ":memory:"
         self._conn_lock = None
+        self._writer: Optional[Any] = None
+        self._readers: List[Any] = []  # every open reader connection
+        self._idle_readers: List[Any] = []
 
     async def _get_lock(self):
         """Get or create the connection lock."""
@@ -178,6 +211,14 @@ class SQLiteAdapter(DatabaseAdapter):
             self._shared_conn = await self._create_connection()
         return self._shared_conn
 
+    async def _ensure_writer(self) -> Any:
+        """Ensure the dedicated writer connection exists and return it."""
+        if self._is_memory:
+            return await self._ensure_connected()
+        if self._writer is None:
+            self._writer = await self._create_connection()
+        return self._writer
+
     @asynccontextmanager
     async def exclusive_transaction(self) -> AsyncIterator[SQLiteTransaction]:
         """
@@ -186,32 +227,47 @@ class SQLiteAdapter(DatabaseAdapter):
         Uses BEGIN IMMEDIATE to acquire write lock immediately,
         preventing race conditions between version check and insert.
 
-        For file-based databases, creates a new connection per transaction.
-        For in-memory databases, uses a shared connection with a lock.
+        Transactions run one at a time on the writer connection (the
+        shared connection for in-memory databases).
+        """
+        lock = await self._get_lock()
+        async with lock:
+            conn = await self._ensure_writer()
+            await conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield SQLiteTransaction(conn)
+                await conn.execute("COMMIT")
+            except BaseException:
+                await conn.execute("ROLLBACK")
+                raise
+
+    @asynccontextmanager
+    async def read_connection(self) -> AsyncIterator[Any]:
+        """
+        Borrow a connection for reads outside a transaction.
+
+        File databases use a pooled reader connection (a new one is opened
+        when none is idle, so borrowing never waits); in-memory databases
+        use the shared connection.
         """
         if self._is_memory:
-            lock = await self._get_lock()
-            conn = await self._ensure_connected()
+            yield await self._ensure_connected()
+            return
 
-            async with lock:
-                await conn.execute("BEGIN IMMEDIATE")
-                try:
-                    yield SQLiteTransaction(conn)
-                    await conn.execute("COMMIT")
-                except Exception:
-                    await conn.execute("ROLLBACK")
-                    raise
+        if self._idle_readers:
+            conn = self._idle_readers.pop()
         else:
             conn = await self._create_connection()
-            try:
-                await conn.execute("BEGIN IMMEDIATE")
-                try:
-                    yield SQLiteTransaction(conn)
-                    await conn.execute("COMMIT")
-                except Exception:
-                    await conn.execute("ROLLBACK")
-                    raise
-            finally:
+            self._readers.append(conn)
+        try:
+            yield conn
+        finally:
+            if conn not in self._readers:
+                pass  # closed by close() while borrowed
+            elif len(self._idle_readers) < self.read_pool_size:
+                self._idle_readers.append(conn)
+            else:
+                self._readers.remove(conn)
                 await conn.close()
 
     def select_for_update(self, table: str, where: str) -> str:
@@ -224,10 +280,16 @@ class SQLiteAdapter(DatabaseAdapter):
         return f"SELECT * FROM {table} WHERE {where}"
 
     async def close(self) -> None:
-        """Close the shared connection."""
+        """Close the shared, writer and reader connections."""
         if self._shared_conn is not None:
             await self._shared_conn.close()
             self._shared_conn = None
+        if self._writer is not None:
+            await self._writer.close()
+            self._writer = None
+        readers, self._readers, self._idle_readers = self._readers, [], []
+        for conn in readers:
+            await conn.close()
 
 
 # ============================================================
@@ -235,6 +297,70 @@ class SQLiteAdapter(DatabaseAdapter):
 # ============================================================
 
 
+class EventRecord:
+    """
+    Stored event with lazily decoded payload.
+
+    Exposes the same attributes as Event, but data, metadata and
+    timestamp are only decoded when first accessed, so readers that
+    look at type/stream_id/global_position skip the JSON work.
+    """
+
+    __slots__ = (
+        "global_position", "id", "stream_id", "type", "version",
+        "correlation_id", "causation_id",
+        "_timestamp", "_data", "_metadata",
+    )
+
+    def __init__(self, row: Any):
+        (
+            self.global_position,
+            self.id,
+            self.stream_id,
+            self.type,
+            self.version,
+            self._timestamp,
+            self.correlation_id,
+            self.causation_id,
+            self._data,
+            self._metadata,
+        ) = row
+
+    @property
+    def timestamp(self) -> datetime:
+        if isinstance(self._timestamp, str):
+            self._timestamp = datetime.fromisoformat(self._timestamp)
+        return self._timestamp
+
+    @property
+    def data(self) -> Dict[str, Any]:
+        if isinstance(self._data, str):
+            self._data = json.loads(self._data)
+        return self._data
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        if isinstance(self._metadata, str):
+            self._metadata = json.loads(self._metadata)
+        return self._metadata
+
+    def to_event(self) -> Event:
+        """Decode into an Event."""
+        return Event(
+            id=self.id,
+            stream_id=self.stream_id,
+            type=self.type,
+            version=self.version,
+            timestamp=self.timestamp,
+            correlation_id=self.correlation_id,
+            causation_id=self.causation_id,
+            data=self.data,
+            metadata=self.metadata,
+            global_position=self.global_position,
+        )
+
+
+
 class AsyncEventStore(ABC):
     """
     Abstract async event store interface.
@@ -300,6 +426,37 @@ class AsyncEventStore(ABC):
         """
         pass
 
+    async def read_pages(
+        self,
+        from_position: int = 0,
+        event_types: Optional[List[str]] = None,
+        page_size: int = 500,
+    ) -> AsyncIterator[List[Any]]:
+        """
+        Read all events across streams in pages of at most page_size.
+
+        Stores can override this to avoid decoding payloads up front;
+        the default groups read_all().
+
+        Yields:
+            Lists of events in global position order
+        """
+        page = []
+        async for event in self.read_all(from_position, event_types):
+            page.append(event)
+            if len(page) >= page_size:
+                yield page
+                page = []
+        if page:
+            yield page
+
+    async def get_global_position(self) -> int:
+        """Get the highest global position in the store (0 if empty)."""
+        position = 0
+        async for event in self.read_all():
+            position = event.global_position
+        return position
+
     @abstractmethod
     async def get_stream_version(self, stream_id: str) -> int:
         """Get current version of a stream (0 if stream doesn't exist)."""
@@ -319,21 +476,34 @@ class SQLiteAsyncEventStore(AsyncEventStore):
     - Event sourcing with optimistic concurrency
     - WAL mode for concurrent access
     - Retry logic for transient failures
+    - Cached per-stream head versions (no MAX(version) scan per append)
+    - Optional group commit: appends from concurrent coroutines are
+      coalesced into one transaction, each in its own savepoint so one
+      failing append does not affect the others
     """
 
     MAX_RETRIES = 3
     RETRY_DELAY_MS = 100
+    DEFAULT_PAGE_SIZE = 500
 
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str, group_commit: bool = False):
         """
         Initialize event store.
 
         Args:
             db_path: Path to SQLite database file, or ":memory:" for in-memory
+            group_commit: Coalesce concurrent appends into shared transactions
         """
         self.db_path = db_path
+        self.group_commit = group_commit
         self._adapter = SQLiteAdapter(db_path)
         self._initialized = False
+        # stream_id -> committed head version, valid while _heads_token holds
+        self._stream_heads: Dict[str, int] = {}
+        self._heads_token: Any = None
+        # Group commit: (stream_id, events, expected_version, future)
+        self._pending: List[tuple] = []
+        self._flush_task: Optional[Any] = None
 
     async def _ensure_schema(self) -> None:
         """Initialize database schema if needed."""
@@ -388,9 +558,25 @@ class SQLiteAsyncEventStore(AsyncEventStore):
 
         await self._ensure_schema()
 
+        if self.group_commit:
+            future = asyncio.get_running_loop().create_future()
+            self._pending.append((stream_id, events, expected_version, future))
+            if self._flush_task is None:
+                self._flush_task = asyncio.ensure_future(self._flush_pending())
+            await future
+            return
+
+        await self._with_retries(
+            lambda: self._append_internal(stream_id, events, expected_version)
+        )
+
+    async def _with_retries(self, operation) -> None:
+        """Run operation, retrying while the database is locked."""
+        import asyncio
+
         for attempt in range(self.MAX_RETRIES):
             try:
-                await self._append_internal(stream_id, events, expected_version)
+                await operation()
                 return
             except Exception as e:
                 if "database is locked" in str(e) and attempt < self.MAX_RETRIES - 1:
@@ -406,45 +592,127 @@ class SQLiteAsyncEventStore(AsyncEventStore):
     ) -> None:
         """Internal append with transaction handling."""
         async with self._adapter.exclusive_transaction() as tx:
+            await self._validate_heads(tx)
+            head = await self._append_events(
+                tx, stream_id, events, expected_version, {}
+            )
+        self._stream_heads[stream_id] = head
+
+    async def _flush_pending(self) -> None:
+        """Commit queued appends, one transaction per batch, until idle."""
+        try:
+            while self._pending:
+                batch, self._pending = self._pending, []
+                try:
+                    await self._with_retries(lambda: self._commit_group(batch))
+                except BaseException as e:
+                    for *_, future in batch:
+                        if not future.done():
+                            future.set_exception(e)
+                    if not isinstance(e, Exception):
+                        raise
+        finally:
+            self._flush_task = None
+
+    async def _commit_group(self, batch: List[tuple]) -> None:
+        """Append a batch of requests in one transaction."""
+        uncommitted: Dict[str, int] = {}
+        errors: Dict[int, Exception] = {}
+
+        async with self._adapter.exclusive_transaction() as tx:
+            await self._validate_heads(tx)
+            for index, (stream_id, events, expected_version, _) in enumerate(batch):
+                await tx.execute("SAVEPOINT group_append")
+                try:
+                    uncommitted[stream_id] = await self._append_events(
+                        tx, stream_id, events, expected_version, uncommitted
+                    )
+                except Exception as e:
+                    await tx.execute("ROLLBACK TO SAVEPOINT group_append")
+                    errors[index] = e
+                await tx.execute("RELEASE SAVEPOINT group_append")
+
+        self._stream_heads.update(uncommitted)
+        for index, (*_, future) in enumerate(batch):
+            if future.done():
+                continue
+            if index in errors:
+                future.set_exception(errors[index])
+            else:
+                future.set_result(None)
+
+    async def _validate_heads(self, tx: SQLiteTransaction) -> None:
+        """Drop cached stream heads if another connection has committed."""
+        token = await tx.change_token()
+        if token != self._heads_token:
+            self._stream_heads.clear()
+            self._heads_token = token
+
+    async def _append_events(
+        self,
+        tx: SQLiteTransaction,
+        stream_id: str,
+        events: List[Event],
+        expected_version: Optional[int],
+        uncommitted: Dict[str, int],
+    ) -> int:
+        """
+        Check versions and insert events inside an open transaction.
+
+        Args:
+            uncommitted: Heads written earlier in the same transaction
+
+        Returns:
+            The new head version of the stream
+        """
+        if stream_id in uncommitted:
+            current_version = uncommitted[stream_id]
+        elif stream_id in self._stream_heads:
+            current_version = self._stream_heads[stream_id]
+        else:
             row = await tx.fetch_one(
                 "SELECT MAX(version) as max_version FROM events WHERE stream_id = ?",
                 (stream_id,)
             )
             current_version = row["max_version"] if row and row["max_version"] is not None else 0
+            self._stream_heads[stream_id] = current_version
 
-            if expected_version is not None and current_version != expected_version:
-                raise ConcurrencyError(
-                    f"Expected version {expected_version}, "
-                    f"but stream is at {current_version}"
-                )
+        if expected_version is not None and current_version != expected_version:
+            raise ConcurrencyError(
+                f"Expected version {expected_version}, "
+                f"but stream is at {current_version}"
+            )
 
-            for i, event in enumerate(events):
-                expected = current_version + i + 1
-                if event.version != expected:
-                    raise ValueError(
-                        f"Event version {event.version} should be {expected}"
-                    )
+        for i, event in enumerate(events):
+            expected = current_version + i + 1
+            if event.version != expected:
+                raise ValueError(
+                    f"Event version {event.version} should be {expected}"
+                )
 
-            for event in events:
-                await tx.execute(
-                    """
-                    INSERT INTO events
-                    (id, stream_id, type, version, timestamp,
-                     correlation_id, causation_id, data, metadata)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        event.id,
-                        stream_id,
-                        event.type,
-                        event.version,
-                        event.timestamp.isoformat(),
-                        event.correlation_id,
-                        event.causation_id,
-                        json.dumps(event.data),
-                        json.dumps(event.metadata),
-                    )
+        await tx.execute_many(
+            """
+            INSERT INTO events
+            (id, stream_id, type, version, timestamp,
+             correlation_id, causation_id, data, metadata)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (
+                    event.id,
+                    stream_id,
+                    event.type,
+                    event.version,
+                    event.timestamp.isoformat(),
+                    event.correlation_id,
+                    event.causation_id,
+                    json.dumps(event.data),
+                    json.dumps(event.metadata),
                 )
+                for event in events
+            ],
+        )
+        return current_version + len(events)
 
     async def read(
         self,
@@ -454,93 +722,112 @@ class SQLiteAsyncEventStore(AsyncEventStore):
         """Read events from stream."""
         await self._ensure_schema()
 
-        conn = await self._adapter._ensure_connected()
-        cursor = await conn.execute(
-            """
-            SELECT global_position, id, stream_id, type, version, timestamp,
-                   correlation_id, causation_id, data, metadata
-            FROM events
-            WHERE stream_id = ? AND version > ?
-            ORDER BY version
-            """,
-            (stream_id, from_version)
-        )
-
-        async for row in cursor:
-            yield Event(
-                id=row[1],
-                stream_id=row[2],
-                type=row[3],
-                version=row[4],
-                timestamp=datetime.fromisoformat(row[5]),
-                correlation_id=row[6],
-                causation_id=row[7],
-                data=json.loads(row[8]),
-                metadata=json.loads(row[9]),
-                global_position=row[0],
+        async with self._adapter.read_connection() as conn:
+            cursor = await conn.execute(
+                """
+                SELECT global_position, id, stream_id, type, version, timestamp,
+                       correlation_id, causation_id, data, metadata
+                FROM events
+                WHERE stream_id = ? AND version > ?
+                ORDER BY version
+                """,
+                (stream_id, from_version)
             )
 
+            async for row in cursor:
+                yield Event(
+                    id=row[1],
+                    stream_id=row[2],
+                    type=row[3],
+                    version=row[4],
+                    timestamp=datetime.fromisoformat(row[5]),
+                    correlation_id=row[6],
+                    causation_id=row[7],
+                    data=json.loads(row[8]),
+                    metadata=json.loads(row[9]),
+                    global_position=row[0],
+                )
+
     async def read_all(
         self,
         from_position: int = 0,
         event_types: Optional[List[str]] = None,
     ) -> AsyncIterator[Event]:
         """Read all events for projections."""
-        await self._ensure_schema()
+        async for page in self.read_pages(from_position, event_types):
+            for record in page:
+                yield record.to_event()
 
-        conn = await self._adapter._ensure_connected()
+    async def read_pages(
+        self,
+        from_position: int = 0,
+        event_types: Optional[List[str]] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> AsyncIterator[List[EventRecord]]:
+        """
+        Read all events in pages of EventRecords (payloads decoded lazily).
 
+        Each page is a separate keyset query on global_position, so a slow
+        consumer never holds a read cursor open across the whole history.
+        """
+        await self._ensure_schema()
+
+        type_filter = ""
+        type_params: tuple = ()
         if event_types:
-            placeholders = ",".join("?" * len(event_types))
-            query = f"""
-                SELECT global_position, id, stream_id, type, version, timestamp,
-                       correlation_id, causation_id, data, metadata
-                FROM events
-                WHERE global_position > ? AND type IN ({placeholders})
-                ORDER BY global_position
-            """
-            params = (from_position,) + tuple(event_types)
-        else:
-            query = """
-                SELECT global_position, id, stream_id, type, version, timestamp,
-                       correlation_id, causation_id, data, metadata
-                FROM events
-                WHERE global_position > ?
-                ORDER BY global_position
-            """
-            params = (from_position,)
-
-        cursor = await conn.execute(query, params)
-
-        async for row in cursor:
-            yield Event(
-                id=row[1],
-                stream_id=row[2],
-                type=row[3],
-                version=row[4],
-                timestamp=datetime.fromisoformat(row[5]),
-                correlation_id=row[6],
-                causation_id=row[7],
-                data=json.loads(row[8]),
-                metadata=json.loads(row[9]),
-                global_position=row[0],
-            )
+            type_filter = f" AND type IN ({','.join('?' * len(event_types))})"
+            type_params = tuple(event_types)
+
+        query = f"""
+            SELECT global_position, id, stream_id, type, version, timestamp,
+                   correlation_id, causation_id, data, metadata
+            FROM events
+            WHERE global_position > ?{type_filter}
+            ORDER BY global_position
+            LIMIT ?
+        """
+
+        position = from_position
+        while True:
+            async with self._adapter.read_connection() as conn:
+                cursor = await conn.execute(query, (position,) + type_params + (page_size,))
+                rows = await cursor.fetchall()
+            if not rows:
+                return
+            page = [EventRecord(tuple(row)) for row in rows]
+            yield page
+            if len(rows) < page_size:
+                return
+            position = page[-1].global_position
+
+    async def get_global_position(self) -> int:
+        """Get the highest global position in the store (0 if empty)."""
+        await self._ensure_schema()
+
+        async with self._adapter.read_connection() as conn:
+            cursor = await conn.execute("SELECT MAX(global_position) FROM events")
+            row = await cursor.fetchone()
+        return row[0] if row and row[0] is not None else 0
 
     async def get_stream_version(self, stream_id: str) -> int:
         """Get current version of a stream."""
         await self._ensure_schema()
 
-        conn = await self._adapter._ensure_connected()
-        cursor = await conn.execute(
-            "SELECT MAX(version) FROM events WHERE stream_id = ?",
-            (stream_id,)
-        )
-        row = await cursor.fetchone()
+        async with self._adapter.read_connection() as conn:
+            cursor = await conn.execute(
+                "SELECT MAX(version) FROM events WHERE stream_id = ?",
+                (stream_id,)
+            )
+            row = await cursor.fetchone()
         return row[0] if row and row[0] is not None else 0
 
     async def close(self) -> None:
         """Close the event store."""
+        if self._flush_task is not None:
+            await self._flush_task
         await self._adapter.close()
+        self._stream_heads.clear()
+        self._heads_token = None
 
 
 # ============================================================
@@ -863,3 +1150,134 @@ class EventSourcedRepository:
         await self.checkpoint_store.delete_older_than(stream_id, keep_count=3)
 
         return checkpoint
+
+
+# ============================================================
+# Projections
+# ============================================================
+
+
+class Projection(ABC):
+    """
+    Read model built by folding events from the whole store.
+
+    Subclasses set name (used as the snapshot key) and, optionally,
+    event_types to limit which events are read. Bump version whenever
+    apply() changes so stale snapshots are discarded and the projection
+    is rebuilt from the start.
+    """
+
+    name: str = ""
+    version: int = 1
+    event_types: Optional[List[str]] = None
+
+    @abstractmethod
+    def initial_state(self) -> Dict[str, Any]:
+        """Return the empty state (must be JSON-serializable)."""
+        pass
+
+    @abstractmethod
+    def apply(self, state: Dict[str, Any], event: Any) -> None:
+        """
+        Fold one event into state (in place).
+
+        Args:
+            state: Current projection state
+            event: Event or EventRecord; decode data/metadata only if needed
+        """
+        pass
+
+
+class ProjectionRunner:
+    """
+    Brings projections up to date incrementally.
+
+    Each projection's state is snapshotted in the checkpoint store under
+    "projection:<name>", with the global position it covers as the
+    checkpoint version. A run loads the snapshot, reads only newer events
+    in bounded pages and saves a new snapshot, so startup cost is
+    proportional to the events appended since the last run.
+    """
+
+    SNAPSHOT_STREAM_PREFIX = "projection:"
+
+    def __init__(
+        self,
+        event_store: AsyncEventStore,
+        checkpoint_store: CheckpointStore,
+        page_size: int = 500,
+        snapshot_every: int = 5000,
+    ):
+        """
+        Initialize projection runner.
+
+        Args:
+            event_store: Event store to read from
+            checkpoint_store: Checkpoint store for projection snapshots
+            page_size: Events read per query
+            snapshot_every: Also snapshot after this many events during a run
+        """
+        self.event_store = event_store
+        self.checkpoint_store = checkpoint_store
+        self.page_size = page_size
+        self.snapshot_every = snapshot_every
+
+    async def run(self, projection: Projection) -> Dict[str, Any]:
+        """
+        Catch the projection up with the store.
+
+        Returns:
+            The up-to-date projection state
+        """
+        stream_id = self.SNAPSHOT_STREAM_PREFIX + projection.name
+        snapshot = await self.checkpoint_store.load_latest(stream_id)
+
+        if snapshot and snapshot.metadata.get("projection_version") == projection.version:
+            state, position = snapshot.state, snapshot.version
+        else:
+            state, position = projection.initial_state(), 0
+        saved_position = position
+
+        # Anything committed up to here is covered by this run, even if it
+        # is filtered out by event_types
+        head = await self.event_store.get_global_position()
+
+        applied = 0
+        since_snapshot = 0
+        async for page in self.event_store.read_pages(
+            position, projection.event_types, self.page_size
+        ):
+            for event in page:
+                projection.apply(state, event)
+            position = page[-1].global_position
+            applied += len(page)
+            since_snapshot += len(page)
+            if since_snapshot >= self.snapshot_every:
+                await self._save(stream_id, projection, state, position)
+                saved_position = position
+                since_snapshot = 0
+
+        position = max(position, head)
+        if position != saved_position:
+            await self._save(stream_id, projection, state, position)
+
+        logger.debug(
+            "Projection %s: applied %d events, now at position %d",
+            projection.name, applied, position,
+        )
+        return state
+
+    async def _save(
+        self,
+        stream_id: str,
+        projection: Projection,
+        state: Dict[str, Any],
+        position: int,
+    ) -> None:
+        await self.checkpoint_store.save(Checkpoint.create(
+            stream_id=stream_id,
+            version=position,
+            state=state,
+            metadata={"projection_version": projection.version},
+        ))
+        await self.checkpoint_store.delete_older_than(stream_id, keep_count=2)
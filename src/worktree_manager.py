@@ -13,6 +13,7 @@ Each isolated workflow gets its own worktree with:
 import random
 import shutil
 import subprocess
+import threading
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -32,6 +33,11 @@ NOUNS = [
 ]
 
 
+# `git worktree add` reads every entry under .git/worktrees, and fails on
+# one that another thread is still writing or deleting
+_worktree_admin_lock = threading.Lock()
+
+
 def generate_worktree_name(session_id: str) -> str:
     """Generate a human-readable worktree name.
 
@@ -204,6 +210,46 @@ class WorktreeManager:
 
         return worktree_path
 
+    def create_detached(self, name: str, ref: str) -> Path:
+        """Create a worktree with an existing ref checked out (detached HEAD).
+
+        Unlike create(), no branch is made and the main working directory
+        may be dirty, so several of these can be used side by side (e.g. to
+        build and test candidate branches in parallel).
+
+        Args:
+            name: Directory name under the worktrees directory
+            ref: Branch, tag or commit to check out
+
+        Returns:
+            Path to the created worktree
+
+        Raises:
+            WorktreeError: If the worktree could not be created
+        """
+        worktree_path = self.worktrees_dir / name
+        self.worktrees_dir.mkdir(parents=True, exist_ok=True)
+
+        with _worktree_admin_lock:
+            result = self._run_git(
+                ["worktree", "add", "--detach", str(worktree_path), ref],
+                check=False
+            )
+        if result.returncode != 0:
+            raise WorktreeError(f"Failed to create worktree for {ref}: {result.stderr.strip()}")
+
+        self._copy_env_files(worktree_path)
+        return worktree_path
+
+    def remove(self, worktree_path: Path) -> None:
+        """Remove a worktree by path (including uncommitted changes in it).
+
+        Args:
+            worktree_path: Path returned by create_detached()
+        """
+        with _worktree_admin_lock:
+            self._run_git(["worktree", "remove", str(worktree_path), "--force"], check=False)
+
     def _copy_env_files(self, worktree_path: Path) -> None:
         """Copy .env* files from repo root to worktree.
 
@@ -0,0 +1,196 @@
+"""
+Tests for textual conflict detection (src/conflict/detector.py).
+
+These run real git commands against a throwaway repository.
+"""
+
+import os
+import subprocess
+import time
+from itertools import combinations
+
+import pytest
+
+from src.conflict.detector import (
+    ConflictDetector,
+    ConflictMatrix,
+    ConflictSeverity,
+    ConflictType,
+)
+
+
+def git(*args: str) -> str:
+    return subprocess.run(
+        ["git", *args], capture_output=True, text=True, check=True
+    ).stdout
+
+
+def make_branch(name: str, files: dict[str, str], base: str = "main") -> None:
+    git("checkout", "-q", "-b", name, base)
+    for path, content in files.items():
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w") as f:
+            f.write(content)
+        git("add", path)
+    git("commit", "-q", "-m", name)
+    git("checkout", "-q", "main")
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    git("init", "-q", "-b", "main")
+    git("config", "user.email", "test@example.com")
+    git("config", "user.name", "Test")
+    git("config", "commit.gpgsign", "false")
+    with open("shared.py", "w") as f:
+        f.write("value = 0\n")
+    git("add", "shared.py")
+    git("commit", "-q", "-m", "init")
+    return tmp_path
+
+
+class TestConflictMatrix:
+    """Tests for N-way conflict detection."""
+
+    def test_reports_every_conflicting_pair(self, repo):
+        make_branch("agent-a", {"shared.py": "value = 1\n"})
+        make_branch("agent-b", {"shared.py": "value = 2\n"})
+        make_branch("agent-c", {"shared.py": "value = 3\n"})
+        make_branch("agent-d", {"other.py": "x = 1\n"})
+
+        matrix = ConflictDetector().detect_matrix(["agent-a", "agent-b", "agent-c", "agent-d"])
+
+        assert isinstance(matrix, ConflictMatrix)
+        assert {tuple(info.branches) for info in matrix.conflicts()} == {
+            ("agent-a", "agent-b"),
+            ("agent-a", "agent-c"),
+            ("agent-b", "agent-c"),
+        }
+        # agent-d touches a different file from everyone: never merged
+        assert matrix.skipped_pairs == 3
+        assert sorted(matrix.conflicting_with("agent-a")) == ["agent-b", "agent-c"]
+        assert matrix.conflicting_with("agent-d") == []
+        assert matrix.conflicts()[0].conflicting_files[0].file_path == "shared.py"
+
+    def test_clean_overlapping_pair_is_checked(self, repo):
+        with open("shared.py", "w") as f:
+            f.write("a = 0\n\n\n\n\nb = 0\n")
+        git("commit", "-q", "-am", "two values")
+        make_branch("agent-a", {"shared.py": "a = 1\n\n\n\n\nb = 0\n"})
+        make_branch("agent-b", {"shared.py": "a = 0\n\n\n\n\nb = 1\n"})
+
+        matrix = ConflictDetector().detect_matrix(["agent-a", "agent-b"])
+
+        info = matrix.pairs[("agent-a", "agent-b")]
+        assert not info.has_conflicts
+        assert info.merged_tree_sha
+
+    def test_file_directory_conflict_is_checked(self, repo):
+        make_branch("b1", {"x": "file\n"})
+        git("checkout", "-q", "-b", "b2", "main")
+        os.mkdir("x")
+        with open("x/y", "w") as f:
+            f.write("nested\n")
+        git("add", "x/y")
+        git("commit", "-q", "-m", "b2")
+        git("checkout", "-q", "main")
+        make_branch("b3", {"other.py": "z = 1\n"})
+
+        assert ConflictDetector().detect(["b1", "b2"]).has_conflicts
+        info = ConflictDetector().detect(["b1", "b2", "b3"])
+
+        assert info.has_conflicts
+        assert ("b1", "b2") in {tuple(i.branches) for i in info.conflict_matrix.conflicts()}
+        assert info.conflict_matrix.skipped_pairs == 2
+
+    def test_files_in_shared_directory_are_skipped(self, repo):
+        make_branch("agent-a", {"src/a.py": "a = 1\n"})
+        make_branch("agent-b", {"src/b.py": "b = 1\n"})
+        make_branch("agent-c", {"src/c.py": "c = 1\n"})
+
+        matrix = ConflictDetector().detect_matrix(["agent-a", "agent-b", "agent-c"])
+
+        assert matrix.skipped_pairs == 3
+        assert matrix.pairs == {}
+
+    def test_detect_summarizes_all_conflicts(self, repo):
+        make_branch("agent-a", {"shared.py": "value = 1\n"})
+        make_branch("agent-b", {"shared.py": "value = 2\n"})
+        make_branch("agent-c", {"auth.py": "secret = 1\n"})
+        make_branch("agent-d", {"auth.py": "secret = 2\n"})
+
+        info = ConflictDetector().detect(["agent-a", "agent-b", "agent-c", "agent-d"])
+
+        assert info.has_conflicts
+        assert info.conflict_type == ConflictType.TEXTUAL
+        assert info.severity == ConflictSeverity.CRITICAL
+        assert sorted(f.file_path for f in info.conflicting_files) == ["auth.py", "shared.py"]
+        assert len(info.conflict_matrix.conflicts()) == 2
+
+    def test_no_conflicts(self, repo):
+        for i in range(3):
+            make_branch(f"agent-{i}", {f"file{i}.py": f"x = {i}\n"})
+
+        info = ConflictDetector().detect(["agent-0", "agent-1", "agent-2"])
+
+        assert not info.has_conflicts
+        assert info.is_fast_path
+        assert info.conflict_matrix.skipped_pairs == 3
+
+    def test_conflict_with_base_reported_first(self, repo):
+        make_branch("agent-a", {"shared.py": "value = 1\n"})
+        make_branch("agent-b", {"other.py": "x = 1\n"})
+        make_branch("agent-c", {"more.py": "y = 1\n"})
+        with open("shared.py", "w") as f:
+            f.write("value = 99\n")
+        git("commit", "-q", "-am", "main moved on")
+
+        info = ConflictDetector().detect(["agent-a", "agent-b", "agent-c"])
+
+        assert info.has_conflicts
+        assert info.branches == ["agent-a"]
+
+    def test_unknown_branch_does_not_hide_other_results(self, repo):
+        make_branch("agent-a", {"shared.py": "value = 1\n"})
+        make_branch("agent-b", {"shared.py": "value = 2\n"})
+
+        results = ConflictDetector()._merge_tree_batch(
+            [("agent-a", "no-such-branch"), ("agent-a", "agent-b")]
+        )
+
+        assert results[("agent-a", "agent-b")].has_conflicts
+        assert results[("agent-a", "agent-b")].conflicting_files[0].file_path == "shared.py"
+        # Failures are reported as conflicts, never as a clean merge
+        assert results[("agent-a", "no-such-branch")].has_conflicts
+
+
+class TestConflictDetectorPerformance:
+    """N-way conflict matrix over many agent branches."""
+
+    def test_matrix_speed(self, repo):
+        """20 branches (190 pairs) are checked faster than pair by pair."""
+        branches = [f"agent-{i:02d}" for i in range(20)]
+        for i, branch in enumerate(branches):
+            # Every fifth agent also edits the shared file
+            files = {f"src/module_{i}.py": f"x = {i}\n"}
+            if i % 5 == 0:
+                files["shared.py"] = f"value = {i + 100}\n"
+            make_branch(branch, files)
+
+        start = time.perf_counter()
+        matrix = ConflictDetector().detect_matrix(branches)
+        elapsed = time.perf_counter() - start
+
+        editors = ["agent-00", "agent-05", "agent-10", "agent-15"]
+        assert {tuple(info.branches) for info in matrix.conflicts()} == set(combinations(editors, 2))
+        assert matrix.skipped_pairs == 190 - 6
+
+        detector = ConflictDetector()
+        start = time.perf_counter()
+        for branch1, branch2 in combinations(branches, 2):
+            detector._detect_pairwise(branch1, branch2)
+        pairwise = time.perf_counter() - start
+
+        # About 9x apart: 184 of the 190 pairs are skipped and the rest share one process
+        assert elapsed * 3 < pairwise, f"matrix {elapsed:.3f}s vs {pairwise:.3f}s pair by pair"
@@ -11,15 +11,19 @@ from pathlib import Path
 from src.conflict.detector import ConflictSeverity, ConflictType
 
 
+@pytest.fixture
+def pipeline():
+    from src.conflict.pipeline import DetectionPipeline
+
+    with DetectionPipeline(base_branch="main") as pipeline:
+        yield pipeline
+
+
 class TestDetectionPipeline:
     """Tests for the main detection pipeline orchestrator."""
 
-    def test_pipeline_runs_all_steps(self):
+    def test_pipeline_runs_all_steps(self, pipeline):
         """Pipeline should run all detection steps in order."""
-        from src.conflict.pipeline import DetectionPipeline
-
-        pipeline = DetectionPipeline(base_branch="main")
-
         # Mock the individual detectors
         with patch.object(pipeline, 'textual_detector') as mock_textual, \
              patch.object(pipeline, 'build_tester') as mock_build, \
@@ -38,12 +42,8 @@ class TestDetectionPipeline:
             assert mock_dep.analyze.called
             assert mock_semantic.analyze.called
 
-    def test_pipeline_short_circuits_on_critical_conflict(self):
+    def test_pipeline_short_circuits_on_critical_conflict(self, pipeline):
         """Pipeline should stop early on critical conflicts."""
-        from src.conflict.pipeline import DetectionPipeline
-
-        pipeline = DetectionPipeline(base_branch="main")
-
         with patch.object(pipeline, 'textual_detector') as mock_textual:
             # Simulate critical textual conflict
             mock_textual.detect.return_value = Mock(
@@ -59,12 +59,8 @@ class TestDetectionPipeline:
             # Should have conflicts and skip later steps
             assert result.has_conflicts
 
-    def test_pipeline_detects_clean_but_broken(self):
+    def test_pipeline_detects_clean_but_broken(self, pipeline):
         """Pipeline should detect when merge is clean but build fails."""
-        from src.conflict.pipeline import DetectionPipeline
-
-        pipeline = DetectionPipeline(base_branch="main")
-
         with patch.object(pipeline, 'textual_detector') as mock_textual, \
              patch.object(pipeline, 'build_tester') as mock_build, \
              patch.object(pipeline, 'dependency_analyzer') as mock_dep, \
@@ -87,6 +83,13 @@ class TestDetectionPipeline:
             assert result.has_conflicts
             assert result.conflict_type.value == "semantic"
 
+    def test_close_stops_object_reader(self, pipeline):
+        """Closing the pipeline stops the shared cat-file reader."""
+        with patch.object(pipeline.object_reader, "close") as close:
+            pipeline.close()
+
+        close.assert_called_once()
+
 
 class TestBuildTester:
     """Tests for build/test runner on merged code."""
@@ -292,6 +295,89 @@ class TestConflictClusterer:
         assert ordered[2]["id"] == "c3"
 
 
+    def test_hot_file_joins_all_agents(self):
+        """Agents linked only through a chain of files end up together."""
+        from src.conflict.clusterer import ConflictClusterer
+
+        clusterer = ConflictClusterer()
+
+        agents = [
+            {"id": "agent1", "files": ["package.json", "src/a.py"]},
+            {"id": "agent2", "files": ["src/a.py", "src/b.py"]},
+            {"id": "agent3", "files": ["src/b.py"]},
+            {"id": "agent4", "files": ["package.json"]},
+            {"id": "agent5", "files": ["src/z.py"]},
+        ]
+
+        clusters = clusterer.cluster(agents)
+
+        assert [c.agent_ids for c in clusters] == [
+            ["agent1", "agent2", "agent3", "agent4"],
+            ["agent5"],
+        ]
+        assert clusters[0].complexity == "complex"
+
+    def test_clusters_by_both(self):
+        """Should join agents linked by either a file or a domain."""
+        from src.conflict.clusterer import ConflictClusterer
+
+        clusterer = ConflictClusterer()
+
+        agents = [
+            {"id": "agent1", "files": ["src/auth/login.py"]},
+            {"id": "agent2", "files": ["src/session.py", "README.md"]},
+            {"id": "agent3", "files": ["README.md"]},
+            {"id": "agent4", "files": ["src/payments/checkout.py"], "domains": []},
+        ]
+
+        clusters = clusterer.cluster(agents, by="both")
+
+        assert [c.agent_ids for c in clusters] == [
+            ["agent1", "agent2", "agent3"],
+            ["agent4"],
+        ]
+
+    def test_infer_domains(self):
+        """Should match domain patterns anywhere in the path."""
+        from src.conflict.clusterer import ConflictClusterer
+
+        clusterer = ConflictClusterer()
+
+        domains = clusterer._infer_domains(["src/API/Routes.py", "app/pagesettings.py"])
+
+        assert sorted(domains) == ["api", "config", "ui"]
+        # Served from the per-path cache the second time
+        assert sorted(clusterer._infer_domains(["src/API/Routes.py"])) == ["api"]
+
+
+class TestConflictClustererPerformance:
+    """Clustering many agents that all share one file."""
+
+    def test_clustering_speed(self):
+        """400 agents sharing one file should cluster quickly (<200ms)."""
+        import time
+        from src.conflict.clusterer import ConflictClusterer
+
+        # 400 agents, 4000 files; every agent touches package.json
+        agents = [
+            {
+                "id": f"agent{i}",
+                "files": ["package.json"] + [f"src/mod{i}/file{j}.py" for j in range(10)],
+            }
+            for i in range(400)
+        ]
+
+        start = time.perf_counter()
+        clusters = ConflictClusterer().cluster(agents)
+        elapsed = time.perf_counter() - start
+
+        assert len(clusters) == 1
+        assert sorted(clusters[0].agent_ids) == sorted(a["id"] for a in agents)
+        assert clusters[0].shared_files == ["package.json"]
+        # The pairwise adjacency graph this replaced took ~720ms here
+        assert elapsed < 0.2, f"Clustering took {elapsed * 1000:.0f}ms (target <200ms)"
+
+
 class TestRiskFlags:
     """Tests for risk flag detection."""
 
@@ -0,0 +1 @@
+# Coordinator tests
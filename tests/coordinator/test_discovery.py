@@ -0,0 +1,219 @@
+"""
+Tests for agent branch discovery (src/coordinator/discovery.py).
+
+These run real git commands against a throwaway repository.
+"""
+
+import subprocess
+import time
+
+import pytest
+
+from src.coordinator.discovery import AgentDiscovery
+
+
+def git(*args: str) -> str:
+    return subprocess.run(
+        ["git", *args], capture_output=True, text=True, check=True
+    ).stdout
+
+
+def make_branch(name: str, commits: int = 1, base: str = "main") -> None:
+    git("checkout", "-q", "-b", name, base)
+    for i in range(commits):
+        path = name.replace("/", "_") + ".py"
+        with open(path, "a") as f:
+            f.write(f"x = {i}\n")
+        git("add", path)
+        git("commit", "-q", "-m", f"{name} {i}")
+    git("checkout", "-q", "main")
+
+
+def commit_on(branch: str, path: str) -> None:
+    git("checkout", "-q", branch)
+    with open(path, "a") as f:
+        f.write("y = 1\n")
+    git("add", path)
+    git("commit", "-q", "-m", f"update {path}")
+    git("checkout", "-q", "main")
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    git("init", "-q", "-b", "main")
+    git("config", "user.email", "test@example.com")
+    git("config", "user.name", "Test")
+    git("config", "commit.gpgsign", "false")
+    with open("README.md", "w") as f:
+        f.write("base\n")
+    git("add", "README.md")
+    git("commit", "-q", "-m", "init")
+    return tmp_path
+
+
+def count_queries(monkeypatch, discovery: AgentDiscovery) -> list[str]:
+    queried = []
+    original = discovery._query_ancestry
+
+    def query(ref):
+        queried.append(ref)
+        return original(ref)
+
+    monkeypatch.setattr(discovery, "_query_ancestry", query)
+    return queried
+
+
+class TestAgentDiscovery:
+    """Tests for branch discovery."""
+
+    def test_discovers_agent_branches(self, repo):
+        make_branch("claude/add-auth-abc123", commits=2)
+        make_branch("feature/not-an-agent")
+
+        branches = AgentDiscovery().discover_branches(include_remote=False)
+
+        assert [b.branch_name for b in branches] == ["claude/add-auth-abc123"]
+        branch = branches[0]
+        assert branch.session_id == "abc123"
+        assert branch.agent_id == "claude-abc123"
+        assert branch.commit_count == 2
+        assert branch.is_ahead_of_base
+        assert branch.head_sha == git("rev-parse", "claude/add-auth-abc123").strip()
+        assert branch.base_sha == git("rev-parse", "main").strip()
+        assert branch.last_commit_time.tzinfo is not None
+
+    def test_remote_branch_skipped_when_local_exists(self, repo):
+        make_branch("claude/local-aaa111")
+        make_branch("claude/remote-bbb222")
+        # Remote-tracking refs without a real remote
+        git("update-ref", "refs/remotes/origin/claude/local-aaa111", "claude/local-aaa111")
+        git("update-ref", "refs/remotes/origin/claude/remote-bbb222", "claude/remote-bbb222")
+        git("branch", "-q", "-D", "claude/remote-bbb222")
+
+        branches = AgentDiscovery().discover_branches(include_remote=True)
+
+        assert sorted(b.branch_name for b in branches) == [
+            "claude/local-aaa111", "claude/remote-bbb222",
+        ]
+
+    def test_base_tip_from_remote_ref(self, repo, monkeypatch):
+        discovery = AgentDiscovery(remote="origin")
+        refs = [("refs/remotes/origin/main", "origin/main", "abc123", None)]
+
+        def fail(*args, **kwargs):
+            raise AssertionError("base tip should come from the listed refs")
+
+        monkeypatch.setattr(subprocess, "run", fail)
+        assert discovery._resolve_base_tip(refs) == "abc123"
+
+
+class TestIncrementalDiscovery:
+    """Tests for reusing cached results between runs."""
+
+    def test_unchanged_branches_are_not_requeried(self, repo, monkeypatch):
+        make_branch("claude/one-aaa111")
+        make_branch("claude/two-bbb222")
+        cache_path = repo / ".claude" / "discovery_cache.json"
+        AgentDiscovery(cache_path=cache_path).discover_branches(include_remote=False)
+
+        commit_on("claude/two-bbb222", "claude_two-bbb222.py")
+        discovery = AgentDiscovery(cache_path=cache_path)
+        queried = count_queries(monkeypatch, discovery)
+        branches = {b.branch_name: b for b in discovery.discover_branches(include_remote=False)}
+
+        assert queried == ["refs/heads/claude/two-bbb222"]
+        assert branches["claude/one-aaa111"].commit_count == 1
+        assert branches["claude/two-bbb222"].commit_count == 2
+
+    def test_unrelated_base_commits_keep_cache(self, repo, monkeypatch):
+        make_branch("claude/one-aaa111")
+        cache_path = repo / ".claude" / "discovery_cache.json"
+        first = AgentDiscovery(cache_path=cache_path).discover_branches(include_remote=False)
+
+        commit_on("main", "README.md")
+        discovery = AgentDiscovery(cache_path=cache_path)
+        queried = count_queries(monkeypatch, discovery)
+        branches = discovery.discover_branches(include_remote=False)
+
+        assert queried == []
+        assert branches[0].base_sha == first[0].base_sha
+
+    def test_merged_branch_is_requeried(self, repo, monkeypatch):
+        make_branch("claude/one-aaa111", commits=2)
+        make_branch("claude/two-bbb222")
+        cache_path = repo / ".claude" / "discovery_cache.json"
+        AgentDiscovery(cache_path=cache_path).discover_branches(include_remote=False)
+
+        git("merge", "-q", "--no-ff", "-m", "merge one", "claude/one-aaa111")
+        discovery = AgentDiscovery(cache_path=cache_path)
+        queried = count_queries(monkeypatch, discovery)
+        branches = {b.branch_name: b for b in discovery.discover_branches(include_remote=False)}
+
+        assert queried == ["refs/heads/claude/one-aaa111"]
+        assert branches["claude/one-aaa111"].commit_count == 0
+        assert not branches["claude/one-aaa111"].is_ahead_of_base
+        assert branches["claude/two-bbb222"].commit_count == 1
+
+    def test_rewritten_base_discards_cache(self, repo, monkeypatch):
+        make_branch("claude/one-aaa111")
+        commit_on("main", "README.md")
+        cache_path = repo / ".claude" / "discovery_cache.json"
+        AgentDiscovery(cache_path=cache_path).discover_branches(include_remote=False)
+
+        git("reset", "-q", "--hard", "HEAD~1")
+        discovery = AgentDiscovery(cache_path=cache_path)
+        queried = count_queries(monkeypatch, discovery)
+        discovery.discover_branches(include_remote=False)
+
+        assert queried == ["refs/heads/claude/one-aaa111"]
+
+    def test_corrupt_cache_is_ignored(self, repo):
+        make_branch("claude/one-aaa111")
+        cache_path = repo / "discovery_cache.json"
+        cache_path.write_text("{not json")
+
+        branches = AgentDiscovery(cache_path=cache_path).discover_branches(include_remote=False)
+
+        assert branches[0].commit_count == 1
+
+
+def legacy_branch_info(branch: str) -> tuple:
+    """Per-branch subprocess sequence used before batched discovery."""
+    base_sha = git("merge-base", "main", branch).strip()
+    head_sha = git("rev-parse", branch).strip()
+    commit_time = git("log", "-1", "--format=%cI", branch).strip()
+    count = int(git("rev-list", "--count", f"{base_sha}..{branch}").strip())
+    return base_sha, head_sha, commit_time, count
+
+
+class TestDiscoveryPerformance:
+    """Batched and incremental discovery over many agent branches."""
+
+    def test_discovery_speed(self, repo):
+        """30 branches: batched discovery beats per-branch calls; the cache beats both."""
+        names = [f"claude/task-{i:02d}-s{i:04d}" for i in range(30)]
+        for name in names:
+            make_branch(name)
+        cache_path = repo / ".claude" / "discovery_cache.json"
+
+        start = time.perf_counter()
+        cold = AgentDiscovery(cache_path=cache_path).discover_branches(include_remote=False)
+        cold_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        warm = AgentDiscovery(cache_path=cache_path).discover_branches(include_remote=False)
+        warm_time = time.perf_counter() - start
+
+        listed = git("branch", "--format=%(refname:short)").split()
+        start = time.perf_counter()
+        legacy = [legacy_branch_info(b) for b in listed if b.startswith("claude/")]
+        legacy_time = time.perf_counter() - start
+
+        assert [(b.base_sha, b.head_sha, b.commit_count) for b in cold] == [
+            (base_sha, head_sha, count) for base_sha, head_sha, _, count in legacy
+        ]
+        assert warm == cold
+        # Typically ~1.6x apart cold (merge bases are still per branch), ~30x warm
+        assert cold_time < legacy_time, f"batched {cold_time:.3f}s vs {legacy_time:.3f}s per branch"
+        assert warm_time * 5 < cold_time, f"incremental {warm_time:.3f}s vs {cold_time:.3f}s cold"
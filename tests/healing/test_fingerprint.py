@@ -348,3 +348,64 @@ class TestStabilityTests:
         )
 
         assert fp.fingerprint(error1) == fp.fingerprint(error2)
+
+
+class TestNormalizationPipeline:
+    """Compiled normalization, LRU and batch fingerprinting."""
+
+    def test_rules_apply_in_order(self):
+        """Later rules see earlier replacements (path, then line number)."""
+        from src.healing.fingerprint import Fingerprinter
+
+        fp = Fingerprinter()
+
+        assert fp._normalize("at /home/u/proj/foo.py:42 pid=7") == "at <path>/foo.py:<line> pid=<pid>"
+        assert fp._normalize("  nothing variable here ") == "nothing variable here"
+
+    def test_custom_rules_with_backreferences(self):
+        """Rules that cannot be combined still normalize correctly."""
+        from src.healing.fingerprint import Fingerprinter, FingerprintConfig
+
+        fp = Fingerprinter(FingerprintConfig(strip_patterns=[(r"(\w)\1+", r"\1")]))
+
+        assert fp._any_rule is None
+        assert fp._normalize("boooom") == "bom"
+
+    def test_fingerprint_many_matches_single_calls(self):
+        """fingerprint_many returns (fine, coarse) pairs in order."""
+        from src.healing.fingerprint import Fingerprinter
+        from src.healing.models import ErrorEvent
+
+        errors = [
+            ErrorEvent(
+                error_id=f"err-{i}",
+                timestamp=datetime(2026, 1, 16, 12, 0, 0),
+                source="transcript",
+                description=f"ValueError: bad value at /srv/app/mod{i % 3}.py:{i}",
+            )
+            for i in range(10)
+        ]
+
+        pairs = Fingerprinter().fingerprint_many(errors)
+        single = Fingerprinter()
+
+        assert pairs == [(single.fingerprint(e), single.fingerprint_coarse(e)) for e in errors]
+        assert len(set(pairs)) == 3
+
+    def test_lru_is_bounded(self):
+        """Only the most recent cache_size inputs are remembered."""
+        from src.healing.fingerprint import Fingerprinter
+        from src.healing.models import ErrorEvent
+
+        fp = Fingerprinter(cache_size=2)
+        for i in range(5):
+            fp.fingerprint(
+                ErrorEvent(
+                    error_id=f"err-{i}",
+                    timestamp=datetime(2026, 1, 16, 12, 0, 0),
+                    source="transcript",
+                    description=f"KeyError: 'k{i}'",
+                )
+            )
+
+        assert [key[1] for key in fp._cache] == ["KeyError: 'k3'", "KeyError: 'k4'"]
@@ -122,6 +122,142 @@ class TestMultiCandidateGenerator:
         assert len(candidates) == 2
 
 
+@pytest.fixture
+def agent_repo(tmp_path):
+    """Repo with two agent branches that conflict on shared.py."""
+    _git(tmp_path, "init", "-q", "-b", "main")
+    _git(tmp_path, "config", "user.email", "test@example.com")
+    _git(tmp_path, "config", "user.name", "Test")
+    _git(tmp_path, "config", "commit.gpgsign", "false")
+    for i in range(200):
+        (tmp_path / f"module_{i}.py").write_text(f"x = {i}\n" * 20)
+    (tmp_path / "shared.py").write_text("value = 0\n")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "init")
+
+    for agent in ("agent1", "agent2"):
+        _git(tmp_path, "checkout", "-q", "-b", f"feature-{agent}", "main")
+        (tmp_path / "shared.py").write_text(f"value = '{agent}'\n")
+        (tmp_path / f"{agent}.py").write_text(f"name = '{agent}'\n")
+        _git(tmp_path, "add", ".")
+        _git(tmp_path, "commit", "-q", "-m", agent)
+    _git(tmp_path, "checkout", "-q", "main")
+
+    context = Mock()
+    context.agent_ids = ["agent1", "agent2"]
+    context.agent_branches = {
+        "agent1": "feature-agent1",
+        "agent2": "feature-agent2",
+    }
+    return tmp_path, context
+
+
+def _intents():
+    intents = Mock()
+    intents.comparison = Mock(relationship="compatible")
+    intents.intents = []
+    return intents
+
+
+class TestParallelCandidateGeneration:
+    """Tests for generating candidates concurrently without a checkout."""
+
+    def test_generates_candidates_without_touching_checkout(self, agent_repo):
+        """Candidate branches are built in-index; the checkout is untouched."""
+        from src.resolution.multi_candidate import MultiCandidateGenerator
+
+        repo, context = agent_repo
+        generator = MultiCandidateGenerator(repo_path=repo)
+        candidates = generator.generate(context, _intents(), Mock())
+
+        assert [c.strategy for c in candidates] == [
+            "agent1_primary", "agent2_primary", "convention_primary",
+        ]
+        assert _git(repo, "rev-parse", "--abbrev-ref", "HEAD").strip() == "main"
+        assert _git(repo, "status", "--porcelain") == ""
+
+        by_strategy = {c.strategy: c for c in candidates}
+        for strategy, winner in (("agent1_primary", "agent1"), ("agent2_primary", "agent2")):
+            branch = by_strategy[strategy].branch_name
+            assert _git(repo, "show", f"{branch}:shared.py") == f"value = '{winner}'\n"
+            assert set(by_strategy[strategy].files_modified) == {
+                "agent1.py", "agent2.py", "shared.py",
+            }
+
+    def test_matches_checkout_merges(self, agent_repo):
+        """In-index candidates have the same trees as checkout-built ones."""
+        from src.resolution.multi_candidate import MultiCandidateGenerator
+
+        repo, context = agent_repo
+        strategies = ["agent1_primary", "agent2_primary", "convention_primary", "fresh_synthesis"]
+        trees = {}
+        for in_index in (True, False):
+            generator = MultiCandidateGenerator(
+                repo_path=repo, strategies=strategies, max_candidates=4, in_index=in_index,
+            )
+            trees[in_index] = {
+                c.strategy: _git(repo, "rev-parse", f"{c.branch_name}^{{tree}}")
+                for c in generator.generate(context, _intents(), Mock())
+            }
+            _git(repo, "checkout", "-q", "main")
+
+        assert len(trees[True]) == 4
+        assert trees[True] == trees[False]
+
+    def test_failed_candidate_leaves_no_branch(self, agent_repo):
+        """A candidate that cannot be created is cleaned up."""
+        from src.resolution.multi_candidate import MultiCandidateGenerator
+
+        repo, context = agent_repo
+        generator = MultiCandidateGenerator(repo_path=repo, base_branch="no-such-branch")
+        candidates = generator.generate(context, _intents(), Mock())
+
+        assert candidates == []
+        assert "resolution/" not in _git(repo, "branch", "--list")
+
+
+class TestCandidateGenerationPerformance:
+    """Concurrent in-index candidate generation."""
+
+    def test_generation_speed(self, agent_repo):
+        """Four strategies are generated at the same time (<0.8s with 0.2s each)."""
+        import threading
+        import time
+        from src.resolution.multi_candidate import MultiCandidateGenerator
+
+        repo, context = agent_repo
+        strategies = ["agent1_primary", "agent2_primary", "convention_primary", "fresh_synthesis"]
+        generator = MultiCandidateGenerator(
+            repo_path=repo, strategies=strategies, max_candidates=4, max_parallel=4,
+        )
+
+        lock = threading.Lock()
+        active = peak = 0
+        create = generator._create_in_index
+
+        def slow_create(*args):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            try:
+                time.sleep(0.2)
+                return create(*args)
+            finally:
+                with lock:
+                    active -= 1
+
+        start = time.perf_counter()
+        with patch.object(generator, "_create_in_index", side_effect=slow_create):
+            candidates = generator.generate(context, _intents(), Mock())
+        elapsed = time.perf_counter() - start
+
+        assert len(candidates) == 4
+        assert peak > 1
+        # One after another this takes at least 4 x 0.2s
+        assert elapsed < 0.8, f"Candidate generation took {elapsed * 1000:.0f}ms (target <800ms)"
+
+
 # ============================================================================
 # DiversityChecker Tests
 # ============================================================================
@@ -230,6 +366,65 @@ class TestDiversityChecker:
         assert result.meets_threshold == False
 
 
+    def test_matrix_matches_pairwise(self):
+        """Matrix entries equal the pairwise Jaccard distances."""
+        from src.resolution.diversity import DiversityChecker
+
+        checker = DiversityChecker()
+        diffs = ["+a\n+b\n-c", "+a\n+d", "", "+x\n+y", "+a\n+b\n-c"]
+        candidates = [Mock(diff_from_base=d, candidate_id=f"c{i}") for i, d in enumerate(diffs)]
+
+        matrix = checker.diversity_matrix(candidates)
+
+        assert matrix[0][1] == pytest.approx(1 - 1 / 4)
+        assert matrix[0][2] == 1.0
+        assert matrix[0][3] == 1.0
+        assert matrix[0][4] == 0.0
+        assert all(matrix[i][i] == 0.0 for i in range(len(diffs)))
+        assert all(matrix[i][j] == matrix[j][i] for i in range(5) for j in range(5))
+
+    def test_most_diverse_subset(self):
+        """Greedy selection picks the candidate farthest from those chosen."""
+        from src.resolution.diversity import DiversityChecker
+
+        checker = DiversityChecker()
+        c1 = Mock(diff_from_base="+a\n+b\n+c", candidate_id="c1")
+        c2 = Mock(diff_from_base="+a\n+b\n+d", candidate_id="c2")
+        c3 = Mock(diff_from_base="+x\n+y\n+z", candidate_id="c3")
+        c4 = Mock(diff_from_base="+a\n+y\n+q", candidate_id="c4")
+
+        subset = checker.get_most_diverse_subset([c1, c2, c3, c4], 3)
+
+        assert [c.candidate_id for c in subset] == ["c1", "c3", "c4"]
+
+
+class TestDiversityCheckerPerformance:
+    """Subset selection over many large candidate diffs."""
+
+    def test_subset_selection_speed(self):
+        """20 candidates x 3500 changed lines, pick 5 (<500ms)."""
+        import random
+        import time
+        from src.resolution.diversity import DiversityChecker
+
+        rng = random.Random(7)
+        shared = [f"shared_line_{i} = compute({i})" for i in range(3000)]
+        candidates = []
+        for c in range(20):
+            lines = rng.sample(shared, 2000) + [f"own_{c}_{i} = {i}" for i in range(1500)]
+            diff = "\n".join(("+" if i % 3 else "-") + line for i, line in enumerate(lines))
+            candidates.append(Mock(diff_from_base=diff, candidate_id=f"c{c}"))
+
+        start = time.perf_counter()
+        subset = DiversityChecker().get_most_diverse_subset(candidates, 5)
+        elapsed = time.perf_counter() - start
+
+        assert len({c.candidate_id for c in subset}) == 5
+        assert subset[0] is candidates[0]
+        # Re-parsing both diffs for every pair took ~2s here
+        assert elapsed < 0.5, f"Subset selection took {elapsed * 1000:.0f}ms (target <500ms)"
+
+
 # ============================================================================
 # TieredValidator Tests
 # ============================================================================
@@ -359,6 +554,147 @@ class TestTieredValidator:
         assert tier == ValidationTier.TARGETED
 
 
+def _git(cwd, *args):
+    import subprocess
+    return subprocess.run(
+        ["git", *args], cwd=cwd, capture_output=True, text=True, check=True
+    ).stdout
+
+
+@pytest.fixture
+def candidate_repo(tmp_path):
+    """Repo whose candidate branches each carry their own build.py."""
+    _git(tmp_path, "init", "-q", "-b", "main")
+    _git(tmp_path, "config", "user.email", "test@example.com")
+    _git(tmp_path, "config", "user.name", "Test")
+    _git(tmp_path, "config", "commit.gpgsign", "false")
+    (tmp_path / "build.py").write_text("")
+    _git(tmp_path, "add", "build.py")
+    _git(tmp_path, "commit", "-q", "-m", "init")
+
+    def add_candidate(name, build_script):
+        from src.resolution.schema import ResolutionCandidate
+
+        _git(tmp_path, "checkout", "-q", "-b", name, "main")
+        (tmp_path / "build.py").write_text(f"{build_script}\n# {name}\n")
+        _git(tmp_path, "commit", "-q", "-am", name)
+        _git(tmp_path, "checkout", "-q", "main")
+        return ResolutionCandidate(
+            candidate_id=name,
+            strategy="agent1_primary",
+            branch_name=name,
+            files_modified=["build.py"],
+        )
+
+    return tmp_path, add_candidate
+
+
+def _make_validator(repo, **kwargs):
+    from src.resolution.validation_tiers import TieredValidator
+
+    return TieredValidator(
+        repo_path=repo,
+        build_command="python build.py",
+        lint_command="python -c pass",
+        **kwargs,
+    )
+
+
+class TestParallelValidation:
+    """Tests for validating candidates concurrently in worktrees."""
+
+    def test_validates_each_candidate_in_own_worktree(self, candidate_repo):
+        """Each candidate is built from its own branch; main stays checked out."""
+        repo, add_candidate = candidate_repo
+        good = add_candidate("good", "")
+        bad = add_candidate("bad", "raise SystemExit(1)")
+
+        validator = _make_validator(repo)
+        results = validator.validate_all([bad, good], Mock(), stop_on_perfect=False)
+
+        assert [r.candidate_id for r in results] == ["bad", "good"]
+        assert not results[0].build_passed
+        assert results[1].build_passed
+        assert results[1].lint_score == 1.0
+        assert good.build_passed and not bad.build_passed
+        assert _git(repo, "rev-parse", "--abbrev-ref", "HEAD").strip() == "main"
+        assert "validate-" not in _git(repo, "worktree", "list")
+
+    def test_cancels_remaining_after_perfect_candidate(self, candidate_repo):
+        """A perfect candidate stops slower ones still running."""
+        import time
+
+        repo, add_candidate = candidate_repo
+        slow = add_candidate("slow", "import time; time.sleep(30)")
+        fast = add_candidate("fast", "")
+        queued = add_candidate("queued", "")
+
+        validator = _make_validator(repo, max_parallel=2)
+        start = time.monotonic()
+        results = validator.validate_all([slow, fast, queued], Mock())
+        elapsed = time.monotonic() - start
+
+        assert elapsed < 10
+        assert results[0].cancelled
+        assert not results[1].cancelled and results[1].build_passed
+        assert results[2].cancelled
+
+    def test_candidate_timeout(self, candidate_repo):
+        """A candidate exceeding its time budget fails instead of blocking."""
+        import time
+
+        repo, add_candidate = candidate_repo
+        slow = add_candidate("slow", "import time; time.sleep(30)")
+
+        validator = _make_validator(repo, candidate_timeout=1)
+        start = time.monotonic()
+        results = validator.validate_all([slow], Mock())
+
+        assert time.monotonic() - start < 10
+        assert not results[0].build_passed
+        assert not results[0].cancelled
+
+    def test_max_tier_caps_comprehensive(self):
+        """max_tier limits high-risk candidates to the cheaper tier."""
+        from src.resolution.validation_tiers import TieredValidator, ValidationTier
+        from src.resolution.schema import TieredValidationResult
+
+        validator = TieredValidator(use_worktrees=False)
+        candidate = Mock(candidate_id="c1", branch_name="b", files_modified=["src/auth.py"])
+
+        with patch.object(validator, "validate_candidate") as mock_validate:
+            mock_validate.return_value = TieredValidationResult(candidate_id="c1")
+            validator.validate_all(
+                [candidate], Mock(), max_tier=ValidationTier.TARGETED, stop_on_perfect=False
+            )
+
+        assert mock_validate.call_args[0][2] == ValidationTier.TARGETED
+
+
+class TestTieredValidatorPerformance:
+    """Parallel worktree validation of slow builds."""
+
+    def test_parallel_validation_speed(self, candidate_repo):
+        """Four 0.5s builds should overlap rather than run back to back."""
+        import time
+
+        repo, add_candidate = candidate_repo
+        candidates = [
+            add_candidate(f"cand{i}", "import time; time.sleep(0.5)")
+            for i in range(4)
+        ]
+
+        start = time.perf_counter()
+        results = _make_validator(repo, max_parallel=4).validate_all(
+            candidates, Mock(), stop_on_perfect=False
+        )
+        elapsed = time.perf_counter() - start
+
+        assert all(r.build_passed for r in results)
+        # Serially this takes 2s; relaxed to account for CI/system load variability
+        assert elapsed < 1.6, f"parallel validation took {elapsed:.2f}s"
+
+
 # ============================================================================
 # FlakyTestHandler Tests
 # ============================================================================
@@ -76,6 +76,47 @@ class TestContextAssembler:
             assert "src/modified.py" in derived[0].files_modified
             assert "src/deleted.py" in derived[0].files_deleted
 
+    def test_reads_files_from_branches(self, tmp_path):
+        """Should read base and agent file versions through the shared reader."""
+        import subprocess
+        from src.resolution.context import ContextAssembler
+
+        def git(*args):
+            subprocess.run(["git", *args], cwd=tmp_path, capture_output=True, check=True)
+
+        git("init", "-q", "-b", "main")
+        git("config", "user.email", "test@example.com")
+        git("config", "user.name", "Test")
+        git("config", "commit.gpgsign", "false")
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "auth.py").write_text("base\n")
+        (tmp_path / "src" / "helpers.py").write_text("helper\n")
+        git("add", ".")
+        git("commit", "-q", "-m", "init")
+        git("checkout", "-q", "-b", "claude/a-abc123")
+        (tmp_path / "src" / "auth.py").write_text("agent\n")
+        git("commit", "-q", "-am", "agent")
+        git("checkout", "-q", "main")
+
+        with ContextAssembler(base_branch="main", repo_path=tmp_path) as assembler:
+            base = assembler._get_base_files(["src/auth.py", "../../etc/passwd"])
+            agent = assembler._get_agent_files(["src/auth.py"], ["claude-abc123"], ["claude/a-abc123"])
+            related = assembler._find_related_files(["src/auth.py"])
+
+        assert [(f.path, f.content) for f in base] == [("src/auth.py", "base\n")]
+        assert [f.content for f in agent["claude-abc123"]] == ["agent\n"]
+        assert [(r.path, r.relationship) for r in related] == [("src/helpers.py", "same_module")]
+        assert assembler.object_reader._batch_proc is None
+
+    def test_does_not_close_shared_reader(self):
+        """A reader passed in by the caller is left open."""
+        from src.resolution.context import ContextAssembler
+
+        reader = Mock()
+        ContextAssembler(object_reader=reader).close()
+
+        reader.close.assert_not_called()
+
 
 class TestIntentExtractor:
     """Tests for Stage 2: Intent Extraction."""
@@ -403,6 +444,17 @@ class TestResolutionValidator:
 class TestResolutionPipeline:
     """Tests for the main resolution pipeline."""
 
+    def test_close_stops_object_reader(self, tmp_path):
+        """Closing the pipeline stops the reader shared with context assembly."""
+        from src.resolution.pipeline import ResolutionPipeline
+
+        pipeline = ResolutionPipeline(repo_path=tmp_path)
+        with patch.object(pipeline.object_reader, "close") as close:
+            with pipeline:
+                assert pipeline.context_assembler.object_reader is pipeline.object_reader
+
+        close.assert_called_once()
+
     def test_returns_no_escalation_when_no_conflicts(self):
         """Should return no escalation when no conflicts."""
         from src.resolution.pipeline import ResolutionPipeline
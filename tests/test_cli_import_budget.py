@@ -0,0 +1,121 @@
+"""
+Startup import budget for hot-path CLI commands.
+
+Hooks call `orchestrator status`, `context-reminder` and
+`verify-write-allowed` on every tool use, so these commands must not import
+the dashboard, review executors, secrets, LLM resolver and friends. The
+budget is measured with `python -X importtime` in a fresh interpreter.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).parent.parent
+
+HOT_PATH_COMMANDS = [
+    ["status"],
+    ["status", "--json"],
+    ["context-reminder"],
+    ["verify-write-allowed"],
+    ["complete", "some_item"],
+    ["skip", "some_item", "--reason", "not needed for this task"],
+    ["advance"],
+]
+
+# Modules that must only be imported by the commands that use them
+COLD_MODULES = [
+    "src.dashboard",
+    "src.visual_verification",
+    "src.review.router",
+    "src.review.api_executor",
+    "src.review.orchestrator",
+    "src.secrets",
+    "src.resolution",
+    "src.adherence_validator",
+    "src.analytics",
+    "src.learning_engine",
+    "src.checkpoint",
+    "src.providers",
+    "src.prd",
+    "src.healing",
+]
+
+# Cumulative import time of src.cli, in milliseconds. Generous enough for slow
+# CI machines; overridable for profiling runs.
+IMPORT_BUDGET_MS = float(os.environ.get("ORCHESTRATOR_CLI_IMPORT_BUDGET_MS", "400"))
+
+_RUNNER = """
+import sys
+from src.cli import main
+sys.argv = ["orchestrator"] + sys.argv[1:]
+try:
+    main()
+except SystemExit:
+    pass
+"""
+
+
+def _run_with_importtime(args, cwd):
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    env["PYTHONPATH"] = str(REPO_ROOT)
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _RUNNER, *args],
+        capture_output=True, text=True, cwd=str(cwd), env=env, timeout=60,
+    )
+
+
+def _parse_importtime(stderr: str) -> dict:
+    """Map module name -> cumulative import time in microseconds."""
+    timings = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        timings[name.strip()] = int(cumulative)
+    return timings
+
+
+@pytest.fixture(scope="module")
+def warm_bytecode(tmp_path_factory):
+    """Compile bytecode once so the budget measures imports, not compilation."""
+    _run_with_importtime(["--version"], tmp_path_factory.mktemp("warm"))
+
+
+@pytest.mark.parametrize("args", HOT_PATH_COMMANDS, ids=lambda a: " ".join(a))
+def test_hot_path_commands_skip_cold_modules(args, tmp_path, warm_bytecode):
+    result = _run_with_importtime(args, tmp_path)
+    imported = _parse_importtime(result.stderr)
+    assert "src.cli" in imported, result.stderr[-2000:]
+
+    loaded = sorted(
+        name for name in imported
+        if any(name == cold or name.startswith(cold + ".") for cold in COLD_MODULES)
+    )
+    assert loaded == [], f"`orchestrator {' '.join(args)}` imported cold modules: {loaded}"
+
+
+def test_cli_import_within_budget(tmp_path, warm_bytecode):
+    # Best of three to smooth out scheduler noise
+    best_ms = min(
+        _parse_importtime(_run_with_importtime(["status"], tmp_path).stderr)["src.cli"] / 1000
+        for _ in range(3)
+    )
+    assert best_ms <= IMPORT_BUDGET_MS, (
+        f"src.cli import took {best_ms:.0f}ms, budget is {IMPORT_BUDGET_MS:.0f}ms"
+    )
+
+
+def test_lazy_choices_still_validated(tmp_path):
+    env = dict(os.environ, PYTHONPATH=str(REPO_ROOT))
+    result = subprocess.run(
+        [sys.executable, "-m", "src.cli", "visual-verify", "http://x", "--device", "bogus"],
+        capture_output=True, text=True, cwd=str(tmp_path), env=env, timeout=60,
+    )
+    assert result.returncode != 0
+    assert "invalid choice" in result.stderr
+    assert "iphone-14" in result.stderr
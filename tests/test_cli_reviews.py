@@ -72,7 +72,7 @@ class TestRunAutoReview:
 
     @pytest.fixture
     def mock_router_cls(self):
-        with patch("src.cli.ReviewRouter") as mock:
+        with patch("src.review.ReviewRouter") as mock:
             yield mock
 
     def test_infrastructure_unavailable(self, mock_router_cls):
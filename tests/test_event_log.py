@@ -0,0 +1,160 @@
+"""
+Tests for the event log tail reader and per-type index used by
+WorkflowEngine.get_events.
+"""
+
+import json
+import pytest
+
+from src.engine import WorkflowEngine
+from src.event_log import read_tail_lines
+from src.schema import WorkflowEvent, EventType
+
+
+def _event(event_type: EventType, n: int) -> WorkflowEvent:
+    return WorkflowEvent(
+        event_type=event_type,
+        workflow_id="wf_test",
+        item_id=f"item_{n}",
+        message=f"event {n}",
+    )
+
+
+@pytest.fixture
+def engine(tmp_path):
+    return WorkflowEngine(working_dir=str(tmp_path), session_id="idx12345")
+
+
+class TestReadTailLines:
+    """Tests for the reverse block reader."""
+
+    @pytest.mark.parametrize("block_size", [1, 3, 16, 64 * 1024])
+    def test_yields_lines_newest_first_with_offsets(self, tmp_path, block_size):
+        data = b"first\n\nsecond\n" + b"".join(b"line %d\n" % i for i in range(50)) + b"last"
+        path = tmp_path / "log.jsonl"
+        path.write_bytes(data)
+
+        result = list(read_tail_lines(path, block_size=block_size))
+
+        assert result[0] == (len(data) - 4, b"last")
+        assert result[-1] == (0, b"first")
+        assert [line for _, line in result if line == b""] == []
+        for offset, line in result:
+            assert data[offset:offset + len(line)] == line
+
+    def test_empty_file(self, tmp_path):
+        path = tmp_path / "log.jsonl"
+        path.write_bytes(b"")
+        assert list(read_tail_lines(path)) == []
+
+
+class TestGetEvents:
+    """Tests for WorkflowEngine.get_events over the tail reader and index."""
+
+    def test_returns_most_recent_events_in_order(self, engine):
+        for n in range(250):
+            engine.log_event(_event(EventType.ITEM_COMPLETED, n))
+
+        events = engine.get_events(limit=100)
+
+        assert len(events) == 100
+        assert [e.item_id for e in events] == [f"item_{n}" for n in range(150, 250)]
+
+    def test_limit_none_returns_all_events(self, engine):
+        for n in range(5):
+            engine.log_event(_event(EventType.ITEM_STARTED, n))
+        assert len(engine.get_events(limit=None)) == 5
+
+    def test_filters_by_event_type(self, engine):
+        for n in range(60):
+            event_type = EventType.REVIEW_COMPLETED if n % 3 == 0 else EventType.ITEM_COMPLETED
+            engine.log_event(_event(event_type, n))
+
+        reviews = engine.get_events(limit=None, event_type=EventType.REVIEW_COMPLETED)
+        latest = engine.get_events(limit=2, event_type=EventType.REVIEW_COMPLETED)
+
+        assert [e.item_id for e in reviews] == [f"item_{n}" for n in range(0, 60, 3)]
+        assert [e.item_id for e in latest] == ["item_54", "item_57"]
+        assert engine.get_events(event_type=EventType.WORKFLOW_ABANDONED) == []
+
+    def test_skips_malformed_lines(self, engine):
+        engine.log_event(_event(EventType.ITEM_COMPLETED, 1))
+        with open(engine.log_file, "a") as f:
+            f.write("{not json\n")
+        engine.log_event(_event(EventType.ITEM_COMPLETED, 2))
+
+        events = engine.get_events()
+
+        assert [e.item_id for e in events] == ["item_1", "item_2"]
+        assert len(engine.get_events(event_type=EventType.ITEM_COMPLETED)) == 2
+
+    def test_completed_reviews_not_limited_to_recent_window(self, engine):
+        engine.log_event(WorkflowEvent(
+            event_type=EventType.REVIEW_COMPLETED,
+            workflow_id="wf_test",
+            message="done",
+            details={"review_type": "security"},
+        ))
+        for n in range(150):
+            engine.log_event(_event(EventType.ITEM_COMPLETED, n))
+
+        assert engine.get_completed_reviews() == {"security"}
+
+
+class TestEventLogIndex:
+    """Tests for keeping the sidecar index consistent with the log."""
+
+    def test_log_event_maintains_postings(self, engine):
+        for n in range(10):
+            engine.log_event(_event(EventType.ITEM_COMPLETED, n))
+
+        index = engine.event_index
+        meta = json.loads(index.meta_file.read_text())
+
+        assert meta["count"] == 10
+        assert meta["indexed_bytes"] == engine.log_file.stat().st_size
+        assert index.count(EventType.ITEM_COMPLETED.value) == 10
+
+    def test_catches_up_with_unindexed_appends(self, engine):
+        engine.log_event(_event(EventType.ITEM_COMPLETED, 0))
+        with open(engine.log_file, "a") as f:
+            for n in range(1, 4):
+                f.write(json.dumps(_event(EventType.ITEM_COMPLETED, n).model_dump(mode="json")) + "\n")
+        engine.log_event(_event(EventType.ITEM_COMPLETED, 4))
+
+        events = engine.get_events(limit=None, event_type=EventType.ITEM_COMPLETED)
+
+        assert [e.item_id for e in events] == [f"item_{n}" for n in range(5)]
+
+    def test_indexes_log_written_before_index_existed(self, engine):
+        engine.paths.ensure_dirs()
+        with open(engine.log_file, "w") as f:
+            for n in range(3):
+                f.write(json.dumps(_event(EventType.PHASE_COMPLETED, n).model_dump(mode="json")) + "\n")
+
+        events = engine.get_events(event_type=EventType.PHASE_COMPLETED)
+
+        assert [e.item_id for e in events] == ["item_0", "item_1", "item_2"]
+
+    def test_rebuilds_after_log_replaced(self, engine):
+        for n in range(5):
+            engine.log_event(_event(EventType.ITEM_COMPLETED, n))
+
+        replacement = engine.log_file.with_suffix(".new")
+        replacement.write_text(
+            json.dumps(_event(EventType.ITEM_SKIPPED, 99).model_dump(mode="json")) + "\n"
+        )
+        replacement.replace(engine.log_file)
+
+        assert engine.get_events(event_type=EventType.ITEM_COMPLETED) == []
+        assert [e.item_id for e in engine.get_events(event_type=EventType.ITEM_SKIPPED)] == ["item_99"]
+
+    def test_rebuilds_corrupt_postings(self, engine):
+        for n in range(3):
+            engine.log_event(_event(EventType.ITEM_COMPLETED, n))
+        index = engine.event_index
+        index._postings_path(EventType.ITEM_COMPLETED.value).write_bytes(b"\x00" * 7 + b"\x05")
+
+        events = engine.get_events(event_type=EventType.ITEM_COMPLETED)
+
+        assert [e.item_id for e in events] == ["item_0", "item_1", "item_2"]
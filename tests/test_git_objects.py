@@ -0,0 +1,140 @@
+"""Tests for GitObjectReader (batched git object reads)."""
+
+import subprocess
+import time
+
+import pytest
+
+from src.git_objects import GitObjectReader
+
+
+def git(repo, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=repo, capture_output=True, text=True, check=True
+    ).stdout
+
+
+@pytest.fixture
+def git_repo(tmp_path):
+    """Repository with a main branch and one feature branch."""
+    git(tmp_path, "init", "-q", "-b", "main")
+    git(tmp_path, "config", "user.email", "test@test.com")
+    git(tmp_path, "config", "user.name", "Test User")
+    git(tmp_path, "config", "commit.gpgsign", "false")
+
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "app.py").write_text("print('main')\n")
+    (tmp_path / "src" / "util.py").write_text("x = 1\n")
+    (tmp_path / "my file.txt").write_text("spaced\n")
+    (tmp_path / "image.bin").write_bytes(b"\xff\xfe\x00binary")
+    git(tmp_path, "add", ".")
+    git(tmp_path, "commit", "-q", "-m", "init")
+
+    git(tmp_path, "checkout", "-q", "-b", "feature")
+    (tmp_path / "src" / "app.py").write_text("print('feature')\n")
+    git(tmp_path, "commit", "-q", "-am", "feature")
+    git(tmp_path, "checkout", "-q", "main")
+    return tmp_path
+
+
+class TestGitObjectReader:
+    """Test GitObjectReader class"""
+
+    def test_reads_files_at_refs(self, git_repo):
+        with GitObjectReader(git_repo) as reader:
+            assert reader.read("main", "src/app.py") == "print('main')\n"
+            assert reader.read("feature", "src/app.py") == "print('feature')\n"
+            assert reader.read("main", "my file.txt") == "spaced\n"
+
+    def test_missing_directory_and_binary_are_none(self, git_repo):
+        with GitObjectReader(git_repo) as reader:
+            assert reader.read("main", "src/missing.py") is None
+            assert reader.read("no-such-branch", "src/app.py") is None
+            assert reader.read("main", "src") is None
+            assert reader.read("main", "image.bin") is None
+            assert reader.read_blobs([("main", "image.bin")])[("main", "image.bin")] == b"\xff\xfe\x00binary"
+            # The processes are still usable afterwards
+            assert reader.read("main", "src/util.py") == "x = 1\n"
+
+    def test_read_many(self, git_repo):
+        with GitObjectReader(git_repo) as reader:
+            contents = reader.read_many([
+                ("main", "src/util.py"),
+                ("feature", "src/util.py"),
+                ("feature", "src/app.py"),
+                ("main", "nope.py"),
+            ])
+
+        assert contents == {
+            ("main", "src/util.py"): "x = 1\n",
+            ("feature", "src/util.py"): "x = 1\n",
+            ("feature", "src/app.py"): "print('feature')\n",
+            ("main", "nope.py"): None,
+        }
+
+    def test_identical_blobs_cached_once(self, git_repo):
+        with GitObjectReader(git_repo) as reader:
+            reader.read_many([("main", "src/util.py"), ("feature", "src/util.py")])
+            assert len(reader._cache) == 1
+
+    def test_cache_is_bounded(self, git_repo):
+        with GitObjectReader(git_repo, cache_bytes=20) as reader:
+            reader.read_many([("main", "src/app.py"), ("feature", "src/app.py")])
+            assert reader._cached_bytes <= 20
+
+    def test_list_tree(self, git_repo):
+        with GitObjectReader(git_repo) as reader:
+            assert reader.list_tree("main", "src") == ["src/app.py", "src/util.py"]
+            assert reader.list_tree("main", "src/") == ["src/app.py", "src/util.py"]
+            assert set(reader.list_tree("main", ".")) == {"image.bin", "my file.txt", "src"}
+            assert reader.list_tree("main", "nope") is None
+
+    def test_resolve(self, git_repo):
+        with GitObjectReader(git_repo) as reader:
+            assert reader.resolve("feature") == git(git_repo, "rev-parse", "feature").strip()
+            assert reader.resolve("no-such-branch") is None
+
+    def test_reopens_after_close(self, git_repo):
+        reader = GitObjectReader(git_repo)
+        assert reader.read("main", "src/util.py") == "x = 1\n"
+        reader.close()
+        assert reader.read("feature", "src/app.py") == "print('feature')\n"
+        reader.close()
+
+
+class TestGitObjectReaderPerformance:
+    """Batched reads of many files across many branches."""
+
+    def test_batched_read_speed(self, tmp_path):
+        """10 agents x 50 files are read through one cat-file pair (<0.5ms per file)."""
+        git(tmp_path, "init", "-q", "-b", "main")
+        git(tmp_path, "config", "user.email", "test@test.com")
+        git(tmp_path, "config", "user.name", "Test User")
+        git(tmp_path, "config", "commit.gpgsign", "false")
+        files = [f"src/module_{i}.py" for i in range(50)]
+        (tmp_path / "src").mkdir()
+        for path in files:
+            (tmp_path / path).write_text(f"# {path}\n" * 50)
+        git(tmp_path, "add", ".")
+        git(tmp_path, "commit", "-q", "-m", "init")
+        branches = []
+        for a in range(10):
+            branch = f"agent-{a}"
+            git(tmp_path, "checkout", "-q", "-b", branch, "main")
+            for path in files[:5]:
+                (tmp_path / path).write_text(f"# {branch}\n")
+            git(tmp_path, "commit", "-q", "-am", branch)
+            branches.append(branch)
+        git(tmp_path, "checkout", "-q", "main")
+        specs = [(b, f) for b in branches for f in files]
+
+        start = time.perf_counter()
+        with GitObjectReader(tmp_path) as reader:
+            contents = reader.read_many(specs)
+        elapsed = time.perf_counter() - start
+
+        assert contents[("agent-3", files[0])] == git(tmp_path, "show", f"agent-3:{files[0]}")
+        assert contents[("agent-3", files[-1])] == git(tmp_path, "show", f"agent-3:{files[-1]}")
+        avg_ms = (elapsed / len(specs)) * 1000
+        # A `git show` per file costs ~2ms here
+        assert avg_ms < 0.5, f"Batched read took {avg_ms:.3f}ms per file (target <0.5ms)"
@@ -0,0 +1,117 @@
+"""
+Tests for the shared pooled HTTP client (src/http_client.py).
+
+A local HTTP/1.1 server stands in for OpenRouter and records which client
+connection served each request, so connection reuse is observable.
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src import http_client
+from src.http_client import close_http_client, create_http_client, get_http_client
+from src.providers.openrouter import OpenRouterProvider
+from src.review.api_executor import APIExecutor
+
+
+COMPLETION = {
+    "choices": [{"message": {"content": "Looks good"}, "finish_reason": "stop"}],
+    "usage": {"total_tokens": 10},
+}
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        payload = json.loads(self.rfile.read(length) or b"{}")
+        self.server.connections.append(self.client_address)
+
+        if payload.get("stream"):
+            body = b"".join(
+                f"data: {json.dumps({'choices': [{'delta': {'content': chunk}}]})}\n\n".encode()
+                for chunk in ("Looks ", "good")
+            ) + b"data: [DONE]\n\n"
+            content_type = "text/event-stream"
+        else:
+            body = json.dumps(COMPLETION).encode()
+            content_type = "application/json"
+
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stub_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    server.connections = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    close_http_client()
+    try:
+        yield server, f"http://127.0.0.1:{server.server_address[1]}/api/v1/chat/completions"
+    finally:
+        close_http_client()
+        server.shutdown()
+        server.server_close()
+
+
+class TestSharedClient:
+
+    def test_singleton_recreated_after_close(self):
+        client = get_http_client()
+        assert get_http_client() is client
+
+        close_http_client()
+        assert client.is_closed
+        assert get_http_client() is not client
+        close_http_client()
+
+    def test_limits_from_environment(self, monkeypatch):
+        monkeypatch.setenv("ORCHESTRATOR_HTTP_MAX_CONNECTIONS", "30")
+        monkeypatch.setenv("ORCHESTRATOR_HTTP_MAX_KEEPALIVE", "not-a-number")
+
+        client = create_http_client(http2=False)
+        pool = client._transport._pool
+        client.close()
+
+        assert pool._max_connections == 30
+        assert pool._max_keepalive_connections == http_client.DEFAULT_MAX_KEEPALIVE
+
+
+class TestConnectionReuse:
+
+    def test_review_calls_share_one_connection(self, stub_url, tmp_path, monkeypatch):
+        server, url = stub_url
+        monkeypatch.setenv("OPENROUTER_API_KEY", "test-key-12345-valid")
+        monkeypatch.setattr(APIExecutor, "API_URL", url)
+        executor = APIExecutor(working_dir=tmp_path)
+
+        for _ in range(3):
+            assert executor._call_openrouter("Review this", "some/model") == "Looks good"
+
+        assert len(server.connections) == 3
+        assert len(set(server.connections)) == 1
+
+    def test_provider_calls_share_one_connection(self, stub_url, monkeypatch):
+        server, url = stub_url
+        monkeypatch.setattr(OpenRouterProvider, "API_URL", url)
+        provider = OpenRouterProvider(api_key="test")
+
+        results = [provider._execute_basic("Hello", "some/model") for _ in range(2)]
+        streamed = "".join(provider.execute_streaming("Hello", "some/model"))
+
+        assert all(r.success and r.output == "Looks good" for r in results)
+        assert streamed == "Looks good"
+        assert len(server.connections) == 3
+        assert len(set(server.connections)) == 1
@@ -0,0 +1,174 @@
+"""
+Tests for parallel command verification (complete --all / advance --verify-parallel).
+"""
+
+import sys
+import time
+
+import pytest
+import yaml
+from pydantic import ValidationError
+
+from src.engine import WorkflowEngine
+from src.schema import EventType, ItemStatus, PhaseDef
+
+
+def _sleep_command(seconds: float) -> str:
+    return f'{sys.executable} -c "import time; time.sleep({seconds})"'
+
+
+def _record_command(name: str, seconds: float = 0.2, exit_code: int = 0) -> str:
+    """Command that appends start/end timestamps for `name` to runs.log."""
+    script = (
+        "import sys, time; "
+        f"open('runs.log', 'a').write('{name} start %f\\n' % time.time()); "
+        f"time.sleep({seconds}); "
+        f"open('runs.log', 'a').write('{name} end %f\\n' % time.time()); "
+        f"sys.exit({exit_code})"
+    )
+    return f'{sys.executable} -c "{script}"'
+
+
+def _start(tmp_path, items: list[dict], settings: dict = None) -> WorkflowEngine:
+    workflow = {
+        "name": "parallel-test",
+        "version": "1.0",
+        "settings": settings or {},
+        "phases": [
+            {"id": "BUILD", "name": "Build", "items": items},
+            {"id": "SHIP", "name": "Ship", "items": [{"id": "release", "name": "Release"}]},
+        ],
+    }
+    path = tmp_path / "workflow.yaml"
+    path.write_text(yaml.safe_dump(workflow))
+    engine = WorkflowEngine(working_dir=str(tmp_path), session_id="parallel1")
+    engine.start_workflow(str(path), "Parallel test", no_archive=True)
+    return engine
+
+
+def _command_item(item_id: str, command: str, **extra) -> dict:
+    return {
+        "id": item_id,
+        "name": item_id,
+        "verification": {"type": "command", "command": command},
+        **extra,
+    }
+
+
+def _runs(tmp_path) -> dict:
+    runs = {}
+    for line in (tmp_path / "runs.log").read_text().splitlines():
+        name, kind, stamp = line.split()
+        runs.setdefault(name, {})[kind] = float(stamp)
+    return runs
+
+
+class TestCompletePhaseItems:
+
+    def test_independent_commands_run_concurrently(self, tmp_path):
+        items = [_command_item(f"check_{i}", _sleep_command(0.5)) for i in range(4)]
+        items.append({"id": "notes", "name": "Notes"})
+        engine = _start(tmp_path, items)
+
+        streamed = []
+        start = time.perf_counter()
+        results = engine.complete_phase_items(max_workers=4, on_result=lambda *r: streamed.append(r))
+        elapsed = time.perf_counter() - start
+
+        assert [r[0] for r in results] == ["check_0", "check_1", "check_2", "check_3", "notes"]
+        assert all(success for _, success, _ in results)
+        assert sorted(item_id for item_id, _, _ in streamed) == [f"check_{i}" for i in range(4)]
+        # Serially this takes 2s; relaxed to account for CI/system load variability
+        assert elapsed < 1.6, f"parallel verification took {elapsed:.2f}s"
+        assert engine.can_advance_phase()[0]
+
+        batch = engine.get_events(event_type=EventType.VERIFICATION_BATCH_COMPLETED)
+        assert len(batch) == 1
+        details = batch[0].details
+        assert details["passed"] == [f"check_{i}" for i in range(4)]
+        assert details["wall_seconds"] < details["item_seconds"]
+        assert details["cpu_seconds"] >= 0
+
+    def test_items_are_completed_through_complete_item(self, tmp_path):
+        engine = _start(tmp_path, [
+            _command_item("passes", "true"),
+            _command_item("fails", "false"),
+        ])
+
+        results = dict((item_id, success) for item_id, success, _ in engine.complete_phase_items())
+
+        items = engine.state.phases["BUILD"].items
+        assert results == {"passes": True, "fails": False}
+        assert items["passes"].status == ItemStatus.COMPLETED
+        assert items["passes"].verification_result["exit_code"] == 0
+        assert items["fails"].status == ItemStatus.FAILED
+        assert items["fails"].retry_count == 1
+        assert engine._prefetched_verifications == {}
+
+    def test_dependencies_run_after_and_block_on_failure(self, tmp_path):
+        engine = _start(tmp_path, [
+            _command_item("deploy", _record_command("deploy"), depends_on=["build"]),
+            _command_item("build", _record_command("build")),
+            _command_item("lint", _record_command("lint", exit_code=1)),
+            _command_item("docs", _record_command("docs"), depends_on=["lint"]),
+        ])
+
+        results = {item_id: (success, message) for item_id, success, message in engine.complete_phase_items(max_workers=4)}
+
+        runs = _runs(tmp_path)
+        assert runs["deploy"]["start"] >= runs["build"]["end"]
+        assert "docs" not in runs
+        assert results["deploy"][0] and results["build"][0]
+        assert results["docs"] == (False, "Blocked by incomplete dependencies: lint")
+        assert engine.state.phases["BUILD"].items["docs"].status == ItemStatus.PENDING
+
+    def test_serial_items_run_alone(self, tmp_path):
+        engine = _start(tmp_path, [
+            _command_item("a", _record_command("a")),
+            _command_item("migrate", _record_command("migrate"), serial=True),
+            _command_item("b", _record_command("b")),
+        ])
+
+        engine.complete_phase_items(max_workers=4)
+
+        runs = _runs(tmp_path)
+        migrate = runs.pop("migrate")
+        for other in runs.values():
+            assert other["end"] <= migrate["start"] or other["start"] >= migrate["end"]
+
+    def test_skips_items_already_done_and_excluded(self, tmp_path):
+        engine = _start(tmp_path, [
+            _command_item("done", "false"),
+            _command_item("review", "false"),
+            _command_item("check", "true"),
+        ])
+        engine.complete_item("done", skip_verification=True)
+
+        results = engine.complete_phase_items(exclude={"review"})
+
+        assert results == [("check", True, "Item completed successfully")]
+
+
+class TestItemDependencySchema:
+
+    def test_unknown_dependency_rejected(self):
+        with pytest.raises(ValidationError, match="unknown items"):
+            PhaseDef(id="BUILD", name="Build", items=[
+                {"id": "a", "name": "A", "depends_on": ["missing"]},
+            ])
+
+    def test_cycle_rejected(self):
+        with pytest.raises(ValidationError, match="circular"):
+            PhaseDef(id="BUILD", name="Build", items=[
+                {"id": "a", "name": "A", "depends_on": ["b"]},
+                {"id": "b", "name": "B", "depends_on": ["a"]},
+            ])
+
+    def test_dependency_order_keeps_definition_order(self):
+        phase = PhaseDef(id="BUILD", name="Build", items=[
+            {"id": "c", "name": "C", "depends_on": ["b"]},
+            {"id": "a", "name": "A"},
+            {"id": "b", "name": "B"},
+        ])
+
+        assert [item.id for item in phase.items_in_dependency_order()] == ["b", "c", "a"]
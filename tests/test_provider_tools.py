@@ -459,9 +459,10 @@ class TestOpenRouterProviderWithTools:
 class TestExecuteWithToolsMocked:
     """Tests for execute_with_tools with mocked API."""
 
-    @patch("src.providers.openrouter.requests.post")
-    def test_execute_with_tools_no_tool_calls(self, mock_post):
+    @patch("src.providers.openrouter.get_http_client")
+    def test_execute_with_tools_no_tool_calls(self, mock_client):
         """Test execution when model doesn't call any tools."""
+        mock_post = mock_client.return_value.post
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = {
@@ -480,9 +481,10 @@ class TestExecuteWithToolsMocked:
         assert result.output == "Final answer"
         assert result.metadata["tool_calls"] == 0
 
-    @patch("src.providers.openrouter.requests.post")
-    def test_execute_with_tools_single_tool_call(self, mock_post):
+    @patch("src.providers.openrouter.get_http_client")
+    def test_execute_with_tools_single_tool_call(self, mock_client):
         """Test execution with a single tool call."""
+        mock_post = mock_client.return_value.post
         with tempfile.TemporaryDirectory() as tmpdir:
             working_dir = Path(tmpdir)
             (working_dir / "test.txt").write_text("File content")
@@ -525,9 +527,10 @@ class TestExecuteWithToolsMocked:
             assert result.metadata["tool_calls"] == 1
             assert result.tokens_used == 125  # 50 + 75
 
-    @patch("src.providers.openrouter.requests.post")
-    def test_execute_with_tools_api_error_fallback(self, mock_post):
+    @patch("src.providers.openrouter.get_http_client")
+    def test_execute_with_tools_api_error_fallback(self, mock_client):
         """Test fallback to basic execution on API error."""
+        mock_post = mock_client.return_value.post
         # First call fails
         error_response = MagicMock()
         error_response.status_code = 400
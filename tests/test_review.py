@@ -195,7 +195,7 @@ class TestReviewContextCollector:
 
     def test_collect_in_git_repo(self):
         """Test context collection in the actual repo."""
-        collector = ReviewContextCollector(Path("."))
+        collector = ReviewContextCollector(Path("."), use_cache=False)
         context = collector.collect("security")
 
         # Should have at least some content
@@ -0,0 +1,153 @@
+"""
+Tests for concurrent review execution (ReviewRouter.iter_reviews and
+execute_all_reviews(concurrent=True)).
+"""
+
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.review.context import ReviewContext, ReviewContextCollector
+from src.review.registry import get_all_review_types
+from src.review.result import ReviewResult
+from src.review.router import ReviewRouter, ReviewMethod
+
+
+REVIEW_SECONDS = 0.3
+
+
+class _FakeReviews:
+    """Stand-in for execute_review that tracks concurrency per provider."""
+
+    def __init__(self, tools: dict[str, str]):
+        self.tools = tools
+        self.lock = threading.Lock()
+        self.running: dict[str, int] = {}
+        self.peak: dict[str, int] = {}
+        self.peak_total = 0
+        self.contexts = {}
+
+    def __call__(self, review_type, context_override=None, context=None):
+        tool = self.tools[review_type]
+        with self.lock:
+            self.running[tool] = self.running.get(tool, 0) + 1
+            self.peak[tool] = max(self.peak.get(tool, 0), self.running[tool])
+            self.peak_total = max(self.peak_total, sum(self.running.values()))
+            self.contexts[review_type] = context
+        time.sleep(REVIEW_SECONDS)
+        with self.lock:
+            self.running[tool] -= 1
+        return ReviewResult(
+            review_type=review_type,
+            success=True,
+            model_used=tool,
+            method_used="cli",
+            duration_seconds=REVIEW_SECONDS,
+        )
+
+
+@pytest.fixture
+def router():
+    with patch("src.review.router.shutil.which", return_value="/usr/bin/tool"):
+        router = ReviewRouter(Path("."), method="cli")
+    return router
+
+
+@pytest.fixture
+def tools():
+    review_types = get_all_review_types()
+    # Alternate providers so per-provider caps are exercised
+    return {t: ("codex" if i % 2 == 0 else "gemini") for i, t in enumerate(review_types)}
+
+
+class TestConcurrentReviews:
+
+    def test_results_complete_concurrently(self, router, tools):
+        fake = _FakeReviews(tools)
+        router.execute_review = fake
+
+        with patch("src.review.router.get_tool", side_effect=tools.get):
+            results = router.execute_all_reviews(concurrent=True, max_concurrency=8, provider_limits={"codex": 8, "gemini": 8})
+
+        assert list(results) == get_all_review_types()
+        assert all(r.success for r in results.values())
+        timing = router.last_timing
+        assert timing.concurrent
+        assert timing.serial_seconds == pytest.approx(REVIEW_SECONDS * len(tools))
+        # All reviews overlap, so wall time is about one review, not the sum
+        assert timing.wall_seconds < timing.serial_seconds * 0.75
+        assert timing.speedup > 1
+
+    def test_respects_global_and_provider_limits(self, router, tools):
+        fake = _FakeReviews(tools)
+        router.execute_review = fake
+
+        with patch("src.review.router.get_tool", side_effect=tools.get):
+            list(router.iter_reviews(max_concurrency=3, provider_limits={"codex": 1}))
+
+        assert fake.peak_total <= 3
+        assert fake.peak["codex"] == 1
+        assert fake.peak["gemini"] <= 2
+
+    def test_yields_in_completion_order(self, router):
+        durations = {"security": 0.3, "quality": 0.0}
+
+        def execute(review_type, context_override=None, context=None):
+            time.sleep(durations[review_type])
+            return ReviewResult(review_type=review_type, success=True, model_used="m", method_used="cli")
+
+        router.execute_review = execute
+        order = [r.review_type for r in router.iter_reviews(["security", "quality"], max_concurrency=2,
+                                                            provider_limits={"codex": 2})]
+
+        assert order == ["quality", "security"]
+
+    def test_api_mode_collects_context_once(self, router, tools):
+        router._method = ReviewMethod.API
+        shared = {t: ReviewContext(git_diff=f"diff for {t}") for t in tools}
+        executor = MagicMock()
+        executor.context_collector.collect_many.return_value = shared
+        router._api_executor = executor
+        fake = _FakeReviews(tools)
+        router.execute_review = fake
+
+        with patch("src.review.router.get_tool", side_effect=tools.get):
+            list(router.iter_reviews(max_concurrency=8))
+
+        executor.context_collector.collect_many.assert_called_once_with(list(tools))
+        assert fake.contexts == shared
+
+
+class TestCollectMany:
+
+    def test_shared_pieces_gathered_once(self, tmp_path):
+        collector = ReviewContextCollector(tmp_path)
+        with patch.object(collector, "_detect_project_context", return_value="python") as project, \
+             patch.object(collector, "_get_git_diff", return_value="diff") as diff, \
+             patch.object(collector, "_get_changed_file_contents", return_value={"a.py": "x"}) as changed, \
+             patch.object(collector, "_get_related_files", return_value={"b.py": "y"}) as related, \
+             patch.object(collector, "_get_architecture_docs", return_value="docs") as docs, \
+             patch.object(collector, "_get_context_summary", return_value="summary") as summary:
+            contexts = collector.collect_many(["security", "quality", "consistency", "holistic"])
+
+        for mock in (project, diff, changed, related, docs, summary):
+            assert mock.call_count == 1
+        assert contexts["security"].related_files == {}
+        assert contexts["consistency"].related_files == {"b.py": "y"}
+        assert contexts["consistency"].architecture_docs == "docs"
+        assert contexts["holistic"].context_summary == "summary"
+        assert contexts["holistic"].architecture_docs is None
+        assert all(c.git_diff == "diff" for c in contexts.values())
+
+    def test_collect_matches_collect_many(self, tmp_path):
+        collector = ReviewContextCollector(tmp_path)
+        with patch.object(collector, "_get_git_diff", return_value="diff"), \
+             patch.object(collector, "_get_changed_file_contents", return_value={}), \
+             patch.object(collector, "_get_related_files", return_value={"r.py": "z"}):
+            single = collector.collect("consistency")
+            many = collector.collect_many(["consistency"])["consistency"]
+
+        assert single == many
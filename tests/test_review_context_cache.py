@@ -0,0 +1,148 @@
+"""
+Tests for the per-commit review context cache (src/review/context.py).
+"""
+
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.review.context import ReviewContextCache, ReviewContextCollector
+
+
+def _git(repo, *args):
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    repo = tmp_path / "repo"
+    (repo / "pkg").mkdir(parents=True)
+    (repo / "pkg" / "helpers.py").write_text("def helper():\n    return 1\n")
+    (repo / "app.py").write_text("print('v1')\n")
+    _git(repo, "init", "-q")
+    _git(repo, "add", ".")
+    _git(repo, "-c", "user.name=t", "-c", "user.email=t@t", "commit", "-q", "-m", "init")
+    (repo / "app.py").write_text("from pkg.helpers import helper\nprint(helper())\n")
+    return repo
+
+
+@pytest.fixture(autouse=True)
+def empty_memory():
+    ReviewContextCache.clear_memory()
+    yield
+    ReviewContextCache.clear_memory()
+
+
+def _spy(collector, name):
+    return patch.object(collector, name, wraps=getattr(collector, name))
+
+
+class TestReviewContextCache:
+
+    def test_shared_across_review_types_and_processes(self, repo):
+        collector = ReviewContextCollector(repo)
+        with _spy(collector, "_get_git_diff") as diff, _spy(collector, "_get_related_files") as related:
+            security = collector.collect("security")
+            consistency = collector.collect("consistency")
+            quality = collector.collect("quality")
+
+        assert diff.call_count == 1
+        assert related.call_count == 1
+        assert security.related_files == {}
+        assert list(consistency.related_files) == ["pkg/helpers.py"]
+        assert quality.changed_files == security.changed_files == {"app.py": (repo / "app.py").read_text()}
+
+        # A new process (e.g. review-retry) reads the entry from disk
+        ReviewContextCache.clear_memory()
+        retry = ReviewContextCollector(repo)
+        with _spy(retry, "_get_git_diff") as diff, _spy(retry, "_get_related_files") as related:
+            again = retry.collect("consistency")
+
+        assert diff.call_count == 0 and related.call_count == 0
+        assert again.related_files == consistency.related_files
+        assert again.git_diff == consistency.git_diff
+        assert list((repo / ".orchestrator" / "review_context_cache").glob("*.json"))
+
+    def test_cache_dir_is_ignored_by_git(self, repo):
+        ReviewContextCollector(repo).collect("security")
+
+        status = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=all"],
+            cwd=repo, check=True, capture_output=True, text=True,
+        ).stdout
+        assert status.split() == ["M", "app.py"]
+
+    def test_new_changes_or_commit_invalidate(self, repo):
+        collector = ReviewContextCollector(repo)
+        first = collector.collect("security")
+
+        (repo / "app.py").write_text("print('v3')\n")
+        edited = collector.collect("security")
+        _git(repo, "-c", "user.name=t", "-c", "user.email=t@t", "commit", "-qam", "edit")
+        committed = collector.collect("security")
+
+        assert "v3" not in first.git_diff
+        assert edited.changed_files["app.py"] == "print('v3')\n"
+        assert committed.git_diff != edited.git_diff
+
+    def test_disabled(self, repo):
+        collector = ReviewContextCollector(repo, use_cache=False)
+        with _spy(collector, "_get_git_diff") as diff:
+            collector.collect("security")
+            collector.collect("security")
+
+        assert diff.call_count == 2
+        assert not (repo / ".orchestrator").exists()
+
+    def test_evicts_oldest_files(self, tmp_path):
+        cache = ReviewContextCache(tmp_path)
+        for i in range(ReviewContextCache.MAX_ENTRIES + 3):
+            cache.put(f"key{i}", {"git_diff": str(i)})
+
+        assert len(list(tmp_path.glob("*.json"))) == ReviewContextCache.MAX_ENTRIES
+
+    def test_memory_keeps_most_recent_entries(self):
+        cache = ReviewContextCache()
+        cache.put("key0", {"git_diff": "0"})
+        for i in range(1, ReviewContextCache.MAX_ENTRIES + 3):
+            cache.get("key0")  # Recently used entries are kept
+            cache.put(f"key{i}", {"git_diff": str(i)})
+
+        assert len(ReviewContextCache._memory) == ReviewContextCache.MAX_ENTRIES
+        assert cache.get("key0") == {"git_diff": "0"}
+        assert cache.get("key1") is None
+
+
+class TestRelatedFileResolution:
+
+    def test_resolves_from_single_listing(self, repo):
+        (repo / "web").mkdir()
+        (repo / "web" / "util.js").write_text("export const x = 1;\n")
+        (repo / "web" / "main.js").write_text("import { x } from './util';\n")
+        collector = ReviewContextCollector(repo, use_cache=False)
+        changed = {
+            "app.py": (repo / "app.py").read_text(),
+            "main.js": "import { x } from './web/util';\nimport os\n",
+        }
+
+        with _spy(collector, "_list_repo_files") as listing, \
+             patch.object(Path, "exists", side_effect=AssertionError("probed path")):
+            related = collector._get_related_files(changed)
+
+        assert listing.call_count == 1
+        assert related == {
+            "pkg/helpers.py": "def helper():\n    return 1\n",
+            "./web/util.js": "export const x = 1;\n",
+        }
+
+    def test_listing_outside_git(self, tmp_path):
+        (tmp_path / "lib").mkdir()
+        (tmp_path / "lib" / "core.py").write_text("x = 1\n")
+        (tmp_path / "node_modules").mkdir()
+        (tmp_path / "node_modules" / "dep.js").write_text("")
+
+        files = ReviewContextCollector(tmp_path, use_cache=False)._list_repo_files()
+
+        assert files == {"lib/core.py"}
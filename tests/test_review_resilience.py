@@ -15,7 +15,7 @@ class TestAPIExecutorErrorClassification:
         """HTTP 401 from API should return error_type=KEY_INVALID."""
         from src.review.api_executor import APIExecutor
         from src.review.result import ReviewErrorType
-        import requests
+        import httpx
 
         # Create mock response with 401
         mock_response = MagicMock()
@@ -23,9 +23,9 @@ class TestAPIExecutorErrorClassification:
         mock_response.json.return_value = {"error": "Invalid API key"}
         mock_response.text = "Unauthorized"
 
-        with patch.object(requests, 'post', return_value=mock_response):
+        with patch.object(httpx.Client, 'post', return_value=mock_response):
             with patch.dict(os.environ, {"OPENROUTER_API_KEY": "test-key-12345-valid"}):
-                executor = APIExecutor(working_dir=Path("."))
+                executor = APIExecutor(working_dir=Path("."), use_cache=False)
                 result = executor.execute("security")
 
         assert result.success is False
@@ -35,16 +35,16 @@ class TestAPIExecutorErrorClassification:
         """HTTP 403 from API should return error_type=KEY_INVALID."""
         from src.review.api_executor import APIExecutor
         from src.review.result import ReviewErrorType
-        import requests
+        import httpx
 
         mock_response = MagicMock()
         mock_response.status_code = 403
         mock_response.json.return_value = {"error": "Access denied"}
         mock_response.text = "Forbidden"
 
-        with patch.object(requests, 'post', return_value=mock_response):
+        with patch.object(httpx.Client, 'post', return_value=mock_response):
             with patch.dict(os.environ, {"OPENROUTER_API_KEY": "test-key-12345-valid"}):
-                executor = APIExecutor(working_dir=Path("."))
+                executor = APIExecutor(working_dir=Path("."), use_cache=False)
                 result = executor.execute("security")
 
         assert result.success is False
@@ -54,16 +54,16 @@ class TestAPIExecutorErrorClassification:
         """HTTP 429 from API should return error_type=RATE_LIMITED."""
         from src.review.api_executor import APIExecutor
         from src.review.result import ReviewErrorType
-        import requests
+        import httpx
 
         mock_response = MagicMock()
         mock_response.status_code = 429
         mock_response.json.return_value = {"error": "Rate limit exceeded"}
         mock_response.text = "Too Many Requests"
 
-        with patch.object(requests, 'post', return_value=mock_response):
+        with patch.object(httpx.Client, 'post', return_value=mock_response):
             with patch.dict(os.environ, {"OPENROUTER_API_KEY": "test-key-12345-valid"}):
-                executor = APIExecutor(working_dir=Path("."))
+                executor = APIExecutor(working_dir=Path("."), use_cache=False)
                 result = executor.execute("security")
 
         assert result.success is False
@@ -73,16 +73,16 @@ class TestAPIExecutorErrorClassification:
         """HTTP 500 from API should return error_type=NETWORK_ERROR."""
         from src.review.api_executor import APIExecutor
         from src.review.result import ReviewErrorType
-        import requests
+        import httpx
 
         mock_response = MagicMock()
         mock_response.status_code = 500
         mock_response.json.return_value = {"error": "Internal server error"}
         mock_response.text = "Internal Server Error"
 
-        with patch.object(requests, 'post', return_value=mock_response):
+        with patch.object(httpx.Client, 'post', return_value=mock_response):
             with patch.dict(os.environ, {"OPENROUTER_API_KEY": "test-key-12345-valid"}):
-                executor = APIExecutor(working_dir=Path("."))
+                executor = APIExecutor(working_dir=Path("."), use_cache=False)
                 result = executor.execute("security")
 
         assert result.success is False
@@ -92,11 +92,11 @@ class TestAPIExecutorErrorClassification:
         """Connection timeout should return error_type=TIMEOUT."""
         from src.review.api_executor import APIExecutor
         from src.review.result import ReviewErrorType
-        import requests
+        import httpx
 
-        with patch.object(requests, 'post', side_effect=requests.exceptions.Timeout("Request timed out")):
+        with patch.object(httpx.Client, 'post', side_effect=httpx.ReadTimeout("Request timed out")):
             with patch.dict(os.environ, {"OPENROUTER_API_KEY": "test-key-12345-valid"}):
-                executor = APIExecutor(working_dir=Path("."))
+                executor = APIExecutor(working_dir=Path("."), use_cache=False)
                 result = executor.execute("security")
 
         assert result.success is False
@@ -106,11 +106,11 @@ class TestAPIExecutorErrorClassification:
         """Connection error should return error_type=NETWORK_ERROR."""
         from src.review.api_executor import APIExecutor
         from src.review.result import ReviewErrorType
-        import requests
+        import httpx
 
-        with patch.object(requests, 'post', side_effect=requests.exceptions.ConnectionError("Connection refused")):
+        with patch.object(httpx.Client, 'post', side_effect=httpx.ConnectError("Connection refused")):
             with patch.dict(os.environ, {"OPENROUTER_API_KEY": "test-key-12345-valid"}):
-                executor = APIExecutor(working_dir=Path("."))
+                executor = APIExecutor(working_dir=Path("."), use_cache=False)
                 result = executor.execute("security")
 
         assert result.success is False
@@ -208,14 +208,14 @@ class TestPingValidation:
     def test_ping_false_makes_no_api_calls(self):
         """ping=False (default) should not make any API calls."""
         from src.review.router import validate_api_keys
-        import requests
+        import httpx
 
         with patch.dict(os.environ, {"OPENROUTER_API_KEY": "test-key-12345-valid"}):
-            with patch.object(requests, 'get') as mock_get:
-                with patch.object(requests, 'post') as mock_post:
+            with patch.object(httpx.Client, 'stream') as mock_stream:
+                with patch.object(httpx.Client, 'post') as mock_post:
                     valid, errors = validate_api_keys(["openrouter"], ping=False)
                     # No API calls should be made
-                    mock_get.assert_not_called()
+                    mock_stream.assert_not_called()
                     mock_post.assert_not_called()
 
         assert valid is True
@@ -224,15 +224,15 @@ class TestPingValidation:
     def test_ping_true_with_valid_key_succeeds(self):
         """ping=True with valid key should return success."""
         from src.review.router import validate_api_keys
-        import urllib.request
+        import httpx
 
         mock_response = MagicMock()
-        mock_response.read.return_value = b'{"data": [{"id": "model-1"}]}'
+        mock_response.status_code = 200
         mock_response.__enter__ = MagicMock(return_value=mock_response)
         mock_response.__exit__ = MagicMock(return_value=False)
 
         with patch.dict(os.environ, {"OPENROUTER_API_KEY": "test-key-12345-valid"}):
-            with patch.object(urllib.request, 'urlopen', return_value=mock_response):
+            with patch.object(httpx.Client, 'stream', return_value=mock_response):
                 valid, errors = validate_api_keys(["openrouter"], ping=True)
 
         assert valid is True
@@ -241,19 +241,16 @@ class TestPingValidation:
     def test_ping_true_with_invalid_key_returns_error(self):
         """ping=True with invalid key should return error."""
         from src.review.router import validate_api_keys
-        import urllib.request
-        import urllib.error
+        import httpx
 
-        error = urllib.error.HTTPError(
-            url="https://openrouter.ai/api/v1/models",
-            code=401,
-            msg="Unauthorized",
-            hdrs={},
-            fp=None
-        )
+        mock_response = MagicMock()
+        mock_response.status_code = 401
+        mock_response.reason_phrase = "Unauthorized"
+        mock_response.__enter__ = MagicMock(return_value=mock_response)
+        mock_response.__exit__ = MagicMock(return_value=False)
 
         with patch.dict(os.environ, {"OPENROUTER_API_KEY": "invalid-key-12345"}):
-            with patch.object(urllib.request, 'urlopen', side_effect=error):
+            with patch.object(httpx.Client, 'stream', return_value=mock_response):
                 valid, errors = validate_api_keys(["openrouter"], ping=True)
 
         assert valid is False
@@ -278,11 +275,10 @@ class TestPingValidation:
     def test_ping_true_with_network_error_returns_error(self):
         """ping=True with network error should return error."""
         from src.review.router import validate_api_keys
-        import urllib.request
-        import urllib.error
+        import httpx
 
         with patch.dict(os.environ, {"OPENROUTER_API_KEY": "test-key-12345-valid"}):
-            with patch.object(urllib.request, 'urlopen', side_effect=urllib.error.URLError("Connection refused")):
+            with patch.object(httpx.Client, 'stream', side_effect=httpx.ConnectError("Connection refused")):
                 valid, errors = validate_api_keys(["openrouter"], ping=True)
 
         assert valid is False
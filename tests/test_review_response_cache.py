@@ -0,0 +1,123 @@
+"""
+Tests for the review response cache (src/review/response_cache.py).
+"""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.review.api_executor import APIExecutor
+from src.review.response_cache import ReviewResponseCache
+
+
+REVIEW_OUTPUT = "**Summary:** Looks fine\n\nNo issues found."
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ReviewResponseCache(tmp_path / "cache")
+
+
+@pytest.fixture
+def executor(tmp_path, cache):
+    with patch.dict(os.environ, {"OPENROUTER_API_KEY": "test-key-12345-valid"}):
+        executor = APIExecutor(working_dir=tmp_path, response_cache=cache)
+    with patch("src.review.api_executor.get_openrouter_model", return_value="test/model"):
+        yield executor
+
+
+class TestReviewResponseCache:
+
+    def test_key_covers_model_type_prompt_and_temperature(self):
+        key = ReviewResponseCache.key_for("m", "security", "prompt", 0.3)
+
+        assert key == ReviewResponseCache.key_for("m", "security", "prompt", 0.3)
+        assert key != ReviewResponseCache.key_for("other", "security", "prompt", 0.3)
+        assert key != ReviewResponseCache.key_for("m", "quality", "prompt", 0.3)
+        assert key != ReviewResponseCache.key_for("m", "security", "prompt!", 0.3)
+        assert key != ReviewResponseCache.key_for("m", "security", "prompt", 0.7)
+
+    def test_counts_hits_and_misses(self, cache):
+        assert cache.get("k") is None
+        cache.put("k", "output", model="m", review_type="security")
+
+        assert cache.get("k") == "output"
+        assert cache.stats() == {
+            "hits": 1,
+            "misses": 1,
+            "entries": 1,
+            "size_bytes": cache.stats()["size_bytes"],
+        }
+
+        cache.clear()
+        assert cache.stats()["hits"] == 0 and cache.stats()["entries"] == 0
+
+    def test_evicts_least_recently_used_beyond_max_bytes(self, tmp_path):
+        cache = ReviewResponseCache(tmp_path, max_bytes=1000)
+        for i in range(5):
+            cache.put(f"k{i}", "x" * 300, model="m", review_type="security")
+            os.utime(tmp_path / f"k{i}.json", (i, i))
+        cache.put("k5", "x" * 300, model="m", review_type="security")
+
+        assert cache.stats()["size_bytes"] <= 1000
+        assert cache.get("k5") == "x" * 300
+        assert cache.get("k0") is None
+
+    def test_unreadable_entry_is_a_miss(self, cache):
+        cache.cache_dir.mkdir(parents=True)
+        (cache.cache_dir / "k.json").write_text("{not json")
+
+        assert cache.get("k") is None
+        assert not (cache.cache_dir / "k.json").exists()
+
+    def test_cache_dir_is_gitignored(self, cache):
+        cache.put("k", "output", model="m", review_type="security")
+
+        assert (cache.cache_dir / ".gitignore").read_text() == "*\n"
+        assert cache.stats()["entries"] == 1
+
+
+class TestAPIExecutorResponseCache:
+
+    def test_identical_prompt_is_served_from_cache(self, executor):
+        with patch.object(executor, "_call_openrouter", return_value=REVIEW_OUTPUT) as call:
+            first = executor.execute_with_fallback("security", context_override="review this", no_fallback=True)
+            second = executor.execute_with_fallback("security", context_override="review this", no_fallback=True)
+            changed = executor.execute("security", context_override="review that")
+
+        assert call.call_count == 2
+        assert not first.cached and second.cached and not changed.cached
+        assert second.raw_output == first.raw_output
+        assert second.to_dict()["cached"] is True
+
+    def test_opt_out_calls_model_and_refreshes_entry(self, executor):
+        with patch.object(executor, "_call_openrouter", side_effect=["old", "new"]) as call:
+            executor.execute("security", context_override="review this")
+            fresh = executor.execute("security", context_override="review this", use_cache=False)
+            again = executor.execute("security", context_override="review this")
+
+        assert call.call_count == 2
+        assert not fresh.cached and fresh.raw_output == "new"
+        assert again.cached and again.raw_output == "new"
+
+    def test_failures_are_not_cached(self, executor, cache):
+        with patch.object(executor, "_call_openrouter", side_effect=RuntimeError("OpenRouter API error: 401")):
+            result = executor.execute_with_fallback("security", context_override="review this", no_fallback=True)
+
+        assert not result.success
+        assert cache.stats()["entries"] == 0
+
+    def test_disabled(self, tmp_path):
+        with patch.dict(os.environ, {"OPENROUTER_API_KEY": "test-key-12345-valid"}):
+            executor = APIExecutor(working_dir=tmp_path, use_cache=False)
+
+        with patch.object(executor, "_call_openrouter", return_value=REVIEW_OUTPUT) as call:
+            executor.execute("security", context_override="review this")
+            executor.execute("security", context_override="review this")
+
+        assert executor.response_cache is None
+        assert executor.context_collector.cache is None
+        assert call.call_count == 2
+        assert not (Path(tmp_path) / ".orchestrator").exists()
@@ -0,0 +1,104 @@
+"""
+Tests for the process-level parsed state cache (src/state_cache.py).
+"""
+
+import json
+
+import pytest
+
+from src.engine import WorkflowEngine
+from src.schema import ItemStatus
+from src.state_cache import clear_state_cache, file_fingerprint, get_state_cache
+
+
+WORKFLOW_YAML = """
+name: cache-test
+version: "1.0"
+phases:
+  - id: PLAN
+    name: Planning
+    items:
+      - id: first
+        name: First
+        verification:
+          type: none
+      - id: second
+        name: Second
+        verification:
+          type: none
+"""
+
+
+@pytest.fixture
+def started(tmp_path):
+    clear_state_cache()
+    yaml_path = tmp_path / "workflow.yaml"
+    yaml_path.write_text(WORKFLOW_YAML)
+    engine = WorkflowEngine(working_dir=str(tmp_path), session_id="cache123")
+    engine.start_workflow(str(yaml_path), "Cache test", no_archive=True)
+    yield tmp_path
+    clear_state_cache()
+
+
+def _load(tmp_path) -> WorkflowEngine:
+    engine = WorkflowEngine(working_dir=str(tmp_path), session_id="cache123")
+    engine.load_state()
+    return engine
+
+
+class TestParsedStateCache:
+
+    def test_repeated_loads_hit_cache(self, started):
+        cache = get_state_cache()
+        _load(started)
+        misses = cache.misses
+
+        for _ in range(3):
+            _load(started)
+
+        assert cache.misses == misses
+        assert cache.hits >= 3
+
+    def test_loaded_states_are_independent(self, started):
+        a = _load(started)
+        b = _load(started)
+
+        a.state.phases["PLAN"].items["first"].status = ItemStatus.COMPLETED
+        a.state.metadata.setdefault("review_models", {})["PLAN"] = {"x": 1}
+
+        assert b.state.phases["PLAN"].items["first"].status == ItemStatus.PENDING
+        assert "review_models" not in b.state.metadata
+        assert _load(started).state.phases["PLAN"].items["first"].status == ItemStatus.PENDING
+
+    def test_save_invalidates_entry(self, started):
+        engine = _load(started)
+        engine.complete_item("first")
+
+        reloaded = _load(started)
+
+        assert reloaded.state.phases["PLAN"].items["first"].status == ItemStatus.COMPLETED
+
+    def test_external_edit_invalidates_entry(self, started):
+        engine = _load(started)
+        data = json.loads(engine.state_file.read_text())
+        data["task_description"] = "Edited outside the engine"
+        engine.state_file.write_text(json.dumps(data))
+
+        assert _load(started).state.task_description == "Edited outside the engine"
+
+    def test_workflow_def_deduplicated_across_versions(self, started):
+        engine = _load(started)
+        engine.complete_item("first")
+
+        reloaded = _load(started)
+
+        assert reloaded.workflow_def is engine.workflow_def
+        assert reloaded.workflow_def.name == "cache-test"
+
+    def test_fingerprint_tracks_missing_files(self, tmp_path):
+        path = tmp_path / "state.json"
+        missing = file_fingerprint(path)
+        path.write_text("{}")
+
+        assert file_fingerprint(path) != missing
+        assert missing == ((str(path), None),)
@@ -0,0 +1,198 @@
+"""
+Tests for journaled workflow state persistence (src/state_journal.py).
+"""
+
+import json
+import time
+
+import yaml
+
+from src.engine import WorkflowEngine
+from src.health import HealthChecker
+from src.learning_engine import LearningEngine
+from src.schema import ItemStatus
+from src.state_journal import apply_ops, diff_state
+
+
+def _write_workflow(tmp_path, items_per_phase: int, phases: int = 2, journal: bool = True, compact_every: int = 50):
+    workflow = {
+        "name": "journal-test",
+        "version": "1.0",
+        "settings": {"state_journal": journal, "state_journal_compact_every": compact_every},
+        "phases": [
+            {
+                "id": f"P{p}",
+                "name": f"Phase {p}",
+                "items": [
+                    {"id": f"p{p}_item_{i}", "name": f"Item {i}", "verification": {"type": "none"}}
+                    for i in range(items_per_phase)
+                ],
+            }
+            for p in range(phases)
+        ],
+    }
+    tmp_path.mkdir(parents=True, exist_ok=True)
+    path = tmp_path / "workflow.yaml"
+    path.write_text(yaml.safe_dump(workflow))
+    return path
+
+
+def _start(tmp_path, **kwargs):
+    yaml_path = _write_workflow(tmp_path, **kwargs)
+    engine = WorkflowEngine(working_dir=str(tmp_path), session_id="journal1")
+    engine.start_workflow(str(yaml_path), "Journal test", no_archive=True)
+    return engine
+
+
+def _fresh_engine(tmp_path):
+    engine = WorkflowEngine(working_dir=str(tmp_path), session_id="journal1")
+    engine.load_state()
+    return engine
+
+
+class TestDiff:
+    """Tests for delta computation and replay."""
+
+    def test_item_change_is_single_operation(self):
+        old = {"status": "active", "phases": {"P0": {"status": "active", "items": {"a": {"status": "pending"}, "b": {"status": "pending"}}}}}
+        new = json.loads(json.dumps(old))
+        new["phases"]["P0"]["items"]["a"]["status"] = "completed"
+
+        ops = diff_state(old, new)
+
+        assert ops == [["set", ["phases", "P0", "items", "a"], {"status": "completed"}]]
+        assert apply_ops(old, ops) == new
+
+    def test_added_and_removed_keys(self):
+        old = {"x": 1, "gone": 2, "phases": {"P0": {"items": {}}}}
+        new = {"x": 1, "added": 3, "phases": {"P0": {"items": {"i": {}}}, "P1": {"items": {}}}}
+
+        assert apply_ops(json.loads(json.dumps(old)), diff_state(old, new)) == new
+
+
+class TestJournaledEngine:
+    """Tests for WorkflowEngine with the state_journal setting."""
+
+    def test_transitions_append_deltas_without_rewriting_snapshot(self, tmp_path):
+        engine = _start(tmp_path, items_per_phase=5)
+        snapshot_before = engine.state_file.read_bytes()
+
+        engine.complete_item("p0_item_0", notes="done")
+        engine.skip_item("p0_item_1", reason="Not applicable to this change at all")
+
+        assert engine.state_file.read_bytes() == snapshot_before
+        assert engine.state_journal.pending_records() == 2
+        record = json.loads(engine.state_journal.journal_file.read_text().splitlines()[0])
+        assert "workflow_definition" not in json.dumps(record["ops"])
+
+        reloaded = _fresh_engine(tmp_path)
+        items = reloaded.state.phases["P0"].items
+        assert items["p0_item_0"].status == ItemStatus.COMPLETED
+        assert items["p0_item_1"].status == ItemStatus.SKIPPED
+        assert reloaded.workflow_def.name == "journal-test"
+
+    def test_compaction_folds_journal_into_snapshot(self, tmp_path):
+        engine = _start(tmp_path, items_per_phase=6, compact_every=3)
+
+        for i in range(4):
+            engine.complete_item(f"p0_item_{i}")
+        engine.state_journal.wait_for_compaction(timeout=10)
+
+        assert engine.state_journal.pending_records() <= 1
+        snapshot = json.loads(engine.state_file.read_text())
+        assert snapshot["phases"]["P0"]["items"]["p0_item_2"]["status"] == "completed"
+
+        reloaded = _fresh_engine(tmp_path)
+        statuses = [reloaded.state.phases["P0"].items[f"p0_item_{i}"].status for i in range(6)]
+        assert statuses == [ItemStatus.COMPLETED] * 4 + [ItemStatus.PENDING] * 2
+
+    def test_replay_is_idempotent_after_interrupted_compaction(self, tmp_path):
+        engine = _start(tmp_path, items_per_phase=3)
+        engine.complete_item("p0_item_0")
+        journal = engine.state_journal.journal_file.read_bytes()
+
+        # Simulate a crash after writing the compacted snapshot but before truncation
+        engine.state_journal.compact()
+        engine.state_journal.journal_file.write_bytes(journal)
+        engine.complete_item("p0_item_1")
+
+        reloaded = _fresh_engine(tmp_path)
+        items = reloaded.state.phases["P0"].items
+        assert items["p0_item_0"].status == ItemStatus.COMPLETED
+        assert items["p0_item_1"].status == ItemStatus.COMPLETED
+
+    def test_torn_record_is_skipped(self, tmp_path):
+        engine = _start(tmp_path, items_per_phase=3)
+        engine.complete_item("p0_item_0")
+        with open(engine.state_journal.journal_file, "a") as f:
+            f.write('{"ops": [["set", ["status"], "abandon')
+        engine.complete_item("p0_item_1")
+
+        reloaded = _fresh_engine(tmp_path)
+        items = reloaded.state.phases["P0"].items
+        assert reloaded.state.status.value == "active"
+        assert items["p0_item_0"].status == ItemStatus.COMPLETED
+        assert items["p0_item_1"].status == ItemStatus.COMPLETED
+
+    def test_disabling_journal_discards_stale_deltas(self, tmp_path):
+        engine = _start(tmp_path, items_per_phase=3)
+        engine.complete_item("p0_item_0")
+
+        engine.workflow_def.settings["state_journal"] = False
+        engine.state.phases["P0"].items["p0_item_0"].notes = "full save"
+        engine.save_state()
+
+        assert engine.state_journal.pending_records() == 0
+        reloaded = _fresh_engine(tmp_path)
+        assert reloaded.state.phases["P0"].items["p0_item_0"].notes == "full save"
+
+    def test_other_state_readers_replay_the_journal(self, tmp_path):
+        engine = _start(tmp_path, items_per_phase=3)
+        engine.complete_item("p0_item_0")
+        (tmp_path / ".orchestrator" / "current").write_text("journal1")
+
+        state = LearningEngine(str(tmp_path), paths=engine.paths)._load_state()
+        assert state.phases["P0"].items["p0_item_0"].status == ItemStatus.COMPLETED
+
+        health = HealthChecker(tmp_path).check_state()
+        assert health.status == "ok"
+        assert health.details == {"pending_journal_records": 1}
+
+
+class TestStateJournalPerformance:
+    """Journaled deltas vs. full rewrites on a 200-item workflow."""
+
+    ITEMS_PER_PHASE = 100  # 2 phases -> 200 items
+
+    def _time_completions(self, tmp_path, journal: bool) -> float:
+        engine = _start(tmp_path, items_per_phase=self.ITEMS_PER_PHASE, journal=journal, compact_every=50)
+        start = time.perf_counter()
+        for i in range(self.ITEMS_PER_PHASE):
+            engine.complete_item(f"p0_item_{i}")
+        elapsed = time.perf_counter() - start
+        engine.state_journal.wait_for_compaction(timeout=30)
+        return elapsed
+
+    def test_journal_faster_than_full_rewrite(self, tmp_path):
+        """Journaled completions append a delta instead of rewriting the state."""
+        full = self._time_completions(tmp_path / "full", journal=False)
+        journaled = self._time_completions(tmp_path / "journal", journal=True)
+
+        # About 10x apart on a 200-item workflow
+        assert journaled * 3 < full, f"journal {journaled:.3f}s vs full rewrite {full:.3f}s"
+
+    def test_journaled_state_matches_full_state(self, tmp_path):
+        self._time_completions(tmp_path / "full", journal=False)
+        self._time_completions(tmp_path / "journal", journal=True)
+
+        full = _fresh_engine(tmp_path / "full").state
+        journaled = _fresh_engine(tmp_path / "journal").state
+
+        def statuses(state):
+            return {
+                item_id: item.status
+                for phase in state.phases.values()
+                for item_id, item in phase.items.items()
+            }
+
+        assert statuses(full) == statuses(journaled)
@@ -0,0 +1,174 @@
+"""
+Tests for the verification result cache (src/enforcement/result_cache.py).
+"""
+
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+import yaml
+
+from src.engine import WorkflowEngine
+from src.schema import ItemStatus
+from src.enforcement import HardGateExecutor, VerificationResultCache, working_tree_hash
+
+
+def _git_repo(path):
+    path.mkdir(parents=True, exist_ok=True)
+    subprocess.run(["git", "init", "-q"], cwd=path, check=True)
+    (path / ".gitignore").write_text("runs.log\n")
+    (path / "app.py").write_text("print('v1')\n")
+    subprocess.run(["git", "add", "."], cwd=path, check=True)
+    return path
+
+
+def _counting_command(exit_code: int = 0) -> str:
+    """Command that records each run in the (ignored) runs.log."""
+    return f"{sys.executable} -c \"open('runs.log', 'a').write('run\\n'); raise SystemExit({exit_code})\""
+
+
+def _runs(path) -> int:
+    log = path / "runs.log"
+    return len(log.read_text().splitlines()) if log.exists() else 0
+
+
+@pytest.fixture
+def repo(tmp_path):
+    return _git_repo(tmp_path / "repo")
+
+
+class TestWorkingTreeHash:
+
+    def test_none_outside_git(self, tmp_path):
+        assert working_tree_hash(tmp_path) is None
+
+    def test_tracks_modified_untracked_and_deleted_files(self, repo):
+        original = working_tree_hash(repo)
+        assert working_tree_hash(repo) == original
+
+        (repo / "app.py").write_text("print('v2')\n")
+        modified = working_tree_hash(repo)
+        (repo / "new.py").write_text("x = 1\n")
+        untracked = working_tree_hash(repo)
+        (repo / "app.py").unlink()
+        deleted = working_tree_hash(repo)
+
+        assert len({original, modified, untracked, deleted}) == 4
+
+    def test_ignores_orchestrator_and_gitignored_files(self, repo):
+        original = working_tree_hash(repo)
+
+        (repo / "runs.log").write_text("noise\n")
+        (repo / ".orchestrator").mkdir()
+        (repo / ".orchestrator" / "state.json").write_text("{}")
+
+        assert working_tree_hash(repo) == original
+
+
+class TestVerificationResultCache:
+
+    def test_expired_entries_are_dropped(self, tmp_path):
+        cache = VerificationResultCache(tmp_path, ttl_seconds=0)
+        cache.put("k", {"exit_code": 0})
+        time.sleep(0.01)
+
+        assert cache.get("k") is None
+        assert list(tmp_path.glob("*.json")) == []
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache = VerificationResultCache(tmp_path, max_entries=2)
+        cache.put("a", {"n": 1})
+        cache.put("b", {"n": 2})
+        old = time.time() - 100
+        os.utime(tmp_path / "a.json", (old, old))
+        os.utime(tmp_path / "b.json", (old - 10, old - 10))
+
+        cache.put("c", {"n": 3})
+
+        assert cache.get("b") is None
+        assert cache.get("a") == {"n": 1}
+        assert cache.get("c") == {"n": 3}
+
+    def test_gate_executor_reuses_pass_only(self, repo, tmp_path):
+        cache = VerificationResultCache(tmp_path / "cache")
+        executor = HardGateExecutor()
+
+        first = executor.execute(_counting_command(), repo, result_cache=cache)
+        second = executor.execute(_counting_command(), repo, result_cache=cache)
+        assert first.success and not first.cached
+        assert second.success and second.cached
+        assert _runs(repo) == 1
+
+        executor.execute(_counting_command(1), repo, result_cache=cache)
+        executor.execute(_counting_command(1), repo, result_cache=cache)
+        assert _runs(repo) == 3
+
+    def test_environment_is_part_of_key(self, repo, tmp_path):
+        cache = VerificationResultCache(tmp_path / "cache")
+
+        assert cache.key_for(repo, "make test") != cache.key_for(repo, "make test", env={"CI": "1"})
+        assert cache.key_for(repo, "make test") != cache.key_for(repo, "make lint")
+
+
+class TestEngineVerificationCache:
+
+    def _start(self, repo, settings=None) -> WorkflowEngine:
+        workflow = {
+            "name": "cache-test",
+            "version": "1.0",
+            "settings": settings or {},
+            "phases": [{
+                "id": "BUILD",
+                "name": "Build",
+                "items": [
+                    {"id": "tests", "name": "Tests",
+                     "verification": {"type": "command", "command": _counting_command()}},
+                    {"id": "gate", "name": "Gate", "step_type": "gate",
+                     "verification": {"type": "command", "command": _counting_command()}},
+                ],
+            }],
+        }
+        (repo / "workflow.yaml").write_text(yaml.safe_dump(workflow))
+        subprocess.run(["git", "add", "workflow.yaml"], cwd=repo, check=True)
+        engine = WorkflowEngine(working_dir=str(repo), session_id="vcache01")
+        engine.start_workflow(str(repo / "workflow.yaml"), "Cache test", no_archive=True)
+        return engine
+
+    def test_unchanged_tree_skips_command(self, repo):
+        engine = self._start(repo)
+        item_def = engine.workflow_def.get_phase("BUILD").items[0]
+
+        passed, _, first = engine._run_verification(item_def)
+        passed_again, message, second = engine._run_verification(item_def)
+
+        assert passed and passed_again
+        assert _runs(repo) == 1
+        assert second["cached"] is True
+        assert "unchanged tree" in message
+
+        (repo / "app.py").write_text("print('v2')\n")
+        engine._run_verification(item_def)
+        assert _runs(repo) == 2
+
+    def test_gate_step_uses_cache(self, repo):
+        engine = self._start(repo)
+        engine.complete_item("gate")
+        assert _runs(repo) == 1
+
+        engine.state.phases["BUILD"].items["gate"].status = ItemStatus.PENDING
+        success, _ = engine.complete_item("gate")
+
+        assert success
+        assert _runs(repo) == 1
+        assert engine.state.phases["BUILD"].items["gate"].gate_result["cached"] is True
+
+    def test_disabled_by_setting(self, repo):
+        engine = self._start(repo, settings={"verification_cache": False})
+        item_def = engine.workflow_def.get_phase("BUILD").items[0]
+
+        engine._run_verification(item_def)
+        engine._run_verification(item_def)
+
+        assert _runs(repo) == 2
@@ -2,6 +2,8 @@
 import pytest
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
+import time
 
 from src.v4.chat.models import Message, MessageRole, SessionConfig, ValidationResult
 from src.v4.chat.context import SafeContextManager
@@ -264,3 +266,81 @@ class TestSafeContextManager:
 
         assert result == []
         mock_wrapper.call.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_token_counts_cached_per_message(self):
+        """Test each message is counted once per counter and content."""
+        token_counter = EstimationTokenCounter()
+        manager = SafeContextManager(
+            token_counter=token_counter,
+            validator=SummaryValidator(),
+            llm_wrapper=MagicMock(),
+        )
+        messages = [self._create_message(str(i), "x" * 40) for i in range(5)]
+
+        with patch.object(token_counter, "count_many", wraps=token_counter.count_many) as count_many:
+            assert await manager.count_tokens(messages) == 50
+            assert await manager.count_tokens(messages) == 50
+            messages[0].content = "x" * 80
+            assert await manager.count_tokens(messages) == 60
+
+        assert [len(call.args[0]) for call in count_many.call_args_list] == [5, 1]
+
+    @pytest.mark.asyncio
+    async def test_caller_token_count_skips_counting(self):
+        """Test a token count passed by the caller is used as-is."""
+        token_counter = EstimationTokenCounter()
+        manager = SafeContextManager(
+            token_counter=token_counter,
+            validator=SummaryValidator(),
+            llm_wrapper=MagicMock(),
+            config=SessionConfig(max_tokens=1000, summarization_threshold=0.7),
+        )
+        messages = [self._create_message("1", "Short message")]
+
+        with patch.object(token_counter, "count_many") as count_many:
+            assert not await manager._should_summarize(messages, token_count=700)
+            assert await manager._should_summarize(messages, token_count=701)
+
+        count_many.assert_not_called()
+
+
+class TestContextTokenCountingPerformance:
+    """Per-turn counting cost with a counter that has network latency."""
+
+    class SlowCounter(EstimationTokenCounter):
+        LATENCY = 0.002
+
+        async def count(self, text: str) -> int:
+            await asyncio.sleep(self.LATENCY)
+            return await super().count(text)
+
+        async def count_many(self, texts):
+            await asyncio.sleep(self.LATENCY)
+            counts = []
+            for text in texts:
+                counts.append(await super().count(text))
+            return counts
+
+    @pytest.mark.asyncio
+    async def test_cached_counting_speed(self):
+        """Each turn only counts the new message (<10ms per turn)."""
+        counter = self.SlowCounter()
+        manager = SafeContextManager(
+            token_counter=counter,
+            validator=SummaryValidator(),
+            llm_wrapper=MagicMock(),
+        )
+        turns = 30
+        messages = []
+
+        start = time.perf_counter()
+        for i in range(turns):
+            messages.append(Message.create(MessageRole.USER, f"message {i} " * 20))
+            total = await manager.count_tokens(messages)
+        elapsed = time.perf_counter() - start
+
+        assert total == sum(counter.count_sync(msg.content) for msg in messages)
+        avg_ms = (elapsed / turns) * 1000
+        # Recounting every message each turn averages ~33ms here
+        assert avg_ms < 10, f"Counting a turn took {avg_ms:.1f}ms (target <10ms)"
@@ -4,11 +4,17 @@ from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from src.v4.chat.models import Message, MessageRole, SessionConfig
-from src.v4.chat.session import ChatSession
+from src.v4.chat.session import ChatSession, ChatSessionsProjection
 from src.v4.chat.context import SafeContextManager
 from src.v4.chat.commands import MetaCommandParser
-from src.v4.security.async_storage import SQLiteAsyncEventStore, CheckpointStore, SQLiteAdapter
-from src.v4.budget import AtomicBudgetTracker, EstimationTokenCounter
+from src.v4.security.async_storage import (
+    SQLiteAsyncEventStore,
+    CheckpointStore,
+    SQLiteAdapter,
+    ProjectionRunner,
+)
+from src.v4.budget import AtomicBudgetTracker, EstimationTokenCounter, TokenUsage
+from src.v4.interceptor import StreamChunk
 
 
 class TestChatSession:
@@ -359,6 +365,180 @@ class TestChatSession:
             await budget_tracker.close()
 
 
+    @pytest.mark.asyncio
+    async def test_context_tokens_counted_incrementally(self):
+        """Test only new messages are counted, and restore recounts."""
+        event_store, checkpoint_store = await self._setup_stores()
+        budget_tracker = await self._setup_budget()
+        token_counter = EstimationTokenCounter()
+
+        try:
+            session = ChatSession(
+                session_id="test_session",
+                event_store=event_store,
+                checkpoint_store=checkpoint_store,
+                budget_tracker=budget_tracker,
+                budget_id="test_budget",
+                llm_wrapper=self._mock_llm_wrapper(),
+                config=SessionConfig(checkpoint_interval_messages=20),
+                token_counter=token_counter,
+            )
+
+            with patch.object(token_counter, "count_many", wraps=token_counter.count_many) as count_many:
+                await session.send("Message 1")
+                cp_id = await session.checkpoint()
+                await session.send("Message 2")
+                # Each turn counts only the new user message
+                assert [len(c.args[0]) for c in count_many.call_args_list] == [1, 2]
+
+                await session.restore(cp_id)
+                expected = sum([await token_counter.count(m.content) for m in session.messages])
+                assert await session.context_tokens() == expected
+
+        finally:
+            await event_store.close()
+            await budget_tracker.close()
+
+
+    def _streaming_llm_wrapper(self, chunks, fail_after=None):
+        """Create mock LLM wrapper whose stream yields chunks (then fails)."""
+        async def call_streaming(request):
+            for i, text in enumerate(chunks):
+                if i == fail_after:
+                    raise ConnectionError("stream dropped")
+                yield StreamChunk(content=text)
+            yield StreamChunk(
+                content="",
+                is_final=True,
+                usage=TokenUsage(input_tokens=10, output_tokens=len(chunks)),
+            )
+
+        wrapper = AsyncMock()
+        wrapper.call_streaming = call_streaming
+        return wrapper
+
+    @pytest.mark.asyncio
+    async def test_send_streaming(self):
+        """Test chunks are yielded as they arrive and the reply is persisted."""
+        event_store, checkpoint_store = await self._setup_stores()
+        budget_tracker = await self._setup_budget()
+
+        try:
+            session = ChatSession(
+                session_id="test_session",
+                event_store=event_store,
+                checkpoint_store=checkpoint_store,
+                budget_tracker=budget_tracker,
+                budget_id="test_budget",
+                llm_wrapper=self._streaming_llm_wrapper(["Hel", "lo", "!"]),
+                config=SessionConfig(stream_persist_interval_seconds=0),
+            )
+
+            chunks = [chunk async for chunk in session.send_streaming("Hi")]
+
+            assert chunks == ["Hel", "lo", "!"]
+            reply = session.messages[-1]
+            assert reply.content == "Hello!"
+            assert reply.metadata["usage"] == {"input_tokens": 10, "output_tokens": 3}
+            assert reply.metadata["streaming"]["chunks"] == 3
+            assert session.last_stream_metrics["time_to_first_token_ms"] is not None
+
+            # Replaying chunks then the completed message yields one reply
+            recovered = ChatSession(
+                session_id="test_session",
+                event_store=event_store,
+                checkpoint_store=checkpoint_store,
+                budget_tracker=budget_tracker,
+                budget_id="test_budget",
+                llm_wrapper=self._mock_llm_wrapper(),
+            )
+            await recovered.recover()
+            assert [m.content for m in recovered.messages] == ["Hi", "Hello!"]
+            assert "partial" not in recovered.messages[-1].metadata
+
+        finally:
+            await event_store.close()
+            await budget_tracker.close()
+
+    @pytest.mark.asyncio
+    async def test_streaming_crash_keeps_partial_output(self):
+        """Test output streamed before a failure survives recovery."""
+        event_store, checkpoint_store = await self._setup_stores()
+        budget_tracker = await self._setup_budget()
+
+        try:
+            session = ChatSession(
+                session_id="test_session",
+                event_store=event_store,
+                checkpoint_store=checkpoint_store,
+                budget_tracker=budget_tracker,
+                budget_id="test_budget",
+                llm_wrapper=self._streaming_llm_wrapper(["one ", "two ", "three"], fail_after=2),
+                config=SessionConfig(stream_persist_interval_seconds=60),
+            )
+
+            chunks = [chunk async for chunk in session.send_streaming("Count")]
+            assert chunks[:2] == ["one ", "two "]
+            assert chunks[-1].startswith("Error:")
+
+            recovered = ChatSession(
+                session_id="test_session",
+                event_store=event_store,
+                checkpoint_store=checkpoint_store,
+                budget_tracker=budget_tracker,
+                budget_id="test_budget",
+                llm_wrapper=self._mock_llm_wrapper(),
+            )
+            await recovered.recover()
+            partial = recovered.messages[-1]
+            assert partial.content == "one two "
+            assert partial.metadata == {"partial": True}
+
+        finally:
+            await event_store.close()
+            await budget_tracker.close()
+
+
+class TestChatSessionsProjection:
+    """Tests for the all-sessions projection."""
+
+    @pytest.mark.asyncio
+    async def test_summarizes_sessions_incrementally(self):
+        """Test message counts, pins and checkpoints across sessions."""
+        event_store = SQLiteAsyncEventStore(":memory:")
+        checkpoint_store = CheckpointStore(event_store._adapter)
+        runner = ProjectionRunner(event_store, checkpoint_store)
+
+        try:
+            sessions = {}
+            for session_id in ("one", "two"):
+                sessions[session_id] = ChatSession(
+                    session_id=session_id,
+                    event_store=event_store,
+                    checkpoint_store=checkpoint_store,
+                    budget_tracker=AsyncMock(),
+                    budget_id="test_budget",
+                    llm_wrapper=AsyncMock(),
+                )
+
+            for content in ("a", "b", "c"):
+                await sessions["one"]._persist_message(Message.create(MessageRole.USER, content))
+            await sessions["two"]._persist_message(Message.create(MessageRole.USER, "x"))
+            cp_id = await sessions["one"].checkpoint()
+
+            state = await runner.run(ChatSessionsProjection())
+            assert state["sessions"]["one"]["message_count"] == 3
+            assert state["sessions"]["one"]["last_checkpoint_id"] == cp_id
+            assert state["sessions"]["two"]["message_count"] == 1
+
+            await sessions["two"]._persist_message(Message.create(MessageRole.USER, "y"))
+            state = await runner.run(ChatSessionsProjection())
+            assert state["sessions"]["two"]["message_count"] == 2
+            assert state["sessions"]["one"]["message_count"] == 3
+        finally:
+            await event_store.close()
+
+
 class TestIntegration:
     """Integration tests for full session lifecycle."""
 
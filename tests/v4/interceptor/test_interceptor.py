@@ -490,6 +490,34 @@ class TestLLMCallWrapper:
         status = await budget_tracker.get_status("test_budget")
         assert status.used == 150  # 50 + 100
 
+    @pytest.mark.asyncio
+    async def test_streaming_closed_early_commits_received_output(self, budget_tracker, token_counter, sample_request):
+        """Test a stream the caller stops reading still settles its reservation."""
+        await self._setup_test_budget(budget_tracker)
+
+        async def mock_stream() -> AsyncIterator[StreamChunk]:
+            yield StreamChunk(content="x" * 40)
+            yield StreamChunk(content="never read")
+
+        adapter = MagicMock(spec=LLMAdapter)
+        adapter.call_streaming = MagicMock(return_value=mock_stream())
+
+        wrapper = LLMCallWrapper(
+            budget_tracker=budget_tracker,
+            token_counter=token_counter,
+            adapter=adapter,
+            budget_id="test_budget",
+        )
+
+        stream = wrapper.call_streaming(sample_request)
+        await stream.__anext__()
+        await stream.aclose()
+
+        status = await budget_tracker.get_status("test_budget")
+        assert status.reserved == 0
+        estimated_input = await wrapper._estimate_input_tokens(sample_request)
+        assert status.used == estimated_input + 10
+
 
 class TestIntegration:
     """Integration tests with full stack."""
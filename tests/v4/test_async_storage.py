@@ -12,6 +12,7 @@ import asyncio
 import os
 import pytest
 import tempfile
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import List
@@ -23,6 +24,9 @@ from src.v4.security.async_storage import (
     CheckpointStore,
     Checkpoint,
     EventSourcedRepository,
+    EventRecord,
+    Projection,
+    ProjectionRunner,
 )
 
 
@@ -128,6 +132,37 @@ class TestSQLiteAdapter:
 
         await adapter.close()
 
+    @pytest.mark.asyncio
+    async def test_writer_connection_reused(self, temp_db_path):
+        """Test that file-backed transactions share one writer connection."""
+        adapter = SQLiteAdapter(temp_db_path)
+
+        async with adapter.exclusive_transaction():
+            first = adapter._writer
+        async with adapter.exclusive_transaction():
+            second = adapter._writer
+
+        assert first is not None and first is second
+
+        await adapter.close()
+        assert adapter._writer is None
+
+    @pytest.mark.asyncio
+    async def test_read_connections_pooled(self, temp_db_path):
+        """Test that reader connections are returned to the pool."""
+        adapter = SQLiteAdapter(temp_db_path, read_pool_size=1)
+
+        async with adapter.read_connection() as first:
+            async with adapter.read_connection() as second:
+                assert first is not second
+        async with adapter.read_connection() as third:
+            assert third in (first, second)
+
+        assert len(adapter._idle_readers) == 1
+
+        await adapter.close()
+        assert adapter._readers == [] and adapter._idle_readers == []
+
     def test_select_for_update_no_for_update_clause(self):
         """Test that SQLite adapter doesn't add FOR UPDATE."""
         adapter = SQLiteAdapter(":memory:")
@@ -535,6 +570,128 @@ class TestEventSourcedRepository:
         await adapter.close()
 
 
+# ============================================================
+# Projection Tests
+# ============================================================
+
+
+class CountingProjection(Projection):
+    """Counts events per type and records how many it was given."""
+
+    name = "counts"
+    event_types = None
+
+    def __init__(self):
+        self.applied = 0
+
+    def initial_state(self):
+        return {"counts": {}}
+
+    def apply(self, state, event):
+        self.applied += 1
+        state["counts"][event.type] = state["counts"].get(event.type, 0) + 1
+
+
+class TestProjectionRunner:
+    """Test paged reads and incremental projections."""
+
+    async def _append_events(self, store, stream_id, count, start=1, event_type="test_event"):
+        await store.append(
+            stream_id,
+            [create_event(stream_id, v, event_type=event_type) for v in range(start, start + count)],
+        )
+
+    @pytest.mark.asyncio
+    async def test_read_pages_bounded_and_ordered(self, temp_db_path):
+        """Test that read_pages yields bounded pages in global order."""
+        store = SQLiteAsyncEventStore(temp_db_path)
+        await self._append_events(store, "stream_a", 7)
+        await self._append_events(store, "stream_b", 5)
+
+        pages = [page async for page in store.read_pages(page_size=5)]
+
+        assert [len(page) for page in pages] == [5, 5, 2]
+        positions = [record.global_position for page in pages for record in page]
+        assert positions == sorted(positions) and len(positions) == 12
+        assert await store.get_global_position() == positions[-1]
+
+        read_all = [event.global_position async for event in store.read_all(from_position=positions[3])]
+        assert read_all == positions[4:]
+
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_event_record_decodes_lazily(self, in_memory_db):
+        """Test that payloads are only decoded on access."""
+        store = SQLiteAsyncEventStore(in_memory_db)
+        await store.append("stream_1", [create_event("stream_1", 1, data={"n": 1})])
+
+        pages = [page async for page in store.read_pages()]
+        record = pages[0][0]
+
+        assert isinstance(record, EventRecord)
+        assert isinstance(record._data, str)
+        assert record.data == {"n": 1}
+        assert record.to_event().metadata == {"test": True}
+
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_projection_resumes_from_snapshot(self, temp_db_path):
+        """Test that a second run only applies new events."""
+        store = SQLiteAsyncEventStore(temp_db_path)
+        checkpoints = CheckpointStore(store._adapter)
+        await self._append_events(store, "stream_1", 10)
+
+        projection = CountingProjection()
+        state = await ProjectionRunner(store, checkpoints, page_size=4).run(projection)
+        assert state == {"counts": {"test_event": 10}}
+        assert projection.applied == 10
+
+        await self._append_events(store, "stream_1", 3, start=11)
+
+        projection = CountingProjection()
+        state = await ProjectionRunner(store, checkpoints, page_size=4).run(projection)
+        assert state == {"counts": {"test_event": 13}}
+        assert projection.applied == 3
+
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_projection_version_change_rebuilds(self, in_memory_db):
+        """Test that bumping the projection version discards the snapshot."""
+        store = SQLiteAsyncEventStore(in_memory_db)
+        checkpoints = CheckpointStore(store._adapter)
+        await self._append_events(store, "stream_1", 5)
+        await ProjectionRunner(store, checkpoints).run(CountingProjection())
+
+        projection = CountingProjection()
+        projection.version = 2
+        state = await ProjectionRunner(store, checkpoints).run(projection)
+
+        assert projection.applied == 5
+        assert state == {"counts": {"test_event": 5}}
+
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_filtered_projection_skips_unmatched_history(self, in_memory_db):
+        """Test that the watermark advances past events of other types."""
+        store = SQLiteAsyncEventStore(in_memory_db)
+        checkpoints = CheckpointStore(store._adapter)
+        await self._append_events(store, "stream_1", 3, event_type="wanted")
+        await self._append_events(store, "stream_2", 50, event_type="other")
+
+        projection = CountingProjection()
+        projection.event_types = ["wanted"]
+        await ProjectionRunner(store, checkpoints).run(projection)
+
+        snapshot = await checkpoints.load_latest("projection:counts")
+        assert snapshot.version == await store.get_global_position()
+
+        await store.close()
+
+
 # ============================================================
 # Concurrency Tests
 # ============================================================
@@ -559,7 +716,8 @@ class TestConcurrency:
                     await store.append("stream_1", [event], expected_version=version)
                     return True
                 except ConcurrencyError:
-                    await asyncio.sleep(0.01)
+                    # Staggered backoff so losers don't retry in lockstep
+                    await asyncio.sleep(0.01 * (n + 1))
             return False
 
         results = await asyncio.gather(*[append_event(i) for i in range(5)])
@@ -593,6 +751,107 @@ class TestConcurrency:
         await store.close()
 
 
+    @pytest.mark.asyncio
+    async def test_stream_head_cache_sees_other_connections(self, temp_db_path):
+        """Test that cached stream heads are refreshed after outside commits."""
+        store_a = SQLiteAsyncEventStore(temp_db_path)
+        store_b = SQLiteAsyncEventStore(temp_db_path)
+
+        await store_a.append("stream_1", [create_event("stream_1", 1)])
+        await store_b.append("stream_1", [create_event("stream_1", 2)], expected_version=1)
+
+        await store_a.append("stream_1", [create_event("stream_1", 3)], expected_version=2)
+        with pytest.raises(ConcurrencyError):
+            await store_b.append("stream_1", [create_event("stream_1", 3)], expected_version=2)
+
+        assert await store_b.get_stream_version("stream_1") == 3
+
+        await store_a.close()
+        await store_b.close()
+
+    @pytest.mark.asyncio
+    async def test_group_commit_coalesces_concurrent_appends(self, temp_db_path):
+        """Test that group commit appends concurrent requests in one transaction."""
+        store = SQLiteAsyncEventStore(temp_db_path, group_commit=True)
+        await store.append("warmup", [create_event("warmup", 1)])
+
+        batch_sizes = []
+        commit_group = store._commit_group
+
+        async def recording_commit_group(batch):
+            batch_sizes.append(len(batch))
+            await commit_group(batch)
+
+        store._commit_group = recording_commit_group
+
+        await asyncio.gather(*[
+            store.append(f"stream_{i}", [create_event(f"stream_{i}", 1), create_event(f"stream_{i}", 2)])
+            for i in range(20)
+        ])
+
+        assert batch_sizes == [20]
+        for i in range(20):
+            assert await store.get_stream_version(f"stream_{i}") == 2
+
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_group_commit_isolates_failed_append(self, temp_db_path):
+        """Test that one failing append does not roll back the rest of its group."""
+        store = SQLiteAsyncEventStore(temp_db_path, group_commit=True)
+        await store.append("stream_1", [create_event("stream_1", 1)])
+
+        results = await asyncio.gather(
+            store.append("stream_1", [create_event("stream_1", 2)], expected_version=1),
+            store.append("stream_1", [create_event("stream_1", 2)], expected_version=1),
+            store.append("stream_2", [create_event("stream_2", 1)]),
+            return_exceptions=True,
+        )
+
+        assert results[0] is None
+        assert isinstance(results[1], ConcurrencyError)
+        assert results[2] is None
+        assert await store.get_stream_version("stream_1") == 2
+        assert await store.get_stream_version("stream_2") == 1
+
+        await store.close()
+
+
+class TestEventStoreThroughputPerformance:
+    """Append throughput with group commit."""
+
+    WRITERS = 100
+    APPENDS_PER_WRITER = 20
+
+    async def _time_appends(self, path, group_commit: bool) -> float:
+        store = SQLiteAsyncEventStore(str(path), group_commit=group_commit)
+        await store.append("warmup", [create_event("warmup", 1)])
+
+        async def writer(n: int):
+            stream_id = f"writer_{n}"
+            for version in range(1, self.APPENDS_PER_WRITER + 1):
+                await store.append(
+                    stream_id, [create_event(stream_id, version)], expected_version=version - 1
+                )
+
+        start = time.perf_counter()
+        await asyncio.gather(*[writer(n) for n in range(self.WRITERS)])
+        elapsed = time.perf_counter() - start
+
+        assert await store.get_stream_version(f"writer_{self.WRITERS - 1}") == self.APPENDS_PER_WRITER
+        await store.close()
+        return elapsed
+
+    @pytest.mark.asyncio
+    async def test_group_commit_append_speed(self, tmp_path):
+        """Concurrent appends share transactions (faster than one commit each)."""
+        single = await self._time_appends(tmp_path / "single.db", group_commit=False)
+        grouped = await self._time_appends(tmp_path / "grouped.db", group_commit=True)
+
+        # Typically 2-3x apart with 100 concurrent writers
+        assert grouped * 1.5 < single, f"group commit {grouped:.3f}s vs {single:.3f}s per-append commits"
+
+
 # ============================================================
 # Recovery Tests
 # ============================================================
@@ -3,6 +3,7 @@ Tests for V4.2 Phase 2: Token Budget System.
 
 Tests cover:
 - TokenCounter implementations (Claude, OpenAI, Estimation)
+- Cached counting and the local BPE tokenizer
 - AtomicBudgetTracker operations (reserve, commit, rollback)
 - Concurrent budget operations
 - Event sourcing integration
@@ -12,6 +13,7 @@ import asyncio
 import os
 import pytest
 import tempfile
+import time
 from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -27,6 +29,8 @@ from src.v4.budget import (
     ClaudeTokenCounter,
     OpenAITokenCounter,
     EstimationTokenCounter,
+    CachingTokenCounter,
+    BPETokenizer,
     get_token_counter,
     AtomicBudgetTracker,
 )
@@ -275,6 +279,230 @@ class TestClaudeTokenCounter:
         counter = ClaudeTokenCounter()
         assert await counter.count_messages([]) == 0
 
+    @pytest.mark.asyncio
+    async def test_count_many(self):
+        """Test batched counting skips empty texts and falls back per text."""
+        counter = ClaudeTokenCounter()
+
+        def count_tokens(model, messages):
+            content = messages[0]["content"]
+            if content == "bad":
+                raise Exception("API Error")
+            return MagicMock(input_tokens=len(content))
+
+        mock_client = MagicMock()
+        mock_client.messages.count_tokens.side_effect = count_tokens
+        counter._client = mock_client
+
+        result = await counter.count_many(["hello", "", "bad", "hi"])
+
+        assert result == [5, 0, 1, 2]
+        assert mock_client.messages.count_tokens.call_count == 3
+
+    def test_cache_key_includes_model(self):
+        """Test counts cached for one model are not reused for another."""
+        assert ClaudeTokenCounter(model="a").cache_key != ClaudeTokenCounter(model="b").cache_key
+        assert EstimationTokenCounter().cache_key == "EstimationTokenCounter"
+
+
+# ============================================================
+# Cached and Offline Counter Tests
+# ============================================================
+
+
+SAMPLE_TEXT = (
+    "The budget tracker reserves tokens before each call and commits the "
+    "actual usage afterwards. Reservations that are never committed expire "
+    "after a timeout, releasing their tokens back to the budget. "
+    "def reserve(self, budget_id: str, tokens: int) -> ReservationResult: ... "
+    "See src/v4/budget/manager.py for the SQLite schema (2048 rows, v4.2)."
+)
+
+
+def _train_ranks(corpus: str, merges: int) -> dict:
+    """Train a small byte-level BPE vocabulary (all bytes + merges)."""
+    from src.v4.budget.bpe import CL100K_PATTERN
+    import re
+    from collections import Counter
+
+    ranks = {bytes([b]): b for b in range(256)}
+    words = Counter(
+        tuple(bytes([b]) for b in piece.encode("utf-8"))
+        for piece in re.findall(CL100K_PATTERN, corpus)
+    )
+    for _ in range(merges):
+        pairs = Counter()
+        for word, freq in words.items():
+            for pair in zip(word, word[1:]):
+                pairs[pair] += freq
+        if not pairs:
+            break
+        (a, b), _ = pairs.most_common(1)[0]
+        ranks[a + b] = len(ranks)
+        merged = Counter()
+        for word, freq in words.items():
+            out, i = [], 0
+            while i < len(word):
+                if i + 1 < len(word) and word[i] == a and word[i + 1] == b:
+                    out.append(a + b)
+                    i += 2
+                else:
+                    out.append(word[i])
+                    i += 1
+            merged[tuple(out)] += freq
+        words = merged
+    return ranks
+
+
+def _write_ranks(path, ranks: dict) -> None:
+    import base64
+    with open(path, "w") as f:
+        for token, rank in ranks.items():
+            f.write(f"{base64.b64encode(token).decode()} {rank}\n")
+
+
+class TestBPETokenizer:
+    """Test local byte-level BPE tokenizer."""
+
+    def test_merges_lowest_rank_first(self):
+        ranks = {bytes([b]): b for b in range(256)}
+        ranks[b"ll"] = 256
+        ranks[b"he"] = 257
+        ranks[b"hell"] = 258
+        ranks[b"llo"] = 259
+        tokenizer = BPETokenizer(ranks)
+
+        # "ll" merges first, then "hell" (258) beats "llo" (259)
+        assert tokenizer.encode("hello") == [258, ord("o")]
+        assert tokenizer.count("hello hello") == 2 + 3  # " hello" -> " ", "hell", "o"
+        assert tokenizer.count("") == 0
+
+    def test_unicode_and_numbers_fall_back_to_bytes(self):
+        tokenizer = BPETokenizer({bytes([b]): b for b in range(256)})
+
+        assert tokenizer.count("héllo") == len("héllo".encode("utf-8"))
+        assert tokenizer.count("12345") == 5
+
+    def test_openai_counter_uses_rank_file_offline(self, tmp_path):
+        ranks = _train_ranks(SAMPLE_TEXT * 3, merges=150)
+        _write_ranks(tmp_path / "tiny.tiktoken", ranks)
+        counter = OpenAITokenCounter(encoding_file=tmp_path / "tiny.tiktoken")
+
+        with patch.dict("sys.modules", {"tiktoken": None}):
+            tokens = counter.count_sync(SAMPLE_TEXT)
+
+        assert tokens == len(BPETokenizer(ranks).encode(SAMPLE_TEXT))
+        assert tokens < len(SAMPLE_TEXT.encode("utf-8")) // 2
+
+
+class TestCachingTokenCounter:
+    """Test LRU token count cache."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_text_served_from_cache(self):
+        inner = EstimationTokenCounter()
+        counter = CachingTokenCounter(inner)
+
+        with patch.object(inner, "count", wraps=inner.count) as count:
+            assert await counter.count("hello world!") == 3
+            assert await counter.count("hello world!") == 3
+            assert counter.count_sync("hello world!") == 3
+
+        assert count.call_count == 1
+        assert (counter.hits, counter.misses) == (2, 1)
+
+    @pytest.mark.asyncio
+    async def test_count_many_batches_only_misses(self):
+        inner = EstimationTokenCounter()
+        counter = CachingTokenCounter(inner)
+        await counter.count("aaaa")
+
+        with patch.object(inner, "count_many", wraps=inner.count_many) as count_many:
+            result = await counter.count_many(["aaaa", "bbbbbbbb", "", "bbbbbbbb"])
+
+        assert result == [1, 2, 0, 2]
+        count_many.assert_called_once_with(["bbbbbbbb"])
+
+    def test_evicts_least_recently_used(self):
+        counter = CachingTokenCounter(EstimationTokenCounter(), max_entries=2)
+        counter.count_sync("a" * 4)
+        counter.count_sync("b" * 4)
+        counter.count_sync("a" * 4)
+        counter.count_sync("c" * 4)
+
+        hits = counter.hits
+        counter.count_sync("a" * 4)
+        assert counter.hits == hits + 1
+        counter.count_sync("b" * 4)
+        assert counter.misses == 4
+
+    def test_keyed_by_model_family(self):
+        counter = CachingTokenCounter(ClaudeTokenCounter(model="a"))
+        key_a = counter._key("text")
+        counter.inner = ClaudeTokenCounter(model="b")
+
+        assert counter._key("text") != key_a
+
+    def test_default_sync_path_reuses_one_event_loop(self):
+        class AsyncOnlyCounter(TokenCounter):
+            async def count(self, text):
+                return len(text)
+
+            async def count_messages(self, messages):
+                return 0
+
+        counter = AsyncOnlyCounter()
+        with patch("asyncio.run", side_effect=AssertionError("new loop per call")):
+            assert counter.count_sync("abc") == 3
+            loop = counter._sync_loop
+            assert counter.count_sync("abcd") == 4
+        assert counter._sync_loop is loop
+        loop.close()
+
+
+class TestTokenCounterPerformance:
+    """Throughput of cached/offline counting, and accuracy vs estimation."""
+
+    def test_throughput(self, tmp_path):
+        """The count cache is much faster than re-encoding with offline BPE."""
+        ranks = _train_ranks(SAMPLE_TEXT * 3, merges=300)
+        texts = [f"{SAMPLE_TEXT} (turn {i % 50})" for i in range(2000)]
+
+        def elapsed(count):
+            start = time.perf_counter()
+            for text in texts:
+                count(text)
+            return time.perf_counter() - start
+
+        _write_ranks(tmp_path / "r.tiktoken", ranks)
+        with patch.dict("sys.modules", {"tiktoken": None}):
+            uncached = elapsed(OpenAITokenCounter(encoding_file=tmp_path / "r.tiktoken").count_sync)
+            cached = elapsed(
+                CachingTokenCounter(OpenAITokenCounter(encoding_file=tmp_path / "r.tiktoken")).count_sync
+            )
+
+        # About 15x apart with 50 distinct texts
+        assert cached * 4 < uncached, f"cached {cached:.3f}s vs {uncached:.3f}s re-encoding"
+
+    def test_accuracy_against_tiktoken(self):
+        tiktoken = pytest.importorskip("tiktoken")
+        try:
+            encoding = tiktoken.get_encoding("cl100k_base")
+        except Exception:
+            pytest.skip("cl100k_base encoding not available offline")
+
+        local = BPETokenizer(encoding._mergeable_ranks)
+        estimation = EstimationTokenCounter()
+        samples = [SAMPLE_TEXT, SAMPLE_TEXT.upper(), "x = [1, 2, 3]\nprint(x)\n" * 5]
+
+        def error(count):
+            return sum(
+                abs(count(t) - len(encoding.encode(t))) / len(encoding.encode(t))
+                for t in samples
+            ) / len(samples)
+
+        assert error(local.count) < error(estimation.count_sync)
+
 
 # ============================================================
 # get_token_counter Factory Tests
@@ -309,6 +537,12 @@ class TestGetTokenCounter:
         counter = get_token_counter("unknown_provider")
         assert isinstance(counter, EstimationTokenCounter)
 
+    def test_get_cached_counter(self):
+        """Test cache_size wraps the counter in an LRU cache."""
+        counter = get_token_counter("openai", cache_size=100)
+        assert isinstance(counter, CachingTokenCounter)
+        assert isinstance(counter.inner, OpenAITokenCounter)
+
 
 # ============================================================
 # AtomicBudgetTracker Tests
@@ -688,6 +922,188 @@ class TestEventSourcingIntegration:
         await event_store.close()
 
 
+    @pytest.mark.asyncio
+    async def test_usage_projection_matches_tracker(self, in_memory_db):
+        """Test that the usage projection rebuilds budget totals from events."""
+        from src.v4.budget import BudgetUsageProjection
+        from src.v4.security.async_storage import (
+            CheckpointStore,
+            ProjectionRunner,
+            SQLiteAsyncEventStore,
+        )
+
+        event_store = SQLiteAsyncEventStore(in_memory_db)
+        tracker = AtomicBudgetTracker(
+            db_path=in_memory_db,
+            event_store=event_store,
+        )
+
+        await tracker.create_budget("test_budget", limit=10000)
+        committed = await tracker.reserve("test_budget", tokens=5000)
+        await tracker.commit(committed.reservation_id, actual_tokens=4500)
+        released = await tracker.reserve("test_budget", tokens=1000)
+        await tracker.rollback(released.reservation_id)
+        pending = await tracker.reserve("test_budget", tokens=2000)
+
+        runner = ProjectionRunner(event_store, CheckpointStore(event_store._adapter))
+        state = await runner.run(BudgetUsageProjection())
+
+        status = await tracker.get_status("test_budget")
+        budget = state["budgets"]["test_budget"]
+        assert budget["limit"] == status.limit
+        assert budget["used"] == status.used == 4500
+        assert budget["reserved"] == status.reserved == 2000
+        assert budget["reservations"] == {pending.reservation_id: 2000}
+        assert budget["exhausted"] is False
+
+        await tracker.close()
+        await event_store.close()
+
+
+# ============================================================
+# Budget Ledger Tests
+# ============================================================
+
+
+class TestBudgetLedger:
+    """Test the in-memory ledger mode of AtomicBudgetTracker."""
+
+    @pytest.mark.asyncio
+    async def test_operations_written_behind_to_sqlite(self, temp_db_path):
+        """Test that ledger operations reach SQLite on flush."""
+        tracker = AtomicBudgetTracker(db_path=temp_db_path, use_ledger=True)
+        await tracker.create_budget("test_budget", limit=10000)
+
+        committed = await tracker.reserve("test_budget", tokens=3000)
+        await tracker.commit(committed.reservation_id, actual_tokens=2500)
+        released = await tracker.reserve("test_budget", tokens=1000)
+        await tracker.rollback(released.reservation_id)
+        pending = await tracker.reserve("test_budget", tokens=500)
+
+        status = await tracker.get_status("test_budget")
+        assert (status.used, status.reserved) == (2500, 500)
+        assert pending.success
+        assert pending.reservation_id in tracker._ledger.reservations
+
+        await tracker.flush()
+
+        reader = AtomicBudgetTracker(db_path=temp_db_path)
+        status = await reader.get_status("test_budget")
+        assert (status.used, status.reserved) == (2500, 500)
+
+        await reader.close()
+        await tracker.close()
+        assert os.path.getsize(f"{temp_db_path}.journal") == 0
+        os.unlink(f"{temp_db_path}.journal")
+
+    @pytest.mark.asyncio
+    async def test_concurrent_reserves_never_overallocate(self, in_memory_db):
+        """Test that concurrent reservations respect the limit."""
+        tracker = AtomicBudgetTracker(db_path=in_memory_db, use_ledger=True)
+        await tracker.create_budget("test_budget", limit=10000)
+
+        results = await asyncio.gather(*[
+            tracker.reserve("test_budget", tokens=1000) for _ in range(20)
+        ])
+
+        assert sum(r.success for r in results) == 10
+        failed = next(r for r in results if not r.success)
+        assert "Insufficient budget" in failed.reason
+        assert failed.budget_status.reserved == 10000
+
+        await tracker.close()
+
+    @pytest.mark.asyncio
+    async def test_expired_reservations_released(self, in_memory_db):
+        """Test that due reservations are released from the expiry heap."""
+        tracker = AtomicBudgetTracker(
+            db_path=in_memory_db,
+            use_ledger=True,
+            reservation_timeout_minutes=0,
+        )
+        await tracker.create_budget("test_budget", limit=10000)
+        result = await tracker.reserve("test_budget", tokens=5000)
+
+        status = await tracker.get_status("test_budget")
+
+        assert status.reserved == 0
+        assert result.reservation_id not in tracker._ledger.reservations
+
+        await tracker.close()
+
+    @pytest.mark.asyncio
+    async def test_journal_replayed_after_crash(self, temp_db_path):
+        """Test that unflushed operations are recovered from the journal."""
+        from src.v4.security.async_storage import SQLiteAsyncEventStore
+
+        event_store = SQLiteAsyncEventStore(":memory:")
+        tracker = AtomicBudgetTracker(
+            db_path=temp_db_path,
+            event_store=event_store,
+            use_ledger=True,
+            ledger_flush_interval_ms=60_000,
+        )
+        await tracker.create_budget("test_budget", limit=10000)
+        result = await tracker.reserve("test_budget", tokens=3000)
+        await tracker.commit(result.reservation_id, actual_tokens=2000)
+        await tracker.reserve("test_budget", tokens=1000)
+
+        # Crash: nothing flushed, connections dropped
+        tracker._ledger._flush_task.cancel()
+        await tracker._adapter.close()
+
+        recovered = AtomicBudgetTracker(
+            db_path=temp_db_path,
+            event_store=event_store,
+            use_ledger=True,
+        )
+        status = await recovered.get_status("test_budget")
+        assert (status.used, status.reserved) == (2000, 1000)
+
+        events = [event.type async for event in event_store.read("budget:test_budget")]
+        assert events == [
+            "budget_created",
+            "tokens_reserved",
+            "tokens_committed",
+            "tokens_reserved",
+        ]
+
+        await recovered.close()
+        await event_store.close()
+        os.unlink(f"{temp_db_path}.journal")
+
+
+class TestBudgetLedgerPerformance:
+    """Reserve/commit round trips through the ledger."""
+
+    CYCLES = 500
+
+    async def _time_cycles(self, path, use_ledger: bool) -> float:
+        tracker = AtomicBudgetTracker(db_path=str(path), use_ledger=use_ledger)
+        await tracker.create_budget("bench", limit=10**9)
+
+        start = time.perf_counter()
+        for _ in range(self.CYCLES):
+            result = await tracker.reserve("bench", tokens=100)
+            await tracker.commit(result.reservation_id, actual_tokens=90)
+        await tracker.flush()
+        elapsed = time.perf_counter() - start
+
+        status = await tracker.get_status("bench")
+        assert status.used == 90 * self.CYCLES and status.reserved == 0
+        await tracker.close()
+        return elapsed
+
+    @pytest.mark.asyncio
+    async def test_ledger_cycle_speed(self, tmp_path):
+        """Reserve+commit is served from memory (faster than SQLite transactions)."""
+        sqlite = await self._time_cycles(tmp_path / "sqlite.db", use_ledger=False)
+        ledger = await self._time_cycles(tmp_path / "ledger.db", use_ledger=True)
+
+        # About 25x apart on a local disk
+        assert ledger * 5 < sqlite, f"ledger {ledger:.3f}s vs {sqlite:.3f}s through SQLite"
+
+
 # ============================================================
 # Integration Tests
 # ============================================================